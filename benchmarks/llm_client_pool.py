@@ -0,0 +1,126 @@
+"""Per-call LLM latency with a fresh client per call vs one pooled client.
+
+Runs a local mock server that speaks the Ollama (/api/generate) and
+OpenAI-compatible (/v1/chat/completions) APIs, then times N generate()
+calls two ways:
+
+  • fresh   — a new provider (and so a new client + connection) per call,
+              which is what every generate() used to do
+  • pooled  — one provider instance reused for all calls (current behaviour)
+
+The mock is plain HTTP on localhost, so the TLS handshake a real API pays
+per new connection is emulated with --connect-delay-ms (slept once per
+accepted connection). OpenAI-compatible providers are only benchmarked
+when the ``openai`` package is installed.
+
+Usage:
+    python -m benchmarks.llm_client_pool --calls 50 --connect-delay-ms 40
+"""
+
+import argparse
+import json
+import socket
+import statistics
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from src.llm.provider import GrokProvider, HTTPSettings, OllamaProvider
+
+
+class _MockHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"   # keep-alive
+
+    def setup(self):
+        super().setup()
+        # Headers and body go out as separate writes; don't let Nagle +
+        # delayed ACK add ~40 ms to every response
+        self.request.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        self.server.connections += 1
+        time.sleep(self.server.connect_delay)
+
+    def log_message(self, *args):
+        pass
+
+    def do_GET(self):
+        self._reply({"models": []})
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        if self.path.endswith("/chat/completions"):
+            self._reply({
+                "id": "mock", "object": "chat.completion", "created": 0, "model": "mock",
+                "choices": [{"index": 0, "finish_reason": "stop",
+                             "message": {"role": "assistant", "content": "ok"}}],
+                "usage": {"prompt_tokens": 5, "completion_tokens": 1, "total_tokens": 6},
+            })
+        else:
+            self._reply({"response": "ok", "eval_count": 1, "done": True})
+
+    def _reply(self, payload: dict):
+        body = json.dumps(payload).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+def start_mock_server(connect_delay_ms: float = 0.0) -> ThreadingHTTPServer:
+    """Start the mock LLM server on a free localhost port (daemon thread)."""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _MockHandler)
+    server.daemon_threads = True
+    server.connections = 0
+    server.connect_delay = connect_delay_ms / 1000
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def _time_calls(make_provider, calls: int, fresh: bool) -> list[float]:
+    latencies = []
+    provider = None if fresh else make_provider()
+    for _ in range(calls):
+        t0 = time.perf_counter()
+        p = make_provider() if fresh else provider
+        p.generate("Say ok", max_tokens=5)
+        latencies.append((time.perf_counter() - t0) * 1000)
+        if fresh:
+            p.close()
+    if provider is not None:
+        provider.close()
+    return latencies
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--calls", type=int, default=30)
+    parser.add_argument("--connect-delay-ms", type=float, default=40.0,
+                        help="Emulated TCP+TLS setup cost per new connection")
+    args = parser.parse_args()
+
+    server = start_mock_server(args.connect_delay_ms)
+    base = f"http://127.0.0.1:{server.server_address[1]}"
+    http = HTTPSettings(timeout=10.0)
+    providers = {"ollama": lambda: OllamaProvider(model="mock", base_url=base, http=http)}
+    try:
+        import openai  # noqa: F401
+        providers["grok (openai sdk)"] = lambda: GrokProvider(
+            api_key="mock", model="mock", base_url=f"{base}/v1", http=http,
+        )
+    except ImportError:
+        print("openai not installed — skipping OpenAI-compatible providers")
+
+    print(f"{args.calls} calls, {args.connect_delay_ms:.0f} ms emulated connection setup\n")
+    print(f"{'provider':<20}{'mode':<8}{'mean ms':>9}{'p50 ms':>9}{'p95 ms':>9}{'conns':>7}")
+    for name, make in providers.items():
+        for mode in ("fresh", "pooled"):
+            before = server.connections
+            lat = sorted(_time_calls(make, args.calls, fresh=mode == "fresh"))
+            p95 = lat[min(len(lat) - 1, int(len(lat) * 0.95))]
+            print(f"{name:<20}{mode:<8}{statistics.mean(lat):>9.1f}"
+                  f"{statistics.median(lat):>9.1f}{p95:>9.1f}{server.connections - before:>7}")
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,228 @@
+"""Persistent cache of LLM-generated application form answers.
+
+Portals ask the same few dozen screening questions across hundreds of
+applications; without this every unknown question costs an LLM round trip
+on every form. Answers are keyed by the normalized question text plus a
+hash of the candidate context the LLM saw, so editing the profile (or the
+answering prompt) invalidates them automatically.
+
+Each row keeps its confidence and provenance (source, model, creation
+time, reuse count). Answers that keep getting reused can be promoted into
+the profile's Q&A bank (``python -m src.cli answers --promote``), after
+which they are matched by regex like any hand-written entry.
+"""
+
+import logging
+import re
+import sqlite3
+import time
+from pathlib import Path
+from typing import Callable
+
+logger = logging.getLogger(__name__)
+
+
+class AnswerCache:
+    """SQLite-backed store of LLM form answers.
+
+    Like JDCache, the database file is opened lazily on first use.
+
+    Args:
+        path: SQLite file location.
+        enabled: When False, every lookup is a miss and nothing is stored.
+        clock: Time source in epoch seconds (injectable for tests).
+    """
+
+    def __init__(
+        self,
+        path: str | Path = "data/answer_cache.db",
+        enabled: bool = True,
+        clock: Callable[[], float] = time.time,
+    ):
+        self.path = Path(path)
+        self.enabled = enabled
+        self._clock = clock
+        self._conn: sqlite3.Connection | None = None
+        self.hits = 0
+        self.misses = 0
+
+    @classmethod
+    def from_config(cls, config=None, clock: Callable[[], float] = time.time) -> "AnswerCache":
+        """Build a cache from the ``answer_cache`` section of config/app.yaml."""
+        if config is None:
+            from src.config import get_config
+            config = get_config()
+        from src.config import PROJECT_ROOT
+
+        cfg = config.answer_cache
+        path = Path(cfg.path)
+        if not path.is_absolute():
+            path = PROJECT_ROOT / path
+        return cls(path=path, enabled=cfg.enabled, clock=clock)
+
+    # ── Public API ───────────────────────────────────────────
+
+    def get(self, question: str, profile_hash: str) -> dict | None:
+        """Cached answer dict for a normalized question, or None on a miss.
+
+        The dict has the QuestionAnswerer shape (answer, source, confidence)
+        with source ``"llm_cache"`` and a ``provenance`` sub-dict.
+        """
+        if not (self.enabled and question):
+            return None
+        conn = self._connect()
+        key = self._key(question, profile_hash)
+        row = conn.execute(
+            "SELECT answer, confidence, source, model, created_at, hits "
+            "FROM answer_cache WHERE key = ?",
+            (key,),
+        ).fetchone()
+        if row is None:
+            self.misses += 1
+            return None
+
+        conn.execute(
+            "UPDATE answer_cache SET hits = hits + 1, used_at = ? WHERE key = ?",
+            (self._clock(), key),
+        )
+        conn.commit()
+        self.hits += 1
+        answer, confidence, source, model, created_at, hits = row
+        return {
+            "answer": answer,
+            "source": "llm_cache",
+            "confidence": confidence,
+            "provenance": {
+                "source": source,
+                "model": model,
+                "created_at": created_at,
+                "hits": hits + 1,
+            },
+        }
+
+    def put(
+        self,
+        question: str,
+        profile_hash: str,
+        answer: str,
+        confidence: float,
+        source: str = "llm",
+        model: str = "",
+    ) -> None:
+        """Store (or replace) the answer for a normalized question."""
+        if not (self.enabled and question and answer):
+            return
+        now = self._clock()
+        conn = self._connect()
+        conn.execute(
+            "INSERT OR REPLACE INTO answer_cache "
+            "(key, question, profile_hash, answer, confidence, source, model, "
+            " created_at, used_at, hits, promoted) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, 0, 0)",
+            (
+                self._key(question, profile_hash),
+                question,
+                profile_hash,
+                answer,
+                confidence,
+                source,
+                model,
+                now,
+                now,
+            ),
+        )
+        conn.commit()
+
+    def entries(
+        self,
+        min_hits: int = 0,
+        include_promoted: bool = True,
+        profile_hash: str | None = None,
+    ) -> list[dict]:
+        """All cached answers (optionally of one profile hash), most reused first."""
+        if not self.enabled:
+            return []
+        rows = self._connect().execute(
+            "SELECT key, question, answer, confidence, source, model, hits, promoted "
+            "FROM answer_cache WHERE hits >= ? AND (? OR promoted = 0) "
+            "AND (? IS NULL OR profile_hash = ?) "
+            "ORDER BY hits DESC, question",
+            (min_hits, include_promoted, profile_hash, profile_hash),
+        ).fetchall()
+        names = ("key", "question", "answer", "confidence", "source", "model", "hits", "promoted")
+        return [dict(zip(names, row)) for row in rows]
+
+    def promote(self, qa_bank: list[dict], min_hits: int = 3) -> list[dict]:
+        """Append frequently reused answers to a Q&A bank list.
+
+        Each promoted answer becomes a ``question_pattern`` matching its
+        normalized question literally. Questions the bank already answers
+        are skipped. Rows are marked promoted so they are offered only once.
+
+        Returns:
+            The new Q&A bank entries (``qa_bank`` is extended in place).
+        """
+        existing = [qa.get("question_pattern", "") for qa in qa_bank]
+        added: list[dict] = []
+        promoted_keys: list[str] = []
+        for row in self.entries(min_hits=min_hits, include_promoted=False):
+            promoted_keys.append(row["key"])
+            if any(_matches(pattern, row["question"]) for pattern in existing):
+                continue
+            entry = {"question_pattern": re.escape(row["question"]), "answer": row["answer"]}
+            qa_bank.append(entry)
+            existing.append(entry["question_pattern"])
+            added.append(entry)
+
+        if promoted_keys:
+            conn = self._connect()
+            conn.executemany(
+                "UPDATE answer_cache SET promoted = 1 WHERE key = ?",
+                [(key,) for key in promoted_keys],
+            )
+            conn.commit()
+        return added
+
+    def __len__(self) -> int:
+        if not self.enabled:
+            return 0
+        return self._connect().execute("SELECT COUNT(*) FROM answer_cache").fetchone()[0]
+
+    def close(self) -> None:
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    # ── Private helpers ──────────────────────────────────────
+
+    @staticmethod
+    def _key(question: str, profile_hash: str) -> str:
+        return f"{profile_hash}:{question}"
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(str(self.path))
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS answer_cache ("
+                "  key TEXT PRIMARY KEY,"
+                "  question TEXT NOT NULL,"
+                "  profile_hash TEXT NOT NULL,"
+                "  answer TEXT NOT NULL,"
+                "  confidence REAL NOT NULL,"
+                "  source TEXT NOT NULL,"
+                "  model TEXT NOT NULL DEFAULT '',"
+                "  created_at REAL NOT NULL,"
+                "  used_at REAL NOT NULL,"
+                "  hits INTEGER NOT NULL DEFAULT 0,"
+                "  promoted INTEGER NOT NULL DEFAULT 0"
+                ")"
+            )
+        return self._conn
+
+
+def _matches(pattern: str, question: str) -> bool:
+    try:
+        return re.search(pattern, question, re.IGNORECASE) is not None
+    except re.error:
+        return pattern.lower() in question
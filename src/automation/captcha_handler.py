@@ -2,11 +2,22 @@
 
 Detects common CAPTCHA types and pauses automation to alert the user
 for manual solving. V1 does NOT solve CAPTCHAs automatically.
+
+Detection on a live page runs one page.evaluate probe that checks known
+iframe sources, widget elements and ``data-sitekey`` attributes and returns
+at the first hit, instead of pulling the whole HTML across CDP. The HTML
+path (detect()) scans once with a single precompiled alternation.
+
+A blocked apply doesn't have to stall the run: park() waits for the human
+in a background task while the driver carries on in a fresh tab.
 """
 
+import asyncio
 import re
 from dataclasses import dataclass
 
+from src.automation.clock import Sleeper
+
 
 @dataclass
 class CaptchaDetection:
@@ -16,13 +27,46 @@ class CaptchaDetection:
     message: str = ""
 
 
+# Runs in the page: cheapest markers first, first hit wins
+_PROBE_JS = """
+() => {
+    const frames = [
+        ['recaptcha', 'recaptcha'], ['hcaptcha.com', 'hcaptcha'],
+        ['challenges.cloudflare.com', 'cloudflare'],
+    ];
+    for (const f of document.querySelectorAll('iframe[src]')) {
+        const src = f.src.toLowerCase();
+        for (const [marker, kind] of frames) if (src.includes(marker)) return kind;
+    }
+    const elements = [
+        ['.g-recaptcha, #g-recaptcha-response, [data-recaptcha]', 'recaptcha'],
+        ['.h-captcha, [data-hcaptcha-widget-id]', 'hcaptcha'],
+        ['.cf-turnstile, #challenge-running, #cf-challenge-running', 'cloudflare'],
+        ['#captcha-container, .captcha-container, #challenge-form, [data-sitekey]', 'unknown'],
+    ];
+    for (const [sel, kind] of elements) if (document.querySelector(sel)) return kind;
+    const text = ((document.title || '') + ' ' +
+                  (document.body ? document.body.innerText.slice(0, 2000) : '')).toLowerCase();
+    if (/verify.*human|not.*robot/.test(text)) return 'unknown';
+    return '';
+}
+"""
+
+
 class CaptchaHandler:
     """Detect CAPTCHAs and handle them by pausing for human intervention.
 
     In V1, the system pauses automation and notifies the user when a
     CAPTCHA is detected. It does NOT attempt to solve CAPTCHAs.
+
+    Args:
+        sleeper: Waits between solve probes (the driver's HumanSimulator
+                 sleeper, so zero / virtual clocks don't wait for real).
     """
 
+    def __init__(self, sleeper: Sleeper | None = None):
+        self.sleeper = sleeper or Sleeper()
+
     # Common CAPTCHA indicator patterns
     CAPTCHA_PATTERNS = [
         (r"recaptcha", "recaptcha"),
@@ -36,40 +80,52 @@ class CaptchaHandler:
         (r"challenge-form", "unknown"),
     ]
 
+    # All patterns in one pass; group p<i> identifies CAPTCHA_PATTERNS[i]
+    _COMBINED_RE = re.compile(
+        "|".join(f"(?P<p{i}>{pattern})" for i, (pattern, _) in enumerate(CAPTCHA_PATTERNS)),
+        re.IGNORECASE,
+    )
+
     def detect(self, page_html: str) -> CaptchaDetection:
         """Check page HTML for CAPTCHA indicators.
 
+        A specific widget (reCAPTCHA, hCaptcha, Turnstile) anywhere on the
+        page wins over a generic "verify you are human" marker.
+
         Args:
             page_html: The full HTML source of the page.
 
         Returns:
             CaptchaDetection with detection result.
         """
-        html_lower = page_html.lower()
-
-        for pattern, captcha_type in self.CAPTCHA_PATTERNS:
-            if re.search(pattern, html_lower):
-                return CaptchaDetection(
-                    detected=True,
-                    captcha_type=captcha_type,
-                    message=f"CAPTCHA detected ({captcha_type}). Please solve it manually.",
-                )
-
-        return CaptchaDetection(detected=False)
+        generic = ""
+        for match in self._COMBINED_RE.finditer(page_html):
+            captcha_type = self.CAPTCHA_PATTERNS[int(match.lastgroup[1:])][1]
+            if captcha_type != "unknown":
+                return self._detection(captcha_type)
+            generic = generic or captcha_type
+        return self._detection(generic) if generic else CaptchaDetection(detected=False)
 
     async def detect_on_page(self, page) -> CaptchaDetection:
         """Detect CAPTCHA on a Playwright page object.
 
+        Uses the in-page probe; falls back to scanning page.content() if the
+        probe can't run (e.g. the page is mid-navigation).
+
         Args:
             page: Playwright page object.
 
         Returns:
             CaptchaDetection result.
         """
-        html = await page.content()
-        return self.detect(html)
-
-    async def handle(self, page, timeout_seconds: int = 120) -> bool:
+        try:
+            captcha_type = await page.evaluate(_PROBE_JS)
+        except Exception:
+            html = await page.content()
+            return self.detect(html)
+        return self._detection(captcha_type) if captcha_type else CaptchaDetection(detected=False)
+
+    async def handle(self, page, timeout_seconds: int = 120, poll_interval: float = 3) -> bool:
         """Wait for human to solve CAPTCHA.
 
         Polls the page periodically to check if the CAPTCHA has been
@@ -78,17 +134,14 @@ class CaptchaHandler:
         Args:
             page: Playwright page object.
             timeout_seconds: How long to wait before giving up.
+            poll_interval: Seconds between probes.
 
         Returns:
             True if CAPTCHA was solved, False if timed out.
         """
-        import asyncio
-
-        elapsed = 0
-        poll_interval = 3
-
+        elapsed = 0.0
         while elapsed < timeout_seconds:
-            await asyncio.sleep(poll_interval)
+            await self.sleeper.wait(poll_interval)
             elapsed += poll_interval
 
             detection = await self.detect_on_page(page)
@@ -96,3 +149,28 @@ class CaptchaHandler:
                 return True  # CAPTCHA solved
 
         return False  # Timed out
+
+    def park(self, page, timeout_seconds: int = 120, poll_interval: float = 3) -> asyncio.Task:
+        """Wait for a human to solve the CAPTCHA on ``page`` in the background.
+
+        The page is closed once the wait ends (solved, timed out or
+        cancelled). Await the returned task for handle()'s result.
+        """
+        async def wait() -> bool:
+            try:
+                return await self.handle(page, timeout_seconds, poll_interval)
+            finally:
+                try:
+                    await page.close()
+                except Exception:
+                    pass
+
+        return asyncio.ensure_future(wait())
+
+    @staticmethod
+    def _detection(captcha_type: str) -> CaptchaDetection:
+        return CaptchaDetection(
+            detected=True,
+            captcha_type=captcha_type,
+            message=f"CAPTCHA detected ({captcha_type}). Please solve it manually.",
+        )
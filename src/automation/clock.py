@@ -0,0 +1,91 @@
+"""Injectable sleep source for HumanSimulator.
+
+Every humanization delay (pauses, per-keystroke typing delays, scroll
+reading time) goes through a Sleeper, so offline driver tests and pipeline
+benchmarks don't have to spend their wall time asleep:
+
+  • real     — actually sleep (production)
+  • zero     — return immediately (still yielding to the event loop)
+  • virtual  — return immediately and advance a virtual clock by the
+               requested delay; time() reports that clock, so anything
+               keyed on wall time (the JD and answer caches) sees the run
+               as a human would have
+
+In every mode the requested human time is accumulated in ``simulated`` and
+the time really spent sleeping in ``slept``; report() splits a run's wall
+time into simulated human time and real compute time. wait() is for time
+spent waiting on something else (a human solving a CAPTCHA): it sleeps
+only in real mode and is not counted as human time.
+"""
+
+import asyncio
+import time
+
+REAL = "real"
+ZERO = "zero"
+VIRTUAL = "virtual"
+MODES = (REAL, ZERO, VIRTUAL)
+
+
+class Sleeper:
+    """Sleep source with simulated-time accounting.
+
+    Args:
+        mode: ``"real"``, ``"zero"`` or ``"virtual"``.
+        start: Epoch seconds the virtual clock starts at (default: now).
+    """
+
+    def __init__(self, mode: str = REAL, start: float | None = None):
+        if mode not in MODES:
+            raise ValueError(f"Unknown sleeper mode: {mode!r}")
+        self.mode = mode
+        self.simulated = 0.0   # human time requested, seconds
+        self.slept = 0.0       # time actually spent sleeping, seconds
+        self._start = time.time() if start is None else start
+        self._waited = 0.0     # virtual time spent in wait()
+
+    async def sleep(self, seconds: float) -> None:
+        """Sleep (or account for) ``seconds`` of human time."""
+        seconds = max(0.0, seconds)
+        self.simulated += seconds
+        if self.mode == REAL and seconds > 0:
+            t0 = time.perf_counter()
+            await asyncio.sleep(seconds)
+            self.slept += time.perf_counter() - t0
+        else:
+            await asyncio.sleep(0)
+
+    async def wait(self, seconds: float) -> None:
+        """Wait ``seconds`` for something external; not counted as human time."""
+        seconds = max(0.0, seconds)
+        if self.mode == REAL and seconds > 0:
+            await asyncio.sleep(seconds)
+            return
+        if self.mode == VIRTUAL:
+            self._waited += seconds
+        await asyncio.sleep(0)
+
+    def typing_delay_ms(self, delay_ms: float) -> float:
+        """Account for a Playwright ``page.type`` keystroke delay.
+
+        Returns the delay to pass to Playwright (0 unless sleeping for real).
+        """
+        self.simulated += delay_ms / 1000
+        if self.mode == REAL:
+            self.slept += delay_ms / 1000
+            return delay_ms
+        return 0
+
+    def time(self) -> float:
+        """Current epoch seconds — virtual in virtual mode, wall clock otherwise."""
+        if self.mode == VIRTUAL:
+            return self._start + self.simulated + self._waited
+        return time.time()
+
+    def report(self, wall_seconds: float) -> dict[str, float]:
+        """Split a run's wall time into simulated human time and compute time."""
+        return {
+            "simulated_human_s": round(self.simulated, 3),
+            "slept_s": round(self.slept, 3),
+            "compute_s": round(max(0.0, wall_seconds - self.slept), 3),
+        }
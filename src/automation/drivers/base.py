@@ -1,9 +1,11 @@
 """Base portal driver interface for job search/apply automation."""
 
+import asyncio
 import logging
 import os
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
+from datetime import UTC, datetime
 from pathlib import Path
 from typing import Any
 
@@ -33,6 +35,11 @@ def _chrome_installed() -> bool:
     return any(os.path.exists(p) for p in candidates if p)
 
 
+def _as_utc(value: datetime) -> datetime:
+    """Treat naive datetimes (e.g. read back from SQLite) as UTC."""
+    return value if value.tzinfo else value.replace(tzinfo=UTC)
+
+
 @dataclass
 class DiscoveredJob:
     """A job discovered by a portal driver."""
@@ -44,6 +51,7 @@ class DiscoveredJob:
     salary_range: str = ""
     description_text: str = ""
     external_id: str = ""
+    # Portal extras; "posted_at" (aware datetime) feeds incremental crawling
     metadata: dict[str, Any] = field(default_factory=dict)
 
 
@@ -57,6 +65,24 @@ class SearchConfig:
     posted_within_days: int = 7
     max_results: int = 50
     salary_min: int | None = None
+    # Incremental crawl: drop already-known jobs and stop paging at the first
+    # results page that contains nothing new (results are sorted by recency).
+    incremental: bool = False
+    known_job_keys: set[str] = field(default_factory=set)   # "source:external_id"
+    high_water_at: dict[str, datetime] = field(default_factory=dict)  # per source
+
+
+@dataclass
+class HighWaterMark:
+    """Newest jobs seen by one portal search; stored on SearchRun."""
+    external_ids: list[str] = field(default_factory=list)  # newest first
+    posted_at: datetime | None = None                      # newest posting date seen
+    pages_crawled: int = 0
+    stopped_early: bool = False
+    jobs_found: int = 0
+    jobs_new: int = 0          # left after deduplication (set by the Orchestrator)
+
+    MAX_IDS = 50
 
 
 class BasePortalDriver(ABC):
@@ -132,19 +158,135 @@ class BaseBrowserDriver(BasePortalDriver):
     Everything else — browser launch, playwright-stealth, pagination loop,
     JD fetching with lognormal delays, and scroll-to-read simulation — is
     handled here so portal drivers stay focused on their own selectors.
+
+    Portals whose pages are rendered from JSON APIs declare ``capture`` rules
+    in their YAML and read the bodies with ``await self.captured(name)``.
     """
 
-    def __init__(self, headless: bool = False, user_data_dir: str = ""):
+    # Typical cards per results page (used for time-budget estimates)
+    RESULTS_PER_PAGE = 25
+    # Humanization pauses of _run_search / _fetch_descriptions in seconds;
+    # estimate_time_budget() is computed from the same values
+    RESULTS_SETTLE_S = (3.5, 6.0)    # after a results page loads
+    PAGE_DELAY_SPREAD_S = 4.5        # page gap: (search_delay, search_delay + spread)
+    JD_DELAY_SPREAD_S = 3.5          # JD gap: (job_detail_delay, job_detail_delay + spread)
+    JD_SETTLE_S = (2.0, 3.5)         # after a JD page loads
+    RESULTS_READING_S = 1.5          # scroll_to_read() reading time on results pages
+    JD_READING_S = 1.2               # scroll_to_read() reading time on JD pages
+
+    def __init__(self, headless: bool = False, user_data_dir: str = "", jd_cache=None):
         self.headless = headless
         self.user_data_dir = user_data_dir
         self.sel: dict[str, Any] = {}   # populated by each subclass from YAML
         self._pw = None
         self._context = None
         self._page = None
+        # CaptchaHandler.park() tasks still waiting on a tab of this browser
+        self._parks: set[asyncio.Task] = set()
 
         # Import lazily to avoid a hard dependency in tests that mock the browser
         from src.automation.human_simulator import HumanSimulator
+        from src.automation.jd_cache import JDCache
         self.sim = HumanSimulator()
+        # Fetched JD text keyed by (source, external_id); opened on first use.
+        # Its TTL runs on the simulator's clock (virtual under Sleeper("virtual")).
+        self.jd_cache = jd_cache if jd_cache is not None else JDCache.from_config(clock=self.now)
+        # Offline record/replay archive (see use_archive)
+        self.archive = None
+        # AIMD pacing; built lazily because subclasses load self.sel after this
+        self._pacer = None
+        # JSON response capture rules from the portal YAML (see captured())
+        self._capture = None
+        self._throttle_reason = ""
+        # High-water mark of the most recent search (for incremental crawls)
+        self.last_high_water: HighWaterMark | None = None
+        # QuestionAnswerer for apply-form questions the static answers miss
+        self.answerer = None
+
+    def now(self) -> float:
+        """Epoch seconds on the HumanSimulator's clock (see Sleeper.time)."""
+        return self.sim.sleeper.time()
+
+    def use_archive(self, archive) -> None:
+        """Record this driver's session to, or replay it from, a SessionArchive.
+
+        Both modes disable the JD cache: a cache hit while recording would
+        skip the JD page, so it would be missing from the archive. Replay
+        also puts HumanSimulator on virtual time so every run does the same
+        work, spends no wall time asleep, and still reports the human time
+        it would have taken.
+        """
+        from src.automation.jd_cache import JDCache
+        self.archive = archive
+        self.jd_cache = JDCache(enabled=False)
+        if archive.replaying:
+            from src.automation.clock import VIRTUAL, Sleeper
+            self.sim.sleeper = Sleeper(VIRTUAL)
+            from src.automation.pacing import PacingController
+            self.pacer = PacingController(self.driver_name(), enabled=False)
+
+    @property
+    def pacer(self):
+        """Per-portal PacingController that scales the YAML rate_limits delays."""
+        if self._pacer is None:
+            from src.automation.pacing import PacingController
+            self._pacer = PacingController.from_selectors(self.driver_name(), self.sel)
+        return self._pacer
+
+    @pacer.setter
+    def pacer(self, value) -> None:
+        self._pacer = value
+
+    @property
+    def capture(self):
+        """ResponseCapture configured from the portal YAML ``capture`` section."""
+        if self._capture is None:
+            from src.automation.response_capture import ResponseCapture
+            self._capture = ResponseCapture.from_selectors(self.sel)
+        return self._capture
+
+    async def captured(
+        self,
+        name: str,
+        timeout: float | None = None,
+        in_flight_only: bool = False,
+    ) -> list:
+        """Drain JSON bodies captured for a named rule (see ResponseCapture.captured)."""
+        return await self.capture.captured(name, timeout=timeout, in_flight_only=in_flight_only)
+
+    def estimate_time_budget(self, config: "SearchConfig") -> dict[str, float]:
+        """Humanization time a search will spend, before launching it.
+
+        Walks the same pause structure (and the same class constants) as
+        _run_search/_fetch_descriptions. ``min_s`` adds every clipped pause's
+        lower bound at the pacer's floor; scroll_to_read() time is lognormal
+        with no lower bound, so it is left out. ``expected_s`` is a rough
+        figure: pause midpoints and nominal reading times at the current
+        learned pacing scale. JD cache hits are not accounted for.
+        """
+        rate = self.sel.get("rate_limits", {})
+        jobs = min(config.max_results, rate.get("max_jobs_per_session", 25))
+        pages = max(1, -(-jobs // self.RESULTS_PER_PAGE))
+        page_s = rate.get("search_delay_ms", 6500) / 1000
+        jd_s = rate.get("job_detail_delay_ms", 5000) / 1000
+        floor = self.pacer.floor if self.pacer.enabled else 1.0
+        scale = self.pacer.scale
+        settle_min, settle_mid = self.RESULTS_SETTLE_S[0], sum(self.RESULTS_SETTLE_S) / 2
+        jd_settle_min, jd_settle_mid = self.JD_SETTLE_S[0], sum(self.JD_SETTLE_S) / 2
+
+        gaps = max(jobs - 1, 0)  # delays between consecutive JD fetches
+        minimum = settle_min + (pages - 1) * (page_s * floor + settle_min)
+        minimum += gaps * jd_s * floor + jobs * jd_settle_min
+        expected = settle_mid + self.RESULTS_READING_S
+        expected += (pages - 1) * (page_s * scale + self.PAGE_DELAY_SPREAD_S / 2 + settle_mid)
+        expected += gaps * (jd_s * scale + self.JD_DELAY_SPREAD_S / 2)
+        expected += jobs * (jd_settle_mid + self.JD_READING_S)
+        return {
+            "jobs": jobs,
+            "pages": pages,
+            "min_s": round(minimum * self.sim.time_scale, 1),
+            "expected_s": round(expected * self.sim.time_scale, 1),
+        }
 
     # ── Browser lifecycle ─────────────────────────────────────────────────────
 
@@ -155,6 +297,11 @@ class BaseBrowserDriver(BasePortalDriver):
         plugins, WebGL renderer, chrome.runtime, languages, iframe ContentWindow …)
         by injecting init scripts before every page load.
         """
+        if self._context is not None:
+            # Kept open for a parked CAPTCHA tab: a second persistent context
+            # on the same user_data_dir would fail, so keep using this one
+            return
+
         from playwright.async_api import async_playwright
 
         _stealth = None
@@ -186,6 +333,9 @@ class BaseBrowserDriver(BasePortalDriver):
             "timezone_id": "Asia/Kolkata",
         }
 
+        if self.archive is not None:
+            launch_kwargs.update(self.archive.launch_kwargs())
+
         if _chrome_installed():
             launch_kwargs["channel"] = "chrome"
             logger.info("%s: using real Chrome (best fingerprint)", self.driver_name())
@@ -209,9 +359,33 @@ class BaseBrowserDriver(BasePortalDriver):
             except Exception as exc:
                 logger.warning("%s: stealth apply failed: %s", self.driver_name(), exc)
 
+        if self.archive is not None:
+            await self.archive.install(self._context)
+
         self._page = await self._context.new_page()
+        self._page.on("response", self._on_response)
+
+    async def _release_browser(self) -> None:
+        """Close the browser after an apply, unless a parked CAPTCHA tab still needs it.
+
+        The orchestrator calls close() once the parked tasks have finished.
+        """
+        if any(not task.done() for task in self._parks):
+            return
+        await self._close_browser()
+
+    async def close(self) -> None:
+        """Close the browser (and any parked tab still open)."""
+        self._parks.clear()
+        await self._close_browser()
 
     async def _close_browser(self) -> None:
+        if self.archive is not None:
+            self.archive.save()
+        if self._pacer is not None:
+            self._pacer.save()
+        if self._capture is not None:
+            self._capture.close()
         if self._context:
             try:
                 await self._context.close()
@@ -239,6 +413,7 @@ class BaseBrowserDriver(BasePortalDriver):
                     "%s: not logged in. Run: python -m src.cli setup-browser --portal %s",
                     self.driver_name(), self.driver_name(),
                 )
+            await self._snapshot("session")
             return await self._run_search(config)
         except Exception as exc:
             logger.error("%s search error: %s", self.driver_name(), exc, exc_info=True)
@@ -253,6 +428,13 @@ class BaseBrowserDriver(BasePortalDriver):
                 title="", company="", url=url,
                 source=self.driver_name(), description_text="stub",
             )
+        external_id = self._canonical_id(url)
+        cached = self.jd_cache.get(self.driver_name(), external_id)
+        if cached:
+            return DiscoveredJob(
+                title="", company="", url=url, source=self.driver_name(),
+                description_text=cached, external_id=external_id,
+            )
         try:
             await self._start_browser()
             await self._check_session()
@@ -260,9 +442,12 @@ class BaseBrowserDriver(BasePortalDriver):
             await self.sim.random_pause(1.5, 2.5)
             await self.sim.scroll_to_read(self._page, reading_time=1.5)
             text = await self._get_full_jd_text()
+            await self._snapshot("jd")
+            await self._observe_pacing(bool(text))
+            self.jd_cache.put(self.driver_name(), external_id, text)
             return DiscoveredJob(
-                title="", company="", url=url,
-                source=self.driver_name(), description_text=text,
+                title="", company="", url=url, source=self.driver_name(),
+                description_text=text, external_id=external_id,
             )
         except Exception as exc:
             logger.error("%s get_job_details error: %s", self.driver_name(), exc)
@@ -297,55 +482,91 @@ class BaseBrowserDriver(BasePortalDriver):
         logger.info("%s: GET %s", self.driver_name(), url)
 
         await self._page.goto(url, wait_until="domcontentloaded", timeout=60000)
-        await self.sim.random_pause(3.5, 6.0)
-        await self.sim.scroll_to_read(self._page, reading_time=1.5)
+        await self.sim.random_pause(*self.RESULTS_SETTLE_S)
+        await self.sim.scroll_to_read(self._page, reading_time=self.RESULTS_READING_S)
 
         jobs: list[DiscoveredJob] = []
         page_num = 0
+        mark = HighWaterMark()
+        self.last_high_water = mark
 
         while len(jobs) < max_jobs:
             page_num += 1
             new_jobs = await self._extract_job_cards()
-            jobs.extend(new_jobs)
+            await self._snapshot("search")
+            await self._observe_pacing(bool(new_jobs))
+            mark.pages_crawled = page_num
+            self._advance_high_water(mark, new_jobs)
+
+            fresh = new_jobs
+            if config.incremental:
+                fresh = [j for j in new_jobs if not self._is_known(j, config)]
+            jobs.extend(fresh)
             logger.info(
-                "%s page %d: %d cards → %d total",
-                self.driver_name(), page_num, len(new_jobs), len(jobs),
+                "%s page %d: %d cards (%d new) → %d total",
+                self.driver_name(), page_num, len(new_jobs), len(fresh), len(jobs),
             )
 
+            if config.incremental and new_jobs and not fresh:
+                logger.info(
+                    "%s: page %d is entirely known jobs — stopping incremental crawl",
+                    self.driver_name(), page_num,
+                )
+                mark.stopped_early = True
+                break
             if len(new_jobs) == 0 or len(jobs) >= max_jobs:
                 break
             if not await self._has_next_page():
                 logger.debug("%s: no next page — stopping", self.driver_name())
                 break
 
-            # Lognormal wait between pages (clusters around mean, occasional longer)
-            await self.sim.random_pause(6.5, 11.0)
-            await self._goto_next_page()
-            await self.sim.random_pause(3.5, 6.0)
+            # Lognormal wait between pages (clusters around mean, occasional longer),
+            # scaled by the adaptive pacing controller
+            page_delay = self.pacer.delay(rate.get("search_delay_ms", 6500) / 1000)
+            await self.sim.random_pause(page_delay, page_delay + self.PAGE_DELAY_SPREAD_S)
+            if not await self._goto_next_results_page():
+                break
+            await self.sim.random_pause(*self.RESULTS_SETTLE_S)
 
         result = jobs[:max_jobs]
+        mark.jobs_found = len(result)
         logger.info("%s: fetching full JDs for %d jobs", self.driver_name(), len(result))
         await self._fetch_descriptions(result)
         return result
 
     async def _fetch_descriptions(self, jobs: list["DiscoveredJob"]) -> None:
-        """Navigate to each job's detail page and extract the full description."""
+        """Navigate to each job's detail page and extract the full description.
+
+        Jobs whose JD is already in the on-disk cache are filled from it
+        without navigating (and without the inter-fetch delay).
+        """
         rate = self.sel.get("rate_limits", {})
-        base_delay = rate.get("job_detail_delay_ms", 5000) / 1000
 
-        for i, job in enumerate(jobs):
+        fetched = 0
+        for job in jobs:
             if job.description_text or not job.url:
                 continue
+            job_id = job.external_id or self._canonical_id(job.url)
+            cached = self.jd_cache.get(self.driver_name(), job_id)
+            if cached:
+                job.description_text = cached
+                logger.debug("  JD '%s': cache hit", job.title)
+                continue
             try:
-                if i > 0:
+                if fetched > 0:
                     # Staggered lognormal delays between consecutive JD fetches
-                    await self.sim.random_pause(base_delay, base_delay + 3.5)
+                    base_delay = self.pacer.delay(rate.get("job_detail_delay_ms", 5000) / 1000)
+                    await self.sim.random_pause(base_delay, base_delay + self.JD_DELAY_SPREAD_S)
+                fetched += 1
 
                 await self._page.goto(job.url, wait_until="domcontentloaded", timeout=30000)
-                await self.sim.random_pause(2.0, 3.5)
-                await self.sim.scroll_to_read(self._page, reading_time=1.2)
+                await self.sim.random_pause(*self.JD_SETTLE_S)
+                await self.sim.scroll_to_read(self._page, reading_time=self.JD_READING_S)
 
                 job.description_text = await self._get_full_jd_text()
+                await self._snapshot("jd")
+                await self._observe_pacing(bool(job.description_text))
+                self.jd_cache.put(self.driver_name(), job_id, job.description_text)
                 logger.debug(
                     "  JD '%s': %s (%d chars)",
                     job.title,
@@ -355,6 +576,187 @@ class BaseBrowserDriver(BasePortalDriver):
             except Exception as exc:
                 logger.debug("  JD fetch failed for %s: %s", job.url, exc)
 
+    async def _extract_cards_js(
+        self,
+        card_sel: str | list[str],
+        fields: dict[str, tuple[str, str]],
+    ) -> list[dict[str, str]]:
+        """Read every job card's fields in a single in-page evaluation.
+
+        Walking card handles with query_selector / inner_text / get_attribute
+        costs one CDP round trip per call (~150 for a 25-card page). This runs
+        the whole walk inside the page and returns one JSON array instead.
+
+        Args:
+            card_sel: Card container selector, or a priority list of selectors
+                      (the first one that matches any element wins).
+            fields: Map of output key → (selector relative to the card, what to
+                    read). What to read is "text" for innerText or an attribute
+                    name such as "href". An empty selector means the card itself.
+
+        Returns:
+            One dict per card with every requested key (missing values are "").
+        """
+        candidates = [card_sel] if isinstance(card_sel, str) else list(card_sel)
+        candidates = [c for c in candidates if c]
+        rows = await self._page.evaluate(
+            """
+            ([candidates, fields]) => {
+                let cards = [];
+                for (const sel of candidates) {
+                    try { cards = Array.from(document.querySelectorAll(sel)); } catch (e) { cards = []; }
+                    if (cards.length) break;
+                }
+                return cards.map(card => {
+                    const out = {};
+                    for (const [key, [sel, what]] of Object.entries(fields)) {
+                        let el = null;
+                        try { el = sel ? card.querySelector(sel) : card; } catch (e) { el = null; }
+                        const v = !el ? '' : (what === 'text' ? el.innerText : el.getAttribute(what));
+                        out[key] = (v || '').trim();
+                    }
+                    return out;
+                });
+            }
+            """,
+            [candidates, {k: list(v) for k, v in fields.items()}],
+        )
+        return rows or []
+
+    async def _fill_form_step(self, frame, answers: dict, root_sel: str = "") -> dict:
+        """Fill every empty field of the current apply-form step.
+
+        Fields are discovered in one evaluation; questions the static
+        ``answers`` can't cover go to ``self.answerer`` in one batch.
+        """
+        from src.automation.forms import fill_form
+        return await fill_form(
+            frame,
+            answers,
+            answerer=self.answerer,
+            root_sel=root_sel,
+            pause=lambda: self.sim.random_pause(0.2, 0.5),
+        )
+
+    def _is_known(self, job: "DiscoveredJob", config: "SearchConfig") -> bool:
+        """True if an incremental crawl has already seen this job."""
+        job_id = job.external_id or self._canonical_id(job.url)
+        if f"{job.source}:{job_id}" in config.known_job_keys:
+            return True
+        since = config.high_water_at.get(self.driver_name())
+        posted = job.metadata.get("posted_at")
+        return bool(since and posted and _as_utc(posted) <= _as_utc(since))
+
+    def _advance_high_water(self, mark: HighWaterMark, page_jobs: list["DiscoveredJob"]) -> None:
+        """Fold one results page (newest first) into the high-water mark."""
+        for job in page_jobs:
+            job_id = job.external_id or self._canonical_id(job.url)
+            if job_id and job_id not in mark.external_ids and len(mark.external_ids) < mark.MAX_IDS:
+                mark.external_ids.append(job_id)
+            posted = job.metadata.get("posted_at")
+            if posted and (mark.posted_at is None or _as_utc(posted) > _as_utc(mark.posted_at)):
+                mark.posted_at = _as_utc(posted)
+
+    async def _goto_next_results_page(self) -> bool:
+        """Advance to the next results page; False if there is none to go to.
+
+        In replay mode portal scripts aren't served, so click-driven
+        pagination is replaced by navigating to the next recorded page.
+        """
+        if self.archive is not None and self.archive.replaying:
+            next_url = self.archive.next_search_url(self._page.url)
+            if not next_url:
+                logger.debug("%s: no further recorded pages", self.driver_name())
+                return False
+            await self._page.goto(next_url, wait_until="domcontentloaded", timeout=30000)
+            return True
+        await self._goto_next_page()
+        return True
+
+    def _on_response(self, response) -> None:
+        """Page response listener: feed response capture, flag throttling for pacing."""
+        from src.automation.pacing import THROTTLE_STATUS_CODES
+        self.capture.observe(response)
+        try:
+            if (
+                response.request.resource_type == "document"
+                and response.status in THROTTLE_STATUS_CODES
+            ):
+                self._throttle_reason = f"HTTP {response.status}"
+        except Exception:
+            pass
+
+    async def _observe_pacing(self, ok: bool) -> None:
+        """Feed one pacing decision per page / JD fetch to the controller.
+
+        A flagged throttling response wins; otherwise an empty result is
+        classified as a login redirect, a CAPTCHA, or simply an empty page.
+        """
+        reason, self._throttle_reason = self._throttle_reason, ""
+        if not reason and not ok:
+            reason = await self._block_reason()
+        if reason:
+            self.pacer.on_throttle(reason)
+        else:
+            self.pacer.on_success()
+
+    async def _block_reason(self) -> str:
+        """Explain why the current page yielded nothing."""
+        url = (self._page.url or "").lower()
+        if any(m in url for m in ("/login", "/authwall", "/checkpoint", "/signin")):
+            return "login redirect"
+        try:
+            from src.automation.captcha_handler import CaptchaHandler
+            detection = await CaptchaHandler().detect_on_page(self._page)
+            if detection.detected:
+                return f"CAPTCHA ({detection.captcha_type})"
+        except Exception:
+            pass
+        return "empty page"
+
+    async def _park_captcha(self, job: "DiscoveredJob", detection) -> dict:
+        """Leave a CAPTCHA'd apply tab open for a human and carry on in a new tab.
+
+        The returned apply result carries the CaptchaHandler.park() task under
+        ``"parked"``; the orchestrator keeps processing other jobs and retries
+        this one once the task reports the CAPTCHA solved. The browser stays
+        open until then (see _release_browser).
+        """
+        from src.automation.captcha_handler import CaptchaHandler
+        self.pacer.on_throttle(f"CAPTCHA ({detection.captcha_type})")
+        result = {"status": "captcha", "message": detection.message, "job_url": job.url}
+        if self._context is None:
+            return result
+        try:
+            parked_page, self._page = self._page, await self._context.new_page()
+            self._page.on("response", self._on_response)
+        except Exception as exc:
+            logger.debug("%s: could not open a new tab: %s", self.driver_name(), exc)
+            return result
+        logger.warning("%s: %s — parked at %s", self.driver_name(), detection.message, job.url)
+        task = CaptchaHandler(self.sim.sleeper).park(parked_page)
+        self._parks.add(task)
+        task.add_done_callback(self._parks.discard)
+        result["parked"] = task
+        return result
+
+    async def _snapshot(self, kind: str) -> None:
+        """Save a DOM snapshot of the current page when recording."""
+        if self.archive is not None and self.archive.recording:
+            try:
+                await self.archive.snapshot(self._page, kind)
+            except Exception as exc:
+                logger.debug("%s: snapshot failed: %s", self.driver_name(), exc)
+
+    def _canonical_id(self, url: str) -> str:
+        """Derive the portal's external job ID from a job URL.
+
+        Used as the JD cache key when a job has no external_id. The default
+        takes the last path segment; portals that carry the ID in a query
+        parameter override this.
+        """
+        return url.split("?")[0].rstrip("/").split("/")[-1]
+
     def _stub_jobs(self, config: "SearchConfig") -> list["DiscoveredJob"]:
         """Override in subclasses to return portal-specific stub data."""
         return []
@@ -3,6 +3,11 @@
 Inherits browser lifecycle, stealth, and pagination from BaseBrowserDriver.
 Indeed search works without login, so _check_session() always returns True.
 
+Search cards are read from the ``window.mosaic.providerData`` blob that the
+results page ships (job key, title, company, location, salary snippet and
+publish date for every card) in a single evaluation; the per-card DOM walk
+is only the fallback.
+
 Full JD strategy:
   1. Navigate to viewjob URL
   2. Click "Show more" if the description is truncated
@@ -12,6 +17,7 @@ Selectors are loaded from config/selectors/indeed.yaml.
 """
 
 import logging
+from datetime import UTC, datetime
 from pathlib import Path
 from typing import Any
 
@@ -47,6 +53,8 @@ class IndeedDriver(BaseBrowserDriver):
     richer results and enables Indeed Apply).
     """
 
+    RESULTS_PER_PAGE = 15
+
     def __init__(
         self,
         headless: bool = False,
@@ -72,66 +80,136 @@ class IndeedDriver(BaseBrowserDriver):
         return True  # Indeed search works without login
 
     async def _extract_job_cards(self) -> list[DiscoveredJob]:
+        jobs = await self._extract_mosaic_jobs()
+        if jobs:
+            return jobs
+
         search_sel = self.sel.get("search", {})
         card_sel = search_sel.get("job_cards", "[data-jk]")
         try:
             await self._page.wait_for_selector(card_sel, timeout=8000)
         except Exception:
-            for alt in [".result", ".tapItem", ".jobCard"]:
-                if await self._page.query_selector(alt):
-                    card_sel = alt
-                    break
-
-        cards = await self._page.query_selector_all(card_sel)
-        if not cards:
-            logger.debug("Indeed: no job cards found with '%s'", card_sel)
-            return []
+            logger.debug("Indeed: timeout waiting for job cards with '%s'", card_sel)
+        # Legacy card containers are probed in-page, in the same evaluation
+        card_candidates = [card_sel, ".result", ".tapItem", ".jobCard"]
 
         title_sel = search_sel.get("job_card_title", "h2.jobTitle a, [data-jk] h2 a, .jobTitle a")
         company_sel = search_sel.get("job_card_company", "[data-testid='company-name'], .companyName")
         location_sel = search_sel.get("job_card_location", "[data-testid='text-location'], .companyLocation")
+        salary_sel = search_sel.get(
+            "job_card_salary", ".estimated-salary, [data-testid='attribute_snippet_testid']"
+        )
+
+        rows = await self._extract_cards_js(card_candidates, {
+            "title": (title_sel, "text"),
+            "href": (title_sel, "href"),
+            "company": (company_sel, "text"),
+            "location": (location_sel, "text"),
+            "salary": (salary_sel, "text"),
+        })
+        if not rows:
+            logger.debug("Indeed: no job cards found with '%s'", card_sel)
+            return []
 
         jobs: list[DiscoveredJob] = []
-        for card in cards:
-            try:
-                title_el = await card.query_selector(title_sel)
-                if not title_el:
-                    continue
-
-                title = (await title_el.inner_text()).strip()
-                company_el = await card.query_selector(company_sel)
-                company = (await company_el.inner_text()).strip() if company_el else ""
-                location_el = await card.query_selector(location_sel)
-                location = (await location_el.inner_text()).strip() if location_el else ""
-                salary_el = await card.query_selector(".estimated-salary, [data-testid='attribute_snippet_testid']")
-                salary = (await salary_el.inner_text()).strip() if salary_el else ""
-
-                href = (await title_el.get_attribute("href") or "").strip()
-                external_id = ""
-                if "jk=" in href:
-                    external_id = href.split("jk=")[-1].split("&")[0]
-                    url = f"https://www.indeed.com/viewjob?jk={external_id}"
-                elif href.startswith("/"):
-                    url = "https://www.indeed.com" + href
-                    external_id = href.rstrip("/").split("/")[-1]
-                elif href.startswith("http"):
-                    url = href
-                else:
-                    continue
-
-                if not (title and url):
-                    continue
-
-                jobs.append(DiscoveredJob(
-                    title=title, company=company, url=url,
-                    source="indeed", location=location,
-                    salary_range=salary, external_id=external_id,
-                ))
-            except Exception as exc:
-                logger.debug("Indeed card parse error: %s", exc)
+        for row in rows:
+            job = self._card_to_job(row)
+            if job is not None:
+                jobs.append(job)
+        return jobs
 
+    async def _extract_mosaic_jobs(self) -> list[DiscoveredJob]:
+        """Read every result card from window.mosaic.providerData in one evaluate.
+
+        Only the fields we map are returned from the page, so the (large)
+        provider blob never crosses the CDP boundary.
+        """
+        try:
+            results = await self._page.evaluate(
+                """
+                () => {
+                    const data = window.mosaic && window.mosaic.providerData;
+                    const cards = data && data['mosaic-provider-jobcards'];
+                    const model = cards && cards.metaData && cards.metaData.mosaicProviderJobCardsModel;
+                    if (!model || !Array.isArray(model.results)) return [];
+                    const strip = html => (html || '').replace(/<[^>]*>/g, ' ').replace(/\\s+/g, ' ').trim();
+                    return model.results.map(r => ({
+                        jobkey: r.jobkey || '',
+                        title: r.displayTitle || r.title || '',
+                        company: r.company || r.truncatedCompany || '',
+                        location: r.formattedLocation || '',
+                        salary: (r.salarySnippet && r.salarySnippet.text) || '',
+                        snippet: strip(r.snippet),
+                        pub_date: r.pubDate || r.createDate || 0,
+                    }));
+                }
+                """
+            )
+        except Exception as exc:
+            logger.debug("Indeed: mosaic provider data unavailable: %s", exc)
+            return []
+
+        jobs = [j for j in map(self._mosaic_to_job, results or []) if j is not None]
+        if jobs:
+            logger.debug("Indeed: %d cards from mosaic provider data", len(jobs))
         return jobs
 
+    @staticmethod
+    def _mosaic_to_job(result: dict[str, Any]) -> DiscoveredJob | None:
+        """Map one mosaic job-card result to a DiscoveredJob."""
+        if not isinstance(result, dict):
+            return None
+        jk = result.get("jobkey", "")
+        title = result.get("title", "")
+        if not (jk and title):
+            return None
+
+        metadata: dict[str, Any] = {}
+        if result.get("snippet"):
+            metadata["snippet"] = result["snippet"]
+        pub_ms = result.get("pub_date")
+        if isinstance(pub_ms, (int, float)) and pub_ms > 0:
+            metadata["posted_at"] = datetime.fromtimestamp(pub_ms / 1000, UTC)
+
+        return DiscoveredJob(
+            title=title, company=result.get("company", ""),
+            url=f"https://www.indeed.com/viewjob?jk={jk}",
+            source="indeed", location=result.get("location", ""),
+            salary_range=result.get("salary", ""), external_id=jk,
+            metadata=metadata,
+        )
+
+    @staticmethod
+    def _card_to_job(row: dict[str, str]) -> DiscoveredJob | None:
+        """Map one raw card dict from _extract_cards_js to a DiscoveredJob."""
+        title = row.get("title", "")
+        href = row.get("href", "")
+        external_id = ""
+        if "jk=" in href:
+            external_id = href.split("jk=")[-1].split("&")[0]
+            url = f"https://www.indeed.com/viewjob?jk={external_id}"
+        elif href.startswith("/"):
+            url = "https://www.indeed.com" + href
+            external_id = href.rstrip("/").split("/")[-1]
+        elif href.startswith("http"):
+            url = href
+        else:
+            return None
+
+        if not (title and url):
+            return None
+
+        return DiscoveredJob(
+            title=title, company=row.get("company", ""), url=url,
+            source="indeed", location=row.get("location", ""),
+            salary_range=row.get("salary", ""), external_id=external_id,
+        )
+
+    def _canonical_id(self, url: str) -> str:
+        if "jk=" in url:
+            return url.split("jk=")[-1].split("&")[0]
+        return super()._canonical_id(url)
+
     async def _has_next_page(self) -> bool:
         sel = self.sel.get("search", {}).get(
             "next_page_button", "[data-testid='pagination-page-next'], a[aria-label='Next Page']"
@@ -235,7 +313,7 @@ class IndeedDriver(BaseBrowserDriver):
             from src.automation.captcha_handler import CaptchaHandler
             detection = await CaptchaHandler().detect_on_page(self._page)
             if detection.detected:
-                return {"status": "captcha", "message": detection.message, "job_url": job.url}
+                return await self._park_captcha(job, detection)
 
             apply_sel = self.sel.get("job_detail", {}).get("apply_button", "#indeedApplyButton")
             if not await self._page.query_selector(apply_sel):
@@ -250,7 +328,7 @@ class IndeedDriver(BaseBrowserDriver):
         except Exception as exc:
             return {"status": "failed", "message": str(exc), "job_url": job.url}
         finally:
-            await self._close_browser()
+            await self._release_browser()
 
     async def _fill_apply_form(self, resume_path: str, answers: dict) -> dict:
         form_sel = self.sel.get("apply_form", {})
@@ -271,24 +349,14 @@ class IndeedDriver(BaseBrowserDriver):
             await file_input.set_input_files(resume_path)
             await self.sim.random_pause(1.0, 2.0)
 
-        field_map = {
-            form_sel.get("name_input", "input[name='applicant.name']"): answers.get("name", ""),
-            form_sel.get("email_input", "input[type='email']"): answers.get("email", ""),
-            form_sel.get("phone_input", "input[type='tel']"): answers.get("phone", ""),
-        }
-        for sel, value in field_map.items():
-            if value and sel:
-                try:
-                    inp = await frame.query_selector(sel)
-                    if inp:
-                        await inp.fill(value)
-                        await self.sim.random_pause(0.2, 0.5)
-                except Exception:
-                    pass
-
         submit_sel = form_sel.get("submit_button", "button[type='submit']")
         continue_sel = form_sel.get("continue_button", "button[type='button'][id*='continue']")
         for _ in range(10):
+            # Contact fields and screening questions: one introspection pass per step
+            try:
+                await self._fill_form_step(frame, answers)
+            except Exception as exc:
+                logger.debug("Indeed: form step fill failed: %s", exc)
             await self.sim.random_pause(delay, delay + 0.5)
             if await frame.query_selector(submit_sel):
                 await frame.click(submit_sel)
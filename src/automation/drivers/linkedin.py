@@ -4,7 +4,10 @@ Inherits browser lifecycle, stealth, and pagination from BaseBrowserDriver.
 This file contains only LinkedIn-specific logic:
   - URL construction
   - Job card extraction (uses data-job-id + ARIA selectors)
-  - Full JD extraction (clicks "Show more", then JS innerText on #job-details)
+  - JSON-first job data: Voyager API responses and the payloads embedded in
+    <code> blocks carry title, company, location, listing date and the full
+    description, so most JDs need no "Show more" click (or no visit at all)
+  - Full JD extraction fallback (clicks "Show more", then JS innerText on #job-details)
   - Session check
   - Easy Apply automation
 
@@ -12,7 +15,10 @@ Selectors are loaded from config/selectors/linkedin.yaml so DOM changes
 can be patched without touching Python code.
 """
 
+import json
 import logging
+import re
+from datetime import UTC, datetime
 from pathlib import Path
 from typing import Any
 
@@ -40,6 +46,92 @@ def _load_selectors() -> dict[str, Any]:
     return {}
 
 
+# ── Voyager JSON parsing ──────────────────────────────────────────────────────
+
+# urn:li:fsd_jobPosting:123, urn:li:fsd_jobPostingCard:(123,JOBS_SEARCH),
+# urn:li:fs_normalized_jobPosting:123, urn:li:fsd_jobDescription:123 …
+_JOB_URN_RE = re.compile(r"urn:li:\w*job(?:Posting|Description)\w*:\(?(\d+)")
+
+# Job entities kept from JSON payloads (oldest dropped beyond this)
+_MAX_JSON_ENTITIES = 500
+
+# Shorter JSON descriptions are card snippets, not the full JD
+_MIN_JSON_DESCRIPTION = 50
+
+
+def _text(value: Any) -> str:
+    """Voyager text fields are either plain strings or {"text": "..."}."""
+    if isinstance(value, dict):
+        value = value.get("text", "")
+    return value.strip() if isinstance(value, str) else ""
+
+
+def _find_key(obj: Any, key: str, depth: int = 4) -> str:
+    """First non-empty string stored under ``key`` within a nested dict."""
+    if depth < 0 or not isinstance(obj, dict):
+        return ""
+    if isinstance(obj.get(key), str) and obj[key].strip():
+        return obj[key].strip()
+    for value in obj.values():
+        found = _find_key(value, key, depth - 1)
+        if found:
+            return found
+    return ""
+
+
+def parse_voyager_payload(payload: Any) -> dict[str, dict[str, Any]]:
+    """Extract job fields from a Voyager API response or embedded payload.
+
+    Both the normalized ``{"data": …, "included": [...]}`` responses and the
+    server-rendered ``<code>`` payloads are walked recursively; every entity
+    whose URN names a job posting contributes its fields.
+
+    Returns:
+        Map of LinkedIn job ID → dict with any of title, company, location,
+        description and posted_at (aware datetime).
+    """
+    jobs: dict[str, dict[str, Any]] = {}
+    stack = [payload]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, list):
+            stack.extend(reversed(node))
+            continue
+        if not isinstance(node, dict):
+            continue
+        stack.extend(v for v in reversed(node.values()) if isinstance(v, (dict, list)))
+
+        urn = node.get("entityUrn") or node.get("jobPostingUrn") or node.get("*jobPosting")
+        match = _JOB_URN_RE.search(urn) if isinstance(urn, str) else None
+        if not match:
+            continue
+
+        is_card = "jobPostingCard" in urn or str(node.get("$type", "")).endswith("JobPostingCard")
+        fields = {
+            "title": _text(node.get("title")) or _text(node.get("jobPostingTitle")),
+            "company": (
+                _text(node.get("companyName"))
+                or _find_key(node.get("companyDetails"), "companyName")
+                or _find_key(node.get("companyDetails"), "name")
+                or (_text(node.get("primaryDescription")) if is_card else "")
+            ),
+            "location": (
+                _text(node.get("formattedLocation"))
+                or (_text(node.get("secondaryDescription")) if is_card else "")
+            ),
+            "description": _text(node.get("description")) or _text(node.get("descriptionText")),
+        }
+        listed_ms = node.get("listedAt") or node.get("originalListedAt")
+        if isinstance(listed_ms, (int, float)) and listed_ms > 0:
+            fields["posted_at"] = datetime.fromtimestamp(listed_ms / 1000, UTC)
+
+        entry = jobs.setdefault(match.group(1), {})
+        for key, value in fields.items():
+            if value and not entry.get(key):
+                entry[key] = value
+    return jobs
+
+
 class LinkedInDriver(BaseBrowserDriver):
     """LinkedIn job search and Easy Apply driver.
 
@@ -51,9 +143,11 @@ class LinkedInDriver(BaseBrowserDriver):
       • Persistent Chrome profile (carries cookies / session state)
 
     Full job description strategy:
-      1. Navigate to job detail page
-      2. Click "Show more" button (expands CSS-truncated description)
-      3. Extract via JS `innerText` on `#job-details` (respects visibility after expand)
+      1. Use the description from Voyager JSON (captured XHR or embedded <code>)
+         when present — search results then need no JD visit at all
+      2. Otherwise navigate to the job detail page
+      3. Click "Show more" button (expands CSS-truncated description)
+      4. Extract via JS `innerText` on `#job-details` (respects visibility after expand)
     """
 
     def __init__(
@@ -63,6 +157,12 @@ class LinkedInDriver(BaseBrowserDriver):
     ):
         super().__init__(headless=headless, user_data_dir=user_data_dir)
         self.sel = _load_selectors()
+        # Job ID → fields parsed from Voyager JSON (see parse_voyager_payload)
+        self._json_jobs: dict[str, dict[str, Any]] = {}
+        # IDs first seen in JSON since the last results page was extracted
+        self._json_pending: list[str] = []
+        # Embedded <code> payloads only change on a full document load
+        self._embedded_stale = False
 
     # ── Required abstract implementations ────────────────────────────────────
 
@@ -105,6 +205,10 @@ class LinkedInDriver(BaseBrowserDriver):
           1. [data-job-id]           — LinkedIn's own data attribute (very stable)
           2. aria-label on title link — semantic, doesn't depend on class names
           3. <strong> inside title link — text fallback
+
+        Cards are enriched from Voyager JSON (description, listing date). If
+        the card selectors match nothing, the jobs that arrived as JSON since
+        the previous page are used instead.
         """
         search_sel = self.sel.get("search", {})
         card_sel = search_sel.get("job_cards", "[data-job-id]")
@@ -114,15 +218,6 @@ class LinkedInDriver(BaseBrowserDriver):
         except Exception:
             logger.debug("LinkedIn: timeout waiting for job cards with '%s'", card_sel)
 
-        cards = await self._page.query_selector_all(card_sel)
-        if not cards:
-            # Check if we've been redirected to a login page
-            if await self._page.query_selector("input#username, .login__form"):
-                logger.error("LinkedIn: redirected to login — session expired")
-            else:
-                logger.debug("LinkedIn: no cards found with '%s'", card_sel)
-            return []
-
         link_sel = search_sel.get("job_card_link", "a.job-card-list__title--link")
         company_sel = search_sel.get(
             "job_card_company", ".artdeco-entity-lockup__subtitle span"
@@ -133,54 +228,69 @@ class LinkedInDriver(BaseBrowserDriver):
             ".job-card-container__metadata-wrapper li:first-child span",
         )
 
+        await self._absorb_json_sources()
+        rows = await self._extract_cards_js(card_sel, {
+            "title_aria": (link_sel, "aria-label"),
+            "title_strong": ("strong", "text"),
+            "link_text": (link_sel, "text"),
+            "href": (link_sel, "href"),
+            "company": (company_sel, "text"),
+            "location": (location_sel, "text"),
+        })
+        pending, self._json_pending = self._json_pending, []
+        if not rows:
+            json_jobs = [j for j in map(self._json_to_job, pending) if j is not None]
+            if json_jobs:
+                logger.info("LinkedIn: no DOM cards — using %d jobs from JSON", len(json_jobs))
+                return json_jobs
+            # Check if we've been redirected to a login page
+            if await self._page.query_selector("input#username, .login__form"):
+                logger.error("LinkedIn: redirected to login — session expired")
+            else:
+                logger.debug("LinkedIn: no cards found with '%s'", card_sel)
+            return []
+
         jobs: list[DiscoveredJob] = []
-        for i, card in enumerate(cards):
-            try:
-                link_el = await card.query_selector(link_sel)
-                if not link_el:
-                    continue
-
-                # Prefer aria-label (stable semantic attribute), fall back to text
-                title = (await link_el.get_attribute("aria-label") or "").strip()
-                if len(title) < 3:
-                    strong = await card.query_selector("strong")
-                    title = (
-                        (await strong.inner_text()).strip()
-                        if strong
-                        else (await link_el.inner_text()).strip()
-                    )
-
-                company_el = await card.query_selector(company_sel)
-                company = (await company_el.inner_text()).strip() if company_el else ""
-
-                loc_el = await card.query_selector(location_sel)
-                location = (await loc_el.inner_text()).strip() if loc_el else ""
-
-                url = (await link_el.get_attribute("href") or "").strip()
-                if not (title and company and url):
-                    logger.debug("LinkedIn card %d: incomplete (t=%s c=%s u=%s)", i, bool(title), bool(company), bool(url))
-                    continue
-
-                if url.startswith("/"):
-                    url = "https://www.linkedin.com" + url
-                url = url.split("?")[0]
-                external_id = url.rstrip("/").split("/")[-1]
-
-                jobs.append(
-                    DiscoveredJob(
-                        title=title,
-                        company=company,
-                        url=url,
-                        source="linkedin",
-                        location=location,
-                        external_id=external_id,
-                    )
-                )
-            except Exception as exc:
-                logger.debug("LinkedIn card %d parse error: %s", i, exc)
+        for i, row in enumerate(rows):
+            job = self._card_to_job(row)
+            if job is None:
+                logger.debug("LinkedIn card %d: incomplete %s", i, row)
+                continue
+            self._enrich_from_json(job)
+            jobs.append(job)
 
         return jobs
 
+    @staticmethod
+    def _card_to_job(row: dict[str, str]) -> DiscoveredJob | None:
+        """Map one raw card dict from _extract_cards_js to a DiscoveredJob."""
+        url = row.get("href", "")
+        if not url:
+            return None
+
+        # Prefer aria-label (stable semantic attribute), fall back to text
+        title = row.get("title_aria", "")
+        if len(title) < 3:
+            title = row.get("title_strong") or row.get("link_text", "")
+
+        company = row.get("company", "")
+        if not (title and company):
+            return None
+
+        if url.startswith("/"):
+            url = "https://www.linkedin.com" + url
+        url = url.split("?")[0]
+        external_id = url.rstrip("/").split("/")[-1]
+
+        return DiscoveredJob(
+            title=title,
+            company=company,
+            url=url,
+            source="linkedin",
+            location=row.get("location", ""),
+            external_id=external_id,
+        )
+
     async def _has_next_page(self) -> bool:
         sel = self.sel.get("search", {}).get(
             "next_page_button", "button[aria-label='View next page']"
@@ -198,12 +308,18 @@ class LinkedInDriver(BaseBrowserDriver):
             pass
 
     async def _get_full_jd_text(self) -> str:
-        """Expand the job description (Show more) then extract via JS innerText.
+        """Return the JD from Voyager JSON, else expand (Show more) and read innerText.
 
         Using `innerText` (not `textContent`) means we only get text that is
         visually rendered — which requires clicking "Show more" first so the
-        previously hidden paragraphs are visible.
+        previously hidden paragraphs are visible. The JSON description is
+        complete without any click.
         """
+        await self._absorb_json_sources()
+        entry = self._json_jobs.get(self._canonical_id(self._page.url), {})
+        if len(entry.get("description", "")) > _MIN_JSON_DESCRIPTION:
+            return entry["description"]
+
         # Attempt to click the "Show more" / expand button
         for show_sel in [
             ".jobs-description__footer-button button",
@@ -242,6 +358,84 @@ class LinkedInDriver(BaseBrowserDriver):
         )
         return (text or "").strip()
 
+    # ── Voyager JSON ──────────────────────────────────────────────────────────
+
+    def _on_response(self, response) -> None:
+        """Also note full document loads (their <code> payloads are new)."""
+        super()._on_response(response)
+        try:
+            if response.request.resource_type == "document":
+                self._embedded_stale = True
+        except Exception:
+            pass
+
+    async def _absorb_json_sources(self) -> None:
+        """Fold captured Voyager responses and embedded payloads into _json_jobs."""
+        for captured in await self.captured("voyager", timeout=0):
+            self._absorb_json(captured.body)
+        await self._absorb_embedded_json()
+
+    async def _absorb_embedded_json(self) -> None:
+        """Parse the <code> payloads of a freshly loaded document (one evaluate)."""
+        if not self._embedded_stale:
+            return
+        self._embedded_stale = False
+        try:
+            blocks = await self._page.evaluate(
+                """
+                () => Array.from(document.querySelectorAll('code'))
+                    .map(el => el.textContent.trim())
+                    .filter(t => t.startsWith('{') && t.includes('urn:li:'))
+                """
+            )
+        except Exception as exc:
+            logger.debug("LinkedIn: embedded JSON read failed: %s", exc)
+            return
+        for block in blocks or []:
+            try:
+                self._absorb_json(json.loads(block))
+            except ValueError:
+                continue
+
+    def _absorb_json(self, payload: Any) -> None:
+        for job_id, fields in parse_voyager_payload(payload).items():
+            entry = self._json_jobs.pop(job_id, None)
+            if entry is None:
+                entry = {}
+                self._json_pending.append(job_id)
+            entry.update({k: v for k, v in fields.items() if v})
+            self._json_jobs[job_id] = entry  # re-insert as most recent
+        while len(self._json_jobs) > _MAX_JSON_ENTITIES:
+            del self._json_jobs[next(iter(self._json_jobs))]
+
+    def _json_to_job(self, job_id: str) -> DiscoveredJob | None:
+        entry = self._json_jobs.get(job_id, {})
+        if not (entry.get("title") and entry.get("company")):
+            return None
+        job = DiscoveredJob(
+            title=entry["title"],
+            company=entry["company"],
+            url=f"https://www.linkedin.com/jobs/view/{job_id}/",
+            source="linkedin",
+            location=entry.get("location", ""),
+            external_id=job_id,
+        )
+        self._enrich_from_json(job)
+        return job
+
+    def _enrich_from_json(self, job: DiscoveredJob) -> None:
+        """Copy the full description, location and listing date from captured JSON."""
+        entry = self._json_jobs.get(job.external_id)
+        if not entry:
+            return
+        description = entry.get("description", "")
+        if not job.description_text and len(description) > _MIN_JSON_DESCRIPTION:
+            job.description_text = description
+        if not job.location:
+            job.location = entry.get("location", "")
+        if entry.get("posted_at"):
+            job.metadata["posted_at"] = entry["posted_at"]
+
     # ── Stub data ─────────────────────────────────────────────────────────────
 
     def _stub_jobs(self, config: SearchConfig) -> list[DiscoveredJob]:
@@ -296,7 +490,7 @@ class LinkedInDriver(BaseBrowserDriver):
             from src.automation.captcha_handler import CaptchaHandler
             detection = await CaptchaHandler().detect_on_page(self._page)
             if detection.detected:
-                return {"status": "captcha", "message": detection.message, "job_url": job.url}
+                return await self._park_captcha(job, detection)
 
             easy_apply_sel = (
                 ".jobs-apply-button--top-card button, button.jobs-apply-button"
@@ -318,7 +512,7 @@ class LinkedInDriver(BaseBrowserDriver):
         except Exception as exc:
             return {"status": "failed", "message": str(exc), "job_url": job.url}
         finally:
-            await self._close_browser()
+            await self._release_browser()
 
     async def _fill_easy_apply(self, resume_path: str, answers: dict) -> dict:
         modal = self.sel.get("easy_apply", {})
@@ -336,6 +530,14 @@ class LinkedInDriver(BaseBrowserDriver):
                 await file_input.set_input_files(resume_path)
                 await self.sim.random_pause(0.8, 1.5)
 
+            # Fill this step's questions (one introspection pass, one LLM batch)
+            try:
+                await self._fill_form_step(
+                    self._page, answers, root_sel=modal.get("modal", ".jobs-easy-apply-modal")
+                )
+            except Exception as exc:
+                logger.debug("LinkedIn: Easy Apply step fill failed: %s", exc)
+
             # Submit
             submit_sel = modal.get(
                 "submit_button", "button[aria-label='Submit application']"
@@ -6,6 +6,13 @@ Naukri search works without login (login gives richer results and enables Apply)
 URL pattern:
     https://www.naukri.com/{keywords}-jobs-in-{location}?jobAge=7
 
+Search results strategy:
+    The results page is rendered from Naukri's internal JSON search API
+    (/jobapi/v3/search?...&pageNo=N). Its responses are captured as the page
+    loads and mapped to DiscoveredJob directly; pagination then follows the
+    API page number (/{keywords}-jobs-in-{location}-{N}) rather than clicking
+    the next button. The DOM card walk remains as the fallback.
+
 Full JD strategy:
     Most Naukri job pages load the full description immediately; no "Show more"
     button to worry about. We use JS innerText on the JD container element.
@@ -18,6 +25,8 @@ NOTE: Naukri's DOM is less stable than LinkedIn's data-job-id approach.
 """
 
 import logging
+import re
+from datetime import UTC, datetime
 from pathlib import Path
 from typing import Any
 
@@ -47,6 +56,8 @@ class NaukriDriver(BaseBrowserDriver):
     Delhi NCR, Mumbai) this portal is often richer than LinkedIn/Indeed.
     """
 
+    RESULTS_PER_PAGE = 20
+
     def __init__(
         self,
         headless: bool = False,
@@ -54,6 +65,9 @@ class NaukriDriver(BaseBrowserDriver):
     ):
         super().__init__(headless=headless, user_data_dir=user_data_dir)
         self.sel = _load_selectors()
+        self._search_url = ""
+        # page_no, page_size, total of the last page read from the search API
+        self._api_page: dict[str, int] = {}
 
     # ── Abstract implementations ──────────────────────────────────────────────
 
@@ -74,7 +88,8 @@ class NaukriDriver(BaseBrowserDriver):
             exp_map = {"entry": "0", "mid": "3", "senior": "6"}
             if exp := exp_map.get(config.experience_level):
                 params.append(f"experience={exp}")
-        return f"https://www.naukri.com/{kw}-jobs-in-{loc}?" + "&".join(params)
+        self._search_url = f"https://www.naukri.com/{kw}-jobs-in-{loc}?" + "&".join(params)
+        return self._search_url
 
     async def _check_session(self) -> bool:
         """Navigate to Naukri homepage; check for logged-in user indicator.
@@ -95,11 +110,28 @@ class NaukriDriver(BaseBrowserDriver):
         return True  # Search works without authentication
 
     async def _extract_job_cards(self) -> list[DiscoveredJob]:
+        """Build jobs from the captured search API response, else parse the DOM."""
+        # Wait only if the page's API response is still being read
+        captured = [
+            c for c in await self.captured("jobs-search", in_flight_only=True)
+            if isinstance(c.body, dict) and "jobDetails" in c.body
+        ]
+        if captured:
+            latest = captured[-1]  # the latest request reflects the page shown
+            jobs = self._api_to_jobs(latest.url, latest.body)
+            if jobs:
+                logger.debug("Naukri: %d jobs from search API (page %d)",
+                             len(jobs), self._api_page.get("page_no", 0))
+                return jobs
+        self._api_page = {}
+        return await self._extract_dom_cards()
+
+    async def _extract_dom_cards(self) -> list[DiscoveredJob]:
         """Parse job cards using multiple fallback selectors.
 
         Naukri has changed its card class names across product iterations.
-        We try a priority list until we find cards, then use JS attribute
-        reads for inner fields (more stable than class-based selectors).
+        The priority list of card containers and every inner field are read
+        in a single in-page evaluation (see _extract_cards_js).
         """
         search_sel = self.sel.get("search", {})
 
@@ -111,95 +143,88 @@ class NaukriDriver(BaseBrowserDriver):
             "[class*='job-tuple']",
             ".list.left-list article",
         ]
-        card_sel = ""
-        cards = []
-        for candidate in card_candidates:
-            if not candidate:
-                continue
-            found = await self._page.query_selector_all(candidate)
-            if found:
-                card_sel = candidate
-                cards = found
-                break
 
-        if not cards:
+        title_sel = search_sel.get("job_card_title", ".title a, a.title, [class*='title'] a")
+        company_sel = search_sel.get(
+            "job_card_company", ".subTitle a, a.subTitle, [class*='company'] a, .comp-name"
+        )
+        location_sel = search_sel.get(
+            "job_card_location",
+            ".location span, [class*='location'] span, li.location, .loc-name",
+        )
+        salary_sel = search_sel.get("job_card_salary", ".salary, [class*='salary'], .sal-wrap")
+        fields = {
+            "title": (title_sel, "text"),
+            "href": (title_sel, "href"),
+            "company": (company_sel, "text"),
+            "location": (location_sel, "text"),
+            "salary": (salary_sel, "text"),
+        }
+
+        rows = await self._extract_cards_js(card_candidates, fields)
+        if not rows:
             try:
                 await self._page.wait_for_selector(
                     "article.jobTuple, .cust-job-tuple, [class*='job-tuple']",
                     timeout=8000,
                 )
-                for candidate in card_candidates[1:]:
-                    cards = await self._page.query_selector_all(candidate)
-                    if cards:
-                        break
+                rows = await self._extract_cards_js(card_candidates[1:], fields)
             except Exception:
                 pass
 
-        if not cards:
+        if not rows:
             logger.debug("Naukri: no job cards found")
             return []
 
-        logger.debug("Naukri: %d cards with '%s'", len(cards), card_sel)
-
-        title_sel = search_sel.get("job_card_title", ".title a, a.title, [class*='title'] a")
-        company_sel = search_sel.get(
-            "job_card_company", ".subTitle a, a.subTitle, [class*='company'] a, .comp-name"
-        )
-        location_sel = search_sel.get(
-            "job_card_location",
-            ".location span, [class*='location'] span, li.location, .loc-name",
-        )
+        logger.debug("Naukri: %d cards", len(rows))
 
         jobs: list[DiscoveredJob] = []
-        for card in cards:
-            try:
-                title_el = await card.query_selector(title_sel)
-                if not title_el:
-                    continue
-
-                title = (await title_el.inner_text()).strip()
-                url = (await title_el.get_attribute("href") or "").strip()
-
-                company_el = await card.query_selector(company_sel)
-                company = (await company_el.inner_text()).strip() if company_el else ""
-
-                location_el = await card.query_selector(location_sel)
-                location = (await location_el.inner_text()).strip() if location_el else ""
-
-                salary_el = await card.query_selector(
-                    ".salary, [class*='salary'], .sal-wrap"
-                )
-                salary = (await salary_el.inner_text()).strip() if salary_el else ""
-
-                if not (title and url):
-                    continue
-                if not url.startswith("http"):
-                    url = "https://www.naukri.com" + url
-
-                jobs.append(
-                    DiscoveredJob(
-                        title=title,
-                        company=company,
-                        url=url,
-                        source="naukri",
-                        location=location,
-                        salary_range=salary,
-                        external_id=url.rstrip("/").split("/")[-1],
-                    )
-                )
-            except Exception as exc:
-                logger.debug("Naukri card parse error: %s", exc)
-
+        for row in rows:
+            job = self._card_to_job(row)
+            if job is not None:
+                jobs.append(job)
         return jobs
 
+    @staticmethod
+    def _card_to_job(row: dict[str, str]) -> DiscoveredJob | None:
+        """Map one raw card dict from _extract_cards_js to a DiscoveredJob."""
+        title = row.get("title", "")
+        url = row.get("href", "")
+        if not (title and url):
+            return None
+        if not url.startswith("http"):
+            url = "https://www.naukri.com" + url
+
+        return DiscoveredJob(
+            title=title,
+            company=row.get("company", ""),
+            url=url,
+            source="naukri",
+            location=row.get("location", ""),
+            salary_range=row.get("salary", ""),
+            external_id=url.rstrip("/").split("/")[-1],
+        )
+
     async def _has_next_page(self) -> bool:
+        if self._api_page:
+            page = self._api_page
+            return page["page_no"] * page["page_size"] < page["total"]
         sel = self.sel.get("search", {}).get(
             "next_page_button", "a.fright.fs14.btn-secondary, a[class*='next']"
         )
         return await self._page.query_selector(sel) is not None
 
     async def _goto_next_page(self) -> None:
-        """Navigate to next page — prefer href navigation over click (more reliable)."""
+        """Navigate to next page — prefer href navigation over click (more reliable).
+
+        When the last page came from the search API, the next page number is
+        loaded directly; the page's own API request is then captured again.
+        """
+        if self._api_page and self._search_url:
+            url = self._page_url(self._api_page["page_no"] + 1)
+            await self._page.goto(url, wait_until="domcontentloaded", timeout=30000)
+            return
+        self.capture.reset("jobs-search")
         for sel in [
             self.sel.get("search", {}).get("next_page_button", ""),
             "a.fright.fs14.btn-secondary",
@@ -255,6 +280,68 @@ class NaukriDriver(BaseBrowserDriver):
         )
         return (text or "").strip()
 
+    # ── Search API ────────────────────────────────────────────────────────────
+
+    def _page_url(self, page_no: int) -> str:
+        """Results URL for a page number: /python-jobs-in-pune-3?jobAge=7.
+
+        Built from the page-1 URL of _get_search_url(), never from the current
+        page, so a slug that itself ends in a number (``-in-sector-62``) is
+        left intact.
+        """
+        path, _, query = self._search_url.partition("?")
+        if page_no > 1:
+            path = f"{path}-{page_no}"
+        return f"{path}?{query}" if query else path
+
+    def _api_to_jobs(self, api_url: str, payload: dict[str, Any]) -> list[DiscoveredJob]:
+        """Map a search API response to jobs and remember its paging state."""
+        details = payload.get("jobDetails") or []
+        try:
+            page_no = int(re.search(r"pageNo=(\d+)", api_url).group(1))
+        except AttributeError:
+            page_no = self._api_page.get("page_no", 0) + 1
+        self._api_page = {
+            "page_no": page_no,
+            "page_size": max(len(details), 1),
+            "total": int(payload.get("noOfJobs") or 0),
+        }
+        return [j for j in map(self._api_job_to_job, details) if j is not None]
+
+    @staticmethod
+    def _api_job_to_job(detail: dict[str, Any]) -> DiscoveredJob | None:
+        """Map one ``jobDetails`` entry of the search API to a DiscoveredJob."""
+        title = detail.get("title", "")
+        url = detail.get("jdURL", "")
+        if not (title and url):
+            return None
+        if not url.startswith("http"):
+            url = "https://www.naukri.com" + url
+
+        labels = {
+            p.get("type"): p.get("label", "")
+            for p in detail.get("placeholders") or []
+            if isinstance(p, dict)
+        }
+        metadata: dict[str, Any] = {"naukri_job_id": str(detail.get("jobId", ""))}
+        if labels.get("experience"):
+            metadata["experience"] = labels["experience"]
+        created_ms = detail.get("createdDate")
+        if isinstance(created_ms, (int, float)) and created_ms > 0:
+            metadata["posted_at"] = datetime.fromtimestamp(created_ms / 1000, UTC)
+
+        return DiscoveredJob(
+            title=title,
+            company=detail.get("companyName", ""),
+            url=url,
+            source="naukri",
+            location=labels.get("location", ""),
+            salary_range=labels.get("salary", ""),
+            # Same ID scheme as DOM cards so JD cache / incremental keys match
+            external_id=url.split("?")[0].rstrip("/").split("/")[-1],
+            metadata=metadata,
+        )
+
     # ── Stub data ─────────────────────────────────────────────────────────────
 
     def _stub_jobs(self, config: SearchConfig) -> list[DiscoveredJob]:
@@ -0,0 +1,283 @@
+"""Single-pass application form introspection and filling.
+
+The apply flows used to probe a fixed list of selectors one query at a
+time and had no way to see the screening questions a step actually asks.
+introspect_form() reads every visible field of a form step — label, type,
+options, required flag and current value — in one page.evaluate, tagging
+each element with a ``data-ja-field`` attribute so it can be filled later
+by a stable selector without another lookup.
+
+fill_form() then resolves answers for all empty fields (static profile
+answers where a field's whole label is a known key and the value fits its
+options, then one QuestionAnswerer.aanswer_batch call for the rest) and
+fills them in a tight loop.
+"""
+
+import logging
+import re
+from dataclasses import dataclass, field
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+FIELD_ATTR = "data-ja-field"
+
+# Answers that tick a lone checkbox
+_CHECKBOX_YES = ("yes", "true", "agree")
+
+_INTROSPECT_JS = """
+([root_sel, attr]) => {
+    let root = null;
+    try { root = root_sel ? document.querySelector(root_sel) : null; } catch (e) { root = null; }
+    root = root || document.body;
+    const skip = new Set(['hidden', 'submit', 'button', 'image', 'reset', 'file', 'search']);
+    const visible = el => !!(el.offsetParent || el.getClientRects().length);
+    const clean = t => (t || '').replace(/\\s+/g, ' ').replace(/\\*$/, '').trim();
+    const labelOf = el => {
+        if (el.id) {
+            const lab = root.querySelector(`label[for="${CSS.escape(el.id)}"]`);
+            if (lab && clean(lab.innerText)) return clean(lab.innerText);
+        }
+        const by = el.getAttribute('aria-labelledby');
+        if (by) {
+            const text = by.split(/\\s+/).map(id => {
+                const ref = document.getElementById(id);
+                return ref ? ref.innerText : '';
+            }).join(' ');
+            if (clean(text)) return clean(text);
+        }
+        if (el.getAttribute('aria-label')) return clean(el.getAttribute('aria-label'));
+        const wrap = el.closest('label');
+        if (wrap && clean(wrap.innerText)) return clean(wrap.innerText);
+        return clean(el.getAttribute('placeholder') || el.name || '');
+    };
+
+    const fields = [];
+    const groups = {};
+    let n = 0;
+    for (const el of root.querySelectorAll('input, textarea, select')) {
+        const type = el.tagName === 'INPUT' ? (el.type || 'text').toLowerCase() : el.tagName.toLowerCase();
+        if (skip.has(type) || el.disabled || el.readOnly) continue;
+        if (!visible(el) && !(type === 'radio' || type === 'checkbox')) continue;
+
+        if (type === 'radio' || (type === 'checkbox' && el.name && root.querySelectorAll(
+                `input[type="checkbox"][name="${CSS.escape(el.name)}"]`).length > 1)) {
+            const key = type + ':' + el.name;
+            let group = groups[key];
+            if (!group) {
+                const legend = el.closest('fieldset') && el.closest('fieldset').querySelector('legend');
+                group = groups[key] = {
+                    key: String(n++), label: clean(legend ? legend.innerText : el.name),
+                    kind: type, options: [], option_keys: [], required: el.required, value: '',
+                };
+                fields.push(group);
+            }
+            const optKey = group.key + '-' + group.options.length;
+            el.setAttribute(attr, optKey);
+            group.options.push(labelOf(el));
+            group.option_keys.push(optKey);
+            group.required = group.required || el.required;
+            if (el.checked) group.value = labelOf(el);
+            continue;
+        }
+
+        const key = String(n++);
+        el.setAttribute(attr, key);
+        let options = [];
+        let value = type === 'checkbox' ? (el.checked ? 'Yes' : '') : (el.value || '');
+        if (type === 'select') {
+            options = Array.from(el.options).map(o => clean(o.text)).filter(t => t && !/^select/i.test(t));
+            const chosen = el.selectedIndex >= 0 ? clean(el.options[el.selectedIndex].text) : '';
+            value = el.value && !/^select/i.test(chosen) ? chosen : '';
+        }
+        fields.push({
+            key, label: labelOf(el), kind: type, options, option_keys: [],
+            required: el.required || el.getAttribute('aria-required') === 'true', value,
+        });
+    }
+    return fields;
+}
+"""
+
+
+@dataclass
+class FormField:
+    """One visible question/field of an application form step."""
+    key: str
+    label: str
+    kind: str                     # text, email, tel, number, textarea, select, radio, checkbox …
+    options: list[str] = field(default_factory=list)
+    option_keys: list[str] = field(default_factory=list)
+    required: bool = False
+    value: str = ""
+
+    @property
+    def selector(self) -> str:
+        return f'[{FIELD_ATTR}="{self.key}"]'
+
+    def option_selector(self, index: int) -> str:
+        return f'[{FIELD_ATTR}="{self.option_keys[index]}"]'
+
+
+async def introspect_form(frame, root_sel: str = "") -> list[FormField]:
+    """Collect every visible field under ``root_sel`` in one page.evaluate."""
+    rows = await frame.evaluate(_INTROSPECT_JS, [root_sel, FIELD_ATTR])
+    return [FormField(**row) for row in rows or []]
+
+
+# Words a plain field label may add around an answers-dict key ("Your
+# email address", "LinkedIn profile URL"). Any other word makes the label
+# a different question ("Company name", "Willing to relocate to this
+# location?"), which goes to the answerer instead.
+_LABEL_FILLER = frozenset({
+    "a", "address", "an", "contact", "enter", "id", "is", "link", "mobile",
+    "no", "number", "optional", "phone", "please", "profile", "the", "total",
+    "url", "what", "your",
+})
+
+
+def match_known_answer(label: str, answers: dict[str, str]) -> str:
+    """Answer from a static answers dict whose key is the whole label.
+
+    The key must appear as whole words, and every other word of the label
+    must be filler (_LABEL_FILLER). The longest matching key wins, so
+    "First name" picks "first name" over "name".
+    """
+    words = re.findall(r"[a-z0-9+#]+", label.lower())
+    best = ""
+    for key, value in answers.items():
+        if not value or len(key) <= len(best):
+            continue
+        key_words = key.split()
+        for start in range(len(words) - len(key_words) + 1):
+            if words[start:start + len(key_words)] != key_words:
+                continue
+            rest = words[:start] + words[start + len(key_words):]
+            if all(w in _LABEL_FILLER for w in rest):
+                best = key
+                break
+    return answers[best] if best else ""
+
+
+def choose_option(options: list[str], answer: str) -> int | None:
+    """Index of the option that best matches a free-text answer, or None."""
+    answer_lower = answer.strip().lower()
+    if not answer_lower:
+        return None
+    lowered = [o.strip().lower() for o in options]
+    for matcher in (
+        lambda o: o == answer_lower,
+        lambda o: answer_lower.startswith(o) or o.startswith(answer_lower),
+        lambda o: o in answer_lower or answer_lower in o,
+    ):
+        for i, option in enumerate(lowered):
+            if option and matcher(option):
+                return i
+    return None
+
+
+async def fill_form(
+    frame,
+    answers: dict[str, str],
+    answerer=None,
+    root_sel: str = "",
+    pause=None,
+) -> dict[str, Any]:
+    """Introspect one form step, resolve answers and fill every empty field.
+
+    Args:
+        frame: Playwright Page or Frame containing the form.
+        answers: Static label-keyword → answer map (build_answers_dict()).
+        answerer: Optional QuestionAnswerer; all fields the static map can't
+                  answer go to its aanswer_batch() (or answer_batch())
+                  in a single call.
+        root_sel: Restrict introspection to this container (e.g. a modal).
+        pause: Optional coroutine function awaited between field fills.
+
+    Returns:
+        Dict with counts: fields, filled, batched (questions sent to the
+        answerer) and unanswered (required fields left empty).
+    """
+    fields = [f for f in await introspect_form(frame, root_sel) if not f.value and f.label]
+    resolved: dict[str, str] = {}
+    unknown: list[FormField] = []
+    for f in fields:
+        known = match_known_answer(f.label, answers)
+        if known and _fits(f, known):
+            resolved[f.key] = known
+        else:
+            unknown.append(f)
+
+    if unknown and answerer is not None:
+        labels, options = [f.label for f in unknown], [f.options for f in unknown]
+        abatch = getattr(answerer, "aanswer_batch", None)
+        if abatch is not None:
+            results = await abatch(labels, options)
+        else:
+            results = answerer.answer_batch(labels, options)
+        for f, result in zip(unknown, results):
+            if result.get("answer"):
+                resolved[f.key] = result["answer"]
+
+    filled = 0
+    unanswered = 0
+    for f in fields:
+        value = resolved.get(f.key, "")
+        if not value:
+            unanswered += f.required
+            continue
+        try:
+            if await _fill_field(frame, f, value):
+                filled += 1
+                if pause is not None:
+                    await pause()
+        except Exception as exc:
+            logger.debug("Form field '%s' not filled: %s", f.label, exc)
+
+    stats = {
+        "fields": len(fields),
+        "filled": filled,
+        "batched": len(unknown) if answerer is not None else 0,
+        "unanswered": unanswered,
+    }
+    logger.debug("Form step: %s", stats)
+    return stats
+
+
+def _fits(f: FormField, value: str) -> bool:
+    """True if ``value`` can be entered into ``f`` (maps onto one of its options)."""
+    if f.options:
+        return choose_option(f.options, value) is not None
+    if f.kind == "checkbox":
+        return value.strip().lower().startswith(_CHECKBOX_YES)
+    return True
+
+
+async def _fill_field(frame, f: FormField, value: str) -> bool:
+    if f.kind == "select":
+        idx = choose_option(f.options, value)
+        if idx is None:
+            return False
+        await frame.select_option(f.selector, label=f.options[idx])
+        return True
+    if f.kind in ("radio", "checkbox") and f.option_keys:
+        idx = choose_option(f.options, value)
+        if idx is None:
+            return False
+        await _check(frame, f.option_selector(idx))
+        return True
+    if f.kind == "checkbox":
+        if value.strip().lower().startswith(_CHECKBOX_YES):
+            await _check(frame, f.selector)
+            return True
+        return False
+    await frame.fill(f.selector, value)
+    return True
+
+
+async def _check(frame, selector: str) -> None:
+    """Check a radio/checkbox; custom widgets often hide the input itself."""
+    try:
+        await frame.check(selector, timeout=2000)
+    except Exception:
+        await frame.dispatch_event(selector, "click")
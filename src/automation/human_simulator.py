@@ -5,21 +5,77 @@ Key principles:
   - Mouse movement before clicks: generates real mousemove events via stepped paths
   - Scroll-to-read: scrolls through content at reading speed before extraction
   - Variable typing: accelerates/decelerates like real typing
+
+All delays go through an injectable Sleeper (src/automation/clock.py), so
+tests and benchmarks can run with zero or virtual time. All randomness comes
+from a seeded HumanizationSchedule, so a session's timing and cursor paths
+can be reproduced exactly from the seed logged on its SearchRun.
 """
 
 import math
 import random
-import asyncio
 
+from src.automation.clock import Sleeper
+
+
+class HumanizationSchedule:
+    """Seeded, precomputed random draws for one browsing session.
 
-def _lognormal(mean: float, sigma: float = 0.45) -> float:
-    """Draw from a lognormal distribution with the given mean (seconds).
+    Standard-normal and uniform variates are generated up front in blocks
+    from a single seeded generator; every pause, keystroke and scroll step
+    consumes the next value instead of drawing from the global ``random``
+    module. Two simulators built with the same seed and driven through the
+    same sequence of calls produce identical delays.
 
-    Humans are lognormal: most interactions are quick, but occasionally
-    take much longer. Sigma=0.45 gives a realistic spread.
+    Args:
+        seed: 32-bit seed; a fresh one is drawn from the OS when omitted.
+        block_size: Variates precomputed per block (extended on demand).
     """
-    mu = math.log(max(mean, 0.001)) - (sigma ** 2) / 2
-    return random.lognormvariate(mu, sigma)
+
+    def __init__(self, seed: int | None = None, block_size: int = 4096):
+        self.seed = seed if seed is not None else random.SystemRandom().getrandbits(32)
+        self._rng = random.Random(self.seed)
+        self._block_size = block_size
+        self._normals: list[float] = []
+        self._uniforms: list[float] = []
+        self._n = 0
+        self._u = 0
+        self._extend()
+
+    def _extend(self) -> None:
+        gauss, rand = self._rng.gauss, self._rng.random
+        self._normals.extend(gauss(0.0, 1.0) for _ in range(self._block_size))
+        self._uniforms.extend(rand() for _ in range(self._block_size))
+
+    def normal(self) -> float:
+        """Next standard-normal variate."""
+        if self._n >= len(self._normals):
+            self._extend()
+        self._n += 1
+        return self._normals[self._n - 1]
+
+    def random(self) -> float:
+        """Next uniform variate in [0, 1)."""
+        if self._u >= len(self._uniforms):
+            self._extend()
+        self._u += 1
+        return self._uniforms[self._u - 1]
+
+    def uniform(self, a: float, b: float) -> float:
+        return a + (b - a) * self.random()
+
+    def randint(self, a: int, b: int) -> int:
+        """Integer in [a, b] inclusive."""
+        return a + int(self.random() * (b - a + 1))
+
+    def lognormal(self, mean: float, sigma: float = 0.45) -> float:
+        """Lognormal draw with the given mean (seconds).
+
+        Humans are lognormal: most interactions are quick, but occasionally
+        take much longer. Sigma=0.45 gives a realistic spread.
+        """
+        mu = math.log(max(mean, 0.001)) - (sigma ** 2) / 2
+        return math.exp(mu + sigma * self.normal())
 
 
 class HumanSimulator:
@@ -29,9 +85,30 @@ class HumanSimulator:
     at realistic lognormal intervals to avoid bot detection.
     """
 
-    def __init__(self, typing_speed_wpm: int = 55):
+    def __init__(
+        self,
+        typing_speed_wpm: int = 55,
+        time_scale: float = 1.0,
+        sleeper: Sleeper | None = None,
+        seed: int | None = None,
+    ):
         # average chars per second at given WPM (5 chars/word)
         self.chars_per_second = (typing_speed_wpm * 5) / 60
+        # Multiplier on every delay
+        self.time_scale = time_scale
+        # Real / zero / virtual sleeping with simulated-time accounting
+        self.sleeper = sleeper or Sleeper()
+        # Every random draw of this session comes from here (see seed)
+        self.schedule = HumanizationSchedule(seed)
+
+    @property
+    def seed(self) -> int:
+        """Seed that reproduces this session's delays and cursor paths."""
+        return self.schedule.seed
+
+    async def _sleep(self, seconds: float):
+        """Single sleep point so delays can be scaled, skipped or virtualised."""
+        await self.sleeper.sleep(seconds * self.time_scale)
 
     # ── Timing ────────────────────────────────────────────────
 
@@ -42,14 +119,14 @@ class HumanSimulator:
         the time with occasional longer ones — matching real user behaviour.
         """
         mean = (min_seconds + max_seconds) / 2
-        t = _lognormal(mean)
+        t = self.schedule.lognormal(mean)
         # Clip to [min, max*1.5] to allow occasional long pauses but nothing absurd
         t = max(min_seconds, min(max_seconds * 1.5, t))
-        await asyncio.sleep(t)
+        await self._sleep(t)
 
     async def think_pause(self):
         """Longer pause simulating reading / decision making (2–6s)."""
-        await asyncio.sleep(_lognormal(3.5, 0.5))
+        await self._sleep(self.schedule.lognormal(3.5, 0.5))
 
     # ── Mouse + Click ─────────────────────────────────────────
 
@@ -65,25 +142,25 @@ class HumanSimulator:
             box = await locator.bounding_box()
             if box:
                 # Target slightly randomised within element bounds
-                tx = box["x"] + box["width"] * random.uniform(0.25, 0.75)
-                ty = box["y"] + box["height"] * random.uniform(0.25, 0.75)
+                tx = box["x"] + box["width"] * self.schedule.uniform(0.25, 0.75)
+                ty = box["y"] + box["height"] * self.schedule.uniform(0.25, 0.75)
                 # Add slight overshoot-and-correct (human cursor behaviour)
-                steps = random.randint(12, 28)
+                steps = self.schedule.randint(12, 28)
                 await page.mouse.move(
-                    tx + random.uniform(-3, 3),
-                    ty + random.uniform(-3, 3),
+                    tx + self.schedule.uniform(-3, 3),
+                    ty + self.schedule.uniform(-3, 3),
                     steps=steps,
                 )
-                await asyncio.sleep(_lognormal(0.08, 0.3))
+                await self._sleep(self.schedule.lognormal(0.08, 0.3))
                 await page.mouse.click(tx, ty)
-                await asyncio.sleep(_lognormal(0.15, 0.3))
+                await self._sleep(self.schedule.lognormal(0.15, 0.3))
                 return
         except Exception:
             pass
         # Fallback: direct click
-        await asyncio.sleep(_lognormal(0.2, 0.3))
+        await self._sleep(self.schedule.lognormal(0.2, 0.3))
         await page.click(selector)
-        await asyncio.sleep(_lognormal(0.15, 0.3))
+        await self._sleep(self.schedule.lognormal(0.15, 0.3))
 
     async def click_with_delay(self, page, selector: str):
         """Convenience alias — move mouse to element and click."""
@@ -98,19 +175,20 @@ class HumanSimulator:
         """
         await self.human_move_and_click(page, selector)
 
-        burst_size = random.randint(3, 7)  # chars before a micro-pause
+        burst_size = self.schedule.randint(3, 7)  # chars before a micro-pause
         burst_count = 0
         for char in text:
-            delay_ms = int((_lognormal(1 / self.chars_per_second, 0.4)) * 1000)
-            await page.type(selector, char, delay=max(30, delay_ms))
+            delay_ms = int((self.schedule.lognormal(1 / self.chars_per_second, 0.4)) * 1000)
+            delay = self.sleeper.typing_delay_ms(max(30, delay_ms) * self.time_scale)
+            await page.type(selector, char, delay=delay)
             burst_count += 1
             if burst_count >= burst_size:
-                await asyncio.sleep(_lognormal(0.06, 0.5))
-                burst_size = random.randint(2, 9)
+                await self._sleep(self.schedule.lognormal(0.06, 0.5))
+                burst_size = self.schedule.randint(2, 9)
                 burst_count = 0
             # Occasional longer thinking pause
-            if random.random() < 0.04:
-                await asyncio.sleep(_lognormal(0.5, 0.5))
+            if self.schedule.random() < 0.04:
+                await self._sleep(self.schedule.lognormal(0.5, 0.5))
 
     # ── Scrolling ─────────────────────────────────────────────
 
@@ -126,33 +204,33 @@ class HumanSimulator:
             viewport_h = await page.evaluate("window.innerHeight")
             if scroll_height <= viewport_h:
                 # Short page — just pause to simulate reading
-                await asyncio.sleep(_lognormal(reading_time, 0.4))
+                await self._sleep(self.schedule.lognormal(reading_time, 0.4))
                 return
 
             pos = 0
             while pos < scroll_height - viewport_h:
                 # Scroll a random chunk (200–600px)
-                chunk = random.randint(180, 520)
+                chunk = self.schedule.randint(180, 520)
                 pos = min(pos + chunk, scroll_height - viewport_h)
                 await page.evaluate(
                     f"window.scrollTo({{top: {pos}, behavior: 'smooth'}})"
                 )
                 # Pause after each scroll chunk — lognormal centred ~0.7s
-                await asyncio.sleep(_lognormal(0.65, 0.5))
+                await self._sleep(self.schedule.lognormal(0.65, 0.5))
                 # Occasional longer pause (stopped to read something)
-                if random.random() < 0.25:
-                    await asyncio.sleep(_lognormal(1.2, 0.5))
+                if self.schedule.random() < 0.25:
+                    await self._sleep(self.schedule.lognormal(1.2, 0.5))
         except Exception:
-            await asyncio.sleep(_lognormal(reading_time, 0.4))
+            await self._sleep(self.schedule.lognormal(reading_time, 0.4))
 
     async def scroll_page(self, page, direction: str = "down", amount: int = 300):
         """Single scroll step (legacy convenience method)."""
-        actual = amount + random.randint(-60, 60)
+        actual = amount + self.schedule.randint(-60, 60)
         if direction == "up":
             actual = -actual
         await page.evaluate(f"window.scrollBy(0, {actual})")
-        await asyncio.sleep(_lognormal(0.35, 0.4))
+        await self._sleep(self.schedule.lognormal(0.35, 0.4))
 
     def get_random_delay(self) -> float:
         """Synchronous lognormal delay value (seconds)."""
-        return _lognormal(1.0)
+        return self.schedule.lognormal(1.0)
@@ -0,0 +1,154 @@
+"""On-disk cache of fetched job descriptions.
+
+Re-running a search the same day (or calling get_job_details for a URL we
+already read) would otherwise renavigate and re-extract every JD, paying the
+full page-load + scroll-to-read + lognormal delay cost each time.
+
+Entries are keyed by the canonical ``(source, external_id)`` pair, stored as
+zlib-compressed text in a local SQLite file together with the fetch time.
+Entries older than the TTL are treated as misses; once the store exceeds
+``max_entries`` the least-recently-used rows are evicted.
+"""
+
+import logging
+import sqlite3
+import time
+import zlib
+from pathlib import Path
+from typing import Callable
+
+logger = logging.getLogger(__name__)
+
+
+class JDCache:
+    """SQLite-backed JD text cache with TTL and LRU eviction.
+
+    The database file is opened lazily on first use, so constructing a
+    driver never touches the filesystem.
+
+    Args:
+        path: SQLite file location.
+        ttl_hours: Entries older than this are ignored (and overwritten on
+                   the next fetch).
+        max_entries: Size cap; least-recently-read rows are evicted beyond it.
+        enabled: When False, every lookup is a miss and nothing is stored.
+        clock: Time source in epoch seconds (injectable for tests).
+    """
+
+    def __init__(
+        self,
+        path: str | Path = "data/cache/jd_cache.db",
+        ttl_hours: float = 72.0,
+        max_entries: int = 5000,
+        enabled: bool = True,
+        clock: Callable[[], float] = time.time,
+    ):
+        self.path = Path(path)
+        self.ttl_seconds = ttl_hours * 3600
+        self.max_entries = max_entries
+        self.enabled = enabled
+        self._clock = clock
+        self._conn: sqlite3.Connection | None = None
+        self.hits = 0
+        self.misses = 0
+
+    @classmethod
+    def from_config(cls, config=None, clock: Callable[[], float] = time.time) -> "JDCache":
+        """Build a cache from the ``jd_cache`` section of config/app.yaml."""
+        if config is None:
+            from src.config import get_config
+            config = get_config()
+        from src.config import PROJECT_ROOT
+
+        cfg = config.jd_cache
+        path = Path(cfg.path)
+        if not path.is_absolute():
+            path = PROJECT_ROOT / path
+        return cls(
+            path=path,
+            ttl_hours=cfg.ttl_hours,
+            max_entries=cfg.max_entries,
+            enabled=cfg.enabled,
+            clock=clock,
+        )
+
+    # ── Public API ───────────────────────────────────────────
+
+    def get(self, source: str, external_id: str) -> str | None:
+        """Return cached JD text, or None on a miss / expired entry."""
+        if not (self.enabled and external_id):
+            return None
+        conn = self._connect()
+        row = conn.execute(
+            "SELECT text, fetched_at FROM jd_cache WHERE key = ?",
+            (self._key(source, external_id),),
+        ).fetchone()
+        now = self._clock()
+        if row is None or now - row[1] > self.ttl_seconds:
+            self.misses += 1
+            return None
+
+        conn.execute(
+            "UPDATE jd_cache SET accessed_at = ? WHERE key = ?",
+            (now, self._key(source, external_id)),
+        )
+        conn.commit()
+        self.hits += 1
+        return zlib.decompress(row[0]).decode("utf-8")
+
+    def put(self, source: str, external_id: str, text: str) -> None:
+        """Store JD text for a job and evict LRU rows beyond the size cap."""
+        if not (self.enabled and external_id and text):
+            return
+        conn = self._connect()
+        now = self._clock()
+        conn.execute(
+            "INSERT OR REPLACE INTO jd_cache (key, text, fetched_at, accessed_at) "
+            "VALUES (?, ?, ?, ?)",
+            (
+                self._key(source, external_id),
+                zlib.compress(text.encode("utf-8")),
+                now,
+                now,
+            ),
+        )
+        conn.execute(
+            "DELETE FROM jd_cache WHERE key IN ("
+            "  SELECT key FROM jd_cache ORDER BY accessed_at DESC LIMIT -1 OFFSET ?"
+            ")",
+            (self.max_entries,),
+        )
+        conn.commit()
+
+    def __len__(self) -> int:
+        if not self.enabled:
+            return 0
+        return self._connect().execute("SELECT COUNT(*) FROM jd_cache").fetchone()[0]
+
+    def close(self) -> None:
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    # ── Private helpers ──────────────────────────────────────
+
+    @staticmethod
+    def _key(source: str, external_id: str) -> str:
+        return f"{source}:{external_id}"
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(str(self.path))
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS jd_cache ("
+                "  key TEXT PRIMARY KEY,"
+                "  text BLOB NOT NULL,"
+                "  fetched_at REAL NOT NULL,"
+                "  accessed_at REAL NOT NULL"
+                ")"
+            )
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS ix_jd_cache_accessed ON jd_cache (accessed_at)"
+            )
+        return self._conn
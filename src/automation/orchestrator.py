@@ -4,16 +4,25 @@ Ties together: job discovery, deduplication, scoring, resume generation,
 and application submission.
 """
 
+import asyncio
 import logging
+import time
 from dataclasses import dataclass, field
 from pathlib import Path
 
-from src.automation.drivers.base import BasePortalDriver, DiscoveredJob, SearchConfig
+from src.automation.answer_cache import AnswerCache
+from src.automation.drivers.base import (
+    BasePortalDriver,
+    DiscoveredJob,
+    HighWaterMark,
+    SearchConfig,
+)
 from src.automation.question_answerer import QuestionAnswerer
 from src.discovery.deduplicator import Deduplicator
 from src.discovery.scorer import JobProfileScorer
 from src.generator.content_selector import ContentSelector
 from src.generator.latex_renderer import generate_latex_resume
+from src.llm.metering import LLMMeter, metering
 from src.profile.manager import CandidateProfile, ProfileManager
 
 logger = logging.getLogger(__name__)
@@ -29,6 +38,20 @@ class PipelineResult:
     resumes_generated: int = 0
     applications_submitted: int = 0
     applications_failed: int = 0
+    # Apply tabs left open on a CAPTCHA for a human, and how many got solved
+    captchas_parked: int = 0
+    captchas_solved: int = 0
+    jd_cache_hits: int = 0
+    jd_cache_misses: int = 0
+    # HumanSimulator time: requested (simulated) vs actually spent asleep
+    human_seconds_simulated: float = 0.0
+    human_seconds_slept: float = 0.0
+    # Per-portal HumanizationSchedule seed (persist to SearchRun for replay)
+    humanization_seeds: dict[str, int] = field(default_factory=dict)
+    # Per-portal newest-jobs mark from this run (persist to SearchRun)
+    high_water: dict[str, HighWaterMark] = field(default_factory=dict)
+    # LLMMeter.summary(): tokens and estimated cost of this run (persist to SearchRun)
+    llm_usage: dict = field(default_factory=dict)
     errors: list[str] = field(default_factory=list)
 
 
@@ -71,6 +94,7 @@ class Orchestrator:
         self.content_selector = ContentSelector(use_llm=True)
         self.question_answerer = QuestionAnswerer(
             profile,
+            answer_cache=AnswerCache.from_config(clock=self._now),
             salary_expectation=salary_expectation,
             notice_period=notice_period,
             work_authorization=work_authorization,
@@ -79,25 +103,70 @@ class Orchestrator:
         )
         # Pre-build the base answers dict (static profile fields, no LLM calls)
         self._base_answers = self.question_answerer.build_answers_dict()
+        # (job, resume_files, park task) for applies waiting on a human CAPTCHA solve
+        self._parked: list[tuple[DiscoveredJob, dict, asyncio.Task]] = []
+        # Browser drivers send unknown apply-form questions here in batches
+        for driver in self.drivers:
+            if hasattr(driver, "answerer"):
+                driver.answerer = self.question_answerer
 
     async def run(self, search_config: SearchConfig) -> PipelineResult:
         """Execute the full pipeline.
 
+        LLM calls are metered per run; once the ``llm_metering`` budget is
+        spent, summaries, bullets and form answers use their rule-based
+        fallbacks.
+
         Args:
             search_config: Search parameters for all drivers.
 
         Returns:
             PipelineResult with summary statistics.
         """
+        try:
+            with metering(LLMMeter.from_config()) as meter:
+                result = await self._run(search_config)
+        finally:
+            await self._aclose_llm()
+        result.llm_usage = meter.summary()
+        return result
+
+    async def _aclose_llm(self) -> None:
+        """Release the async LLM clients bound to this run's event loop.
+
+        They are recreated on first use, so a later run() on a new loop
+        still works.
+        """
+        providers = [self.content_selector._llm, self.question_answerer.llm]
+        for provider in {id(p): p for p in providers if p is not None}.values():
+            try:
+                await provider.aclose()
+            except Exception as e:
+                logger.warning(f"Closing LLM provider failed: {e}")
+
+    async def _run(self, search_config: SearchConfig) -> PipelineResult:
         result = PipelineResult()
+        simulated_before, slept_before = self._human_time()
+        self._parked = []
 
         # 1. Discover jobs from all drivers
         all_jobs: list[DiscoveredJob] = []
         for driver in self.drivers:
             try:
                 if await driver.is_available():
+                    cache = getattr(driver, "jd_cache", None)
+                    hits, misses = (cache.hits, cache.misses) if cache is not None else (0, 0)
                     jobs = await driver.search(search_config)
                     all_jobs.extend(jobs)
+                    if cache is not None:
+                        result.jd_cache_hits += cache.hits - hits
+                        result.jd_cache_misses += cache.misses - misses
+                    mark = getattr(driver, "last_high_water", None)
+                    if mark is not None:
+                        result.high_water[driver.driver_name()] = mark
+                    sim = getattr(driver, "sim", None)
+                    if sim is not None:
+                        result.humanization_seeds[driver.driver_name()] = sim.seed
                     logger.info(f"{driver.driver_name()}: found {len(jobs)} jobs")
                 else:
                     logger.warning(f"{driver.driver_name()}: not available, skipping")
@@ -114,6 +183,8 @@ class Orchestrator:
         )
         result.jobs_new = len(unique_jobs)
         result.jobs_duplicates = len(duplicates)
+        for portal, mark in result.high_water.items():
+            mark.jobs_new = sum(job.source == portal for job in unique_jobs)
 
         # 3. Score and rank
         scored_jobs = self.scorer.score_and_rank(
@@ -125,7 +196,7 @@ class Orchestrator:
         for job, score in scored_jobs:
             try:
                 # Generate tailored resume as LaTeX PDF
-                content = self.content_selector.select(
+                content = await self.content_selector.aselect(
                     self.profile, job.description_text or job.title
                 )
                 resume_files = generate_latex_resume(
@@ -149,15 +220,75 @@ class Orchestrator:
                 logger.error(error)
                 result.errors.append(error)
 
+        # 5. Retry applications whose CAPTCHA a human solved meanwhile
+        await self._drain_parked(result)
+
+        simulated, slept = self._human_time()
+        result.human_seconds_simulated = simulated - simulated_before
+        result.human_seconds_slept = slept - slept_before
         return result
 
+    def _now(self) -> float:
+        """Latest HumanSimulator clock across drivers (virtual time in virtual mode)."""
+        return max(
+            (d.sim.sleeper.time() for d in self.drivers if getattr(d, "sim", None) is not None),
+            default=time.time(),
+        )
+
+    def _human_time(self) -> tuple[float, float]:
+        """Total (simulated, slept) HumanSimulator seconds across all drivers."""
+        simulated = slept = 0.0
+        for driver in self.drivers:
+            sim = getattr(driver, "sim", None)
+            if sim is not None:
+                simulated += sim.sleeper.simulated
+                slept += sim.sleeper.slept
+        return simulated, slept
+
+    async def _drain_parked(self, result: PipelineResult) -> None:
+        """Wait for parked CAPTCHAs and retry the applications that were freed.
+
+        Drivers keep their browser open while a tab is parked; it is closed
+        here once every parked task has finished.
+        """
+        parked, self._parked = self._parked, []
+        try:
+            for job, resume_files, task in parked:
+                try:
+                    solved = await task
+                except Exception:
+                    solved = False
+                if solved:
+                    result.captchas_solved += 1
+                    logger.info(f"CAPTCHA solved; retrying {job.title} @ {job.company}")
+                    await self._apply_to_job(job, resume_files, result, retry=True)
+                else:
+                    result.applications_failed += 1
+                    result.errors.append(
+                        f"CAPTCHA blocked application to {job.title} @ {job.company}: "
+                        "not solved in time"
+                    )
+        finally:
+            closed = set()
+            for job, _, task in parked:
+                task.cancel()   # no-op unless we are unwinding early
+                driver = self._get_driver_for_source(job.source)
+                if driver is not None and id(driver) not in closed and hasattr(driver, "close"):
+                    closed.add(id(driver))
+                    await driver.close()
+
     async def _apply_to_job(
         self,
         job: DiscoveredJob,
         resume_files: dict,
         result: PipelineResult,
+        retry: bool = False,
     ):
-        """Submit application for a specific job."""
+        """Submit application for a specific job.
+
+        A CAPTCHA the driver parked is queued for _drain_parked() (once —
+        a retry that hits another CAPTCHA counts as failed).
+        """
         resume_path = str(resume_files.get("pdf") or resume_files.get("tex", ""))
 
         driver = self._get_driver_for_source(job.source)
@@ -179,7 +310,15 @@ class Orchestrator:
                     f"Applied to {job.title} @ {job.company} [{job.source}]: "
                     f"{apply_result.get('message', '')}"
                 )
+            elif status == "captcha" and apply_result.get("parked") is not None and not retry:
+                result.captchas_parked += 1
+                self._parked.append((job, resume_files, apply_result["parked"]))
+                logger.warning(
+                    f"CAPTCHA on {job.title} @ {job.company}; parked for manual solving"
+                )
             elif status == "captcha":
+                if apply_result.get("parked") is not None:
+                    apply_result["parked"].cancel()
                 result.errors.append(
                     f"CAPTCHA blocked application to {job.title} @ {job.company}: "
                     f"{apply_result.get('message', '')}"
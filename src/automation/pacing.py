@@ -0,0 +1,147 @@
+"""Adaptive per-portal request pacing (AIMD).
+
+The static ``rate_limits`` in each portal YAML are either too conservative
+(Naukri at 9 s/page when it isn't throttling) or not conservative enough
+(throttled / CAPTCHA'd). PacingController learns a delay scale per portal:
+
+  • Clean page / JD fetch  → request *rate* increases additively
+  • Throttle signal        → request *rate* is cut multiplicatively
+
+Throttle signals are HTTP 429/403/503/999 document responses, CAPTCHA
+detections, empty results pages and login redirects. The scale multiplies
+every YAML delay and is clamped to the portal's configured floor/ceiling.
+Learned scales are persisted to a JSON file so the next run starts from
+where the last one left off.
+
+Portal YAML:
+    pacing:
+      floor: 0.5            # fastest: 0.5× the rate_limits delays
+      ceiling: 3.0          # slowest: 3× the rate_limits delays
+      increase_step: 0.1    # additive rate increase per clean request
+      decrease_factor: 0.5  # multiplicative rate cut on a throttle signal
+"""
+
+import json
+import logging
+from datetime import UTC, datetime
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+# Document response codes treated as "slow down" (999 is LinkedIn's bot wall)
+THROTTLE_STATUS_CODES = frozenset({403, 429, 503, 999})
+
+
+class PacingController:
+    """AIMD controller for one portal's delay scale.
+
+    Internally tracks the request rate relative to the YAML baseline
+    (``rate = 1 / scale``) so increases are additive and decreases are
+    multiplicative in rate, as in TCP congestion control.
+
+    Args:
+        portal: Driver name, used as the persistence key.
+        floor: Minimum delay scale (fastest allowed pacing).
+        ceiling: Maximum delay scale (slowest pacing).
+        increase_step: Rate added after each clean request.
+        decrease_factor: Rate multiplier (0-1) applied on a throttle signal.
+        state_path: JSON file for persisting learned scales ("" = don't persist).
+        enabled: When False the scale is fixed at 1.0 and nothing is persisted.
+    """
+
+    def __init__(
+        self,
+        portal: str,
+        floor: float = 0.5,
+        ceiling: float = 3.0,
+        increase_step: float = 0.1,
+        decrease_factor: float = 0.5,
+        state_path: str | Path = "",
+        enabled: bool = True,
+    ):
+        self.portal = portal
+        self.floor = floor
+        self.ceiling = ceiling
+        self.increase_step = increase_step
+        self.decrease_factor = decrease_factor
+        self.state_path = Path(state_path) if state_path else None
+        self.enabled = enabled
+        self.scale = 1.0
+        self.throttle_events = 0
+        if enabled:
+            self._load()
+
+    @classmethod
+    def from_selectors(cls, portal: str, sel: dict, config=None) -> "PacingController":
+        """Build a controller from a portal YAML ``pacing`` section + app config."""
+        if config is None:
+            from src.config import get_config
+            config = get_config()
+        from src.config import PROJECT_ROOT
+
+        state_path = Path(config.pacing.state_path)
+        if not state_path.is_absolute():
+            state_path = PROJECT_ROOT / state_path
+        p = sel.get("pacing", {})
+        return cls(
+            portal,
+            floor=p.get("floor", 0.5),
+            ceiling=p.get("ceiling", 3.0),
+            increase_step=p.get("increase_step", 0.1),
+            decrease_factor=p.get("decrease_factor", 0.5),
+            state_path=state_path,
+            enabled=config.pacing.enabled,
+        )
+
+    # ── Public API ───────────────────────────────────────────
+
+    def delay(self, base_seconds: float) -> float:
+        """Scale a YAML baseline delay by the learned pacing factor."""
+        return base_seconds * self.scale
+
+    def on_success(self) -> None:
+        """A request completed cleanly — speed up additively."""
+        if not self.enabled:
+            return
+        self._set_scale(1.0 / (1.0 / self.scale + self.increase_step))
+
+    def on_throttle(self, reason: str) -> None:
+        """A throttle signal was observed — slow down multiplicatively."""
+        if not self.enabled:
+            return
+        self.throttle_events += 1
+        self._set_scale(self.scale / self.decrease_factor)
+        logger.info(
+            "%s pacing: %s → delay scale %.2f×", self.portal, reason, self.scale
+        )
+
+    def save(self) -> None:
+        """Persist the learned scale (merged with other portals' entries)."""
+        if not (self.enabled and self.state_path):
+            return
+        state = self._read_state()
+        state[self.portal] = {
+            "scale": round(self.scale, 4),
+            "updated_at": datetime.now(UTC).isoformat(),
+        }
+        self.state_path.parent.mkdir(parents=True, exist_ok=True)
+        self.state_path.write_text(json.dumps(state, indent=2), encoding="utf-8")
+
+    # ── Private helpers ──────────────────────────────────────
+
+    def _set_scale(self, scale: float) -> None:
+        self.scale = max(self.floor, min(self.ceiling, scale))
+
+    def _load(self) -> None:
+        entry = self._read_state().get(self.portal)
+        if entry:
+            self._set_scale(float(entry.get("scale", 1.0)))
+
+    def _read_state(self) -> dict:
+        if not (self.state_path and self.state_path.exists()):
+            return {}
+        try:
+            return json.loads(self.state_path.read_text(encoding="utf-8")) or {}
+        except (OSError, ValueError) as exc:
+            logger.warning("Ignoring unreadable pacing state %s: %s", self.state_path, exc)
+            return {}
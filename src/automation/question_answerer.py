@@ -3,13 +3,30 @@
 Answer strategy (in priority order):
 1. Exact/regex match against the candidate's Q&A bank (zero LLM cost)
 2. Answer from well-known fields (experience years, location, salary, etc.)
-3. LLM generation with rich candidate context prompt (only for unknown questions)
+3. Persistent cache of earlier LLM answers (src/automation/answer_cache.py)
+4. Semantic nearest-neighbour match against known questions, for paraphrases
+   the regexes miss (src/automation/semantic_matcher.py)
+5. LLM generation with rich candidate context prompt (only for unknown questions)
+
+Bank and derived patterns are compiled once per answerer; answers are
+memoized per normalized question text for the answerer's lifetime.
+aanswer_batch() is the async variant used while filling apply forms: LLM
+calls go through agenerate() and batch chunks run concurrently. All LLM
+calls run at Priority.INTERACTIVE, so they overtake queued resume generation,
+and are metered as the "qa" call site; with the LLM budget spent, unknown
+questions are left for manual answers.
 """
 
+import asyncio
+import hashlib
+import json
 import re
 import logging
+from src.automation.semantic_matcher import SemanticMatcher, pattern_phrases
 from src.profile.manager import CandidateProfile
 from src.llm.provider import get_llm_provider, BaseLLMProvider
+from src.llm.metering import llm_call_site
+from src.llm.scheduler import Priority, llm_priority
 
 logger = logging.getLogger(__name__)
 
@@ -24,6 +41,9 @@ _QA_SYSTEM_PROMPT = (
     "Never fabricate information not present in the candidate profile."
 )
 
+# Questions per batched LLM call (keeps each reply well under max_tokens)
+_BATCH_SIZE = 10
+
 # ── Known/derived question patterns ──────────────────────────
 
 _DERIVED_PATTERNS: list[tuple[str, str]] = [
@@ -46,6 +66,76 @@ _DERIVED_PATTERNS: list[tuple[str, str]] = [
 ]
 
 
+def _normalize(question: str) -> str:
+    """Lowercase, whitespace-collapsed question text (match and memo key)."""
+    return " ".join(question.lower().split())
+
+
+def _batch_key(question: str, options: list[str]) -> tuple:
+    return _normalize(question), tuple(options)
+
+
+def _distinct(questions: list[str], options: list[list[str]], indices: list[int]) -> list[int]:
+    """``indices`` without repeats of the same question (text and options)."""
+    seen: set[tuple] = set()
+    first = []
+    for i in indices:
+        key = _batch_key(questions[i], options[i])
+        if key not in seen:
+            seen.add(key)
+            first.append(i)
+    return first
+
+
+class _PatternIndex:
+    """Ordered, precompiled regex → value table.
+
+    Patterns are compiled once; an invalid regex is reported once and
+    matched literally (as the per-call fallback used to). A combined
+    named-group alternation answers the common "nothing matches" case in a
+    single scan before the ordered per-pattern check that decides priority.
+    """
+
+    def __init__(self, entries: list[tuple[str, str]], source: str):
+        self.entries: list[tuple[re.Pattern, str]] = []
+        for pattern, value in entries:
+            try:
+                compiled = re.compile(pattern, re.IGNORECASE)
+            except re.error as e:
+                logger.warning(
+                    f"{source} pattern {pattern!r} is not a valid regex ({e}); matching literally"
+                )
+                compiled = re.compile(re.escape(pattern), re.IGNORECASE)
+            self.entries.append((compiled, value))
+
+        # Capturing groups could renumber backreferences inside the alternation
+        self._combined: re.Pattern | None = None
+        if self.entries and all(c.groups == 0 for c, _ in self.entries):
+            try:
+                self._combined = re.compile(
+                    "|".join(f"(?P<p{i}>{c.pattern})" for i, (c, _) in enumerate(self.entries)),
+                    re.IGNORECASE,
+                )
+            except re.error:
+                pass
+
+    def values(self, text: str):
+        """Values of every pattern found in ``text``, in table order."""
+        if not self.entries or (self._combined is not None and not self._combined.search(text)):
+            return
+        for compiled, value in self.entries:
+            if compiled.search(text):
+                yield value
+
+
+_DERIVED_INDEX = _PatternIndex(_DERIVED_PATTERNS, "derived")
+
+
+def _options_hint(options: list[str] | None) -> str:
+    """Prompt suffix listing a choice field's allowed answers."""
+    return f" (options: {' / '.join(options)})" if options else ""
+
+
 class QuestionAnswerer:
     """Answer application form questions using Q&A bank, derived facts, and LLM.
 
@@ -60,6 +150,10 @@ class QuestionAnswerer:
         work_authorization: Work auth status string.
         remote_preference: Preferred work style (e.g. "Remote/Hybrid").
         relocation: Whether open to relocation ("Yes" / "No").
+        answer_cache: Optional persistent AnswerCache; LLM answers are stored
+                      there and reused across applications and runs.
+        semantic_threshold: Cosine similarity needed for a semantic match;
+                            None disables semantic matching.
     """
 
     def __init__(
@@ -71,8 +165,11 @@ class QuestionAnswerer:
         work_authorization: str = "Yes, authorized to work",
         remote_preference: str = "Remote or Hybrid preferred; open to on-site",
         relocation: str = "Open to discussion",
+        answer_cache=None,
+        semantic_threshold: float | None = 0.7,
     ):
         self.profile = profile
+        self.answer_cache = answer_cache
         self.llm = llm_provider or get_llm_provider()
         self._salary = salary_expectation
         self._notice = notice_period
@@ -103,6 +200,29 @@ class QuestionAnswerer:
             "relocation": relocation,
         }
 
+        self._qa_index = _PatternIndex(
+            [
+                (qa.get("question_pattern", ""), qa.get("answer", ""))
+                for qa in profile.qa_bank
+                if qa.get("question_pattern", "")
+            ],
+            "Q&A bank",
+        )
+        # normalized question → answer dict (never "manual" misses)
+        self._memo: dict[str, dict] = {}
+        # Cached LLM answers are only valid for the context the LLM saw
+        self.profile_hash = hashlib.sha256(
+            (_QA_SYSTEM_PROMPT + self._profile_context()).encode("utf-8")
+        ).hexdigest()[:16]
+        # Semantic index identity: candidate context + Q&A bank contents
+        self._semantic_threshold = semantic_threshold
+        self._semantic_version = hashlib.sha256(
+            (self.profile_hash + json.dumps(profile.qa_bank, sort_keys=True, default=str))
+            .encode("utf-8")
+        ).hexdigest()[:16]
+        self._semantic: SemanticMatcher | None = None      # shared: bank + derived
+        self._answered: SemanticMatcher | None = None      # this answerer's LLM answers
+
     # ── Public API ───────────────────────────────────────────
 
     def answer(self, question: str) -> dict:
@@ -111,33 +231,119 @@ class QuestionAnswerer:
         Returns:
             Dict with keys:
                 answer: The answer string.
-                source: "qa_bank" | "derived" | "llm" | "manual"
+                source: "qa_bank" | "derived" | "llm_cache" | "semantic" | "llm" | "manual"
                 confidence: float 0-1.
+            Cached LLM answers also carry a ``provenance`` dict.
         """
-        # 1. Q&A bank — exact/regex match (zero cost)
-        qa_answer = self._match_qa_bank(question)
-        if qa_answer:
-            return {"answer": qa_answer, "source": "qa_bank", "confidence": 0.97}
-
-        # 2. Derived from known profile fields (zero cost)
-        derived = self._derive_answer(question)
-        if derived:
-            return {"answer": derived, "source": "derived", "confidence": 0.92}
+        # 1–4. Memo, Q&A bank, derived fields, answer cache, semantic match (zero cost)
+        known = self._known_answer(question)
+        if known:
+            return dict(known)
 
-        # 3. LLM — only for genuinely unknown questions
+        # 5. LLM — only for genuinely unknown questions
         if self.llm.is_available():
             try:
-                llm_answer = self._llm_answer(question)
+                with llm_priority(Priority.INTERACTIVE), llm_call_site("qa"):
+                    llm_answer = self._llm_answer(question)
                 if llm_answer:
-                    return {"answer": llm_answer, "source": "llm", "confidence": 0.70}
+                    return self._remember_llm(question, llm_answer)
             except Exception as e:
                 logger.warning(f"LLM question answering failed: {e}")
 
         return {"answer": "", "source": "manual", "confidence": 0.0}
 
-    def answer_batch(self, questions: list[str]) -> list[dict]:
-        """Answer multiple questions, grouping LLM calls when possible."""
-        return [self.answer(q) for q in questions]
+    def answer_batch(
+        self,
+        questions: list[str],
+        options: list[list[str]] | None = None,
+    ) -> list[dict]:
+        """Answer multiple questions with one LLM call per batch.
+
+        Q&A bank, derived, cached and semantic answers are resolved first; every
+        remaining question goes into a single structured LLM request (e.g.
+        all screening questions of one apply-form step; more than
+        _BATCH_SIZE unknowns are split into several requests). A question
+        repeated on the form (same text and options) is asked once.
+
+        Args:
+            questions: Question texts.
+            options: Optional allowed choices per question (select / radio
+                     fields); the LLM is asked to pick one of them.
+
+        Returns:
+            One answer dict (see answer()) per question, in order.
+        """
+        options = options or [[] for _ in questions]
+        results, unknown = self._resolve_known(questions)
+        asked = _distinct(questions, options, unknown)
+
+        llm_answers: list[str] = []
+        if unknown and self.llm.is_available():
+            try:
+                with llm_priority(Priority.INTERACTIVE), llm_call_site("qa"):
+                    llm_answers = self._llm_answer_many(
+                        [questions[i] for i in asked], [options[i] for i in asked]
+                    )
+            except Exception as e:
+                logger.warning(f"LLM batch question answering failed: {e}")
+        return self._merge_llm(questions, options, results, unknown, asked, llm_answers)
+
+    async def aanswer_batch(
+        self,
+        questions: list[str],
+        options: list[list[str]] | None = None,
+    ) -> list[dict]:
+        """Async answer_batch(): same answers, but LLM calls use agenerate()
+        and the _BATCH_SIZE chunks are sent concurrently."""
+        options = options or [[] for _ in questions]
+        results, unknown = self._resolve_known(questions)
+        asked = _distinct(questions, options, unknown)
+
+        llm_answers: list[str] = []
+        if unknown and self.llm.is_available():
+            try:
+                with llm_priority(Priority.INTERACTIVE), llm_call_site("qa"):
+                    llm_answers = await self._allm_answer_many(
+                        [questions[i] for i in asked], [options[i] for i in asked]
+                    )
+            except Exception as e:
+                logger.warning(f"LLM batch question answering failed: {e}")
+        return self._merge_llm(questions, options, results, unknown, asked, llm_answers)
+
+    def _resolve_known(self, questions: list[str]) -> tuple[list[dict | None], list[int]]:
+        """Zero-cost answers, plus the indices still needing the LLM."""
+        results: list[dict | None] = []
+        unknown: list[int] = []
+        for i, question in enumerate(questions):
+            known = self._known_answer(question)
+            if known:
+                results.append(dict(known))
+                continue
+            results.append(None)
+            unknown.append(i)
+        return results, unknown
+
+    def _merge_llm(
+        self,
+        questions: list[str],
+        options: list[list[str]],
+        results: list[dict | None],
+        unknown: list[int],
+        asked: list[int],
+        llm_answers: list[str],
+    ) -> list[dict]:
+        """Fill the unknown questions; repeats of an asked question share its answer."""
+        by_key = {
+            _batch_key(questions[i], options[i]): llm_answers[n] if n < len(llm_answers) else ""
+            for n, i in enumerate(asked)
+        }
+        for i in unknown:
+            text = by_key.get(_batch_key(questions[i], options[i]), "")
+            if text:
+                results[i] = self._remember_llm(questions[i], text)
+            else:
+                results[i] = {"answer": "", "source": "manual", "confidence": 0.0}
+        return results
 
     def build_answers_dict(self) -> dict:
         """Return a flat dict of common form field labels → answers.
@@ -167,44 +373,261 @@ class QuestionAnswerer:
 
     # ── Private helpers ──────────────────────────────────────
 
-    def _match_qa_bank(self, question: str) -> str | None:
-        question_lower = question.lower().strip()
+    def _known_answer(self, question: str) -> dict | None:
+        """Memoized bank / derived / cached answer, or None if the LLM is needed."""
+        key = _normalize(question)
+        if key in self._memo:
+            return self._memo[key]
+        qa_answer = self._match_qa_bank(question)
+        if qa_answer:
+            return self._remember(
+                question, {"answer": qa_answer, "source": "qa_bank", "confidence": 0.97}
+            )
+        derived = self._derive_answer(question)
+        if derived:
+            return self._remember(
+                question, {"answer": derived, "source": "derived", "confidence": 0.92}
+            )
+        if self.answer_cache is not None:
+            cached = self.answer_cache.get(key, self.profile_hash)
+            if cached:
+                return self._remember(question, cached)
+        match = self._semantic_match(key)
+        if match is not None:
+            return self._remember(question, {
+                "answer": match.answer,
+                "source": "semantic",
+                "confidence": round(match.score, 2),
+                "matched": match.matched,
+            })
+        return None
+
+    def _semantic_match(self, question: str):
+        """Best semantic match across the bank index and answered questions."""
+        if self._semantic_threshold is None:
+            return None
+        if self._semantic is None:
+            # Built once per profile version and shared between answerers
+            self._semantic = SemanticMatcher.for_version(
+                self._semantic_version, self._semantic_entries, self._semantic_threshold
+            )
+            self._answered = SemanticMatcher(self._semantic_threshold)
+            if self.answer_cache is not None:
+                for row in self.answer_cache.entries(profile_hash=self.profile_hash):
+                    self._answered.add(row["question"], row["answer"])
+        matches = [
+            m for m in (self._semantic.match(question), self._answered.match(question)) if m
+        ]
+        return max(matches, key=lambda m: m.score) if matches else None
+
+    def _semantic_entries(self):
+        """(phrasing, answer) pairs from the Q&A bank and derived fields."""
         for qa in self.profile.qa_bank:
-            pattern = qa.get("question_pattern", "")
             answer = qa.get("answer", "")
-            if not pattern:
-                continue
-            try:
-                if re.search(pattern, question_lower, re.IGNORECASE):
-                    return answer
-            except re.error:
-                if pattern.lower() in question_lower:
-                    return answer
-        return None
+            for example in qa.get("examples", []) or []:
+                yield example, answer
+            for phrase in pattern_phrases(qa.get("question_pattern", "")):
+                yield phrase, answer
+        for pattern, info_key in _DERIVED_PATTERNS:
+            for phrase in pattern_phrases(pattern):
+                yield phrase, self._candidate_info.get(info_key, "")
+
+    def _remember(self, question: str, result: dict) -> dict:
+        self._memo[_normalize(question)] = result
+        return dict(result)
+
+    def _remember_llm(self, question: str, text: str) -> dict:
+        """Memoize a fresh LLM answer and persist it to the answer cache."""
+        result = {"answer": text, "source": "llm", "confidence": 0.70}
+        if self.answer_cache is not None:
+            self.answer_cache.put(
+                _normalize(question),
+                self.profile_hash,
+                text,
+                confidence=result["confidence"],
+                model=getattr(self.llm, "model", type(self.llm).__name__),
+            )
+        if self._answered is not None:
+            self._answered.add(_normalize(question), text)
+        return self._remember(question, result)
+
+    def _match_qa_bank(self, question: str) -> str | None:
+        return next(self._qa_index.values(_normalize(question)), None)
 
     def _derive_answer(self, question: str) -> str | None:
-        q_lower = question.lower().strip()
-        for pattern, info_key in _DERIVED_PATTERNS:
-            if re.search(pattern, q_lower, re.IGNORECASE):
-                value = self._candidate_info.get(info_key, "")
-                if value:
-                    return value
+        for info_key in _DERIVED_INDEX.values(_normalize(question)):
+            value = self._candidate_info.get(info_key, "")
+            if value:
+                return value
         return None
 
-    def _llm_answer(self, question: str) -> str:
+    def _llm_answer(self, question: str, options: list[str] | None = None) -> str:
         """Use Grok with rich candidate context to answer an unknown question."""
         from src.llm.provider import StubProvider
         if isinstance(self.llm, StubProvider):
             return ""
 
-        top_skills = self.profile.get_all_skill_names()[:10]
-        recent_exp = self.profile.experience[0] if self.profile.experience else {}
+        response = self.llm.generate(
+            self._single_prompt(question, options),
+            max_tokens=120,
+            system_prompt=_QA_SYSTEM_PROMPT,
+        )
+        return response.text.strip()
 
-        prompt = f"""\
-Answer this job application form question for the candidate below.
+    async def _allm_answer(self, question: str, options: list[str] | None = None) -> str:
+        """Async _llm_answer()."""
+        from src.llm.provider import StubProvider
+        if isinstance(self.llm, StubProvider):
+            return ""
 
-QUESTION: {question}
+        response = await self.llm.agenerate(
+            self._single_prompt(question, options),
+            max_tokens=120,
+            system_prompt=_QA_SYSTEM_PROMPT,
+        )
+        return response.text.strip()
+
+    def _fallback_answer(self, question: str, options: list[str]) -> str:
+        """_llm_answer() for one question of a batch; a failure only empties this answer."""
+        try:
+            return self._llm_answer(question, options)
+        except Exception as e:
+            logger.warning(f"LLM answer failed for {question!r}: {e}")
+            return ""
+
+    async def _afallback_answer(self, question: str, options: list[str]) -> str:
+        """Async _fallback_answer()."""
+        try:
+            return await self._allm_answer(question, options)
+        except Exception as e:
+            logger.warning(f"LLM answer failed for {question!r}: {e}")
+            return ""
+
+    def _single_prompt(self, question: str, options: list[str] | None) -> str:
+        # Candidate context first: it is identical across questions, so it
+        # forms a prefix the provider can serve from its prompt cache.
+        return f"""\
+{self._profile_context()}
+
+Answer this job application form question for the candidate above.
+
+QUESTION: {question}{_options_hint(options)}
+
+Provide a brief, professional answer (1-3 sentences for open-ended questions, \
+a single word/number for factual questions). Reply with ONLY the answer text."""
 
+    def _llm_answer_many(
+        self,
+        questions: list[str],
+        options: list[list[str]] | None = None,
+    ) -> list[str]:
+        """Answer several questions with one LLM call per _BATCH_SIZE chunk.
+
+        Each call returns a JSON object keyed by question number. Questions
+        the reply leaves out or answers unparseably (or the whole chunk, if
+        the reply isn't JSON) are answered one call each; questions the
+        model deliberately left empty are not re-asked. A failed per-question
+        call leaves only that answer empty.
+        """
+        from src.llm.provider import StubProvider
+        if isinstance(self.llm, StubProvider):
+            return ["" for _ in questions]
+        options = options or [[] for _ in questions]
+        if len(questions) > _BATCH_SIZE:
+            answers: list[str] = []
+            for start in range(0, len(questions), _BATCH_SIZE):
+                answers.extend(self._llm_answer_many(
+                    questions[start:start + _BATCH_SIZE], options[start:start + _BATCH_SIZE]
+                ))
+            return answers
+        if len(questions) == 1:
+            return [self._fallback_answer(questions[0], options[0])]
+
+        response = self.llm.generate(
+            self._batch_prompt(questions, options),
+            max_tokens=min(120 * len(questions), 1500),
+            system_prompt=_QA_SYSTEM_PROMPT,
+        )
+        answers = self._parse_batch(response.text, len(questions))
+        return [
+            self._fallback_answer(question, opts) if text is None else text
+            for text, question, opts in zip(answers, questions, options)
+        ]
+
+    async def _allm_answer_many(
+        self,
+        questions: list[str],
+        options: list[list[str]] | None = None,
+    ) -> list[str]:
+        """Async _llm_answer_many(); chunks and per-question fallbacks run concurrently."""
+        from src.llm.provider import StubProvider
+        if isinstance(self.llm, StubProvider):
+            return ["" for _ in questions]
+        options = options or [[] for _ in questions]
+        if len(questions) > _BATCH_SIZE:
+            chunks = await asyncio.gather(*(
+                self._allm_answer_many(
+                    questions[start:start + _BATCH_SIZE], options[start:start + _BATCH_SIZE]
+                )
+                for start in range(0, len(questions), _BATCH_SIZE)
+            ))
+            return [text for chunk in chunks for text in chunk]
+        if len(questions) == 1:
+            return [await self._afallback_answer(questions[0], options[0])]
+
+        response = await self.llm.agenerate(
+            self._batch_prompt(questions, options),
+            max_tokens=min(120 * len(questions), 1500),
+            system_prompt=_QA_SYSTEM_PROMPT,
+        )
+        answers = self._parse_batch(response.text, len(questions))
+        missing = [i for i, text in enumerate(answers) if text is None]
+        retried = await asyncio.gather(
+            *(self._afallback_answer(questions[i], options[i]) for i in missing)
+        )
+        for i, text in zip(missing, retried):
+            answers[i] = text
+        return answers
+
+    def _batch_prompt(self, questions: list[str], options: list[list[str]]) -> str:
+        numbered = "\n".join(
+            f"{i}. {q}{_options_hint(opts)}"
+            for i, (q, opts) in enumerate(zip(questions, options), 1)
+        )
+        return f"""\
+{self._profile_context()}
+
+Answer these job application form questions for the candidate above.
+
+QUESTIONS:
+{numbered}
+
+Reply with ONLY a JSON object mapping each question number (as a string) to \
+its answer, e.g. {{"1": "Yes", "2": "5"}}. Keep each answer brief \
+(1-3 sentences for open-ended questions, a single word/number for factual ones). \
+Where options are listed, answer with exactly one of them."""
+
+    @staticmethod
+    def _parse_batch(text: str, count: int) -> list[str | None]:
+        """Answers 1..count from a batch reply; None where missing or unparseable."""
+        try:
+            match = re.search(r"\{.*\}", text, re.DOTALL)
+            data = json.loads(match.group(0)) if match else None
+        except ValueError:
+            data = None
+        if not isinstance(data, dict):
+            logger.warning("Unparseable batch answer; answering questions one by one")
+            data = {}
+        answers = []
+        for i in range(1, count + 1):
+            value = data.get(str(i))
+            answers.append(str(value).strip() if isinstance(value, (str, int, float)) else None)
+        return answers
+
+    def _profile_context(self) -> str:
+        """Candidate facts shared by every question-answering prompt."""
+        top_skills = self.profile.get_all_skill_names()[:10]
+        return f"""\
 CANDIDATE PROFILE:
 - Name: {self._candidate_info['full_name']}
 - Location: {self._candidate_info['location']}
@@ -216,14 +639,4 @@ CANDIDATE PROFILE:
 - Salary expectation: {self._candidate_info['salary_expectation']}
 - Work preference: {self._candidate_info['remote_preference']}
 - LinkedIn: {self._candidate_info['linkedin']}
-- GitHub: {self._candidate_info['github']}
-
-Provide a brief, professional answer (1-3 sentences for open-ended questions, \
-a single word/number for factual questions). Reply with ONLY the answer text."""
-
-        response = self.llm.generate(
-            prompt,
-            max_tokens=120,
-            system_prompt=_QA_SYSTEM_PROMPT,
-        )
-        return response.text.strip()
+- GitHub: {self._candidate_info['github']}"""
@@ -0,0 +1,161 @@
+"""Offline record/replay archives for portal drivers.
+
+Record mode captures a HAR of every network exchange plus a DOM snapshot
+(``page.content()``) of each page a driver extracts from — the session
+check, every search results page and every JD page — the same thing the
+ad-hoc ``debug_card.html`` / ``data/indeed_debug.html`` dumps were for.
+
+Replay mode serves those snapshots back through Playwright ``route`` so
+LinkedInDriver, IndeedDriver and NaukriDriver run end to end with no
+network access. Document requests are answered from the snapshots; XHR and
+other sub-resources come from the HAR (or are aborted when there is none).
+With HumanSimulator delays zeroed this gives repeatable throughput numbers.
+
+Layout on disk (one directory per portal):
+    <root>/<portal>/manifest.json      ordered list of recorded pages
+    <root>/<portal>/session.har.zip    HAR with attached bodies
+    <root>/<portal>/pages/<hash>.html  DOM snapshots
+"""
+
+import hashlib
+import json
+import logging
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+RECORD = "record"
+REPLAY = "replay"
+
+
+def _normalize_url(url: str) -> str:
+    """Drop the fragment so in-page anchors don't split snapshot keys."""
+    return url.split("#")[0]
+
+
+class SessionArchive:
+    """A recorded browsing session for one portal.
+
+    Args:
+        root: Archive root directory (e.g. ``data/replay``).
+        portal: Driver name; each portal gets its own sub-directory.
+        mode: ``"record"`` or ``"replay"``.
+    """
+
+    def __init__(self, root: str | Path, portal: str, mode: str):
+        if mode not in (RECORD, REPLAY):
+            raise ValueError(f"Unknown archive mode: {mode!r}")
+        self.dir = Path(root) / portal
+        self.portal = portal
+        self.mode = mode
+        self.pages: list[dict[str, str]] = []
+        if mode == REPLAY:
+            self._load()
+
+    @property
+    def recording(self) -> bool:
+        return self.mode == RECORD
+
+    @property
+    def replaying(self) -> bool:
+        return self.mode == REPLAY
+
+    @property
+    def har_path(self) -> Path:
+        return self.dir / "session.har.zip"
+
+    @property
+    def manifest_path(self) -> Path:
+        return self.dir / "manifest.json"
+
+    # ── Record ───────────────────────────────────────────────
+
+    def launch_kwargs(self) -> dict:
+        """Extra launch_persistent_context kwargs (HAR capture when recording)."""
+        if not self.recording:
+            return {}
+        self.dir.mkdir(parents=True, exist_ok=True)
+        return {"record_har_path": str(self.har_path), "record_har_content": "attach"}
+
+    async def snapshot(self, page, kind: str) -> None:
+        """Save the rendered DOM of the current page (record mode only).
+
+        Args:
+            page: Playwright page.
+            kind: ``"session"``, ``"search"`` or ``"jd"``.
+        """
+        if not self.recording:
+            return
+        url = _normalize_url(page.url)
+        html = await page.content()
+        name = hashlib.sha1(url.encode("utf-8")).hexdigest()[:16] + ".html"
+        pages_dir = self.dir / "pages"
+        pages_dir.mkdir(parents=True, exist_ok=True)
+        (pages_dir / name).write_text(html, encoding="utf-8")
+        self.pages = [p for p in self.pages if p["url"] != url]
+        self.pages.append({"url": url, "kind": kind, "file": name})
+        logger.debug("%s: recorded %s snapshot %s", self.portal, kind, url)
+
+    def save(self) -> None:
+        """Write the manifest (record mode only)."""
+        if not self.recording or not self.pages:
+            return
+        self.dir.mkdir(parents=True, exist_ok=True)
+        self.manifest_path.write_text(
+            json.dumps({"portal": self.portal, "pages": self.pages}, indent=2),
+            encoding="utf-8",
+        )
+        logger.info("%s: recorded %d pages → %s", self.portal, len(self.pages), self.dir)
+
+    # ── Replay ───────────────────────────────────────────────
+
+    async def install(self, context) -> None:
+        """Route all requests in a browser context to the archive (replay only)."""
+        if not self.replaying:
+            return
+        # Routes match last-registered first: documents → snapshots, rest → HAR.
+        if self.har_path.exists():
+            await context.route_from_har(str(self.har_path), not_found="abort")
+        await context.route("**/*", self._serve)
+
+    async def _serve(self, route) -> None:
+        request = route.request
+        if request.resource_type == "document":
+            html = self.lookup(request.url)
+            await route.fulfill(
+                status=200 if html is not None else 404,
+                content_type="text/html; charset=utf-8",
+                body=html if html is not None else "<html><body></body></html>",
+            )
+            return
+        if self.har_path.exists():
+            await route.fallback()
+        else:
+            await route.abort()
+
+    def lookup(self, url: str) -> str | None:
+        """Return the recorded HTML for a URL, or None if it wasn't recorded."""
+        url = _normalize_url(url)
+        for entry in self.pages:
+            if entry["url"] == url:
+                return (self.dir / "pages" / entry["file"]).read_text(encoding="utf-8")
+        return None
+
+    def next_search_url(self, current_url: str) -> str | None:
+        """URL of the search page recorded after ``current_url``.
+
+        Click-driven pagination can't be replayed (portal scripts are not
+        served), so replay navigates straight to the next recorded page.
+        """
+        searches = [p["url"] for p in self.pages if p["kind"] == "search"]
+        current_url = _normalize_url(current_url)
+        if current_url in searches:
+            idx = searches.index(current_url) + 1
+            return searches[idx] if idx < len(searches) else None
+        return None
+
+    def _load(self) -> None:
+        if not self.manifest_path.exists():
+            raise FileNotFoundError(f"No recorded session at {self.manifest_path}")
+        data = json.loads(self.manifest_path.read_text(encoding="utf-8"))
+        self.pages = data.get("pages", [])
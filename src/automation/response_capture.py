@@ -0,0 +1,179 @@
+"""Capture of XHR / fetch JSON responses for portal drivers.
+
+Portals render their result pages from internal JSON APIs (LinkedIn Voyager,
+Naukri's job search API, …). Reading those bodies is faster and sturdier
+than walking the DOM, but every driver would otherwise repeat the same
+plumbing: match URLs, read bodies off the response event, buffer them until
+the extractor asks, time out, and keep memory bounded.
+
+Rules are configured per portal in the selector YAML:
+
+    capture:
+      jobs-search:
+        url_pattern: "/jobapi/v3/search"   # regex, matched with re.search
+        wait_ms: 8000                      # default timeout for captured()
+        max_buffered: 5                    # oldest bodies dropped beyond this
+        max_bytes: 2000000                 # larger bodies are skipped
+
+Buffers are cleared whenever the main frame loads a new document, so a
+caller only ever sees bodies belonging to the page it is looking at.
+"""
+
+import asyncio
+import json
+import logging
+import re
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class CapturedResponse:
+    """One captured JSON response body."""
+    url: str
+    status: int
+    body: Any
+
+
+@dataclass
+class CaptureRule:
+    """A named URL pattern whose JSON responses are buffered."""
+    name: str
+    url_pattern: str
+    wait_ms: int = 5000
+    max_buffered: int = 10
+    max_bytes: int = 2_000_000
+    pattern: re.Pattern = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self.pattern = re.compile(self.url_pattern)
+
+
+class ResponseCapture:
+    """Bounded per-rule buffers of JSON response bodies.
+
+    Args:
+        rules: Capture rules; usually built with from_selectors().
+    """
+
+    def __init__(self, rules: list[CaptureRule] | None = None):
+        self.rules = {rule.name: rule for rule in rules or []}
+        self._buffers: dict[str, deque[CapturedResponse]] = {
+            name: deque(maxlen=rule.max_buffered) for name, rule in self.rules.items()
+        }
+        self._arrived = {name: asyncio.Event() for name in self.rules}
+        self._in_flight: dict[str, set[asyncio.Task]] = {name: set() for name in self.rules}
+        self.dropped = 0   # bodies skipped for size or evicted by max_buffered
+
+    @classmethod
+    def from_selectors(cls, sel: dict) -> "ResponseCapture":
+        """Build rules from a portal YAML ``capture`` section."""
+        rules = []
+        for name, spec in (sel.get("capture") or {}).items():
+            if not spec or not spec.get("url_pattern"):
+                continue
+            rules.append(CaptureRule(
+                name=name,
+                url_pattern=spec["url_pattern"],
+                wait_ms=spec.get("wait_ms", 5000),
+                max_buffered=spec.get("max_buffered", 10),
+                max_bytes=spec.get("max_bytes", 2_000_000),
+            ))
+        return cls(rules)
+
+    # ── Feeding (from the page "response" event) ─────────────
+
+    def observe(self, response) -> None:
+        """Inspect one page response; schedule a body read if a rule matches."""
+        if not self.rules:
+            return
+        try:
+            if response.request.resource_type == "document":
+                if response.frame.parent_frame is None:
+                    self.reset()   # new page: earlier bodies no longer apply
+                return
+            if not response.ok:
+                return
+            url = response.url
+        except Exception:
+            return
+        for name, rule in self.rules.items():
+            if rule.pattern.search(url):
+                task = asyncio.ensure_future(self._read(rule, response))
+                self._in_flight[name].add(task)
+                task.add_done_callback(self._in_flight[name].discard)
+
+    async def _read(self, rule: CaptureRule, response) -> None:
+        try:
+            raw = await response.body()
+        except Exception:
+            return  # page closed or body evicted before we got to it
+        if len(raw) > rule.max_bytes:
+            self.dropped += 1
+            logger.debug("capture %s: skipped %d-byte body from %s",
+                         rule.name, len(raw), response.url)
+            return
+        try:
+            body = json.loads(raw)
+        except ValueError:
+            return  # not JSON (e.g. an HTML challenge page)
+        self.add(rule.name, CapturedResponse(url=response.url, status=response.status, body=body))
+
+    def add(self, name: str, captured: CapturedResponse) -> None:
+        """Buffer a body under a rule (oldest evicted beyond max_buffered)."""
+        buffer = self._buffers[name]
+        if len(buffer) == buffer.maxlen:
+            self.dropped += 1
+        buffer.append(captured)
+        self._arrived[name].set()
+
+    # ── Consuming ────────────────────────────────────────────
+
+    async def captured(
+        self,
+        name: str,
+        timeout: float | None = None,
+        in_flight_only: bool = False,
+    ) -> list[CapturedResponse]:
+        """Drain the bodies buffered for a rule, oldest first.
+
+        If none are buffered yet, waits up to ``timeout`` seconds (default:
+        the rule's wait_ms) for the first one. With ``in_flight_only`` it
+        waits only while a matching body is still being read, so pages that
+        never issue the request fall back to the DOM without delay.
+
+        Returns:
+            The captured responses; empty on timeout.
+        """
+        if name not in self.rules:
+            return []
+        if not self._buffers[name]:
+            if in_flight_only and not self._in_flight[name]:
+                return []
+            wait = self.rules[name].wait_ms / 1000 if timeout is None else timeout
+            if wait <= 0:
+                return []
+            try:
+                await asyncio.wait_for(self._arrived[name].wait(), wait)
+            except asyncio.TimeoutError:
+                logger.debug("capture %s: nothing within %.1fs", name, wait)
+                return []
+        drained = list(self._buffers[name])
+        self.reset(name)
+        return drained
+
+    def reset(self, name: str | None = None) -> None:
+        """Forget buffered bodies for one rule (or all rules)."""
+        for key in [name] if name else list(self.rules):
+            self._buffers[key].clear()
+            self._arrived[key].clear()
+
+    def close(self) -> None:
+        """Cancel pending body reads and drop all buffers."""
+        for tasks in self._in_flight.values():
+            for task in list(tasks):
+                task.cancel()
+        self.reset()
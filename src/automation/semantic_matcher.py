@@ -0,0 +1,213 @@
+"""Local nearest-neighbour matching of form questions to known answers.
+
+Q&A bank regexes miss paraphrases ("Do you need a visa to work here?" vs
+``require.*sponsorship|need.*visa``), so those questions fell through to the
+LLM. SemanticMatcher indexes short phrasings of every known question — the
+literal parts of each bank pattern, optional ``examples`` on bank entries,
+the derived-field patterns and previously answered questions — as TF-IDF
+vectors over words and character trigrams (NumPy, CPU only, no model
+downloads) and returns the stored answer of the most similar phrasing when
+its cosine similarity clears a threshold.
+
+A similar phrasing is not enough to reuse its answer: "experience with
+Java?" must not get the answer stored for "experience with Python?". The
+cosine is taken over the union of query and index features, so words the
+index has never seen still lower the score. Every content word of the
+matched phrasing must also appear in the question (allowing inflections
+such as ethnic / ethnicity).
+
+The bank/derived index is built lazily and shared per profile version (see
+for_version), so every QuestionAnswerer of the same profile reuses one
+matrix; each answerer keeps a small index of its own answered questions.
+"""
+
+import logging
+import re
+from dataclasses import dataclass
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# Words that carry no signal in form questions
+_STOP_WORDS = frozenset(
+    "a an and any are at be can did do does for from have has here how i in is it "
+    "of on or our please the this that to we what which will would with you your".split()
+)
+_WORD_RE = re.compile(r"[a-z0-9+#]+")
+_REGEX_SYNTAX_RE = re.compile(r"\\[a-z]|[()\[\]{}|?*+.^$\\]", re.IGNORECASE)
+
+# version → shared index (a handful of profile versions per process at most)
+_INDEXES: dict[str, "SemanticMatcher"] = {}
+_MAX_INDEXES = 4
+
+
+def pattern_phrases(pattern: str) -> list[str]:
+    """Literal phrasings of a question regex, one per top-level alternative.
+
+    ``"require.*sponsorship|need.*visa"`` → ``["require sponsorship", "need visa"]``.
+    """
+    phrases = []
+    depth = 0
+    start = 0
+    for i, ch in enumerate(pattern + "|"):
+        if ch == "(" and not pattern[i - 1:i] == "\\":
+            depth += 1
+        elif ch == ")" and not pattern[i - 1:i] == "\\":
+            depth -= 1
+        elif ch == "|" and depth <= 0:
+            phrase = " ".join(_REGEX_SYNTAX_RE.sub(" ", pattern[start:i]).split())
+            if phrase:
+                phrases.append(phrase)
+            start = i + 1
+    return phrases
+
+
+def _content_words(text: str) -> list[str]:
+    return [w for w in _WORD_RE.findall(text.lower()) if w not in _STOP_WORDS]
+
+
+def _features(text: str) -> list[str]:
+    """Content words plus their character trigrams (robust to inflection)."""
+    features = []
+    for word in _content_words(text):
+        features.append("w:" + word)
+        padded = f" {word} "
+        features.extend(padded[i:i + 3] for i in range(len(padded) - 2))
+    return features
+
+
+def _same_word(a: str, b: str) -> bool:
+    """Equal, a plural, or sharing a stem of 5+ letters (prefer / preferred)."""
+    if a == b or a == b + "s" or b == a + "s":
+        return True
+    stem = 0
+    for x, y in zip(a, b):
+        if x != y:
+            break
+        stem += 1
+    return stem >= 5 and stem >= min(len(a), len(b)) - 3
+
+
+def _covers(question_words: list[str], phrase_words: tuple[str, ...]) -> bool:
+    """True if every content word of the indexed phrasing occurs in the question."""
+    return all(any(_same_word(p, q) for q in question_words) for p in phrase_words)
+
+
+@dataclass
+class SemanticMatch:
+    """Best stored answer for a question."""
+    answer: str
+    score: float      # cosine similarity, 0-1
+    matched: str      # the indexed phrasing that matched
+
+
+class SemanticMatcher:
+    """TF-IDF nearest-neighbour index over known question phrasings.
+
+    Args:
+        threshold: Minimum cosine similarity for a match.
+    """
+
+    def __init__(self, threshold: float = 0.7):
+        self.threshold = threshold
+        self._texts: list[str] = []
+        self._words: list[tuple[str, ...]] = []
+        self._answers: list[str] = []
+        self._seen: set[str] = set()
+        self._vocab: dict[str, int] = {}
+        self._idf: np.ndarray | None = None
+        self._matrix: np.ndarray | None = None
+
+    @classmethod
+    def for_version(cls, version: str, entries, threshold: float = 0.7) -> "SemanticMatcher":
+        """Shared index for a profile version, built from ``entries`` on first use.
+
+        Args:
+            version: Hash identifying the profile / Q&A bank contents.
+            entries: Zero-arg callable returning ``(phrasing, answer)`` pairs;
+                     only called when the version has no index yet.
+            threshold: Similarity threshold for a newly built index.
+        """
+        index = _INDEXES.get(version)
+        if index is None:
+            if len(_INDEXES) >= _MAX_INDEXES:
+                _INDEXES.pop(next(iter(_INDEXES)))
+            index = _INDEXES[version] = cls(threshold)
+            for text, answer in entries():
+                index.add(text, answer)
+            logger.debug("Semantic index %s: %d phrasings", version, len(index))
+        return index
+
+    def add(self, text: str, answer: str) -> None:
+        """Index a phrasing → answer pair (first answer for a phrasing wins)."""
+        key = " ".join(text.lower().split())
+        if not (key and answer) or key in self._seen:
+            return
+        self._seen.add(key)
+        self._texts.append(key)
+        self._words.append(tuple(_content_words(key)))
+        self._answers.append(answer)
+        self._matrix = None   # rebuilt on the next match
+
+    def match(self, question: str) -> SemanticMatch | None:
+        """Most similar indexed phrasing's answer, or None below the threshold."""
+        if not self._texts:
+            return None
+        if self._matrix is None:
+            self._build()
+        features = _features(question)
+        vector, unseen = self._vectorize(features)
+        # Features the index has never seen count towards the query's norm
+        norm = np.sqrt(vector @ vector + unseen)
+        if not norm:
+            return None
+        scores = self._matrix @ (vector / norm)
+        words = _content_words(question)
+        for best in np.argsort(-scores):
+            score = float(scores[best])
+            if score < self.threshold:
+                return None
+            if _covers(words, self._words[best]):
+                return SemanticMatch(
+                    answer=self._answers[best], score=score, matched=self._texts[best]
+                )
+        return None
+
+    def __len__(self) -> int:
+        return len(self._texts)
+
+    # ── Private helpers ──────────────────────────────────────
+
+    def _build(self) -> None:
+        docs = [_features(t) for t in self._texts]
+        self._vocab = {}
+        for doc in docs:
+            for feature in doc:
+                self._vocab.setdefault(feature, len(self._vocab))
+        counts = self._counts(docs)
+        df = (counts > 0).sum(axis=0)
+        self._idf = np.log((1 + len(docs)) / (1 + df)) + 1.0
+        matrix = np.log1p(counts) * self._idf
+        norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+        self._matrix = matrix / np.where(norms == 0, 1.0, norms)
+
+    def _counts(self, docs: list[list[str]]) -> np.ndarray:
+        counts = np.zeros((len(docs), len(self._vocab)))
+        for row, doc in enumerate(docs):
+            for feature in doc:
+                col = self._vocab.get(feature)
+                if col is not None:
+                    counts[row, col] += 1
+        return counts
+
+    def _vectorize(self, features: list[str]) -> tuple[np.ndarray, float]:
+        """TF-IDF vector over the index vocabulary, plus the squared weight of
+        unseen features (idf as if in no document)."""
+        vector = np.log1p(self._counts([features])[0]) * self._idf
+        unseen: dict[str, int] = {}
+        for feature in features:
+            if feature not in self._vocab:
+                unseen[feature] = unseen.get(feature, 0) + 1
+        idf = np.log(1 + len(self._texts)) + 1.0
+        return vector, float(sum((np.log1p(n) * idf) ** 2 for n in unseen.values()))
@@ -24,6 +24,8 @@ import asyncio
 import logging
 import os
 import sys
+import time
+from datetime import UTC, datetime
 from pathlib import Path
 
 from src.automation.drivers.base import SearchConfig
@@ -84,6 +86,10 @@ def build_parser() -> argparse.ArgumentParser:
         description="ATS Optimizer — Automated Job Application Pipeline",
         epilog="Run 'python -m src.cli setup-browser' first to log in to portals.",
     )
+    parser.add_argument(
+        "--no-llm-cache", action="store_true",
+        help="Always call the LLM instead of reusing cached responses (still refreshes the cache)",
+    )
     sub = parser.add_subparsers(dest="command")
 
     # ── setup-browser ─────────────────────────────────────
@@ -117,12 +123,57 @@ def build_parser() -> argparse.ArgumentParser:
         "--notice-period", default=os.environ.get("NOTICE_PERIOD", "1 month"),
         help="Notice period for application forms",
     )
+    search.add_argument(
+        "--incremental", action="store_true",
+        help="Skip known jobs and stop paging at the first fully-known results page",
+    )
+    search.add_argument(
+        "--save-run", action="store_true",
+        help="Record this run (seed, high-water marks, LLM usage) in the database; "
+             "implied by --incremental",
+    )
+    search.add_argument(
+        "--clock", choices=["real", "zero", "virtual"], default="real",
+        help="Humanization delays: real sleeps, zero (skip) or virtual (skip, keep a virtual clock)",
+    )
+    search.add_argument(
+        "--seed", type=int, default=None,
+        help="Humanization schedule seed (reproduce a run's delays from its SearchRun)",
+    )
+    search.add_argument(
+        "--llm-budget-usd", type=float, default=None,
+        help="Estimated LLM spend cap for this run; rule-based fallbacks once reached",
+    )
+    archive = search.add_mutually_exclusive_group()
+    archive.add_argument(
+        "--record", metavar="DIR",
+        help="Save HAR + DOM snapshots of every visited page under DIR/<portal>",
+    )
+    archive.add_argument(
+        "--replay", metavar="DIR",
+        help="Run offline from pages recorded with --record (delays disabled)",
+    )
 
     # ── profile ──────────────────────────────────────────
     profile_cmd = sub.add_parser("profile", help="View candidate profile")
     profile_cmd.add_argument("--show", action="store_true", help="Display current profile")
     profile_cmd.add_argument("--path", default="data/profiles/candidate_profile.yaml")
 
+    # ── answers ──────────────────────────────────────────
+    answers = sub.add_parser(
+        "answers", help="List cached LLM form answers / promote them to the Q&A bank",
+    )
+    answers.add_argument(
+        "--promote", action="store_true",
+        help="Add frequently reused answers to the profile's Q&A bank",
+    )
+    answers.add_argument("--min-hits", type=int, default=3, help="Reuses required for promotion")
+    answers.add_argument("--profile", default="data/profiles/candidate_profile.yaml")
+
+    # ── llm-cache ────────────────────────────────────────
+    llm_cache = sub.add_parser("llm-cache", help="Show LLM response cache statistics")
+    llm_cache.add_argument("--clear", action="store_true", help="Delete every cached response")
+
     # ── analyze ──────────────────────────────────────────
     analyze = sub.add_parser("analyze", help="ATS score a resume against a JD")
     analyze.add_argument("--resume", required=True, help="Path to resume text file")
@@ -130,10 +181,14 @@ def build_parser() -> argparse.ArgumentParser:
 
     # ── generate ─────────────────────────────────────────
     gen = sub.add_parser("generate", help="Generate a tailored LaTeX/PDF resume for a JD")
-    gen.add_argument("--jd", required=True, help="Path to job description text file")
+    gen.add_argument("--jd", required=True, nargs="+", help="Path(s) to job description text files")
     gen.add_argument("--profile", default="data/profiles/candidate_profile.yaml")
     gen.add_argument("--output", default="data/output/resumes", help="Output directory")
     gen.add_argument("--no-llm", action="store_true", help="Skip LLM (faster, rule-based only)")
+    gen.add_argument(
+        "--batch", action="store_true",
+        help="Send all LLM calls through one provider batch (half price; may take hours)",
+    )
 
     return parser
 
@@ -200,7 +255,13 @@ def run_test_llm(args):
     print(f"{'='*55}")
 
     provider = get_llm_provider()
-    print(f"  Provider : {type(provider).__name__}")
+    # A connectivity check must reach the API, not the response cache
+    if hasattr(provider, "bypass"):
+        provider.bypass = True
+    inner = provider
+    while hasattr(inner, "inner"):  # cache / scheduler wrappers
+        inner = inner.inner
+    print(f"  Provider : {type(inner).__name__}")
 
     if isinstance(provider, StubProvider):
         print("  Status   : STUB (no API key set or provider config missing)")
@@ -212,16 +273,21 @@ def run_test_llm(args):
     print("  Testing API call...")
     t0 = time.time()
     try:
-        resp = provider.generate(
+        with provider.stream(
             "Reply with exactly: OK",
             max_tokens=10,
             system_prompt="You are a test responder. Reply with exactly what is requested.",
-        )
+        ) as stream:
+            for _ in stream:
+                pass
         elapsed = time.time() - t0
+        resp, metrics = stream.response, stream.metrics
         print(f"  Response : {resp.text!r}")
         print(f"  Model    : {resp.model}")
         print(f"  Tokens   : {resp.tokens_used}")
         print(f"  Latency  : {elapsed:.2f}s")
+        if metrics.ttft_s is not None:
+            print(f"  TTFT     : {metrics.ttft_s:.2f}s ({metrics.tokens_per_s:.1f} tok/s)")
         print("  Status   : OK ✓")
     except Exception as e:
         print(f"  Status   : FAILED — {e}")
@@ -255,6 +321,24 @@ async def run_search(args):
         logger.error("No portal drivers configured.")
         return 1
 
+    if getattr(args, "record", None) or getattr(args, "replay", None):
+        from src.automation.replay import RECORD, REPLAY, SessionArchive
+        mode, root = (RECORD, args.record) if args.record else (REPLAY, args.replay)
+        for driver in drivers:
+            driver.use_archive(SessionArchive(root, driver.driver_name(), mode))
+        logger.info(f"Archive mode: {mode} ({root})")
+
+    if getattr(args, "seed", None) is not None:
+        from src.automation.human_simulator import HumanizationSchedule
+        for driver in drivers:
+            driver.sim.schedule = HumanizationSchedule(args.seed)
+
+    if getattr(args, "clock", "real") != "real":
+        from src.automation.clock import Sleeper
+        for driver in drivers:
+            driver.sim.sleeper = Sleeper(args.clock)
+        logger.info(f"Humanization clock: {args.clock}")
+
     config = SearchConfig(
         keywords=args.keywords,
         location=args.location,
@@ -262,6 +346,37 @@ async def run_search(args):
         max_results=args.max_results,
     )
 
+    for driver in drivers:
+        budget = driver.estimate_time_budget(config)
+        logger.info(
+            f"{driver.driver_name()}: ≤{budget['jobs']} jobs over {budget['pages']} page(s) — "
+            f"humanization time ≥{budget['min_s']:.0f}s (expected ~{budget['expected_s']:.0f}s), "
+            f"seed {driver.sim.seed}"
+        )
+
+    # Search history (SearchRun rows) is only touched when asked for; a
+    # database problem costs the history, never the run itself
+    session = None
+    if getattr(args, "incremental", False) or getattr(args, "save_run", False):
+        from sqlalchemy.exc import SQLAlchemyError
+        from src.database import get_session_factory, init_db
+        try:
+            init_db()
+            session = get_session_factory()()
+            if getattr(args, "incremental", False):
+                from src.discovery.incremental import load_incremental_state
+                load_incremental_state(session, config, args.portals)
+                logger.info(f"Incremental crawl: {len(config.known_job_keys)} known jobs")
+        except SQLAlchemyError as e:
+            logger.warning(f"Search history unavailable, running without it: {e}")
+            if session is not None:
+                session.close()
+            session = None
+
+    if getattr(args, "llm_budget_usd", None) is not None:
+        from src.config import get_config
+        get_config().llm_metering.budget_usd = args.llm_budget_usd
+
     work_auth = os.environ.get("WORK_AUTHORIZATION", "Yes, authorized to work in India")
     remote_pref = os.environ.get("REMOTE_PREFERENCE", "Remote or Hybrid preferred; open to on-site")
 
@@ -277,15 +392,53 @@ async def run_search(args):
     )
 
     logger.info(f"Searching: {args.keywords} | portals={args.portals} | max={args.max_results}")
+    started = time.perf_counter()
+    started_at = datetime.now(UTC)
     result = await orch.run(config)
+    elapsed = time.perf_counter() - started
+
+    # SearchRun rows carry high-water marks, humanization seeds and LLM usage
+    if session is not None:
+        from sqlalchemy.exc import SQLAlchemyError
+        from src.discovery.incremental import record_search_runs
+        try:
+            record_search_runs(session, config, result, started_at)
+        except SQLAlchemyError as e:
+            session.rollback()
+            logger.warning(f"Could not save the search run: {e}")
+        finally:
+            session.close()
 
     notifier.notify_pipeline_complete(result)
     print(f"\n{'='*55}")
     print(f"  Jobs discovered   : {result.jobs_discovered}")
     print(f"  New (unique)      : {result.jobs_new}")
     print(f"  Duplicates skipped: {result.jobs_duplicates}")
+    print(f"  JD cache hit/miss : {result.jd_cache_hits}/{result.jd_cache_misses}")
     print(f"  Scored >= {args.min_score:.0f}     : {result.jobs_scored}")
     print(f"  Resumes generated : {result.resumes_generated}")
+    for portal, mark in result.high_water.items():
+        early = " (stopped at known jobs)" if mark.stopped_early else ""
+        print(f"  {portal:<18}: {mark.pages_crawled} page(s) crawled{early}")
+    if result.captchas_parked:
+        print(f"  CAPTCHAs solved   : {result.captchas_solved}/{result.captchas_parked} parked")
+    usage = result.llm_usage
+    if usage.get("calls") or usage.get("refused_calls"):
+        print(
+            f"  LLM usage         : {usage['calls']} calls, {usage['input_tokens']} in "
+            f"({usage['cached_tokens']} cached) / {usage['output_tokens']} out, "
+            f"~${usage['cost_usd']:.4f}"
+        )
+        for site, site_usage in sorted(usage["by_call_site"].items()):
+            print(f"    {site:<16}: {site_usage['calls']} calls, ~${site_usage['cost_usd']:.4f}")
+        if usage["budget_exhausted"]:
+            print(f"  LLM budget        : spent; {usage['refused_calls']} call(s) used fallbacks")
+    print(f"  Elapsed           : {elapsed:.1f}s")
+    print(
+        f"  Human time        : {result.human_seconds_simulated:.1f}s simulated, "
+        f"{result.human_seconds_slept:.1f}s slept; "
+        f"compute {max(0.0, elapsed - result.human_seconds_slept):.1f}s"
+    )
     if args.auto_apply:
         print(f"  Applications sent : {result.applications_submitted}")
         print(f"  Apply failures    : {result.applications_failed}")
@@ -298,7 +451,7 @@ async def run_search(args):
 
 
 def run_generate(args):
-    """Generate a tailored LaTeX PDF resume for a specific JD."""
+    """Generate a tailored LaTeX PDF resume for each JD (--batch: one provider batch)."""
     import hashlib
     from src.generator.content_selector import ContentSelector
     from src.generator.latex_renderer import generate_latex_resume
@@ -309,26 +462,32 @@ def run_generate(args):
         return 1
     profile = pm.load()
 
-    jd_text = Path(args.jd).read_text(encoding="utf-8")
-    jd_hash = hashlib.md5(jd_text.encode()).hexdigest()[:8]
+    jds = {}
+    for path in args.jd:
+        jd_text = Path(path).read_text(encoding="utf-8")
+        jds[hashlib.md5(jd_text.encode()).hexdigest()[:8]] = jd_text
 
     if not os.environ.get("GROK_API_KEY") and not args.no_llm:
         logger.warning("GROK_API_KEY not set — using rule-based content selection.")
 
     selector = ContentSelector(use_llm=not args.no_llm)
-    content = selector.select(profile, jd_text)
-
-    files = generate_latex_resume(content, args.output, job_id=jd_hash)
-    print(f"\n{'='*55}")
-    print(f"  Profile   : {profile.full_name}")
-    print(f"  Summary   : {content.summary[:80]}...")
-    print(f"  Skills    : {len(content.skills)} selected")
-    print(f"  Roles     : {len(content.experience)}")
-    print(f"  .tex file : {files.get('tex', 'N/A')}")
-    print(f"  PDF       : {files.get('pdf') or '(compile failed — see .tex)' }")
-    if files.get("error"):
-        print(f"  Error     : {files['error']}")
-    print(f"{'='*55}\n")
+    if args.batch:
+        contents = selector.select_batch(profile, jds)
+    else:
+        contents = {jd_hash: selector.select(profile, jd_text) for jd_hash, jd_text in jds.items()}
+
+    for jd_hash, content in contents.items():
+        files = generate_latex_resume(content, args.output, job_id=jd_hash)
+        print(f"\n{'='*55}")
+        print(f"  Profile   : {profile.full_name}")
+        print(f"  Summary   : {content.summary[:80]}...")
+        print(f"  Skills    : {len(content.skills)} selected")
+        print(f"  Roles     : {len(content.experience)}")
+        print(f"  .tex file : {files.get('tex', 'N/A')}")
+        print(f"  PDF       : {files.get('pdf') or '(compile failed — see .tex)' }")
+        if files.get("error"):
+            print(f"  Error     : {files['error']}")
+        print(f"{'='*55}\n")
     return 0
 
 
@@ -359,6 +518,60 @@ def run_profile(args):
     return 0
 
 
+def run_answers(args):
+    """Show the LLM answer cache; optionally promote answers into the Q&A bank."""
+    from src.automation.answer_cache import AnswerCache
+
+    cache = AnswerCache.from_config()
+    if args.promote:
+        manager = ProfileManager(Path(args.profile))
+        profile = manager.load()
+        qa_bank = list(profile.qa_bank)
+        added = cache.promote(qa_bank, min_hits=args.min_hits)
+        if added:
+            manager.update_section("qa_bank", qa_bank)
+        print(f"\nPromoted {len(added)} answer(s) into {args.profile}")
+        for entry in added:
+            print(f"  {entry['question_pattern']}  →  {entry['answer']}")
+        print()
+        return 0
+
+    rows = cache.entries()
+    print(f"\n{'='*55}")
+    print(f"  Cached LLM answers: {len(rows)}")
+    print(f"{'='*55}")
+    for row in rows:
+        flag = " [promoted]" if row["promoted"] else ""
+        print(f"  ({row['hits']:>3} reuses, {row['model'] or row['source']}){flag}")
+        print(f"    Q: {row['question']}")
+        print(f"    A: {row['answer']}")
+    print()
+    return 0
+
+
+def run_llm_cache(args):
+    """Show LLM response cache statistics; optionally clear it."""
+    from src.llm.cache import LLMResponseCache
+
+    cache = LLMResponseCache.from_config()
+    if args.clear:
+        print(f"\nRemoved {cache.clear()} cached response(s) from {cache.path}\n")
+        return 0
+
+    stats = cache.stats()
+    print(f"\n{'='*55}")
+    print("  LLM Response Cache")
+    print(f"{'='*55}")
+    print(f"  Path         : {cache.path}")
+    print(f"  Enabled      : {cache.enabled}")
+    print(f"  Entries      : {stats['entries']} (max {cache.max_entries})")
+    print(f"  TTL          : {cache.ttl_seconds / 3600:.0f}h")
+    print(f"  Hits         : {stats['hits']}")
+    print(f"  Tokens saved : {stats['tokens_saved']}")
+    print(f"{'='*55}\n")
+    return 0
+
+
 def run_analyze(args):
     """ATS score a resume against a JD and show suggestions."""
     from src.analyzer.scorer import ATSScorer
@@ -400,6 +613,9 @@ def main():
     if not args.command:
         parser.print_help()
         return 1
+    if args.no_llm_cache:
+        from src.config import get_config
+        get_config().llm_cache.bypass = True
 
     if args.command == "setup-browser":
         return asyncio.run(run_setup_browser(args))
@@ -411,6 +627,10 @@ def main():
         return run_generate(args)
     elif args.command == "profile":
         return run_profile(args)
+    elif args.command == "answers":
+        return run_answers(args)
+    elif args.command == "llm-cache":
+        return run_llm_cache(args)
     elif args.command == "analyze":
         return run_analyze(args)
     return 0
@@ -20,6 +20,14 @@ class LLMConfig(BaseModel):
     model: str = "llama3"
     api_key: str | None = None
     base_url: str = "http://localhost:11434"
+    # HTTP client pool shared by all calls of one provider instance
+    timeout_s: float = 120.0
+    connect_timeout_s: float = 10.0
+    max_connections: int = 10
+    max_keepalive_connections: int = 5
+    keepalive_expiry_s: float = 30.0
+    # Ollama: how long the model (and its prompt-prefix cache) stays loaded
+    keep_alive: str = "30m"
 
 
 class BrowserConfig(BaseModel):
@@ -28,6 +36,52 @@ class BrowserConfig(BaseModel):
     user_data_dir: str = "data/browser_profiles"
 
 
+class JDCacheConfig(BaseModel):
+    enabled: bool = True
+    path: str = "data/cache/jd_cache.db"
+    ttl_hours: float = 72.0
+    max_entries: int = 5000
+
+
+class AnswerCacheConfig(BaseModel):
+    enabled: bool = True
+    path: str = "data/answer_cache.db"
+
+
+class LLMCacheConfig(BaseModel):
+    enabled: bool = True
+    path: str = "data/cache/llm_cache.db"
+    ttl_hours: float = 168.0
+    max_entries: int = 20000
+    bypass: bool = False
+
+
+class LLMSchedulerConfig(BaseModel):
+    enabled: bool = True
+    requests_per_min: float | None = 60.0
+    tokens_per_min: float | None = 200_000.0
+    max_concurrency: int = 4
+    max_retries: int = 4
+    backoff_base_s: float = 1.0
+    backoff_max_s: float = 30.0
+    # Per-provider overrides, e.g. {"ollama": {"requests_per_min": None}}
+    providers: dict[str, dict[str, Any]] = {}
+
+
+class LLMMeteringConfig(BaseModel):
+    # Per pipeline run; when spent, callers use their rule-based fallbacks
+    budget_tokens: int | None = None
+    budget_usd: float | None = None
+    # Model-name prefix -> [input, cached input, output] USD per million tokens,
+    # optionally followed by the batch API price factor (default 0.5)
+    prices: dict[str, list[float]] = {}
+
+
+class PacingConfig(BaseModel):
+    enabled: bool = True
+    state_path: str = "data/cache/pacing_state.json"
+
+
 class NotificationsConfig(BaseModel):
     enabled: bool = False
     method: str = "desktop"
@@ -51,6 +105,12 @@ class Config(BaseModel):
     database: DatabaseConfig = DatabaseConfig()
     llm: LLMConfig = LLMConfig()
     browser: BrowserConfig = BrowserConfig()
+    jd_cache: JDCacheConfig = JDCacheConfig()
+    answer_cache: AnswerCacheConfig = AnswerCacheConfig()
+    llm_cache: LLMCacheConfig = LLMCacheConfig()
+    llm_scheduler: LLMSchedulerConfig = LLMSchedulerConfig()
+    llm_metering: LLMMeteringConfig = LLMMeteringConfig()
+    pacing: PacingConfig = PacingConfig()
     notifications: NotificationsConfig = NotificationsConfig()
     scoring: ScoringConfig = ScoringConfig()
 
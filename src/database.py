@@ -2,7 +2,7 @@
 
 from pathlib import Path
 
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, inspect, text
 from sqlalchemy.orm import DeclarativeBase, Session, sessionmaker
 
 from src.config import get_config, PROJECT_ROOT
@@ -35,8 +35,37 @@ def get_session_factory(engine=None) -> sessionmaker[Session]:
     return sessionmaker(bind=engine, expire_on_commit=False)
 
 
+# Columns added to existing tables after their first release. create_all()
+# only creates missing tables, so init_db() adds these to older databases.
+_ADDED_COLUMNS: dict[str, list[str]] = {
+    "search_runs": [
+        "high_water_ids", "high_water_at", "pages_crawled", "stopped_early",
+        "humanization_seed", "llm_usage",
+    ],
+}
+
+
 def init_db(engine=None):
-    """Create all tables."""
+    """Create all tables and add columns missing from older databases."""
+    import src.models  # noqa: F401 — registers the tables on Base.metadata
+
     if engine is None:
         engine = get_engine()
     Base.metadata.create_all(engine)
+    _add_missing_columns(engine)
+
+
+def _add_missing_columns(engine) -> None:
+    """ALTER TABLE ... ADD COLUMN for every _ADDED_COLUMNS entry not yet present."""
+    inspector = inspect(engine)
+    with engine.begin() as conn:
+        for table_name, column_names in _ADDED_COLUMNS.items():
+            table = Base.metadata.tables.get(table_name)
+            if table is None or not inspector.has_table(table_name):
+                continue
+            existing = {c["name"] for c in inspector.get_columns(table_name)}
+            for name in column_names:
+                if name in existing:
+                    continue
+                column_type = table.c[name].type.compile(dialect=engine.dialect)
+                conn.execute(text(f"ALTER TABLE {table_name} ADD COLUMN {name} {column_type}"))
@@ -0,0 +1,82 @@
+"""Incremental crawling — per-search-query high-water marks.
+
+Portal results are sorted newest first (Indeed ``sort=date``, LinkedIn
+``sortBy=DD``), so once a results page contains only jobs we already know,
+every later page is older and also known. Each portal search records a
+high-water mark (newest external IDs + newest posting time) on its
+SearchRun row; the next run for the same query loads it and stops paging
+at the first fully known page instead of waiting 6–11 s per redundant page.
+"""
+
+from datetime import UTC, datetime
+
+from sqlalchemy.orm import Session
+
+from src.automation.drivers.base import SearchConfig
+from src.models import SearchRun
+
+
+def search_query_key(config: SearchConfig) -> str:
+    """Stable identifier of a search (keywords + location + remote flag)."""
+    key = " ".join(k.strip().lower() for k in config.keywords)
+    if config.location:
+        key += f" @ {config.location.strip().lower()}"
+    if config.remote_only:
+        key += " [remote]"
+    return key
+
+
+def load_incremental_state(
+    session: Session,
+    config: SearchConfig,
+    portals: list[str],
+) -> None:
+    """Enable incremental mode on ``config`` and fill in what is already known.
+
+    Known jobs are the high-water IDs and posting time of the latest
+    SearchRun for this query on each portal.
+    """
+    config.incremental = True
+    query = search_query_key(config)
+
+    for portal in portals:
+        last = (
+            session.query(SearchRun)
+            .filter(SearchRun.portal == portal, SearchRun.search_query == query)
+            .order_by(SearchRun.started_at.desc())
+            .first()
+        )
+        if last is None:
+            continue
+        config.known_job_keys.update(f"{portal}:{i}" for i in last.high_water_ids or [])
+        if last.high_water_at:
+            config.high_water_at[portal] = last.high_water_at
+
+
+def record_search_runs(
+    session: Session,
+    config: SearchConfig,
+    result,
+    started_at: datetime,
+) -> list[SearchRun]:
+    """Persist one SearchRun per portal from a PipelineResult's high-water marks."""
+    query = search_query_key(config)
+    runs = []
+    for portal, mark in result.high_water.items():
+        runs.append(SearchRun(
+            portal=portal,
+            search_query=query,
+            jobs_found=mark.jobs_found,
+            jobs_new=mark.jobs_new,
+            started_at=started_at,
+            completed_at=datetime.now(UTC),
+            high_water_ids=mark.external_ids,
+            high_water_at=mark.posted_at,
+            pages_crawled=mark.pages_crawled,
+            stopped_early=mark.stopped_early,
+            humanization_seed=result.humanization_seeds.get(portal),
+            llm_usage=result.llm_usage or None,
+        ))
+    session.add_all(runs)
+    session.commit()
+    return runs
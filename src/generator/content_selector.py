@@ -9,8 +9,17 @@ When a GrokProvider is configured (GROK_API_KEY set), the selector will:
 - Optionally rephrase the top 2 bullets per role to match JD keywords
 
 Set use_llm=False on ContentSelector() to disable LLM calls (e.g. in tests).
+Async callers use aselect(), which sends the summary and all bullet
+rephrasings to the provider concurrently via agenerate(). Both run their
+LLM calls at Priority.BULK, behind apply-time question answering, and meter
+them under the "summary" and "bullet" call sites. Once the LLM budget is
+spent the provider reports itself unavailable and the pre-written summary
+and original bullets are used. Overnight runs over many JDs
+(``cli generate --batch``) use select_batch(), which sends every summary
+and rephrasing through one provider batch (src/llm/batch.py).
 """
 
+import asyncio
 import logging
 from dataclasses import dataclass, field
 
@@ -112,6 +121,12 @@ class ContentSelector:
             self._llm = get_llm_provider()
         return self._llm
 
+    def _llm_ready(self) -> bool:
+        """True when a real (non-stub) LLM provider is configured and reachable."""
+        llm = self._get_llm()
+        from src.llm.provider import StubProvider
+        return not isinstance(llm, StubProvider) and llm.is_available()
+
     def select(
         self,
         profile: CandidateProfile,
@@ -132,6 +147,134 @@ class ContentSelector:
         Returns:
             SelectedContent with the best-fit items.
         """
+        from src.llm.scheduler import Priority, llm_priority
+
+        with llm_priority(Priority.BULK):
+            result = self._select_static(
+                profile, jd_text, max_skills, max_bullets_per_role, max_projects,
+                rephrase=True,
+            )
+            # 1. Summary — LLM-generated if available, otherwise best pre-written match
+            result.summary = self._build_summary(profile, jd_text, result.target_keywords, result)
+        return result
+
+    async def aselect(
+        self,
+        profile: CandidateProfile,
+        jd_text: str,
+        max_skills: int = 15,
+        max_bullets_per_role: int = 4,
+        max_projects: int = 2,
+    ) -> SelectedContent:
+        """Async select() for the pipeline.
+
+        Ranking is the same; the summary and every bullet rephrasing are
+        requested concurrently with agenerate() instead of one blocking
+        call after another.
+        """
+        result = self._select_static(
+            profile, jd_text, max_skills, max_bullets_per_role, max_projects,
+            rephrase=False,
+        )
+        if not (self.use_llm and self._llm_ready()):
+            result.summary = self._select_summary_fallback(profile, jd_text)
+            return result
+
+        from src.llm.scheduler import Priority, llm_priority
+
+        keywords = result.target_keywords
+        rephrasings = [
+            self._arephrase_bullets(exp["bullets"], keywords, max_rephrase=2)
+            for exp in result.experience
+        ] if keywords else []
+        with llm_priority(Priority.BULK):
+            summary, *bullets = await asyncio.gather(
+                self._abuild_summary(profile, jd_text, keywords, result), *rephrasings
+            )
+        result.summary = summary
+        for exp, rephrased in zip(result.experience, bullets):
+            exp["bullets"] = rephrased
+        return result
+
+    def select_batch(
+        self,
+        profile: CandidateProfile,
+        jds: dict[str, str],
+        backend=None,
+        max_skills: int = 15,
+        max_bullets_per_role: int = 4,
+        max_projects: int = 2,
+        poll_interval_s: float = 60.0,
+    ) -> dict[str, SelectedContent]:
+        """select() for many JDs through one provider batch.
+
+        Ranking is the same. All summaries and bullet rephrasings go into a
+        single batch. Anything that fails falls back like select() does: a
+        single request, the whole batch, or a spent budget.
+
+        Args:
+            profile: The candidate's full profile.
+            jds: Key (e.g. job id) -> job description text.
+            backend: A BatchBackend; defaults to batch_backend_for() the provider.
+            poll_interval_s: Seconds between batch status checks.
+
+        Returns:
+            SelectedContent per key of ``jds``.
+        """
+        from src.llm.batch import BatchError, LLMBatch, batch_backend_for
+
+        results = {
+            key: self._select_static(
+                profile, jd_text, max_skills, max_bullets_per_role, max_projects,
+                rephrase=False,
+            )
+            for key, jd_text in jds.items()
+        }
+        responses = {}
+        summary_ids: dict[str, str] = {}
+        bullet_ids: list[tuple[dict, int, str]] = []   # (experience entry, bullet index, request id)
+        if self.use_llm and self._llm_ready():
+            try:
+                # Raises ValueError for providers without a batch API
+                batch = LLMBatch(backend or batch_backend_for(self._get_llm()), poll_interval_s)
+                for key, content in results.items():
+                    keywords = content.target_keywords
+                    summary_ids[key] = batch.add(
+                        self._summary_prompt(profile, jds[key], keywords, content),
+                        max_tokens=150,
+                        system_prompt=_SUMMARY_SYSTEM_PROMPT,
+                        site="summary",
+                    )
+                    for exp in content.experience if keywords else []:
+                        for i, prompt in self._bullet_prompts(exp["bullets"], keywords, 2):
+                            bullet_ids.append((exp, i, batch.add(
+                                prompt, max_tokens=80, system_prompt=_BULLET_SYSTEM_PROMPT,
+                                site="bullet",
+                            )))
+                responses = batch.run()
+            except Exception as e:
+                logger.warning(f"LLM batch failed, using fallbacks: {e}")
+
+        for key, content in results.items():
+            response = responses.get(summary_ids.get(key))
+            summary = "" if response is None or isinstance(response, BatchError) else self._accept_summary(response)
+            content.summary = summary or self._select_summary_fallback(profile, jds[key])
+        for exp, i, request_id in bullet_ids:
+            response = responses.get(request_id)
+            if response is not None and not isinstance(response, BatchError):
+                exp["bullets"][i] = self._accept_bullet(exp["bullets"][i], response)
+        return results
+
+    def _select_static(
+        self,
+        profile: CandidateProfile,
+        jd_text: str,
+        max_skills: int,
+        max_bullets_per_role: int,
+        max_projects: int,
+        rephrase: bool,
+    ) -> SelectedContent:
+        """Everything except the summary; bullets are LLM-rephrased only if ``rephrase``."""
         jd_kw_result = extract_keywords(jd_text, max_keywords=25)
         jd_keywords = {k.canonical.lower() for k in jd_kw_result.keywords}
         jd_keyword_list = [k.canonical for k in jd_kw_result.keywords]
@@ -152,7 +295,7 @@ class ContentSelector:
 
         # 3. Experience — rank bullets by relevance (optionally LLM-rephrase top bullets)
         result.experience = self._select_experience(
-            profile, jd_keywords, jd_keyword_list, max_bullets_per_role
+            profile, jd_keywords, jd_keyword_list if rephrase else [], max_bullets_per_role
         )
 
         # 4. Education — include all
@@ -165,10 +308,6 @@ class ContentSelector:
         result.projects = self._select_projects(
             profile, jd_keywords, max_projects
         )
-
-        # 1. Summary — LLM-generated if available, otherwise best pre-written match
-        result.summary = self._build_summary(profile, jd_text, jd_keyword_list, result)
-
         return result
 
     # ── Summary ──────────────────────────────────────────────
@@ -181,17 +320,36 @@ class ContentSelector:
         content: SelectedContent,
     ) -> str:
         """Generate a tailored summary using LLM, or fall back to pre-written."""
-        if self.use_llm:
-            llm = self._get_llm()
-            from src.llm.provider import StubProvider
-            if not isinstance(llm, StubProvider) and llm.is_available():
-                try:
-                    return self._llm_generate_summary(profile, jd_text, jd_keyword_list, content)
-                except Exception as e:
-                    logger.warning(f"LLM summary generation failed, using fallback: {e}")
+        if self.use_llm and self._llm_ready():
+            try:
+                return self._llm_generate_summary(profile, jd_text, jd_keyword_list, content)
+            except Exception as e:
+                logger.warning(f"LLM summary generation failed, using fallback: {e}")
 
         return self._select_summary_fallback(profile, jd_text)
 
+    async def _abuild_summary(
+        self,
+        profile: CandidateProfile,
+        jd_text: str,
+        jd_keyword_list: list[str],
+        content: SelectedContent,
+    ) -> str:
+        """Async _build_summary() (caller has already checked _llm_ready())."""
+        from src.llm.metering import llm_call_site
+
+        try:
+            with llm_call_site("summary"):
+                response = await self._get_llm().agenerate(
+                    self._summary_prompt(profile, jd_text, jd_keyword_list, content),
+                    max_tokens=150,
+                    system_prompt=_SUMMARY_SYSTEM_PROMPT,
+                )
+            return self._accept_summary(response) or self._select_summary_fallback(profile, jd_text)
+        except Exception as e:
+            logger.warning(f"LLM summary generation failed, using fallback: {e}")
+            return self._select_summary_fallback(profile, jd_text)
+
     def _llm_generate_summary(
         self,
         profile: CandidateProfile,
@@ -200,8 +358,23 @@ class ContentSelector:
         content: SelectedContent,
     ) -> str:
         """Call Grok to generate a JD-tailored professional summary."""
-        llm = self._get_llm()
+        from src.llm.metering import llm_call_site
 
+        with llm_call_site("summary"):
+            response = self._get_llm().generate(
+                self._summary_prompt(profile, jd_text, jd_keyword_list, content),
+                max_tokens=150,
+                system_prompt=_SUMMARY_SYSTEM_PROMPT,
+            )
+        return self._accept_summary(response) or self._select_summary_fallback(profile, jd_text)
+
+    def _summary_prompt(
+        self,
+        profile: CandidateProfile,
+        jd_text: str,
+        jd_keyword_list: list[str],
+        content: SelectedContent,
+    ) -> str:
         # Extract job title/company from JD heuristically
         jd_lines = [l.strip() for l in jd_text.splitlines() if l.strip()]
         job_title = jd_lines[0][:80] if jd_lines else "the role"
@@ -217,7 +390,7 @@ class ContentSelector:
         recent_title = profile.experience[0].get("title", "") if profile.experience else ""
         recent_company = profile.experience[0].get("company", "") if profile.experience else ""
 
-        prompt = _SUMMARY_USER_TEMPLATE.format(
+        return _SUMMARY_USER_TEMPLATE.format(
             name=profile.full_name,
             years=profile.total_years_experience(),
             recent_title=recent_title,
@@ -229,18 +402,15 @@ class ContentSelector:
             jd_keywords=", ".join(jd_keyword_list[:12]),
         )
 
-        response = llm.generate(
-            prompt,
-            max_tokens=150,
-            system_prompt=_SUMMARY_SYSTEM_PROMPT,
-        )
+    @staticmethod
+    def _accept_summary(response) -> str:
+        """The generated summary, or "" if it fails the sanity check."""
         text = response.text.strip()
         # Sanity check — should be non-empty and not too long
         if text and len(text) > 20:
             logger.info(f"LLM generated summary ({response.tokens_used} tokens)")
             return text
-
-        return self._select_summary_fallback(profile, jd_text)
+        return ""
 
     def _select_summary_fallback(self, profile: CandidateProfile, jd_text: str) -> str:
         """Pick the most relevant pre-written summary."""
@@ -350,15 +520,60 @@ class ContentSelector:
         Only rephrases bullets that don't already have strong keyword coverage.
         Falls back to original if LLM call fails.
         """
-        llm = self._get_llm()
-        from src.llm.provider import StubProvider
-        if isinstance(llm, StubProvider) or not llm.is_available():
+        if not self._llm_ready():
             return bullets
+        from src.llm.metering import llm_call_site
+
+        llm = self._get_llm()
+        rephrased = list(bullets)
+        for i, prompt in self._bullet_prompts(rephrased, jd_keyword_list, max_rephrase):
+            try:
+                with llm_call_site("bullet"):
+                    response = llm.generate(
+                        prompt,
+                        max_tokens=80,
+                        system_prompt=_BULLET_SYSTEM_PROMPT,
+                    )
+                rephrased[i] = self._accept_bullet(rephrased[i], response)
+            except Exception as e:
+                logger.debug(f"Bullet rephrase failed: {e}")
+
+        return rephrased
 
+    async def _arephrase_bullets(
+        self,
+        bullets: list[dict],
+        jd_keyword_list: list[str],
+        max_rephrase: int = 2,
+    ) -> list[dict]:
+        """Async _maybe_rephrase_bullets(): all rephrasings in flight at once."""
+        from src.llm.metering import llm_call_site
+
+        llm = self._get_llm()
+        prompts = self._bullet_prompts(bullets, jd_keyword_list, max_rephrase)
+        with llm_call_site("bullet"):
+            responses = await asyncio.gather(
+                *(llm.agenerate(p, max_tokens=80, system_prompt=_BULLET_SYSTEM_PROMPT)
+                  for _, p in prompts),
+                return_exceptions=True,
+            )
         rephrased = list(bullets)
-        rephrase_count = 0
+        for (i, _), response in zip(prompts, responses):
+            if isinstance(response, Exception):
+                logger.debug(f"Bullet rephrase failed: {response}")
+                continue
+            rephrased[i] = self._accept_bullet(rephrased[i], response)
+        return rephrased
 
-        for i, bullet in enumerate(rephrased[:max_rephrase]):
+    @staticmethod
+    def _bullet_prompts(
+        bullets: list[dict],
+        jd_keyword_list: list[str],
+        max_rephrase: int,
+    ) -> list[tuple[int, str]]:
+        """(index, prompt) for each of the top bullets worth rephrasing."""
+        prompts = []
+        for i, bullet in enumerate(bullets[:max_rephrase]):
             original_text = bullet.get("text", "")
             if not original_text:
                 continue
@@ -370,25 +585,19 @@ class ContentSelector:
             if not missing_kws:
                 continue  # Bullet already well-matched
 
-            try:
-                prompt = _BULLET_USER_TEMPLATE.format(
-                    bullet=original_text,
-                    keywords=", ".join(missing_kws[:5]),
-                )
-                response = llm.generate(
-                    prompt,
-                    max_tokens=80,
-                    system_prompt=_BULLET_SYSTEM_PROMPT,
-                )
-                new_text = response.text.strip()
-                if new_text and len(new_text) > 20:
-                    rephrased[i] = {**bullet, "text": new_text}
-                    rephrase_count += 1
-                    logger.info(f"Bullet rephrased ({response.tokens_used} tokens)")
-            except Exception as e:
-                logger.debug(f"Bullet rephrase failed: {e}")
-
-        return rephrased
+            prompts.append((i, _BULLET_USER_TEMPLATE.format(
+                bullet=original_text,
+                keywords=", ".join(missing_kws[:5]),
+            )))
+        return prompts
+
+    @staticmethod
+    def _accept_bullet(bullet: dict, response) -> dict:
+        new_text = response.text.strip()
+        if new_text and len(new_text) > 20:
+            logger.info(f"Bullet rephrased ({response.tokens_used} tokens)")
+            return {**bullet, "text": new_text}
+        return bullet
 
     # ── Projects ──────────────────────────────────────────────
 
@@ -14,6 +14,19 @@ Usage (Python):
     builder = ResumeBuilder()
     tex = builder.build(jd_text="...")
     Path("resume.tex").write_text(tex)
+
+The reply is streamed: it is rejected as soon as its opening is not
+\\documentclass (or a markdown fence shows up inside the document), reading
+stops at \\end{document}, and build_and_save() writes the .tex as chunks
+arrive. ResumeBuilder.last_metrics holds time-to-first-token and tokens/sec.
+Generation runs at Priority.BULK in the LLM scheduler and is metered as the
+"full_resume" call site.
+
+Overnight runs over many JDs use build_batch() (CLI: --jd-dir), which sends
+every resume through one provider batch (src/llm/batch.py) and applies the
+same LaTeX checks to each reply:
+    python -m src.generator.resume_builder --jd-dir data/jds --out-dir data/output/batch
+    python -m src.generator.resume_builder --jd-dir data/jds --provider ollama --batch-dir data/batches
 """
 
 from __future__ import annotations
@@ -21,6 +34,7 @@ from __future__ import annotations
 import logging
 import textwrap
 from pathlib import Path
+from typing import TextIO
 
 import yaml
 
@@ -132,9 +146,13 @@ QUALITY TARGETS:
 • Skills section: list JD-matched skills first within each category.
 """
 
-# ── User prompt template ──────────────────────────────────────
+# ── Prompt templates ──────────────────────────────────────────
+# Everything that is the same for every JD (rules, LaTeX macros, profile,
+# tailoring instructions) goes into the system prompt, in a fixed order, so
+# consecutive builds share a byte-identical prefix that providers can serve
+# from their prompt cache. Only the short JD message varies per call.
 
-USER_PROMPT_TEMPLATE = """\
+PROFILE_PROMPT_TEMPLATE = """\
 ══════════════════════════════════════════════════════
 LATEX TEMPLATE (use these macros exactly)
 ══════════════════════════════════════════════════════
@@ -146,12 +164,7 @@ CANDIDATE PROFILE
 {profile_text}
 
 ══════════════════════════════════════════════════════
-JOB DESCRIPTION
-══════════════════════════════════════════════════════
-{jd_text}
-
-══════════════════════════════════════════════════════
-TAILORING INSTRUCTIONS
+TAILORING INSTRUCTIONS (apply to the JOB DESCRIPTION in the user message)
 ══════════════════════════════════════════════════════
 
 HEADER
@@ -204,6 +217,13 @@ HONORS \\& AWARDS + CERTIFICATIONS
 SECTION ORDER (ordered by value delivered to the reader):
   Header → Summary → Experience → Projects \\& Open Source →
   Technical Skills → Education → Honors \\& Awards → Certifications
+"""
+
+JD_PROMPT_TEMPLATE = """\
+══════════════════════════════════════════════════════
+JOB DESCRIPTION
+══════════════════════════════════════════════════════
+{jd_text}
 
 OUTPUT: The complete LaTeX document from \\documentclass to \\end{{document}}.
 No preamble text, no markdown fences, no explanations. Just the .tex content.
@@ -333,6 +353,9 @@ class ResumeBuilder:
         self._profile_path = Path(profile_path) if profile_path else _PROFILE_PATH
         self._llm = llm_provider
         self._max_tokens = max_output_tokens
+        # StreamMetrics of the most recent build() (None before the first)
+        self.last_metrics = None
+        self._prefix: tuple[float, str] | None = None   # (profile mtime, static prompt)
 
     def _get_llm(self):
         if self._llm is None:
@@ -344,26 +367,37 @@ class ResumeBuilder:
         with open(self._profile_path, encoding="utf-8") as f:
             return yaml.safe_load(f)
 
-    def build(self, jd_text: str) -> str:
+    def _static_prompt(self) -> str:
+        """System prompt + LaTeX macros + profile + instructions: the cacheable prefix.
+
+        Rebuilt only when the profile file changes, so it stays byte-identical
+        across builds.
+        """
+        mtime = self._profile_path.stat().st_mtime
+        if self._prefix is None or self._prefix[0] != mtime:
+            reference = PROFILE_PROMPT_TEMPLATE.format(
+                latex_preamble=_LATEX_PREAMBLE,
+                profile_text=_fmt_profile(self._load_profile()),
+            )
+            self._prefix = (mtime, f"{SYSTEM_PROMPT}\n{reference}")
+        return self._prefix[1]
+
+    def build(self, jd_text: str, sink: TextIO | None = None) -> str:
         """Generate a complete LaTeX resume tailored to the given JD.
 
         Args:
             jd_text: Full job description text.
+            sink: Optional text stream the LaTeX is written to as it arrives.
 
         Returns:
             Complete LaTeX source string, ready to compile with tectonic/pdflatex.
 
         Raises:
-            RuntimeError: If the LLM call fails or returns invalid output.
+            RuntimeError: If the LLM call fails or returns invalid output
+                          (raised as soon as the output is known to be bad).
         """
-        profile = self._load_profile()
-        profile_text = _fmt_profile(profile)
-
-        user_prompt = USER_PROMPT_TEMPLATE.format(
-            latex_preamble=_LATEX_PREAMBLE,
-            profile_text=profile_text,
-            jd_text=jd_text.strip(),
-        )
+        system_prompt = self._static_prompt()
+        user_prompt = JD_PROMPT_TEMPLATE.format(jd_text=jd_text.strip())
 
         llm = self._get_llm()
         logger.info(
@@ -371,25 +405,49 @@ class ResumeBuilder:
             f"(max_tokens={self._max_tokens})"
         )
 
-        response = llm.generate(
+        stream = llm.stream(
             prompt=user_prompt,
             max_tokens=self._max_tokens,
-            system_prompt=SYSTEM_PROMPT,
+            system_prompt=system_prompt,
         )
-
-        tex = response.text.strip()
-        tex = _strip_markdown_fences(tex)
-
+        from src.llm.metering import llm_call_site
+        from src.llm.scheduler import Priority, llm_priority
+
+        guard = _LatexStreamGuard(sink)
+        try:
+            # Closing the stream (e.g. on invalid LaTeX) meters its usage, so it
+            # must happen while the call site and priority are still set
+            with llm_call_site("full_resume"), llm_priority(Priority.BULK), stream:
+                for chunk in stream:
+                    # Read to the end even after \end{document}: usage arrives
+                    # last, and only a completed stream is cached
+                    guard.feed(chunk)
+        except _InvalidLatex as e:
+            self.last_metrics = stream.metrics
+            raise RuntimeError(
+                f"LLM output does not look like valid LaTeX: {e} "
+                f"(first 200 chars: {stream.text.strip()[:200]!r}). "
+                f"Provider: {stream.provider}, model: {stream.model}. "
+                f"Aborted after {self.last_metrics.output_tokens} tokens."
+            ) from None
+        self.last_metrics = metrics = stream.metrics
+
+        tex = guard.text.strip()
         if not _looks_like_latex(tex):
             raise RuntimeError(
                 f"LLM output does not look like valid LaTeX "
-                f"(first 200 chars: {tex[:200]!r}). "
-                f"Provider: {response.provider}, model: {response.model}."
+                f"(first 200 chars: {stream.text.strip()[:200]!r}). "
+                f"Provider: {stream.provider}, model: {stream.model}."
             )
+        if not guard.done:
+            logger.warning("LLM output has no \\end{document}; it may be truncated")
 
+        ttft = f"{metrics.ttft_s:.2f}s" if metrics.ttft_s is not None else "n/a"
         logger.info(
-            f"Resume generated — {response.tokens_used} tokens used "
-            f"(provider={response.provider}, model={response.model})"
+            f"Resume generated — {stream.response.tokens_used} tokens used "
+            f"({stream.cached_prompt_tokens}/{stream.prompt_tokens} prompt tokens from "
+            f"the provider's prompt cache), TTFT {ttft}, {metrics.tokens_per_s:.1f} tok/s "
+            f"(provider={stream.provider}, model={stream.model})"
         )
         return tex
 
@@ -403,24 +461,176 @@ class ResumeBuilder:
         Returns:
             Path to the saved .tex file.
         """
-        tex = self.build(jd_text)
         out = Path(output_path)
         out.parent.mkdir(parents=True, exist_ok=True)
-        out.write_text(tex, encoding="utf-8")
+        # Written incrementally; only renamed into place once the LaTeX is complete
+        part = out.with_name(out.name + ".part")
+        try:
+            with part.open("w", encoding="utf-8") as f:
+                self.build(jd_text, sink=f)
+        except BaseException:
+            part.unlink(missing_ok=True)
+            raise
+        part.replace(out)
         logger.info(f"Resume saved to {out}")
         return out
 
+    def build_batch(
+        self,
+        jds: dict[str, str],
+        backend=None,
+        poll_interval_s: float = 60.0,
+    ) -> dict[str, str | RuntimeError]:
+        """build() for many JDs through one provider batch.
+
+        Every request shares the static prompt prefix, so provider prompt
+        caching still applies. Each reply gets build()'s LaTeX checks.
+
+        Args:
+            jds: Key (e.g. job id) -> job description text.
+            backend: A BatchBackend; defaults to batch_backend_for() the provider.
+            poll_interval_s: Seconds between batch status checks.
+
+        Returns:
+            LaTeX source per key, or the RuntimeError explaining why that
+            entry failed (request error or invalid LaTeX).
+
+        Raises:
+            RuntimeError: The batch as a whole failed, timed out or the LLM
+                          budget is spent (BatchError / LLMBudgetExceeded).
+        """
+        from src.llm.batch import BatchError, LLMBatch, batch_backend_for
+
+        system_prompt = self._static_prompt()
+        batch = LLMBatch(backend or batch_backend_for(self._get_llm()), poll_interval_s)
+        request_ids = {
+            key: batch.add(
+                JD_PROMPT_TEMPLATE.format(jd_text=jd_text.strip()),
+                max_tokens=self._max_tokens,
+                system_prompt=system_prompt,
+                site="full_resume",
+            )
+            for key, jd_text in jds.items()
+        }
+        responses = batch.run()
+
+        results: dict[str, str | RuntimeError] = {}
+        for key, request_id in request_ids.items():
+            response = responses[request_id]
+            if isinstance(response, BatchError):
+                results[key] = RuntimeError(f"Batch request failed: {response}")
+                continue
+            try:
+                results[key] = _checked_latex(response.text)
+            except RuntimeError as e:
+                results[key] = e
+        return results
+
+    def build_batch_and_save(
+        self,
+        jds: dict[str, str],
+        output_dir: str | Path,
+        backend=None,
+        poll_interval_s: float = 60.0,
+    ) -> dict[str, Path | RuntimeError]:
+        """build_batch() and write each valid resume to ``output_dir/<key>.tex``."""
+        out_dir = Path(output_dir)
+        out_dir.mkdir(parents=True, exist_ok=True)
+        saved: dict[str, Path | RuntimeError] = {}
+        for key, tex in self.build_batch(jds, backend, poll_interval_s).items():
+            if isinstance(tex, RuntimeError):
+                logger.warning(f"No resume for {key}: {tex}")
+                saved[key] = tex
+                continue
+            out = out_dir / f"{key}.tex"
+            out.write_text(tex, encoding="utf-8")
+            saved[key] = out
+        written = sum(isinstance(p, Path) for p in saved.values())
+        logger.info(f"Batch: {written}/{len(saved)} resumes saved to {out_dir}")
+        return saved
+
 
 # ── Helpers ───────────────────────────────────────────────────
 
-def _strip_markdown_fences(text: str) -> str:
-    """Remove ```latex ... ``` or ``` ... ``` wrappers if the LLM added them."""
-    lines = text.splitlines()
-    if lines and lines[0].startswith("```"):
-        lines = lines[1:]
-    if lines and lines[-1].strip() == "```":
-        lines = lines[:-1]
-    return "\n".join(lines).strip()
+_DOCUMENTCLASS = r"\documentclass"
+_END_DOCUMENT = r"\end{document}"
+
+
+class _InvalidLatex(Exception):
+    pass
+
+
+class _LatexStreamGuard:
+    """Validate streamed LaTeX chunk by chunk.
+
+    An opening ```latex fence line is tolerated and skipped; after it the
+    text must begin with \\documentclass. A fence inside the document raises
+    _InvalidLatex; text after \\end{document} is dropped and ``done`` is set.
+    """
+
+    def __init__(self, sink: TextIO | None = None):
+        self.sink = sink
+        self.started = False
+        self.done = False
+        self._head = ""
+        self._tail = ""     # end of accepted text, to catch markers split across chunks
+        self._parts: list[str] = []
+
+    @property
+    def text(self) -> str:
+        return "".join(self._parts)
+
+    def feed(self, chunk: str) -> None:
+        if self.done:
+            return
+        if not self.started:
+            self._head += chunk
+            head = self._head.lstrip()
+            if head.startswith("```"):
+                if "\n" not in head:
+                    return  # wait for the rest of the fence line
+                head = head.split("\n", 1)[1].lstrip()
+            if len(head) < len(_DOCUMENTCLASS):
+                if _DOCUMENTCLASS.startswith(head):
+                    return
+                raise _InvalidLatex("does not start with \\documentclass")
+            if not head.startswith(_DOCUMENTCLASS):
+                raise _InvalidLatex("does not start with \\documentclass")
+            self.started = True
+            chunk = head
+
+        window = self._tail + chunk
+        end = window.find(_END_DOCUMENT)
+        if end >= 0:
+            window = window[:end + len(_END_DOCUMENT)]
+            self.done = True
+        if "```" in window:
+            raise _InvalidLatex("markdown fence inside the document")
+        accepted = window[len(self._tail):]
+        self._parts.append(accepted)
+        if self.sink is not None:
+            self.sink.write(accepted)
+        self._tail = window[-(len(_END_DOCUMENT) - 1):]
+
+
+def _checked_latex(text: str) -> str:
+    """build()'s LaTeX checks applied to a complete reply (batch results)."""
+    guard = _LatexStreamGuard()
+    try:
+        guard.feed(text)
+    except _InvalidLatex as e:
+        raise RuntimeError(
+            f"LLM output does not look like valid LaTeX: {e} "
+            f"(first 200 chars: {text.strip()[:200]!r})"
+        ) from None
+    tex = guard.text.strip()
+    if not _looks_like_latex(tex):
+        raise RuntimeError(
+            f"LLM output does not look like valid LaTeX (first 200 chars: {text.strip()[:200]!r})"
+        )
+    if not guard.done:
+        logger.warning("LLM output has no \\end{document}; it may be truncated")
+    return tex
 
 
 def _looks_like_latex(text: str) -> bool:
@@ -442,6 +652,10 @@ def _main() -> None:
     group = parser.add_mutually_exclusive_group(required=True)
     group.add_argument("--jd", metavar="FILE", help="Path to a .txt file containing the job description")
     group.add_argument("--jd-text", metavar="TEXT", help="Job description as a direct string argument")
+    group.add_argument(
+        "--jd-dir", metavar="DIR",
+        help="Batch mode: one resume per DIR/*.txt, submitted as one provider batch",
+    )
 
     parser.add_argument(
         "--out",
@@ -449,6 +663,19 @@ def _main() -> None:
         default="data/output/resume_tailored.tex",
         help="Output .tex file path (default: data/output/resume_tailored.tex)",
     )
+    parser.add_argument(
+        "--out-dir",
+        metavar="DIR",
+        default="data/output/resumes_batch",
+        help="Batch mode output directory, one <jd name>.tex per JD",
+    )
+    parser.add_argument(
+        "--batch-dir",
+        metavar="DIR",
+        default=None,
+        help="Batch mode without a provider batch API: run the local batch "
+             "server on DIR with the selected provider (e.g. ollama)",
+    )
     parser.add_argument(
         "--profile",
         metavar="FILE",
@@ -461,7 +688,18 @@ def _main() -> None:
         default=None,
         help="Override LLM provider",
     )
+    parser.add_argument(
+        "--no-llm-cache",
+        action="store_true",
+        help="Always call the LLM instead of reusing a cached response",
+    )
     args = parser.parse_args()
+    if args.no_llm_cache:
+        from src.config import get_config
+        get_config().llm_cache.bypass = True
+
+    if args.jd_dir:
+        sys.exit(_run_batch(args))
 
     # Read JD
     if args.jd:
@@ -486,14 +724,65 @@ def _main() -> None:
     try:
         out_path = builder.build_and_save(jd_text, args.out)
         print(f"✓ Resume written to: {out_path}")
+        metrics = builder.last_metrics
+        if metrics is not None and metrics.ttft_s is not None:
+            print(
+                f"  {metrics.output_tokens} tokens, TTFT {metrics.ttft_s:.2f}s, "
+                f"{metrics.tokens_per_s:.1f} tok/s"
+            )
         print(f"  Compile with: tectonic {out_path}")
     except Exception as e:
         print(f"ERROR: {e}", file=sys.stderr)
         sys.exit(1)
 
 
+def _run_batch(args) -> int:
+    """--jd-dir: generate every JD in the directory through one batch."""
+    import sys
+    import threading
+
+    jd_paths = sorted(Path(args.jd_dir).glob("*.txt"))
+    if not jd_paths:
+        print(f"ERROR: no .txt job descriptions in {args.jd_dir}", file=sys.stderr)
+        return 1
+    jds = {p.stem: p.read_text(encoding="utf-8") for p in jd_paths}
+
+    llm_provider = _get_provider_by_name(args.provider) if args.provider else None
+    builder = ResumeBuilder(profile_path=args.profile, llm_provider=llm_provider)
+
+    backend, poll_interval_s, stop = None, 60.0, threading.Event()
+    if args.batch_dir:
+        from src.llm.batch import LocalBatchBackend, LocalBatchServer, unwrap_provider
+
+        provider = unwrap_provider(builder._get_llm())
+        backend = LocalBatchBackend(args.batch_dir, model=getattr(provider, "model", "local"))
+        server = LocalBatchServer(args.batch_dir, provider)
+        threading.Thread(target=server.serve, args=(1.0, stop), daemon=True).start()
+        poll_interval_s = 1.0
+
+    try:
+        saved = builder.build_batch_and_save(jds, args.out_dir, backend, poll_interval_s)
+    except Exception as e:
+        print(f"ERROR: {e}", file=sys.stderr)
+        return 1
+    finally:
+        stop.set()
+
+    failed = {key: err for key, err in saved.items() if isinstance(err, Exception)}
+    print(f"✓ {len(saved) - len(failed)}/{len(saved)} resumes written to: {args.out_dir}")
+    for key, err in failed.items():
+        print(f"  ✗ {key}: {err}")
+    return 1 if failed else 0
+
+
 def _get_provider_by_name(name: str):
-    """Resolve a provider name string to an instance."""
+    """Resolve a provider name string to an instance (scheduled and cached)."""
+    from src.llm.provider import wrap_provider
+
+    return wrap_provider(_build_named_provider(name))
+
+
+def _build_named_provider(name: str):
     import os
     from src.llm.provider import (
         AnthropicProvider, GrokProvider, OllamaProvider,
@@ -0,0 +1,427 @@
+"""Offline bulk generation through provider batch APIs.
+
+Overnight runs over hundreds of JDs don't need interactive latency. Batch
+endpoints are cheaper and have their own rate limits. LLMBatch accumulates
+requests, submits them as one batch, polls until the provider has finished
+and returns every result by request id.
+
+Backends:
+- AnthropicBatchBackend: Message Batches (``messages.batches``).
+- OpenAIBatchBackend: OpenAI-compatible batch files. A JSONL file is
+  uploaded with ``purpose="batch"`` and run against /v1/chat/completions
+  (OpenAI, Grok).
+- LocalBatchBackend + LocalBatchServer: a file-based stand-in that uses the
+  same JSONL formats in a local directory. The server answers pending
+  batches with any BaseLLMProvider, so tests need no network and Ollama
+  can run bulk jobs offline.
+
+ContentSelector.select_batch() (``cli generate --batch``) and
+ResumeBuilder.build_batch() use it. Batched calls skip the request
+scheduler and the response cache, since the provider queues them itself.
+They are still metered, at the model's batch discount (ModelPrice.batch),
+and nothing is submitted once the budget is spent.
+"""
+
+import json
+import logging
+import threading
+import time
+import uuid
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Callable
+
+from src.llm.metering import _estimate_input, current_meter
+from src.llm.provider import (
+    BaseLLMProvider,
+    LLMResponse,
+    _openai_cached_tokens,
+    unwrap_provider,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class BatchError(RuntimeError):
+    """A batch, or one request in it, failed."""
+
+
+@dataclass
+class BatchRequest:
+    """One completion request inside a batch."""
+    custom_id: str
+    prompt: str
+    max_tokens: int = 500
+    system_prompt: str | None = None
+
+
+class BatchBackend(ABC):
+    """A provider's batch endpoint."""
+
+    @abstractmethod
+    def submit(self, requests: list[BatchRequest]) -> str:
+        """Start a batch; returns its id."""
+
+    @abstractmethod
+    def status(self, batch_id: str) -> str:
+        """"pending", "completed" or "failed"."""
+
+    @abstractmethod
+    def results(self, batch_id: str) -> dict[str, LLMResponse | BatchError]:
+        """Result per custom_id of a completed batch."""
+
+
+class AnthropicBatchBackend(BatchBackend):
+    """Anthropic Message Batches; requests use the provider's usual parameters."""
+
+    def __init__(self, provider):
+        self.provider = provider
+
+    def submit(self, requests: list[BatchRequest]) -> str:
+        batch = self.provider.client.messages.batches.create(requests=[
+            {
+                "custom_id": r.custom_id,
+                "params": self.provider._request(r.prompt, r.max_tokens, r.system_prompt),
+            }
+            for r in requests
+        ])
+        return batch.id
+
+    def status(self, batch_id: str) -> str:
+        batch = self.provider.client.messages.batches.retrieve(batch_id)
+        return "completed" if batch.processing_status == "ended" else "pending"
+
+    def results(self, batch_id: str) -> dict[str, LLMResponse | BatchError]:
+        results: dict[str, LLMResponse | BatchError] = {}
+        for entry in self.provider.client.messages.batches.results(batch_id):
+            if entry.result.type == "succeeded":
+                results[entry.custom_id] = self.provider._response(entry.result.message)
+            else:
+                error = getattr(entry.result, "error", None)
+                results[entry.custom_id] = BatchError(f"{entry.result.type}: {error or ''}".strip())
+        return results
+
+
+_OPENAI_BATCH_ENDPOINT = "/v1/chat/completions"
+
+# Expired batches still return the requests that finished in time
+_OPENAI_STATUS = {
+    "completed": "completed",
+    "expired": "completed",
+    "failed": "failed",
+    "cancelled": "failed",
+}
+
+
+class OpenAIBatchBackend(BatchBackend):
+    """OpenAI-compatible batch files (OpenAIProvider, GrokProvider)."""
+
+    def __init__(self, provider, completion_window: str = "24h"):
+        self.provider = provider
+        self.completion_window = completion_window
+
+    def submit(self, requests: list[BatchRequest]) -> str:
+        client = self.provider.client
+        upload = client.files.create(
+            file=("batch.jsonl", _batch_file(requests, self._body)),
+            purpose="batch",
+        )
+        batch = client.batches.create(
+            input_file_id=upload.id,
+            endpoint=_OPENAI_BATCH_ENDPOINT,
+            completion_window=self.completion_window,
+        )
+        return batch.id
+
+    def status(self, batch_id: str) -> str:
+        return _OPENAI_STATUS.get(self.provider.client.batches.retrieve(batch_id).status, "pending")
+
+    def results(self, batch_id: str) -> dict[str, LLMResponse | BatchError]:
+        client = self.provider.client
+        batch = client.batches.retrieve(batch_id)
+        results: dict[str, LLMResponse | BatchError] = {}
+        for file_id in (batch.output_file_id, batch.error_file_id):
+            if file_id:
+                results.update(_batch_results(client.files.content(file_id).text, self.provider._response))
+        return results
+
+    def _body(self, request: BatchRequest) -> dict:
+        return self.provider._request(request.prompt, request.max_tokens, request.system_prompt)
+
+
+class LocalBatchBackend(BatchBackend):
+    """Batches as directories under ``root``, answered by a LocalBatchServer.
+
+    Each batch is ``root/<batch_id>/`` with ``input.jsonl`` and ``output.jsonl``
+    in the OpenAI batch file format, plus ``batch.json`` holding its status.
+    """
+
+    def __init__(self, root: str | Path, model: str = "local"):
+        self.root = Path(root)
+        self.model = model
+
+    def submit(self, requests: list[BatchRequest]) -> str:
+        batch_id = f"batch_{uuid.uuid4().hex[:12]}"
+        folder = self.root / batch_id
+        folder.mkdir(parents=True)
+        (folder / "input.jsonl").write_bytes(_batch_file(requests, self._body))
+        _write_status(folder, "in_progress")
+        return batch_id
+
+    def status(self, batch_id: str) -> str:
+        state = json.loads((self.root / batch_id / "batch.json").read_text(encoding="utf-8"))
+        return _OPENAI_STATUS.get(state["status"], "pending")
+
+    def results(self, batch_id: str) -> dict[str, LLMResponse | BatchError]:
+        output = self.root / batch_id / "output.jsonl"
+        if not output.exists():
+            return {}
+        return _batch_results(output.read_text(encoding="utf-8"), _local_response)
+
+    def _body(self, request: BatchRequest) -> dict:
+        messages = [{"role": "user", "content": request.prompt}]
+        if request.system_prompt:
+            messages.insert(0, {"role": "system", "content": request.system_prompt})
+        return {"model": self.model, "messages": messages, "max_tokens": request.max_tokens}
+
+
+class LocalBatchServer:
+    """Stand-in batch server: answers LocalBatchBackend batches under ``root``.
+
+    Args:
+        root: Directory shared with the LocalBatchBackend.
+        provider: Answers each request with generate() (an unwrapped provider,
+                  so batch usage is not metered twice).
+    """
+
+    def __init__(self, root: str | Path, provider: BaseLLMProvider):
+        self.root = Path(root)
+        self.provider = provider
+
+    def process_pending(self) -> int:
+        """Answer every in-progress batch; returns how many were completed."""
+        completed = 0
+        for status_path in sorted(self.root.glob("*/batch.json")):
+            if json.loads(status_path.read_text(encoding="utf-8"))["status"] != "in_progress":
+                continue
+            folder = status_path.parent
+            lines = [
+                json.dumps(self._answer(json.loads(line)))
+                for line in (folder / "input.jsonl").read_text(encoding="utf-8").splitlines()
+                if line.strip()
+            ]
+            (folder / "output.jsonl").write_text("\n".join(lines) + "\n", encoding="utf-8")
+            _write_status(folder, "completed")
+            completed += 1
+        return completed
+
+    def serve(self, poll_interval_s: float = 1.0, stop: threading.Event | None = None) -> None:
+        """Process batches until ``stop`` is set."""
+        stop = stop or threading.Event()
+        while not stop.is_set():
+            self.process_pending()
+            stop.wait(poll_interval_s)
+
+    def _answer(self, request: dict) -> dict:
+        body = request["body"]
+        system = next((m["content"] for m in body["messages"] if m["role"] == "system"), None)
+        prompt = next(m["content"] for m in body["messages"] if m["role"] == "user")
+        try:
+            response = self.provider.generate(prompt, body.get("max_tokens", 500), system)
+        except Exception as e:
+            return {"custom_id": request["custom_id"], "response": None, "error": {"message": str(e)}}
+        output_tokens = response.output_tokens or max(response.tokens_used - response.prompt_tokens, 0)
+        return {
+            "custom_id": request["custom_id"],
+            "response": {
+                "status_code": 200,
+                "body": {
+                    "model": response.model,
+                    "provider": response.provider,
+                    "choices": [{"index": 0, "message": {"role": "assistant", "content": response.text}}],
+                    "usage": {
+                        "prompt_tokens": response.prompt_tokens,
+                        "completion_tokens": output_tokens,
+                        "total_tokens": response.prompt_tokens + output_tokens,
+                        "prompt_tokens_details": {"cached_tokens": response.cached_prompt_tokens},
+                    },
+                },
+            },
+            "error": None,
+        }
+
+
+class LLMBatch:
+    """Requests accumulated for one batch submission.
+
+    Args:
+        backend: Where the batch runs (see batch_backend_for()).
+        poll_interval_s: Seconds between status checks.
+        timeout_s: Give up after this long (provider batches finish within 24 h).
+        sleep: Called between polls (injectable for tests).
+        clock: Monotonic time source for the timeout.
+    """
+
+    def __init__(
+        self,
+        backend: BatchBackend,
+        poll_interval_s: float = 60.0,
+        timeout_s: float = 24 * 3600,
+        sleep: Callable[[float], None] = time.sleep,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.backend = backend
+        self.poll_interval_s = poll_interval_s
+        self.timeout_s = timeout_s
+        self.requests: list[BatchRequest] = []
+        self.batch_id: str | None = None
+        self._sites: dict[str, str] = {}
+        self._sleep = sleep
+        self._clock = clock
+
+    def __len__(self) -> int:
+        return len(self.requests)
+
+    def add(
+        self,
+        prompt: str,
+        max_tokens: int = 500,
+        system_prompt: str | None = None,
+        site: str = "other",
+    ) -> str:
+        """Queue a request; returns the id its result will be filed under."""
+        custom_id = f"req-{len(self.requests):05d}"
+        self.requests.append(BatchRequest(custom_id, prompt, max_tokens, system_prompt))
+        self._sites[custom_id] = site
+        return custom_id
+
+    def run(self) -> dict[str, LLMResponse | BatchError]:
+        """Submit, wait for the batch to finish and return every request's result.
+
+        Raises:
+            LLMBudgetExceeded: The LLM budget is already spent (nothing submitted).
+            BatchError: The batch failed or did not finish within ``timeout_s``.
+        """
+        if not self.requests:
+            return {}
+        meter = current_meter()
+        meter.check()
+        self.batch_id = self.backend.submit(self.requests)
+        logger.info(
+            f"Submitted batch {self.batch_id} ({len(self.requests)} requests) "
+            f"via {type(self.backend).__name__}"
+        )
+        deadline = self._clock() + self.timeout_s
+        while (status := self.backend.status(self.batch_id)) == "pending":
+            if self._clock() >= deadline:
+                raise BatchError(f"batch {self.batch_id} not finished after {self.timeout_s:.0f}s")
+            self._sleep(self.poll_interval_s)
+        if status == "failed":
+            raise BatchError(f"batch {self.batch_id} failed")
+
+        results = self.backend.results(self.batch_id)
+        for request in self.requests:
+            result = results.get(request.custom_id)
+            if result is None:
+                results[request.custom_id] = BatchError("no result returned")
+            elif isinstance(result, LLMResponse):
+                meter.record_response(
+                    result,
+                    _estimate_input(request.prompt, request.system_prompt),
+                    site=self._sites[request.custom_id],
+                    batch=True,
+                )
+        failed = sum(isinstance(r, BatchError) for r in results.values())
+        logger.info(f"Batch {self.batch_id} done: {len(results) - failed} ok, {failed} failed")
+        return results
+
+
+def batch_backend_for(provider: BaseLLMProvider) -> BatchBackend:
+    """The batch API backend for a (possibly wrapped) provider.
+
+    Raises:
+        ValueError: The provider has no batch API (Ollama, stub); run a
+                    LocalBatchServer with a LocalBatchBackend instead.
+    """
+    from src.llm.provider import AnthropicProvider, GrokProvider, OpenAIProvider
+
+    inner = unwrap_provider(provider)
+    if isinstance(inner, AnthropicProvider):
+        return AnthropicBatchBackend(inner)
+    if isinstance(inner, (OpenAIProvider, GrokProvider)):
+        return OpenAIBatchBackend(inner)
+    raise ValueError(
+        f"{type(inner).__name__} has no batch API; use a LocalBatchBackend "
+        f"with a LocalBatchServer instead"
+    )
+
+
+# ── Private helpers ──────────────────────────────────────────
+
+
+def _batch_file(requests: list[BatchRequest], body: Callable[[BatchRequest], dict]) -> bytes:
+    """OpenAI batch input file: one JSON request per line."""
+    lines = [
+        json.dumps({
+            "custom_id": r.custom_id,
+            "method": "POST",
+            "url": _OPENAI_BATCH_ENDPOINT,
+            "body": body(r),
+        })
+        for r in requests
+    ]
+    return ("\n".join(lines) + "\n").encode("utf-8")
+
+
+def _batch_results(
+    text: str,
+    to_response: Callable[[SimpleNamespace], LLMResponse],
+) -> dict[str, LLMResponse | BatchError]:
+    """Parse an OpenAI batch output / error file.
+
+    Response bodies are turned into attribute objects so providers'
+    _response() helpers can read them like SDK responses.
+    """
+    results: dict[str, LLMResponse | BatchError] = {}
+    for line in text.splitlines():
+        if not line.strip():
+            continue
+        entry = json.loads(line)
+        response = entry.get("response") or {}
+        if entry.get("error") or response.get("status_code") != 200:
+            error = entry.get("error") or (response.get("body") or {}).get("error")
+            results[entry["custom_id"]] = BatchError(
+                f"request failed (status {response.get('status_code')}): {error}"
+            )
+            continue
+        results[entry["custom_id"]] = to_response(_namespace(response["body"]))
+    return results
+
+
+def _namespace(value):
+    if isinstance(value, dict):
+        return SimpleNamespace(**{k: _namespace(v) for k, v in value.items()})
+    if isinstance(value, list):
+        return [_namespace(v) for v in value]
+    return value
+
+
+def _local_response(body: SimpleNamespace) -> LLMResponse:
+    usage = getattr(body, "usage", None)
+    return LLMResponse(
+        text=(body.choices[0].message.content or "").strip(),
+        model=body.model,
+        tokens_used=usage.total_tokens if usage else 0,
+        provider=getattr(body, "provider", "local"),
+        prompt_tokens=usage.prompt_tokens if usage else 0,
+        cached_prompt_tokens=_openai_cached_tokens(usage),
+        output_tokens=usage.completion_tokens if usage else 0,
+    )
+
+
+def _write_status(folder: Path, status: str) -> None:
+    tmp = folder / "batch.json.tmp"
+    tmp.write_text(json.dumps({"status": status, "updated_at": time.time()}), encoding="utf-8")
+    tmp.replace(folder / "batch.json")
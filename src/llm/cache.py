@@ -0,0 +1,336 @@
+"""Persistent LLM response cache.
+
+The same prompts recur constantly: a JD reposted on several portals yields
+the same summary prompt, the same bullets meet the same keyword sets, and
+``generate`` is often rerun for a JD file that has not changed. CachedProvider
+wraps any BaseLLMProvider and answers repeated requests from a local SQLite
+store instead of paying for another completion.
+
+Entries are keyed by a hash of (provider, model, system prompt, prompt,
+max_tokens, temperature), with prompts normalized for line endings and
+trailing whitespace so cosmetic differences still hit. Entries older than
+the TTL are misses; beyond ``max_entries`` the least-recently-used rows are
+evicted. get_llm_provider() applies the wrapper, so ContentSelector,
+ResumeBuilder and QuestionAnswerer use it without changes. Settings live in
+the ``llm_cache`` section of config/app.yaml.
+"""
+
+import hashlib
+import json
+import logging
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Callable
+
+from src.llm.provider import BaseLLMProvider, LLMResponse, LLMStream, unwrap_provider
+
+logger = logging.getLogger(__name__)
+
+
+def _normalize_prompt(text: str | None) -> str:
+    """Prompt text as it goes into the cache key."""
+    if not text:
+        return ""
+    return "\n".join(line.rstrip() for line in text.strip().splitlines())
+
+
+class LLMResponseCache:
+    """SQLite-backed store of LLM responses with TTL and LRU eviction.
+
+    Like JDCache, the database file is opened lazily on first use. The
+    connection is shared across threads (the default agenerate() runs
+    generate() in a worker thread), so every access holds a lock.
+
+    Args:
+        path: SQLite file location.
+        ttl_hours: Entries older than this are misses (and overwritten).
+        max_entries: Size cap; least-recently-read rows are evicted beyond it.
+        enabled: When False, every lookup is a miss and nothing is stored.
+        clock: Time source in epoch seconds (injectable for tests).
+    """
+
+    def __init__(
+        self,
+        path: str | Path = "data/cache/llm_cache.db",
+        ttl_hours: float = 168.0,
+        max_entries: int = 20000,
+        enabled: bool = True,
+        clock: Callable[[], float] = time.time,
+    ):
+        self.path = Path(path)
+        self.ttl_seconds = ttl_hours * 3600
+        self.max_entries = max_entries
+        self.enabled = enabled
+        self._clock = clock
+        self._conn: sqlite3.Connection | None = None
+        self._lock = threading.Lock()
+        # This process's lookups; lifetime totals come from stats()
+        self.hits = 0
+        self.misses = 0
+        self.tokens_saved = 0
+
+    @classmethod
+    def from_config(cls, config=None) -> "LLMResponseCache":
+        """Build a cache from the ``llm_cache`` section of config/app.yaml."""
+        if config is None:
+            from src.config import get_config
+            config = get_config()
+        from src.config import PROJECT_ROOT
+
+        cfg = config.llm_cache
+        path = Path(cfg.path)
+        if not path.is_absolute():
+            path = PROJECT_ROOT / path
+        return cls(
+            path=path,
+            ttl_hours=cfg.ttl_hours,
+            max_entries=cfg.max_entries,
+            enabled=cfg.enabled,
+        )
+
+    # ── Public API ───────────────────────────────────────────
+
+    @staticmethod
+    def key(
+        provider: str,
+        model: str,
+        system_prompt: str | None,
+        prompt: str,
+        max_tokens: int,
+        temperature: float | None,
+    ) -> str:
+        """Cache key for one request."""
+        raw = json.dumps([
+            provider,
+            model,
+            _normalize_prompt(system_prompt),
+            _normalize_prompt(prompt),
+            max_tokens,
+            temperature,
+        ])
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def get(self, key: str) -> LLMResponse | None:
+        """Cached response (marked ``cached=True``), or None on a miss / expired entry."""
+        if not self.enabled:
+            return None
+        now = self._clock()
+        with self._lock:
+            conn = self._connect()
+            row = conn.execute(
+                "SELECT text, model, tokens_used, provider, created_at "
+                "FROM llm_cache WHERE key = ?",
+                (key,),
+            ).fetchone()
+            if row is None or now - row[4] > self.ttl_seconds:
+                self.misses += 1
+                return None
+            conn.execute(
+                "UPDATE llm_cache SET accessed_at = ?, hits = hits + 1 WHERE key = ?",
+                (now, key),
+            )
+            conn.commit()
+        text, model, tokens_used, provider, _ = row
+        self.hits += 1
+        self.tokens_saved += tokens_used
+        return LLMResponse(
+            text=text, model=model, tokens_used=tokens_used, provider=provider, cached=True,
+        )
+
+    def put(self, key: str, response: LLMResponse) -> None:
+        """Store a response and evict LRU rows beyond the size cap."""
+        if not (self.enabled and response.text):
+            return
+        now = self._clock()
+        with self._lock:
+            conn = self._connect()
+            conn.execute(
+                "INSERT OR REPLACE INTO llm_cache "
+                "(key, text, model, tokens_used, provider, created_at, accessed_at, hits) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, 0)",
+                (
+                    key,
+                    response.text,
+                    response.model,
+                    response.tokens_used,
+                    response.provider,
+                    now,
+                    now,
+                ),
+            )
+            conn.execute(
+                "DELETE FROM llm_cache WHERE key IN ("
+                "  SELECT key FROM llm_cache ORDER BY accessed_at DESC LIMIT -1 OFFSET ?"
+                ")",
+                (self.max_entries,),
+            )
+            conn.commit()
+
+    def stats(self) -> dict:
+        """Lifetime totals: entries, hits and tokens saved, plus this process's hit rate."""
+        if not self.enabled:
+            return {"entries": 0, "hits": 0, "tokens_saved": 0, "hit_rate": 0.0}
+        with self._lock:
+            entries, hits, saved = self._connect().execute(
+                "SELECT COUNT(*), COALESCE(SUM(hits), 0), "
+                "COALESCE(SUM(hits * tokens_used), 0) FROM llm_cache"
+            ).fetchone()
+        return {"entries": entries, "hits": hits, "tokens_saved": saved, "hit_rate": self.hit_rate}
+
+    def clear(self) -> int:
+        """Delete every entry; returns how many were removed."""
+        if not self.enabled:
+            return 0
+        with self._lock:
+            conn = self._connect()
+            removed = conn.execute("DELETE FROM llm_cache").rowcount
+            conn.commit()
+        return removed
+
+    def __len__(self) -> int:
+        if not self.enabled:
+            return 0
+        with self._lock:
+            return self._connect().execute("SELECT COUNT(*) FROM llm_cache").fetchone()[0]
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    # ── Private helpers ──────────────────────────────────────
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS llm_cache ("
+                "  key TEXT PRIMARY KEY,"
+                "  text TEXT NOT NULL,"
+                "  model TEXT NOT NULL,"
+                "  tokens_used INTEGER NOT NULL DEFAULT 0,"
+                "  provider TEXT NOT NULL,"
+                "  created_at REAL NOT NULL,"
+                "  accessed_at REAL NOT NULL,"
+                "  hits INTEGER NOT NULL DEFAULT 0"
+                ")"
+            )
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS ix_llm_cache_accessed ON llm_cache (accessed_at)"
+            )
+        return self._conn
+
+
+class CachedProvider(BaseLLMProvider):
+    """BaseLLMProvider wrapper that serves repeated requests from LLMResponseCache.
+
+    Any other attribute (model, client, DEFAULT_MODEL, ...) is read from the
+    wrapped provider.
+
+    Args:
+        inner: The provider that makes the real calls.
+        cache: Response store.
+        bypass: Skip cache lookups (every call goes to ``inner``) but keep
+                storing fresh responses, e.g. to refresh stale entries.
+    """
+
+    def __init__(self, inner: BaseLLMProvider, cache: LLMResponseCache, bypass: bool = False):
+        self.inner = inner
+        self.cache = cache
+        self.bypass = bypass
+
+    @classmethod
+    def from_config(cls, inner: BaseLLMProvider, config=None) -> "CachedProvider":
+        if config is None:
+            from src.config import get_config
+            config = get_config()
+        return cls(inner, LLMResponseCache.from_config(config), bypass=config.llm_cache.bypass)
+
+    @property
+    def temperature(self) -> float | None:
+        return self.inner.temperature
+
+    def __getattr__(self, name):
+        # Only called for attributes not found on the wrapper itself
+        if name == "inner":
+            raise AttributeError(name)
+        return getattr(self.inner, name)
+
+    def generate(
+        self,
+        prompt: str,
+        max_tokens: int = 500,
+        system_prompt: str | None = None,
+    ) -> LLMResponse:
+        key = self._key(prompt, max_tokens, system_prompt)
+        cached = self._lookup(key)
+        if cached is not None:
+            return cached
+        response = self.inner.generate(prompt, max_tokens, system_prompt)
+        self.cache.put(key, response)
+        return response
+
+    async def agenerate(
+        self,
+        prompt: str,
+        max_tokens: int = 500,
+        system_prompt: str | None = None,
+    ) -> LLMResponse:
+        key = self._key(prompt, max_tokens, system_prompt)
+        cached = self._lookup(key)
+        if cached is not None:
+            return cached
+        response = await self.inner.agenerate(prompt, max_tokens, system_prompt)
+        self.cache.put(key, response)
+        return response
+
+    def stream(
+        self,
+        prompt: str,
+        max_tokens: int = 500,
+        system_prompt: str | None = None,
+    ) -> LLMStream:
+        """Replay a cached response as one chunk, or stream from ``inner`` and
+        cache the result if it is read to the end (aborted streams are not stored)."""
+        key = self._key(prompt, max_tokens, system_prompt)
+        cached = self._lookup(key)
+        if cached is not None:
+            return LLMStream.from_response(cached)
+        stream = self.inner.stream(prompt, max_tokens, system_prompt)
+        stream.on_complete = lambda response: self.cache.put(key, response)
+        return stream
+
+    def is_available(self) -> bool:
+        return self.inner.is_available()
+
+    def close(self) -> None:
+        self.inner.close()
+        self.cache.close()
+
+    async def aclose(self) -> None:
+        await self.inner.aclose()
+
+    def _key(self, prompt: str, max_tokens: int, system_prompt: str | None) -> str:
+        return self.cache.key(
+            # The real provider, not the scheduler / meter wrapper in between
+            type(unwrap_provider(self.inner)).__name__,
+            getattr(self.inner, "model", ""),
+            system_prompt,
+            prompt,
+            max_tokens,
+            self.inner.temperature,
+        )
+
+    def _lookup(self, key: str) -> LLMResponse | None:
+        if self.bypass:
+            return None
+        return self.cache.get(key)
@@ -0,0 +1,354 @@
+"""LLM token and cost metering with enforced budgets.
+
+Every real LLM call is recorded on the current LLMMeter. The meter keeps
+input, output and provider-cached prompt tokens plus an estimated USD cost,
+broken down by (provider, model, call site). Call sites are set by callers
+with ``with llm_call_site("summary"):`` and follow asyncio tasks via
+contextvars: "summary" and "bullet" (ContentSelector), "qa"
+(QuestionAnswerer) and "full_resume" (ResumeBuilder). Anything untagged is
+recorded as "other".
+
+Budgets (tokens and/or USD) come from the ``llm_metering`` section of
+config/app.yaml. Once one is spent, MeteredProvider.is_available() turns
+False and further calls raise LLMBudgetExceeded. Callers then take their
+rule-based fallbacks (pre-written summary, original bullets, manual
+answers). Calls already in flight still finish, so a budget may be
+overshot by at most those calls.
+
+Orchestrator.run() uses a fresh meter per pipeline run, and its summary()
+is stored on the run's SearchRun rows. Outside a run, calls go to a
+process-wide meter built from config. Prices are estimates in USD per
+million tokens; local Ollama models are free.
+"""
+
+import logging
+import threading
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import asdict, dataclass
+from typing import Iterator
+
+from src.llm.provider import BaseLLMProvider, LLMResponse, LLMStream
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class ModelPrice:
+    """USD per million tokens; ``batch`` scales the cost of batch API calls."""
+    input: float
+    cached_input: float
+    output: float
+    batch: float = 0.5   # Anthropic, OpenAI and xAI batches are half price
+
+
+# Matched by longest model-name prefix; override or extend via llm_metering.prices
+DEFAULT_PRICES: dict[str, ModelPrice] = {
+    "grok-3-mini": ModelPrice(0.30, 0.075, 0.50),
+    "grok-3": ModelPrice(3.00, 0.75, 15.00),
+    "grok-4": ModelPrice(3.00, 0.75, 15.00),
+    "gpt-4o-mini": ModelPrice(0.15, 0.075, 0.60),
+    "gpt-4o": ModelPrice(2.50, 1.25, 10.00),
+    "claude-haiku": ModelPrice(1.00, 0.10, 5.00),
+    "claude-sonnet": ModelPrice(3.00, 0.30, 15.00),
+    "claude-opus": ModelPrice(15.00, 1.50, 75.00),
+}
+
+_FREE = ModelPrice(0.0, 0.0, 0.0)
+
+
+class LLMBudgetExceeded(RuntimeError):
+    """Raised instead of calling the LLM once the run's budget is spent."""
+
+
+_CALL_SITE: ContextVar[str] = ContextVar("llm_call_site", default="other")
+
+
+@contextmanager
+def llm_call_site(site: str):
+    """Attribute LLM calls made inside the block (and tasks started from it) to ``site``."""
+    token = _CALL_SITE.set(site)
+    try:
+        yield
+    finally:
+        _CALL_SITE.reset(token)
+
+
+@dataclass
+class Usage:
+    """Token counts and estimated cost of a group of calls."""
+    calls: int = 0
+    input_tokens: int = 0        # all prompt tokens, including cached ones
+    cached_tokens: int = 0       # prompt tokens read from the provider's prompt cache
+    output_tokens: int = 0
+    cost_usd: float = 0.0
+
+    @property
+    def total_tokens(self) -> int:
+        return self.input_tokens + self.output_tokens
+
+    def add(self, other: "Usage") -> None:
+        self.calls += other.calls
+        self.input_tokens += other.input_tokens
+        self.cached_tokens += other.cached_tokens
+        self.output_tokens += other.output_tokens
+        self.cost_usd += other.cost_usd
+
+    def to_dict(self) -> dict:
+        return {**asdict(self), "cost_usd": round(self.cost_usd, 6)}
+
+
+class LLMMeter:
+    """Thread-safe usage ledger with optional token / cost budgets.
+
+    Args:
+        budget_tokens: Stop calling the LLM after this many input + output tokens.
+        budget_usd: Stop calling the LLM after this estimated cost.
+        prices: Model-name prefix -> ModelPrice (defaults to DEFAULT_PRICES).
+    """
+
+    def __init__(
+        self,
+        budget_tokens: int | None = None,
+        budget_usd: float | None = None,
+        prices: dict[str, ModelPrice] | None = None,
+    ):
+        self.budget_tokens = budget_tokens
+        self.budget_usd = budget_usd
+        self.prices = dict(DEFAULT_PRICES if prices is None else prices)
+        self.usage: dict[tuple[str, str, str], Usage] = {}
+        self.total = Usage()
+        self.refused = 0  # calls not made because the budget was spent
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_config(cls, config=None) -> "LLMMeter":
+        """Build a meter from the ``llm_metering`` section of config/app.yaml."""
+        if config is None:
+            from src.config import get_config
+            config = get_config()
+        cfg = config.llm_metering
+        prices = {**DEFAULT_PRICES, **{
+            prefix: ModelPrice(*values) for prefix, values in cfg.prices.items()
+        }}
+        return cls(budget_tokens=cfg.budget_tokens, budget_usd=cfg.budget_usd, prices=prices)
+
+    # ── Public API ───────────────────────────────────────────
+
+    @property
+    def exhausted(self) -> bool:
+        """True once a token or cost budget has been spent."""
+        return (
+            (self.budget_tokens is not None and self.total.total_tokens >= self.budget_tokens)
+            or (self.budget_usd is not None and self.total.cost_usd >= self.budget_usd)
+        )
+
+    def check(self) -> None:
+        """Raise LLMBudgetExceeded if no further calls are allowed."""
+        if self.exhausted:
+            with self._lock:
+                self.refused += 1
+            raise LLMBudgetExceeded(
+                f"LLM budget spent ({self.total.total_tokens} tokens, "
+                f"${self.total.cost_usd:.4f}); using rule-based fallbacks"
+            )
+
+    def price(self, provider: str, model: str) -> ModelPrice:
+        if provider == "ollama":
+            return _FREE
+        matches = [prefix for prefix in self.prices if model.startswith(prefix)]
+        if not matches:
+            return _FREE
+        return self.prices[max(matches, key=len)]
+
+    def record(
+        self,
+        provider: str,
+        model: str,
+        input_tokens: int,
+        output_tokens: int,
+        cached_tokens: int = 0,
+        site: str | None = None,
+        batch: bool = False,
+    ) -> Usage:
+        """Add one call; ``site`` defaults to the current llm_call_site().
+
+        ``batch`` calls (see src/llm/batch.py) are charged at the model's
+        batch discount.
+        """
+        price = self.price(provider, model)
+        cached_tokens = min(cached_tokens, input_tokens)
+        usage = Usage(
+            calls=1,
+            input_tokens=input_tokens,
+            cached_tokens=cached_tokens,
+            output_tokens=output_tokens,
+            cost_usd=(
+                (input_tokens - cached_tokens) * price.input
+                + cached_tokens * price.cached_input
+                + output_tokens * price.output
+            ) * (price.batch if batch else 1.0) / 1_000_000,
+        )
+        key = (provider, model, site or _CALL_SITE.get())
+        with self._lock:
+            self.usage.setdefault(key, Usage()).add(usage)
+            self.total.add(usage)
+        return usage
+
+    def record_response(
+        self,
+        response: LLMResponse,
+        estimated_input: int = 0,
+        site: str | None = None,
+        batch: bool = False,
+    ) -> Usage:
+        """Add a finished call; ``estimated_input`` stands in if the provider reported no prompt usage."""
+        output = response.output_tokens or max(response.tokens_used - response.prompt_tokens, 0)
+        return self.record(
+            response.provider,
+            response.model,
+            response.prompt_tokens or estimated_input,
+            output,
+            response.cached_prompt_tokens,
+            site,
+            batch,
+        )
+
+    def by_call_site(self) -> dict[str, Usage]:
+        sites: dict[str, Usage] = {}
+        with self._lock:
+            for (_, _, site), usage in self.usage.items():
+                sites.setdefault(site, Usage()).add(usage)
+        return sites
+
+    def summary(self) -> dict:
+        """JSON-serializable totals, per-call-site totals and per-(provider, model, site) rows."""
+        with self._lock:
+            rows = [
+                {"provider": provider, "model": model, "call_site": site, **usage.to_dict()}
+                for (provider, model, site), usage in sorted(self.usage.items())
+            ]
+            total = self.total.to_dict()
+        return {
+            **total,
+            "budget_tokens": self.budget_tokens,
+            "budget_usd": self.budget_usd,
+            "budget_exhausted": self.exhausted,
+            "refused_calls": self.refused,
+            "by_call_site": {site: usage.to_dict() for site, usage in self.by_call_site().items()},
+            "entries": rows,
+        }
+
+
+_METER: ContextVar[LLMMeter | None] = ContextVar("llm_meter", default=None)
+_default_meter: LLMMeter | None = None
+_default_lock = threading.Lock()
+
+
+def current_meter() -> LLMMeter:
+    """The meter of the enclosing metering() block, else the process-wide one."""
+    meter = _METER.get()
+    if meter is not None:
+        return meter
+    global _default_meter
+    with _default_lock:
+        if _default_meter is None:
+            _default_meter = LLMMeter.from_config()
+        return _default_meter
+
+
+@contextmanager
+def metering(meter: LLMMeter):
+    """Record LLM calls made inside the block (and tasks started from it) on ``meter``."""
+    token = _METER.set(meter)
+    try:
+        yield meter
+    finally:
+        _METER.reset(token)
+
+
+def _estimate_input(prompt: str, system_prompt: str | None) -> int:
+    return (len(prompt) + len(system_prompt or "")) // 4
+
+
+class MeteredProvider(BaseLLMProvider):
+    """BaseLLMProvider wrapper that records usage and enforces the budget.
+
+    Any other attribute (model, client, ...) is read from the wrapped provider.
+
+    Args:
+        inner: The provider that makes the real calls.
+        meter: Fixed meter; by default the current_meter() at call time.
+    """
+
+    def __init__(self, inner: BaseLLMProvider, meter: LLMMeter | None = None):
+        self.inner = inner
+        self._meter = meter
+
+    def __getattr__(self, name):
+        # Only called for attributes not found on the wrapper itself
+        if name == "inner":
+            raise AttributeError(name)
+        return getattr(self.inner, name)
+
+    @property
+    def meter(self) -> LLMMeter:
+        return self._meter or current_meter()
+
+    @property
+    def temperature(self) -> float | None:
+        return self.inner.temperature
+
+    def generate(
+        self,
+        prompt: str,
+        max_tokens: int = 500,
+        system_prompt: str | None = None,
+    ) -> LLMResponse:
+        meter = self.meter
+        meter.check()
+        response = self.inner.generate(prompt, max_tokens, system_prompt)
+        meter.record_response(response, _estimate_input(prompt, system_prompt))
+        return response
+
+    async def agenerate(
+        self,
+        prompt: str,
+        max_tokens: int = 500,
+        system_prompt: str | None = None,
+    ) -> LLMResponse:
+        meter = self.meter
+        meter.check()
+        response = await self.inner.agenerate(prompt, max_tokens, system_prompt)
+        meter.record_response(response, _estimate_input(prompt, system_prompt))
+        return response
+
+    def _stream_chunks(
+        self,
+        stream: LLMStream,
+        prompt: str,
+        max_tokens: int,
+        system_prompt: str | None,
+    ) -> Iterator[str]:
+        """Aborted streams are recorded too: their tokens were still billed."""
+        meter = self.meter
+        meter.check()
+        try:
+            yield from self.inner._stream_chunks(stream, prompt, max_tokens, system_prompt)
+        finally:
+            meter.record(
+                stream.provider,
+                stream.model,
+                stream.prompt_tokens or _estimate_input(prompt, system_prompt),
+                stream.metrics.output_tokens,
+                stream.cached_prompt_tokens,
+            )
+
+    def is_available(self) -> bool:
+        return not self.meter.exhausted and self.inner.is_available()
+
+    def close(self) -> None:
+        self.inner.close()
+
+    async def aclose(self) -> None:
+        await self.inner.aclose()
@@ -5,10 +5,37 @@ that returns placeholder text (used when no real LLM is configured).
 
 Provider priority: grok → ollama → stub
 API key for Grok is sourced from the GROK_API_KEY environment variable.
+
+Each provider instance owns one long-lived SDK / httpx client (built on first
+use), so consecutive calls reuse pooled keep-alive connections instead of
+paying a new connection pool and TLS handshake per call. Pool limits and
+timeouts come from HTTPSettings (``llm`` section of config/app.yaml).
+
+Async callers (the Playwright pipeline) use agenerate(), which goes through
+the SDKs' async clients / httpx.AsyncClient so an LLM call never blocks the
+event loop; generate() remains the synchronous path for the CLI.
+
+get_llm_provider() wraps real providers in CachedProvider (src/llm/cache.py)
+so repeated prompts are answered from a local SQLite cache.
+
+stream() returns an LLMStream of text chunks, so long generations (the
+full-LaTeX ResumeBuilder call) can be validated and written as they arrive
+and aborted early; it also measures time-to-first-token and tokens/sec.
+
+Provider-side prompt caching: callers put static text first (typically in
+the system prompt). Anthropic gets an explicit ``cache_control`` breakpoint
+on long system prompts, OpenAI-compatible APIs cache matching prefixes
+automatically, and Ollama keeps the model (and its prompt cache) loaded via
+``keep_alive``. LLMResponse.cached_prompt_tokens reports how much of the
+prompt was served from that cache.
 """
 
+import asyncio
+import json
+import time
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
+from typing import Callable, Iterator
 
 
 @dataclass
@@ -18,11 +45,175 @@ class LLMResponse:
     model: str
     tokens_used: int = 0
     provider: str = "unknown"
+    cached: bool = False           # served from the LLM response cache
+    prompt_tokens: int = 0
+    cached_prompt_tokens: int = 0  # prompt tokens read from the provider's prompt cache
+    output_tokens: int = 0
+
+
+@dataclass
+class StreamMetrics:
+    """Timing of one streamed generation."""
+    ttft_s: float | None        # seconds until the first chunk (None if none arrived)
+    total_s: float
+    output_tokens: int
+
+    @property
+    def tokens_per_s(self) -> float:
+        """Output tokens per second after the first token arrived."""
+        generating = self.total_s - (self.ttft_s or 0.0)
+        return self.output_tokens / generating if generating > 0 else 0.0
+
+
+class LLMStream:
+    """Text chunks of one generation, as the provider produces them.
+
+    Iterate to receive chunks; ``response`` and ``metrics`` describe what
+    has arrived so far. close() (or leaving a ``with`` block) aborts the
+    request. ``on_complete`` is called with the final LLMResponse only if
+    the stream is read to the end.
+    """
+
+    def __init__(
+        self,
+        model: str = "",
+        provider: str = "unknown",
+        clock: Callable[[], float] = time.perf_counter,
+    ):
+        self.model = model
+        self.provider = provider
+        # Filled in by the provider when it reports usage
+        self.tokens_used = 0
+        self.output_tokens = 0
+        self.prompt_tokens = 0
+        self.cached_prompt_tokens = 0
+        self.cached = False
+        self.completed = False
+        self.on_complete: Callable[[LLMResponse], None] | None = None
+        self._chunks: Iterator[str] = iter(())
+        self._parts: list[str] = []
+        self._clock = clock
+        self._started_at = self._first_at = self._ended_at = None
+
+    @classmethod
+    def from_response(cls, response: LLMResponse) -> "LLMStream":
+        """A single-chunk stream replaying a complete response."""
+        stream = cls(model=response.model, provider=response.provider)
+        stream.tokens_used = response.tokens_used
+        stream.cached = response.cached
+        return stream.attach(iter([response.text]))
+
+    def attach(self, chunks: Iterator[str]) -> "LLMStream":
+        self._chunks = chunks
+        return self
+
+    def __iter__(self) -> Iterator[str]:
+        self._started_at = self._clock()
+        try:
+            for chunk in self._chunks:
+                if self._first_at is None:
+                    self._first_at = self._clock()
+                self._parts.append(chunk)
+                yield chunk
+            self.completed = True
+        finally:
+            self._ended_at = self._clock()
+        if self.on_complete is not None:
+            self.on_complete(self.response)
+
+    def close(self) -> None:
+        """Abort the underlying request (no-op once finished)."""
+        close = getattr(self._chunks, "close", None)
+        if close is not None:
+            close()
+
+    def __enter__(self) -> "LLMStream":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    @property
+    def text(self) -> str:
+        return "".join(self._parts)
+
+    @property
+    def response(self) -> LLMResponse:
+        return LLMResponse(
+            text=self.text,
+            model=self.model,
+            tokens_used=self.tokens_used or self.output_tokens or len(self._parts),
+            provider=self.provider,
+            cached=self.cached,
+            prompt_tokens=self.prompt_tokens,
+            cached_prompt_tokens=self.cached_prompt_tokens,
+            output_tokens=self.output_tokens,
+        )
+
+    @property
+    def metrics(self) -> StreamMetrics:
+        started = self._started_at if self._started_at is not None else self._clock()
+        ended = self._ended_at if self._ended_at is not None else self._clock()
+        return StreamMetrics(
+            ttft_s=self._first_at - started if self._first_at is not None else None,
+            total_s=ended - started,
+            # Providers that don't report usage: one delta is roughly one token
+            output_tokens=self.output_tokens or len(self._parts),
+        )
+
+
+@dataclass
+class HTTPSettings:
+    """Connection pool and timeout settings for a provider's HTTP client."""
+    timeout: float = 120.0              # read/write/pool timeout, seconds
+    connect_timeout: float = 10.0
+    max_connections: int = 10
+    max_keepalive_connections: int = 5
+    keepalive_expiry: float = 30.0      # idle seconds before a pooled connection closes
+
+    @classmethod
+    def from_config(cls, llm_config) -> "HTTPSettings":
+        """Build settings from the ``llm`` section of config/app.yaml."""
+        return cls(
+            timeout=llm_config.timeout_s,
+            connect_timeout=llm_config.connect_timeout_s,
+            max_connections=llm_config.max_connections,
+            max_keepalive_connections=llm_config.max_keepalive_connections,
+            keepalive_expiry=llm_config.keepalive_expiry_s,
+        )
+
+    def client(self, **kwargs):
+        """A pooled httpx.Client with these limits and timeouts."""
+        import httpx
+        return httpx.Client(**self._client_kwargs(), **kwargs)
+
+    def async_client(self, **kwargs):
+        """A pooled httpx.AsyncClient with these limits and timeouts."""
+        import httpx
+        return httpx.AsyncClient(**self._client_kwargs(), **kwargs)
+
+    def _client_kwargs(self) -> dict:
+        import httpx
+        return {
+            "limits": httpx.Limits(
+                max_connections=self.max_connections,
+                max_keepalive_connections=self.max_keepalive_connections,
+                keepalive_expiry=self.keepalive_expiry,
+            ),
+            "timeout": httpx.Timeout(self.timeout, connect=self.connect_timeout),
+        }
 
 
 class BaseLLMProvider(ABC):
     """Abstract base class for LLM providers."""
 
+    # Sampling temperature sent with every request (None = provider default);
+    # part of the response-cache key
+    temperature: float | None = None
+    # Retries inside the vendor SDK client (None = SDK default). Set to 0 by
+    # ScheduledProvider, which retries with its own backoff.
+    sdk_max_retries: int | None = None
+
     @abstractmethod
     def generate(
         self,
@@ -47,6 +238,54 @@ class BaseLLMProvider(ABC):
         """Check if this provider is configured and reachable."""
         ...
 
+    async def agenerate(
+        self,
+        prompt: str,
+        max_tokens: int = 500,
+        system_prompt: str | None = None,
+    ) -> LLMResponse:
+        """Async generate().
+
+        The default runs generate() in a worker thread so it can't block the
+        event loop; providers with an async client override it.
+        """
+        return await asyncio.to_thread(self.generate, prompt, max_tokens, system_prompt)
+
+    def stream(
+        self,
+        prompt: str,
+        max_tokens: int = 500,
+        system_prompt: str | None = None,
+    ) -> LLMStream:
+        """Generate text incrementally; see LLMStream."""
+        stream = LLMStream(model=getattr(self, "model", ""))
+        return stream.attach(self._stream_chunks(stream, prompt, max_tokens, system_prompt))
+
+    def _stream_chunks(
+        self,
+        stream: LLMStream,
+        prompt: str,
+        max_tokens: int,
+        system_prompt: str | None,
+    ) -> Iterator[str]:
+        """Yield text chunks and record usage on ``stream``.
+
+        The default yields the whole generate() reply as one chunk;
+        providers with a streaming API override it.
+        """
+        response = self.generate(prompt, max_tokens, system_prompt)
+        stream.model, stream.provider = response.model, response.provider
+        stream.tokens_used = response.tokens_used
+        stream.prompt_tokens = response.prompt_tokens
+        stream.cached_prompt_tokens = response.cached_prompt_tokens
+        yield response.text
+
+    def close(self) -> None:
+        """Release pooled connections (no-op for providers without a client)."""
+
+    async def aclose(self) -> None:
+        """Release the async client's pooled connections."""
+
 
 class StubProvider(BaseLLMProvider):
     """Stub LLM provider — returns placeholder text.
@@ -86,6 +325,14 @@ class StubProvider(BaseLLMProvider):
             provider="stub",
         )
 
+    async def agenerate(
+        self,
+        prompt: str,
+        max_tokens: int = 500,
+        system_prompt: str | None = None,
+    ) -> LLMResponse:
+        return self.generate(prompt, max_tokens, system_prompt)
+
     def is_available(self) -> bool:
         return True
 
@@ -111,6 +358,8 @@ class GrokProvider(BaseLLMProvider):
     # 4000 accommodates full-document generation (ResumeBuilder) in addition
     # to the typical summary (150) / bullet (80) calls.
     MAX_TOKENS_CEILING = 4000
+    # Lower temperature for deterministic, factual output
+    temperature = 0.3
 
     # Default system prompt used when callers don't supply one.
     DEFAULT_SYSTEM_PROMPT = (
@@ -119,9 +368,47 @@ class GrokProvider(BaseLLMProvider):
         "metrics, or technologies not explicitly mentioned in the provided context."
     )
 
-    def __init__(self, api_key: str, model: str = DEFAULT_MODEL):
+    def __init__(
+        self,
+        api_key: str,
+        model: str = DEFAULT_MODEL,
+        base_url: str = GROK_BASE_URL,
+        http: HTTPSettings | None = None,
+    ):
         self.api_key = api_key
         self.model = model
+        self.base_url = base_url
+        self.http = http or HTTPSettings()
+        self._client = None
+        self._aclient = None
+
+    @property
+    def client(self):
+        """Long-lived OpenAI-compatible client (pooled keep-alive connections)."""
+        if self._client is None:
+            self._client = _openai_client(
+                self.api_key, self.base_url, self.http, self.sdk_max_retries
+            )
+        return self._client
+
+    @property
+    def aclient(self):
+        """Long-lived async OpenAI-compatible client."""
+        if self._aclient is None:
+            self._aclient = _openai_client(
+                self.api_key, self.base_url, self.http, self.sdk_max_retries, aio=True
+            )
+        return self._aclient
+
+    def close(self) -> None:
+        if self._client is not None:
+            self._client.close()
+            self._client = None
+
+    async def aclose(self) -> None:
+        if self._aclient is not None:
+            await self._aclient.close()
+            self._aclient = None
 
     def generate(
         self,
@@ -129,42 +416,113 @@ class GrokProvider(BaseLLMProvider):
         max_tokens: int = 400,
         system_prompt: str | None = None,
     ) -> LLMResponse:
-        try:
-            from openai import OpenAI
-        except ImportError:
-            raise ImportError("Install openai: pip install 'openai>=1.30.0'")
+        response = self.client.chat.completions.create(
+            **self._request(prompt, max_tokens, system_prompt)
+        )
+        return self._response(response)
 
-        capped = min(max_tokens, self.MAX_TOKENS_CEILING)
-        sys_msg = system_prompt or self.DEFAULT_SYSTEM_PROMPT
+    async def agenerate(
+        self,
+        prompt: str,
+        max_tokens: int = 400,
+        system_prompt: str | None = None,
+    ) -> LLMResponse:
+        response = await self.aclient.chat.completions.create(
+            **self._request(prompt, max_tokens, system_prompt)
+        )
+        return self._response(response)
 
-        client = OpenAI(api_key=self.api_key, base_url=self.GROK_BASE_URL)
-        response = client.chat.completions.create(
-            model=self.model,
-            messages=[
-                {"role": "system", "content": sys_msg},
+    def _request(self, prompt: str, max_tokens: int, system_prompt: str | None) -> dict:
+        return {
+            "model": self.model,
+            "messages": [
+                {"role": "system", "content": system_prompt or self.DEFAULT_SYSTEM_PROMPT},
                 {"role": "user", "content": prompt},
             ],
-            max_tokens=capped,
-            temperature=0.3,  # Lower temperature for deterministic, factual output
-        )
+            "max_tokens": min(max_tokens, self.MAX_TOKENS_CEILING),
+            "temperature": self.temperature,
+        }
+
+    def _response(self, response) -> LLMResponse:
         choice = response.choices[0]
         return LLMResponse(
             text=(choice.message.content or "").strip(),
             model=self.model,
             tokens_used=response.usage.total_tokens if response.usage else 0,
             provider="grok",
+            prompt_tokens=response.usage.prompt_tokens if response.usage else 0,
+            cached_prompt_tokens=_openai_cached_tokens(response.usage),
+            output_tokens=response.usage.completion_tokens if response.usage else 0,
         )
 
+    def _stream_chunks(self, stream, prompt, max_tokens, system_prompt):
+        stream.provider = "grok"
+        events = self.client.chat.completions.create(
+            **self._request(prompt, max_tokens, system_prompt),
+            stream=True,
+            stream_options={"include_usage": True},
+        )
+        try:
+            for event in events:
+                if event.usage:
+                    stream.tokens_used = event.usage.total_tokens
+                    stream.output_tokens = event.usage.completion_tokens
+                    stream.prompt_tokens = event.usage.prompt_tokens
+                    stream.cached_prompt_tokens = _openai_cached_tokens(event.usage)
+                if event.choices and event.choices[0].delta.content:
+                    yield event.choices[0].delta.content
+        finally:
+            events.close()
+
     def is_available(self) -> bool:
         return bool(self.api_key)
 
 
 class OllamaProvider(BaseLLMProvider):
-    """Ollama local LLM provider. Calls the Ollama REST API."""
+    """Ollama local LLM provider. Calls the Ollama REST API.
+
+    ``keep_alive`` keeps the model loaded between calls, so the server can
+    reuse its cached evaluation of a shared prompt prefix instead of
+    reloading the model and re-reading the whole prompt.
+    """
 
-    def __init__(self, model: str = "llama3", base_url: str = "http://localhost:11434"):
+    def __init__(
+        self,
+        model: str = "llama3",
+        base_url: str = "http://localhost:11434",
+        http: HTTPSettings | None = None,
+        keep_alive: str = "30m",
+    ):
         self.model = model
         self.base_url = base_url.rstrip("/")
+        self.http = http or HTTPSettings()
+        self.keep_alive = keep_alive
+        self._client = None
+        self._aclient = None
+
+    @property
+    def client(self):
+        """Long-lived httpx.Client for the Ollama REST API."""
+        if self._client is None:
+            self._client = self.http.client(base_url=self.base_url)
+        return self._client
+
+    @property
+    def aclient(self):
+        """Long-lived httpx.AsyncClient for the Ollama REST API."""
+        if self._aclient is None:
+            self._aclient = self.http.async_client(base_url=self.base_url)
+        return self._aclient
+
+    def close(self) -> None:
+        if self._client is not None:
+            self._client.close()
+            self._client = None
+
+    async def aclose(self) -> None:
+        if self._aclient is not None:
+            await self._aclient.aclose()
+            self._aclient = None
 
     def generate(
         self,
@@ -172,36 +530,66 @@ class OllamaProvider(BaseLLMProvider):
         max_tokens: int = 500,
         system_prompt: str | None = None,
     ) -> LLMResponse:
-        import httpx
+        response = self.client.post(
+            "/api/generate", json=self._payload(prompt, max_tokens, system_prompt)
+        )
+        response.raise_for_status()
+        return self._response(response.json())
 
+    async def agenerate(
+        self,
+        prompt: str,
+        max_tokens: int = 500,
+        system_prompt: str | None = None,
+    ) -> LLMResponse:
+        response = await self.aclient.post(
+            "/api/generate", json=self._payload(prompt, max_tokens, system_prompt)
+        )
+        response.raise_for_status()
+        return self._response(response.json())
+
+    def _payload(self, prompt: str, max_tokens: int, system_prompt: str | None) -> dict:
         full_prompt = prompt
         if system_prompt:
             full_prompt = f"[INST] <<SYS>>\n{system_prompt}\n<</SYS>>\n\n{prompt} [/INST]"
-
-        payload = {
+        return {
             "model": self.model,
             "prompt": full_prompt,
             "stream": False,
+            "keep_alive": self.keep_alive,
             "options": {"num_predict": max_tokens},
         }
-        response = httpx.post(
-            f"{self.base_url}/api/generate",
-            json=payload,
-            timeout=120.0,
-        )
-        response.raise_for_status()
-        data = response.json()
+
+    def _response(self, data: dict) -> LLMResponse:
         return LLMResponse(
             text=data.get("response", ""),
             model=self.model,
             tokens_used=data.get("eval_count", 0),
             provider="ollama",
+            # Prompt tokens actually evaluated (a reused prefix is not counted)
+            prompt_tokens=data.get("prompt_eval_count", 0),
+            output_tokens=data.get("eval_count", 0),
         )
 
+    def _stream_chunks(self, stream, prompt, max_tokens, system_prompt):
+        stream.provider = "ollama"
+        payload = {**self._payload(prompt, max_tokens, system_prompt), "stream": True}
+        with self.client.stream("POST", "/api/generate", json=payload) as response:
+            response.raise_for_status()
+            # Newline-delimited JSON objects; the last one has done=true and usage
+            for line in response.iter_lines():
+                if not line:
+                    continue
+                data = json.loads(line)
+                if data.get("response"):
+                    yield data["response"]
+                if data.get("done"):
+                    stream.tokens_used = stream.output_tokens = data.get("eval_count", 0)
+                    stream.prompt_tokens = data.get("prompt_eval_count", 0)
+
     def is_available(self) -> bool:
         try:
-            import httpx
-            r = httpx.get(f"{self.base_url}/api/tags", timeout=3.0)
+            r = self.client.get("/api/tags", timeout=3.0)
             return r.status_code == 200
         except Exception:
             return False
@@ -210,9 +598,47 @@ class OllamaProvider(BaseLLMProvider):
 class OpenAIProvider(BaseLLMProvider):
     """OpenAI API provider (kept as optional fallback; prefer GrokProvider)."""
 
-    def __init__(self, api_key: str, model: str = "gpt-4o-mini"):
+    def __init__(
+        self,
+        api_key: str,
+        model: str = "gpt-4o-mini",
+        base_url: str | None = None,
+        http: HTTPSettings | None = None,
+    ):
         self.api_key = api_key
         self.model = model
+        self.base_url = base_url
+        self.http = http or HTTPSettings()
+        self._client = None
+        self._aclient = None
+
+    @property
+    def client(self):
+        """Long-lived OpenAI client (pooled keep-alive connections)."""
+        if self._client is None:
+            self._client = _openai_client(
+                self.api_key, self.base_url, self.http, self.sdk_max_retries
+            )
+        return self._client
+
+    @property
+    def aclient(self):
+        """Long-lived async OpenAI client."""
+        if self._aclient is None:
+            self._aclient = _openai_client(
+                self.api_key, self.base_url, self.http, self.sdk_max_retries, aio=True
+            )
+        return self._aclient
+
+    def close(self) -> None:
+        if self._client is not None:
+            self._client.close()
+            self._client = None
+
+    async def aclose(self) -> None:
+        if self._aclient is not None:
+            await self._aclient.close()
+            self._aclient = None
 
     def generate(
         self,
@@ -220,29 +646,64 @@ class OpenAIProvider(BaseLLMProvider):
         max_tokens: int = 500,
         system_prompt: str | None = None,
     ) -> LLMResponse:
-        try:
-            from openai import OpenAI
-        except ImportError:
-            raise ImportError("Install openai: pip install 'openai>=1.30.0'")
+        response = self.client.chat.completions.create(
+            **self._request(prompt, max_tokens, system_prompt)
+        )
+        return self._response(response)
+
+    async def agenerate(
+        self,
+        prompt: str,
+        max_tokens: int = 500,
+        system_prompt: str | None = None,
+    ) -> LLMResponse:
+        response = await self.aclient.chat.completions.create(
+            **self._request(prompt, max_tokens, system_prompt)
+        )
+        return self._response(response)
 
+    def _request(self, prompt: str, max_tokens: int, system_prompt: str | None) -> dict:
         sys_msg = system_prompt or "You are a helpful professional career coach."
-        client = OpenAI(api_key=self.api_key)
-        response = client.chat.completions.create(
-            model=self.model,
-            messages=[
+        return {
+            "model": self.model,
+            "messages": [
                 {"role": "system", "content": sys_msg},
                 {"role": "user", "content": prompt},
             ],
-            max_tokens=max_tokens,
-        )
+            "max_tokens": max_tokens,
+        }
+
+    def _response(self, response) -> LLMResponse:
         choice = response.choices[0]
         return LLMResponse(
             text=choice.message.content or "",
             model=self.model,
             tokens_used=response.usage.total_tokens if response.usage else 0,
             provider="openai",
+            prompt_tokens=response.usage.prompt_tokens if response.usage else 0,
+            cached_prompt_tokens=_openai_cached_tokens(response.usage),
+            output_tokens=response.usage.completion_tokens if response.usage else 0,
         )
 
+    def _stream_chunks(self, stream, prompt, max_tokens, system_prompt):
+        stream.provider = "openai"
+        events = self.client.chat.completions.create(
+            **self._request(prompt, max_tokens, system_prompt),
+            stream=True,
+            stream_options={"include_usage": True},
+        )
+        try:
+            for event in events:
+                if event.usage:
+                    stream.tokens_used = event.usage.total_tokens
+                    stream.output_tokens = event.usage.completion_tokens
+                    stream.prompt_tokens = event.usage.prompt_tokens
+                    stream.cached_prompt_tokens = _openai_cached_tokens(event.usage)
+                if event.choices and event.choices[0].delta.content:
+                    yield event.choices[0].delta.content
+        finally:
+            events.close()
+
     def is_available(self) -> bool:
         return bool(self.api_key)
 
@@ -260,10 +721,58 @@ class AnthropicProvider(BaseLLMProvider):
     """
 
     DEFAULT_MODEL = "claude-sonnet-4-6"
+    # System prompts at least this long (~1024 tokens, the smallest cacheable
+    # prefix) get a cache_control breakpoint; shorter ones aren't worth the
+    # cache-write surcharge.
+    PROMPT_CACHE_MIN_CHARS = 4096
 
-    def __init__(self, api_key: str, model: str = DEFAULT_MODEL):
+    def __init__(
+        self,
+        api_key: str,
+        model: str = DEFAULT_MODEL,
+        base_url: str | None = None,
+        http: HTTPSettings | None = None,
+    ):
         self.api_key = api_key
         self.model = model
+        self.base_url = base_url
+        self.http = http or HTTPSettings()
+        self._client = None
+        self._aclient = None
+
+    @property
+    def client(self):
+        """Long-lived Anthropic client (pooled keep-alive connections)."""
+        if self._client is None:
+            self._client = _anthropic_module().Anthropic(
+                api_key=self.api_key,
+                base_url=self.base_url,
+                http_client=self.http.client(),
+                **_sdk_retries(self.sdk_max_retries),
+            )
+        return self._client
+
+    @property
+    def aclient(self):
+        """Long-lived async Anthropic client."""
+        if self._aclient is None:
+            self._aclient = _anthropic_module().AsyncAnthropic(
+                api_key=self.api_key,
+                base_url=self.base_url,
+                http_client=self.http.async_client(),
+                **_sdk_retries(self.sdk_max_retries),
+            )
+        return self._aclient
+
+    def close(self) -> None:
+        if self._client is not None:
+            self._client.close()
+            self._client = None
+
+    async def aclose(self) -> None:
+        if self._aclient is not None:
+            await self._aclient.close()
+            self._aclient = None
 
     def generate(
         self,
@@ -271,39 +780,114 @@ class AnthropicProvider(BaseLLMProvider):
         max_tokens: int = 500,
         system_prompt: str | None = None,
     ) -> LLMResponse:
-        try:
-            import anthropic
-        except ImportError:
-            raise ImportError("Install anthropic: pip install 'anthropic>=0.40.0'")
+        message = self.client.messages.create(**self._request(prompt, max_tokens, system_prompt))
+        return self._response(message)
 
-        client = anthropic.Anthropic(api_key=self.api_key)
+    async def agenerate(
+        self,
+        prompt: str,
+        max_tokens: int = 500,
+        system_prompt: str | None = None,
+    ) -> LLMResponse:
+        message = await self.aclient.messages.create(
+            **self._request(prompt, max_tokens, system_prompt)
+        )
+        return self._response(message)
+
+    def _request(self, prompt: str, max_tokens: int, system_prompt: str | None) -> dict:
         sys_msg = system_prompt or (
             "You are a professional career coach and expert resume writer specialising "
             "in tech industry roles. Be concise and factual. Never fabricate experience, "
             "metrics, or technologies not explicitly mentioned in the provided context."
         )
-        message = client.messages.create(
-            model=self.model,
-            max_tokens=max_tokens,
-            system=sys_msg,
-            messages=[{"role": "user", "content": prompt}],
-        )
+        system: str | list[dict] = sys_msg
+        if len(sys_msg) >= self.PROMPT_CACHE_MIN_CHARS:
+            system = [{"type": "text", "text": sys_msg, "cache_control": {"type": "ephemeral"}}]
+        return {
+            "model": self.model,
+            "max_tokens": max_tokens,
+            "system": system,
+            "messages": [{"role": "user", "content": prompt}],
+        }
+
+    def _response(self, message) -> LLMResponse:
         text = message.content[0].text if message.content else ""
-        tokens_used = (
-            message.usage.input_tokens + message.usage.output_tokens
-            if message.usage else 0
-        )
+        prompt_tokens, cached = _anthropic_prompt_tokens(message.usage)
         return LLMResponse(
             text=text.strip(),
             model=self.model,
-            tokens_used=tokens_used,
+            tokens_used=prompt_tokens + message.usage.output_tokens if message.usage else 0,
             provider="anthropic",
+            prompt_tokens=prompt_tokens,
+            cached_prompt_tokens=cached,
+            output_tokens=message.usage.output_tokens if message.usage else 0,
         )
 
+    def _stream_chunks(self, stream, prompt, max_tokens, system_prompt):
+        stream.provider = "anthropic"
+        with self.client.messages.stream(**self._request(prompt, max_tokens, system_prompt)) as events:
+            yield from events.text_stream
+            usage = events.get_final_message().usage
+            if usage:
+                stream.prompt_tokens, stream.cached_prompt_tokens = _anthropic_prompt_tokens(usage)
+                stream.tokens_used = stream.prompt_tokens + usage.output_tokens
+                stream.output_tokens = usage.output_tokens
+
     def is_available(self) -> bool:
         return bool(self.api_key)
 
 
+def _openai_client(
+    api_key: str,
+    base_url: str | None,
+    http: HTTPSettings,
+    max_retries: int | None = None,
+    aio: bool = False,
+):
+    """OpenAI SDK client on a pooled httpx client (Grok / OpenAI)."""
+    try:
+        from openai import AsyncOpenAI, OpenAI
+    except ImportError:
+        raise ImportError("Install openai: pip install 'openai>=1.30.0'")
+    kwargs = _sdk_retries(max_retries)
+    if aio:
+        return AsyncOpenAI(
+            api_key=api_key, base_url=base_url, http_client=http.async_client(), **kwargs
+        )
+    return OpenAI(api_key=api_key, base_url=base_url, http_client=http.client(), **kwargs)
+
+
+def _sdk_retries(max_retries: int | None) -> dict:
+    """``max_retries`` keyword for an SDK client, omitted to keep the SDK default."""
+    return {} if max_retries is None else {"max_retries": max_retries}
+
+
+def _openai_cached_tokens(usage) -> int:
+    """Prompt tokens served from an OpenAI-compatible API's automatic prefix cache."""
+    details = getattr(usage, "prompt_tokens_details", None) if usage else None
+    return getattr(details, "cached_tokens", None) or 0
+
+
+def _anthropic_prompt_tokens(usage) -> tuple[int, int]:
+    """(all prompt tokens, tokens read from the prompt cache) for an Anthropic usage block.
+
+    ``input_tokens`` excludes both cache reads and cache writes.
+    """
+    if not usage:
+        return 0, 0
+    cached = getattr(usage, "cache_read_input_tokens", None) or 0
+    written = getattr(usage, "cache_creation_input_tokens", None) or 0
+    return usage.input_tokens + cached + written, cached
+
+
+def _anthropic_module():
+    try:
+        import anthropic
+    except ImportError:
+        raise ImportError("Install anthropic: pip install 'anthropic>=0.40.0'")
+    return anthropic
+
+
 # ── Factory ──────────────────────────────────────────────────
 
 def get_llm_provider(config=None) -> BaseLLMProvider:
@@ -316,14 +900,53 @@ def get_llm_provider(config=None) -> BaseLLMProvider:
 
     The Grok API key must be set as the GROK_API_KEY environment variable.
     It is never stored in config files to avoid accidental credential leaks.
+
+    Real providers come wrapped by wrap_provider(); the stub is returned as is.
     """
-    import os
+    if config is None:
+        from src.config import get_config
+        config = get_config()
 
+    return wrap_provider(_build_provider(config), config)
+
+
+def wrap_provider(provider: BaseLLMProvider, config=None) -> BaseLLMProvider:
+    """Put a real provider behind the request scheduler, the usage meter and
+    the response cache.
+
+    The cache is the outer layer so hits never wait on rate limits or count
+    against the budget (``llm_scheduler``, ``llm_metering`` and ``llm_cache``
+    sections of config/app.yaml).
+    """
+    if isinstance(provider, StubProvider):
+        return provider
     if config is None:
         from src.config import get_config
         config = get_config()
 
+    if config.llm_scheduler.enabled:
+        from src.llm.scheduler import ScheduledProvider
+        provider = ScheduledProvider.from_config(provider, config)
+    from src.llm.metering import MeteredProvider
+    provider = MeteredProvider(provider)
+    if config.llm_cache.enabled:
+        from src.llm.cache import CachedProvider
+        provider = CachedProvider.from_config(provider, config)
+    return provider
+
+
+def unwrap_provider(provider: BaseLLMProvider) -> BaseLLMProvider:
+    """The real provider under the cache / meter / scheduler wrappers."""
+    while hasattr(provider, "inner"):
+        provider = provider.inner
+    return provider
+
+
+def _build_provider(config) -> BaseLLMProvider:
+    import os
+
     provider_name = config.llm.provider
+    http = HTTPSettings.from_config(config.llm)
 
     if provider_name == "anthropic":
         api_key = os.environ.get("ANTHROPIC_API_KEY", "")
@@ -331,6 +954,7 @@ def get_llm_provider(config=None) -> BaseLLMProvider:
             return AnthropicProvider(
                 api_key=api_key,
                 model=config.llm.model or AnthropicProvider.DEFAULT_MODEL,
+                http=http,
             )
         import logging
         logging.getLogger(__name__).warning(
@@ -344,7 +968,7 @@ def get_llm_provider(config=None) -> BaseLLMProvider:
         model_override = os.environ.get("GROK_MODEL", "")
         model = model_override or config.llm.model or GrokProvider.DEFAULT_MODEL
         if api_key:
-            return GrokProvider(api_key=api_key, model=model)
+            return GrokProvider(api_key=api_key, model=model, http=http)
         # Grok configured but no key set — warn and fall through
         import logging
         logging.getLogger(__name__).warning(
@@ -356,6 +980,8 @@ def get_llm_provider(config=None) -> BaseLLMProvider:
         provider = OllamaProvider(
             model=config.llm.model,
             base_url=config.llm.base_url,
+            http=http,
+            keep_alive=config.llm.keep_alive,
         )
         if provider.is_available():
             return provider
@@ -363,7 +989,7 @@ def get_llm_provider(config=None) -> BaseLLMProvider:
     elif provider_name == "openai":
         api_key = os.environ.get("OPENAI_API_KEY", config.llm.api_key or "")
         if api_key:
-            return OpenAIProvider(api_key=api_key, model=config.llm.model)
+            return OpenAIProvider(api_key=api_key, model=config.llm.model, http=http)
 
     # Default fallback — no API calls
     return StubProvider()
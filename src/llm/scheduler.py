@@ -0,0 +1,429 @@
+"""Central LLM request scheduler.
+
+Every call to a real provider passes through a per-provider LLMScheduler:
+
+- Token buckets cap requests/min and tokens/min. A request reserves its
+  estimated tokens (prompt length / 4 + max_tokens); the estimate is settled
+  against the reported usage when the call finishes.
+- At most ``max_concurrency`` calls are in flight per provider, so several
+  generations can safely run in parallel.
+- Waiting requests are admitted in priority order. Apply-time question
+  answering (Priority.INTERACTIVE, a browser page is waiting) goes ahead of
+  bulk resume generation (Priority.BULK). Callers set the priority for a
+  block of code with ``with llm_priority(...)``; it follows asyncio tasks
+  and to_thread() calls via contextvars.
+- Retryable failures (429, 408/409, 5xx, connection errors and timeouts)
+  are retried with exponential backoff and full jitter, honouring
+  Retry-After. The slot is released while backing off.
+
+ScheduledProvider applies all of this to a BaseLLMProvider. get_llm_provider()
+installs it under the response cache, so cache hits never wait. Limits come
+from the ``llm_scheduler`` section of config/app.yaml, with optional
+per-provider overrides.
+"""
+
+import asyncio
+import heapq
+import itertools
+import logging
+import math
+import random
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field, fields
+from enum import IntEnum
+from typing import Callable, Iterator
+
+from src.llm.provider import BaseLLMProvider, LLMResponse, LLMStream
+
+logger = logging.getLogger(__name__)
+
+
+class Priority(IntEnum):
+    """Admission order when requests queue up (lower goes first)."""
+    INTERACTIVE = 0     # apply-time form answering
+    NORMAL = 1
+    BULK = 2            # resume generation, summaries, bullet rephrasing
+
+
+_PRIORITY: ContextVar[Priority] = ContextVar("llm_priority", default=Priority.NORMAL)
+
+
+@contextmanager
+def llm_priority(priority: Priority):
+    """Run LLM calls made inside the block (and tasks started from it) at ``priority``."""
+    token = _PRIORITY.set(priority)
+    try:
+        yield
+    finally:
+        _PRIORITY.reset(token)
+
+
+@dataclass
+class RateLimits:
+    """Per-provider scheduling limits (None = unlimited)."""
+    requests_per_min: float | None = 60.0
+    tokens_per_min: float | None = 200_000.0
+    max_concurrency: int = 4
+    max_retries: int = 4
+    backoff_base_s: float = 1.0
+    backoff_max_s: float = 30.0
+
+    @classmethod
+    def from_config(cls, scheduler_config, provider_name: str) -> "RateLimits":
+        """Limits from the ``llm_scheduler`` section, with that provider's overrides applied."""
+        values = {f.name: getattr(scheduler_config, f.name) for f in fields(cls)}
+        values.update(scheduler_config.providers.get(provider_name, {}))
+        return cls(**values)
+
+
+class TokenBucket:
+    """Continuously refilling bucket holding up to one minute of ``per_minute``.
+
+    The level may go negative when a request is larger than the bucket or
+    its usage exceeded the reservation; later requests then wait it out.
+    """
+
+    def __init__(self, per_minute: float | None, clock: Callable[[], float] = time.monotonic):
+        self.capacity = per_minute
+        self.level = per_minute or 0.0
+        self._rate = per_minute / 60.0 if per_minute else 0.0
+        self._clock = clock
+        self._updated = clock()
+
+    def wait_time(self, amount: float) -> float:
+        """Seconds until ``amount`` can be taken (0 if now)."""
+        if not self.capacity:
+            return 0.0
+        self._refill()
+        need = min(amount, self.capacity)
+        return 0.0 if self.level >= need else (need - self.level) / self._rate
+
+    def take(self, amount: float) -> None:
+        if self.capacity:
+            self._refill()
+            self.level -= amount
+
+    def refund(self, amount: float) -> None:
+        """Give back (or, if negative, charge) ``amount`` after settling usage."""
+        if self.capacity:
+            self._refill()
+            self.level = min(self.capacity, self.level + amount)
+
+    def _refill(self) -> None:
+        now = self._clock()
+        self.level = min(self.capacity, self.level + (now - self._updated) * self._rate)
+        self._updated = now
+
+
+@dataclass(order=True)
+class _Ticket:
+    priority: int
+    seq: int
+    tokens: int = field(compare=False)
+
+
+class LLMScheduler:
+    """Admission control for one provider (thread- and asyncio-safe).
+
+    Args:
+        limits: RateLimits for this provider.
+        clock: Monotonic time source (injectable for tests).
+    """
+
+    def __init__(self, limits: RateLimits, clock: Callable[[], float] = time.monotonic):
+        self.limits = limits
+        self._requests = TokenBucket(limits.requests_per_min, clock)
+        self._tokens = TokenBucket(limits.tokens_per_min, clock)
+        self._cond = threading.Condition()
+        self._queue: list[_Ticket] = []
+        self._seq = itertools.count()
+        self._active = 0
+        self._async_waiters: set[tuple[asyncio.AbstractEventLoop, asyncio.Future]] = set()
+        self.retries = 0
+
+    @classmethod
+    def shared(cls, name: str, limits: RateLimits) -> "LLMScheduler":
+        """The process-wide scheduler for provider ``name`` (created on first use).
+
+        ContentSelector, QuestionAnswerer and ResumeBuilder each build their
+        own provider instance; sharing the scheduler makes them draw on the
+        same limits.
+        """
+        with _SHARED_LOCK:
+            if name not in _SHARED:
+                _SHARED[name] = cls(limits)
+            return _SHARED[name]
+
+    @property
+    def active(self) -> int:
+        return self._active
+
+    @property
+    def queued(self) -> int:
+        return len(self._queue)
+
+    def acquire(self, tokens: int, priority: Priority = Priority.NORMAL) -> _Ticket:
+        """Block until the request may start; pair with release()."""
+        with self._cond:
+            ticket = self._enqueue(tokens, priority)
+            try:
+                while (wait := self._try_admit(ticket)) > 0:
+                    self._cond.wait(None if wait == math.inf else wait)
+            except BaseException:
+                # Interrupted while queued (e.g. KeyboardInterrupt)
+                self._dequeue(ticket)
+                raise
+        return ticket
+
+    async def aacquire(self, tokens: int, priority: Priority = Priority.NORMAL) -> _Ticket:
+        """Async acquire(): waits without blocking the event loop."""
+        loop = asyncio.get_running_loop()
+        with self._cond:
+            ticket = self._enqueue(tokens, priority)
+        try:
+            while True:
+                with self._cond:
+                    wait = self._try_admit(ticket)
+                    if wait == 0:
+                        return ticket
+                    waiter = (loop, loop.create_future())
+                    self._async_waiters.add(waiter)
+                try:
+                    await asyncio.wait_for(waiter[1], None if wait == math.inf else wait)
+                except asyncio.TimeoutError:
+                    pass
+                finally:
+                    with self._cond:
+                        self._async_waiters.discard(waiter)
+        except BaseException:
+            with self._cond:
+                self._dequeue(ticket)
+            raise
+
+    def release(self, ticket: _Ticket, tokens_used: int | None = None) -> None:
+        """Free the slot; settle the token reservation against actual usage."""
+        with self._cond:
+            self._active -= 1
+            if tokens_used is not None:
+                self._tokens.refund(ticket.tokens - tokens_used)
+            self._wake()
+
+    # ── Private helpers ──────────────────────────────────────
+
+    def _enqueue(self, tokens: int, priority: Priority) -> _Ticket:
+        ticket = _Ticket(int(priority), next(self._seq), tokens)
+        heapq.heappush(self._queue, ticket)
+        return ticket
+
+    def _dequeue(self, ticket: _Ticket) -> None:
+        """Drop a cancelled ticket from the queue so others aren't blocked."""
+        if ticket in self._queue:
+            self._queue.remove(ticket)
+            heapq.heapify(self._queue)
+            self._wake()
+
+    def _try_admit(self, ticket: _Ticket) -> float:
+        """0 if ``ticket`` was admitted, else seconds to wait (inf: until woken)."""
+        if self._queue[0] is not ticket or self._active >= self.limits.max_concurrency:
+            return math.inf
+        wait = max(self._requests.wait_time(1), self._tokens.wait_time(ticket.tokens))
+        if wait > 0:
+            return wait
+        heapq.heappop(self._queue)
+        self._requests.take(1)
+        self._tokens.take(ticket.tokens)
+        self._active += 1
+        self._wake()  # the next in line may fit too
+        return 0.0
+
+    def _wake(self) -> None:
+        """Make every waiter re-check admission (caller holds the lock)."""
+        self._cond.notify_all()
+        for loop, future in self._async_waiters:
+            loop.call_soon_threadsafe(_resolve, future)
+
+
+_SHARED: dict[str, LLMScheduler] = {}
+_SHARED_LOCK = threading.Lock()
+
+
+def _resolve(future: asyncio.Future) -> None:
+    if not future.done():
+        future.set_result(None)
+
+
+def _status_code(exc: BaseException) -> int | None:
+    status = getattr(exc, "status_code", None)
+    if status is None:
+        status = getattr(getattr(exc, "response", None), "status_code", None)
+    return status if isinstance(status, int) else None
+
+
+_RETRYABLE_ERRORS = {
+    # httpx transport errors and the SDKs' wrappers around them
+    "ConnectError", "ConnectTimeout", "ReadTimeout", "WriteTimeout", "PoolTimeout",
+    "ReadError", "RemoteProtocolError", "APIConnectionError", "APITimeoutError",
+}
+
+
+def is_retryable(exc: BaseException) -> bool:
+    """True for rate limits, server errors, timeouts and dropped connections."""
+    status = _status_code(exc)
+    if status is not None:
+        return status in (408, 409, 429) or status >= 500
+    return any(cls.__name__ in _RETRYABLE_ERRORS for cls in type(exc).__mro__)
+
+
+def _retry_after(exc: BaseException) -> float | None:
+    headers = getattr(getattr(exc, "response", None), "headers", None) or {}
+    try:
+        return float(headers.get("retry-after"))
+    except (TypeError, ValueError):
+        return None
+
+
+def _estimate_tokens(prompt: str, system_prompt: str | None, max_tokens: int) -> int:
+    return (len(prompt) + len(system_prompt or "")) // 4 + max_tokens
+
+
+class ScheduledProvider(BaseLLMProvider):
+    """BaseLLMProvider wrapper that runs every call through an LLMScheduler.
+
+    Any other attribute (model, client, ...) is read from the wrapped provider.
+
+    Args:
+        inner: The provider that makes the real calls.
+        scheduler: Usually LLMScheduler.shared() for this provider.
+        rng: Jitter source (injectable for tests).
+    """
+
+    def __init__(
+        self,
+        inner: BaseLLMProvider,
+        scheduler: LLMScheduler,
+        rng: random.Random | None = None,
+    ):
+        self.inner = inner
+        self.scheduler = scheduler
+        self._rng = rng or random.Random()
+        # Retries happen here, inside the scheduler's slot and backoff; SDK
+        # retries on top would multiply attempts and bypass the rate limits
+        inner.sdk_max_retries = 0
+
+    @classmethod
+    def from_config(cls, inner: BaseLLMProvider, config=None) -> "ScheduledProvider":
+        if config is None:
+            from src.config import get_config
+            config = get_config()
+        name = type(inner).__name__.removesuffix("Provider").lower()
+        limits = RateLimits.from_config(config.llm_scheduler, name)
+        return cls(inner, LLMScheduler.shared(name, limits))
+
+    def __getattr__(self, name):
+        # Only called for attributes not found on the wrapper itself
+        if name == "inner":
+            raise AttributeError(name)
+        return getattr(self.inner, name)
+
+    @property
+    def temperature(self) -> float | None:
+        return self.inner.temperature
+
+    def generate(
+        self,
+        prompt: str,
+        max_tokens: int = 500,
+        system_prompt: str | None = None,
+    ) -> LLMResponse:
+        estimate = _estimate_tokens(prompt, system_prompt, max_tokens)
+        priority = _PRIORITY.get()
+        for attempt in itertools.count():
+            ticket = self.scheduler.acquire(estimate, priority)
+            response = None
+            try:
+                response = self.inner.generate(prompt, max_tokens, system_prompt)
+            except Exception as e:
+                delay = self._retry_delay(e, attempt)
+            finally:
+                # Always free the slot, even on KeyboardInterrupt
+                self.scheduler.release(ticket, response.tokens_used if response else None)
+            if response is not None:
+                return response
+            time.sleep(delay)
+
+    async def agenerate(
+        self,
+        prompt: str,
+        max_tokens: int = 500,
+        system_prompt: str | None = None,
+    ) -> LLMResponse:
+        estimate = _estimate_tokens(prompt, system_prompt, max_tokens)
+        priority = _PRIORITY.get()
+        for attempt in itertools.count():
+            ticket = await self.scheduler.aacquire(estimate, priority)
+            response = None
+            try:
+                response = await self.inner.agenerate(prompt, max_tokens, system_prompt)
+            except Exception as e:
+                delay = self._retry_delay(e, attempt)
+            finally:
+                # Always free the slot, even when the caller is cancelled
+                self.scheduler.release(ticket, response.tokens_used if response else None)
+            if response is not None:
+                return response
+            await asyncio.sleep(delay)
+
+    def _stream_chunks(
+        self,
+        stream: LLMStream,
+        prompt: str,
+        max_tokens: int,
+        system_prompt: str | None,
+    ) -> Iterator[str]:
+        """Holds a slot for the whole stream; retried only if it fails before the first chunk."""
+        estimate = _estimate_tokens(prompt, system_prompt, max_tokens)
+        priority = _PRIORITY.get()
+        for attempt in itertools.count():
+            ticket = self.scheduler.acquire(estimate, priority)
+            started = False
+            try:
+                for chunk in self.inner._stream_chunks(stream, prompt, max_tokens, system_prompt):
+                    started = True
+                    yield chunk
+                return
+            except Exception as e:
+                if started:
+                    raise
+                delay = self._retry_delay(e, attempt)
+            finally:
+                self.scheduler.release(ticket, stream.tokens_used or None)
+            time.sleep(delay)
+
+    def is_available(self) -> bool:
+        return self.inner.is_available()
+
+    def close(self) -> None:
+        self.inner.close()
+
+    async def aclose(self) -> None:
+        await self.inner.aclose()
+
+    def _retry_delay(self, exc: Exception, attempt: int) -> float:
+        """Backoff before the next attempt; re-raises ``exc`` when it shouldn't be retried."""
+        limits = self.scheduler.limits
+        if attempt >= limits.max_retries or not is_retryable(exc):
+            raise exc
+        ceiling = min(limits.backoff_max_s, limits.backoff_base_s * 2 ** attempt)
+        delay = self._rng.uniform(0, ceiling)
+        retry_after = _retry_after(exc)
+        if retry_after is not None:
+            delay = max(delay, min(retry_after, limits.backoff_max_s))
+        self.scheduler.retries += 1
+        logger.warning(
+            f"{type(self.inner).__name__} call failed ({exc}); "
+            f"retry {attempt + 1}/{limits.max_retries} in {delay:.1f}s"
+        )
+        return delay
@@ -3,6 +3,8 @@
 from datetime import UTC, datetime
 
 from sqlalchemy import (
+    BigInteger,
+    Boolean,
     Column,
     DateTime,
     Float,
@@ -100,6 +102,17 @@ class SearchRun(Base):
     jobs_new = Column(Integer, default=0)
     started_at = Column(DateTime, default=lambda: datetime.now(UTC))
     completed_at = Column(DateTime, nullable=True)
+    # Incremental-crawl high-water mark: newest external IDs (newest first)
+    # and newest posting time seen, plus how far the crawl paginated.
+    high_water_ids = Column(JSON, nullable=True)
+    high_water_at = Column(DateTime, nullable=True)
+    pages_crawled = Column(Integer, default=0)
+    stopped_early = Column(Boolean, default=False)
+    # HumanizationSchedule seed: replays this run's delays and cursor paths
+    humanization_seed = Column(BigInteger, nullable=True)
+    # LLMMeter.summary() of the pipeline run: tokens and estimated cost by
+    # provider, model and call site (the same for every portal row of a run)
+    llm_usage = Column(JSON, nullable=True)
 
     def __repr__(self):
         return f"<SearchRun(id={self.id}, portal='{self.portal}', jobs_found={self.jobs_found})>"
@@ -10,7 +10,7 @@ from src.analyzer.keywords import (
 )
 from src.analyzer.scorer import ATSScorer, ScoreResult
 from src.analyzer.suggestions import generate_suggestions
-from src.llm.provider import StubProvider, get_llm_provider
+from src.llm.provider import BaseLLMProvider, LLMResponse, StubProvider, get_llm_provider
 
 
 # ── Sample texts ─────────────────────────────────────────────
@@ -251,6 +251,618 @@ class TestLLMProvider:
         provider = get_llm_provider()
         assert isinstance(provider, StubProvider)
 
+    def test_ollama_reuses_one_pooled_client(self):
+        import httpx
+        from src.llm.provider import HTTPSettings, OllamaProvider
+
+        requests = []
+
+        def handler(request):
+            requests.append(request.url.path)
+            return httpx.Response(200, json={"response": "ok", "eval_count": 3})
+
+        http = HTTPSettings(timeout=5.0, max_connections=2, max_keepalive_connections=1)
+        provider = OllamaProvider(model="m", base_url="http://ollama.test", http=http)
+        provider._client = http.client(
+            base_url=provider.base_url, transport=httpx.MockTransport(handler)
+        )
+        client = provider.client
+        for _ in range(3):
+            assert provider.generate("Say ok").text == "ok"
+        assert provider.client is client
+        assert requests == ["/api/generate"] * 3
+        provider.close()
+        assert provider._client is None
+
+    def test_ollama_agenerate_uses_async_client(self):
+        import asyncio
+        import httpx
+        from src.llm.provider import HTTPSettings, OllamaProvider
+
+        def handler(request):
+            return httpx.Response(200, json={"response": "async ok", "eval_count": 2})
+
+        http = HTTPSettings(timeout=5.0)
+        provider = OllamaProvider(model="m", base_url="http://ollama.test", http=http)
+        provider._aclient = http.async_client(
+            base_url=provider.base_url, transport=httpx.MockTransport(handler)
+        )
+
+        async def run():
+            responses = await asyncio.gather(*(provider.agenerate("Say ok") for _ in range(3)))
+            await provider.aclose()
+            return responses
+
+        responses = asyncio.get_event_loop().run_until_complete(run())
+        assert [r.text for r in responses] == ["async ok"] * 3
+        assert provider._aclient is None
+
+    def test_default_agenerate_runs_generate_off_loop(self):
+        import asyncio
+        import threading
+        from src.llm.provider import BaseLLMProvider, LLMResponse
+
+        class _SyncOnly(BaseLLMProvider):
+            def generate(self, prompt, max_tokens=500, system_prompt=None):
+                return LLMResponse(text=threading.current_thread().name, model="sync")
+
+            def is_available(self):
+                return True
+
+        response = asyncio.get_event_loop().run_until_complete(_SyncOnly().agenerate("hi"))
+        assert response.text != threading.main_thread().name
+
+    def test_ollama_streams_ndjson_chunks(self):
+        import json
+        import httpx
+        from src.llm.provider import HTTPSettings, OllamaProvider
+
+        lines = [{"response": "Hel"}, {"response": "lo"}, {"response": "", "done": True, "eval_count": 2}]
+
+        def handler(request):
+            assert json.loads(request.content)["stream"] is True
+            return httpx.Response(200, content="\n".join(json.dumps(l) for l in lines).encode())
+
+        http = HTTPSettings(timeout=5.0)
+        provider = OllamaProvider(model="m", base_url="http://ollama.test", http=http)
+        provider._client = http.client(
+            base_url=provider.base_url, transport=httpx.MockTransport(handler)
+        )
+        stream = provider.stream("Say hello")
+        assert list(stream) == ["Hel", "lo"]
+        assert stream.completed and stream.response.text == "Hello"
+        assert stream.response.provider == "ollama"
+        assert stream.metrics.output_tokens == 2 and stream.metrics.ttft_s is not None
+
+    def test_anthropic_marks_long_system_prompt_cacheable(self):
+        from types import SimpleNamespace
+        from src.llm.provider import AnthropicProvider
+
+        provider = AnthropicProvider(api_key="k")
+        short = provider._request("JD", 100, "Be brief.")
+        assert short["system"] == "Be brief."
+        long = provider._request("JD", 100, "x" * AnthropicProvider.PROMPT_CACHE_MIN_CHARS)
+        assert long["system"][0]["cache_control"] == {"type": "ephemeral"}
+
+        usage = SimpleNamespace(
+            input_tokens=50, output_tokens=10,
+            cache_read_input_tokens=3000, cache_creation_input_tokens=0,
+        )
+        message = SimpleNamespace(content=[SimpleNamespace(text="ok")], usage=usage)
+        response = provider._response(message)
+        assert (response.prompt_tokens, response.cached_prompt_tokens) == (3050, 3000)
+        assert response.tokens_used == 3060
+
+    def test_openai_compatible_reports_cached_prompt_tokens(self):
+        from types import SimpleNamespace
+        from src.llm.provider import GrokProvider
+
+        usage = SimpleNamespace(
+            total_tokens=2100, prompt_tokens=2000, completion_tokens=100,
+            prompt_tokens_details=SimpleNamespace(cached_tokens=1792),
+        )
+        choice = SimpleNamespace(message=SimpleNamespace(content="ok"))
+        response = GrokProvider(api_key="k")._response(
+            SimpleNamespace(choices=[choice], usage=usage)
+        )
+        assert (response.prompt_tokens, response.cached_prompt_tokens) == (2000, 1792)
+
+    def test_ollama_keeps_model_loaded(self):
+        from src.llm.provider import OllamaProvider
+
+        assert OllamaProvider(keep_alive="1h")._payload("hi", 10, None)["keep_alive"] == "1h"
+
+    def test_http_settings_from_config(self):
+        from src.config import LLMConfig
+        from src.llm.provider import HTTPSettings
+
+        http = HTTPSettings.from_config(LLMConfig(timeout_s=30, max_connections=4))
+        assert http.timeout == 30
+        client = http.client()
+        assert client.timeout.read == 30
+        client.close()
+
+
+class _CountingProvider(BaseLLMProvider):
+    """Fake real provider that counts generate() calls."""
+
+    temperature = 0.3
+
+    def __init__(self, model="m"):
+        self.model = model
+        self.calls = 0
+
+    def generate(self, prompt, max_tokens=500, system_prompt=None):
+        self.calls += 1
+        return LLMResponse(text=f"reply {self.calls}", model=self.model, tokens_used=7, provider="fake")
+
+    def is_available(self):
+        return True
+
+
+class TestLLMResponseCache:
+    def test_repeat_prompt_is_served_from_cache(self, tmp_path):
+        from src.llm.cache import CachedProvider, LLMResponseCache
+
+        inner = _CountingProvider()
+        provider = CachedProvider(inner, LLMResponseCache(tmp_path / "llm.db"))
+        first = provider.generate("Summarise this JD", max_tokens=150, system_prompt="sys")
+        again = provider.generate("Summarise this JD  \r\n", max_tokens=150, system_prompt="sys")
+        assert inner.calls == 1
+        assert again.text == first.text and again.cached and not first.cached
+        assert provider.cache.hit_rate == 0.5
+        assert provider.cache.stats()["tokens_saved"] == 7
+        # Any key component changing is a different request
+        provider.generate("Summarise this JD", max_tokens=80, system_prompt="sys")
+        provider.generate("Summarise this JD", max_tokens=150, system_prompt="other")
+        assert inner.calls == 3
+        assert provider.model == "m"
+
+    def test_async_path_shares_cache(self, tmp_path):
+        import asyncio
+        from src.llm.cache import CachedProvider, LLMResponseCache
+
+        inner = _CountingProvider()
+        provider = CachedProvider(inner, LLMResponseCache(tmp_path / "llm.db"))
+        provider.generate("Rephrase bullet")
+        response = asyncio.get_event_loop().run_until_complete(provider.agenerate("Rephrase bullet"))
+        assert response.cached and inner.calls == 1
+
+    def test_stream_is_cached_only_when_read_to_the_end(self, tmp_path):
+        from src.llm.cache import CachedProvider, LLMResponseCache
+
+        inner = _CountingProvider()
+        provider = CachedProvider(inner, LLMResponseCache(tmp_path / "llm.db"))
+        with provider.stream("Write LaTeX") as aborted:
+            next(iter(aborted))
+        assert len(provider.cache) == 0
+        assert "".join(provider.stream("Write LaTeX")) == "reply 2"
+        replay = provider.stream("Write LaTeX")
+        assert list(replay) == ["reply 2"] and replay.cached
+        assert inner.calls == 2
+
+    def test_key_names_the_real_provider_under_the_wrappers(self, tmp_path):
+        from src.config import Config
+        from src.llm.cache import CachedProvider, LLMResponseCache
+        from src.llm.provider import AnthropicProvider, OpenAIProvider, wrap_provider
+
+        config = Config()
+        config.llm_cache.enabled = False
+        cache = LLMResponseCache(tmp_path / "llm.db")
+        claude = CachedProvider(wrap_provider(AnthropicProvider("k", model="same"), config), cache)
+        openai = CachedProvider(wrap_provider(OpenAIProvider("k", model="same"), config), cache)
+        assert claude._key("Q", 100, None) != openai._key("Q", 100, None)
+        unwrapped = CachedProvider(AnthropicProvider("k", model="same"), cache)
+        assert claude._key("Q", 100, None) == unwrapped._key("Q", 100, None)
+
+    def test_ttl_and_size_limit(self, tmp_path):
+        from src.llm.cache import LLMResponseCache
+        from src.llm.provider import LLMResponse
+
+        now = [1000.0]
+        cache = LLMResponseCache(tmp_path / "llm.db", ttl_hours=1, max_entries=2, clock=lambda: now[0])
+        for key in ("a", "b", "c"):
+            now[0] += 1
+            cache.put(key, LLMResponse(text=key, model="m"))
+        assert len(cache) == 2
+        assert cache.get("a") is None
+        assert cache.get("c").text == "c"
+        now[0] += 3601
+        assert cache.get("c") is None
+
+    def test_bypass_skips_lookup_but_refreshes(self, tmp_path):
+        from src.llm.cache import CachedProvider, LLMResponseCache
+
+        inner = _CountingProvider()
+        cache = LLMResponseCache(tmp_path / "llm.db")
+        CachedProvider(inner, cache).generate("Q")
+        bypassed = CachedProvider(inner, cache, bypass=True)
+        assert bypassed.generate("Q").text == "reply 2"
+        assert CachedProvider(inner, cache).generate("Q").text == "reply 2"
+        assert inner.calls == 2
+
+    def test_factory_wraps_real_providers_only(self, tmp_path, monkeypatch):
+        from src.config import Config
+        from src.llm.cache import CachedProvider
+
+        config = Config()
+        config.llm_cache.path = str(tmp_path / "llm.db")
+        assert isinstance(get_llm_provider(config), StubProvider)
+        config.llm.provider = "grok"
+        monkeypatch.setenv("GROK_API_KEY", "test-key")
+        provider = get_llm_provider(config)
+        assert isinstance(provider, CachedProvider)
+        assert provider.inner.model and provider.temperature == 0.3
+        config.llm_cache.enabled = False
+        assert not isinstance(get_llm_provider(config), CachedProvider)
+
+
+class _StatusError(Exception):
+    def __init__(self, status_code):
+        super().__init__(f"HTTP {status_code}")
+        self.status_code = status_code
+
+
+class _FlakyProvider(_CountingProvider):
+    """Raises the queued errors first, then answers."""
+
+    def __init__(self, errors):
+        super().__init__()
+        self.errors = list(errors)
+
+    def generate(self, prompt, max_tokens=500, system_prompt=None):
+        if self.errors:
+            self.calls += 1
+            raise self.errors.pop(0)
+        return super().generate(prompt, max_tokens, system_prompt)
+
+
+class TestLLMScheduler:
+    def test_token_bucket_refills_over_time(self):
+        from src.llm.scheduler import TokenBucket
+
+        now = [0.0]
+        bucket = TokenBucket(60, clock=lambda: now[0])
+        bucket.take(60)
+        assert bucket.wait_time(1) == pytest.approx(1.0)
+        now[0] += 30
+        assert bucket.wait_time(30) == 0
+        # Larger than the bucket: waits for a full bucket, then overdraws
+        assert bucket.wait_time(500) == pytest.approx(30.0)
+
+    def test_retries_rate_limits_with_backoff(self):
+        import random
+        from src.llm.scheduler import LLMScheduler, RateLimits, ScheduledProvider
+
+        limits = RateLimits(backoff_base_s=0.001, backoff_max_s=0.01)
+        inner = _FlakyProvider([_StatusError(429), _StatusError(503)])
+        provider = ScheduledProvider(inner, LLMScheduler(limits), rng=random.Random(0))
+        assert provider.generate("Q").text == "reply 3"
+        assert provider.scheduler.retries == 2 and provider.scheduler.active == 0
+        assert provider.model == "m" and provider.temperature == 0.3
+
+        bad_request = ScheduledProvider(_FlakyProvider([_StatusError(400)]), LLMScheduler(limits))
+        with pytest.raises(_StatusError):
+            bad_request.generate("Q")
+        assert bad_request.scheduler.retries == 0
+
+        exhausted = RateLimits(max_retries=1, backoff_base_s=0.001)
+        provider = ScheduledProvider(_FlakyProvider([_StatusError(429)] * 2), LLMScheduler(exhausted))
+        with pytest.raises(_StatusError):
+            provider.generate("Q")
+
+    def test_interactive_requests_preempt_bulk(self):
+        import asyncio
+        from src.llm.scheduler import LLMScheduler, Priority, RateLimits
+
+        scheduler = LLMScheduler(RateLimits(max_concurrency=1))
+        order = []
+
+        async def request(name, priority):
+            ticket = await scheduler.aacquire(10, priority)
+            order.append(name)
+            scheduler.release(ticket, 10)
+
+        async def main():
+            held = await scheduler.aacquire(10)
+            tasks = [asyncio.ensure_future(request("resume", Priority.BULK))]
+            await asyncio.sleep(0)
+            tasks.append(asyncio.ensure_future(request("qa", Priority.INTERACTIVE)))
+            await asyncio.sleep(0)
+            assert scheduler.queued == 2
+            scheduler.release(held)
+            await asyncio.gather(*tasks)
+
+        asyncio.get_event_loop().run_until_complete(main())
+        assert order == ["qa", "resume"]
+
+    def test_interrupted_acquire_leaves_the_queue(self):
+        from src.llm.scheduler import LLMScheduler, RateLimits
+
+        scheduler = LLMScheduler(RateLimits(max_concurrency=1))
+        held = scheduler.acquire(10)
+
+        def interrupted(timeout=None):
+            raise KeyboardInterrupt
+
+        wait = scheduler._cond.wait
+        scheduler._cond.wait = interrupted
+        with pytest.raises(KeyboardInterrupt):
+            scheduler.acquire(10)
+        assert scheduler.queued == 0
+        scheduler._cond.wait = wait
+        scheduler.release(held)
+        scheduler.release(scheduler.acquire(10))
+        assert scheduler.active == 0
+
+    def test_cancelled_call_frees_its_slot(self):
+        import asyncio
+        from src.llm.scheduler import LLMScheduler, RateLimits, ScheduledProvider
+
+        class _Slow(_CountingProvider):
+            async def agenerate(self, prompt, max_tokens=500, system_prompt=None):
+                if prompt == "slow":
+                    await asyncio.sleep(60)
+                return super().generate(prompt, max_tokens, system_prompt)
+
+        provider = ScheduledProvider(_Slow(), LLMScheduler(RateLimits(max_concurrency=1)))
+
+        async def main():
+            task = asyncio.ensure_future(provider.agenerate("slow"))
+            await asyncio.sleep(0.01)
+            assert provider.scheduler.active == 1
+            task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+            assert provider.scheduler.active == 0
+            return await asyncio.wait_for(provider.agenerate("next"), 1)
+
+        assert asyncio.get_event_loop().run_until_complete(main()).text
+
+    def test_sdk_retries_are_disabled_under_the_scheduler(self, monkeypatch):
+        import sys
+        from types import SimpleNamespace
+        from src.llm.provider import AnthropicProvider, GrokProvider
+        from src.llm.scheduler import LLMScheduler, RateLimits, ScheduledProvider
+
+        def client(**kwargs):
+            return SimpleNamespace(**kwargs)
+
+        fake = SimpleNamespace(OpenAI=client, AsyncOpenAI=client, Anthropic=client,
+                               AsyncAnthropic=client)
+        monkeypatch.setitem(sys.modules, "openai", fake)
+        monkeypatch.setitem(sys.modules, "anthropic", fake)
+        assert not hasattr(GrokProvider("k").client, "max_retries")   # SDK default
+
+        for inner in (GrokProvider("k"), AnthropicProvider("k")):
+            ScheduledProvider(inner, LLMScheduler(RateLimits()))
+            assert inner.client.max_retries == 0
+            assert inner.aclient.max_retries == 0
+
+    def test_priority_context_reaches_async_calls(self):
+        import asyncio
+        from src.llm.scheduler import LLMScheduler, Priority, RateLimits, ScheduledProvider, llm_priority
+
+        seen = []
+        scheduler = LLMScheduler(RateLimits())
+        acquire = scheduler.aacquire
+
+        async def spy(tokens, priority=Priority.NORMAL):
+            seen.append(priority)
+            return await acquire(tokens, priority)
+
+        scheduler.aacquire = spy
+        provider = ScheduledProvider(_CountingProvider(), scheduler)
+
+        async def main():
+            with llm_priority(Priority.INTERACTIVE):
+                await asyncio.gather(provider.agenerate("a"), provider.agenerate("b"))
+            await provider.agenerate("c")
+
+        asyncio.get_event_loop().run_until_complete(main())
+        assert seen == [Priority.INTERACTIVE, Priority.INTERACTIVE, Priority.NORMAL]
+
+    def test_factory_schedules_under_the_cache(self, tmp_path, monkeypatch):
+        from src.config import Config
+        from src.llm.metering import MeteredProvider
+        from src.llm.scheduler import ScheduledProvider
+
+        config = Config()
+        config.llm_cache.path = str(tmp_path / "llm.db")
+        config.llm.provider = "grok"
+        monkeypatch.setenv("GROK_API_KEY", "test-key")
+        provider = get_llm_provider(config)
+        assert isinstance(provider.inner, MeteredProvider)
+        assert isinstance(provider.inner.inner, ScheduledProvider)
+        assert provider.inner.scheduler is get_llm_provider(config).inner.scheduler
+        config.llm_cache.enabled = False
+        assert isinstance(get_llm_provider(config), MeteredProvider)
+
+
+class TestLLMMetering:
+    def test_records_tokens_and_cost_by_call_site(self):
+        import asyncio
+        from src.llm.metering import LLMMeter, MeteredProvider, ModelPrice, llm_call_site
+
+        class _PricedProvider(_CountingProvider):
+            def generate(self, prompt, max_tokens=500, system_prompt=None):
+                return LLMResponse(
+                    text="ok", model="grok-3-mini-fast-beta", provider="grok",
+                    tokens_used=1100, prompt_tokens=1000, cached_prompt_tokens=400,
+                    output_tokens=100,
+                )
+
+        meter = LLMMeter(prices={"grok-3-mini": ModelPrice(1.0, 0.25, 2.0)})
+        provider = MeteredProvider(_PricedProvider(), meter)
+        with llm_call_site("summary"):
+            provider.generate("Summarise")
+        with llm_call_site("bullet"):
+            asyncio.get_event_loop().run_until_complete(
+                asyncio.gather(provider.agenerate("a"), provider.agenerate("b"))
+            )
+        provider.generate("untagged")
+
+        summary = meter.summary()
+        assert summary["calls"] == 4 and summary["input_tokens"] == 4000
+        assert summary["cached_tokens"] == 1600 and summary["output_tokens"] == 400
+        # 600 fresh + 400 cached input and 100 output tokens per call
+        assert summary["cost_usd"] == pytest.approx(4 * (600 * 1.0 + 400 * 0.25 + 100 * 2.0) / 1e6)
+        assert {site: u["calls"] for site, u in summary["by_call_site"].items()} == {
+            "summary": 1, "bullet": 2, "other": 1,
+        }
+        assert summary["entries"][0]["model"] == "grok-3-mini-fast-beta"
+
+    def test_batch_calls_are_charged_at_the_batch_discount(self):
+        from src.llm.metering import LLMMeter, ModelPrice
+
+        meter = LLMMeter(prices={
+            "m": ModelPrice(1.0, 0.25, 2.0), "cheap": ModelPrice(1.0, 0.25, 2.0, batch=0.25),
+        })
+        interactive = meter.record("grok", "m", 1000, 100, site="summary")
+        batched = meter.record("grok", "m", 1000, 100, site="summary", batch=True)
+        assert batched.cost_usd == pytest.approx(interactive.cost_usd / 2)
+        assert meter.record("grok", "cheap", 1000, 100, batch=True).cost_usd == pytest.approx(
+            interactive.cost_usd / 4
+        )
+
+    def test_budget_stops_calls_and_callers_fall_back(self):
+        from src.generator.content_selector import ContentSelector
+        from src.llm.metering import LLMBudgetExceeded, LLMMeter, MeteredProvider
+
+        inner = _CountingProvider()
+        meter = LLMMeter(budget_tokens=20)
+        provider = MeteredProvider(inner, meter)
+        provider.generate("x" * 40)  # ~10 estimated prompt tokens + 7 reported
+        provider.generate("x" * 40)
+        assert meter.exhausted and not provider.is_available()
+        with pytest.raises(LLMBudgetExceeded):
+            provider.generate("one more")
+        assert inner.calls == 2 and meter.summary()["refused_calls"] == 1
+
+        selector = ContentSelector(llm_provider=provider, use_llm=True)
+        bullets = [{"text": "Built a data pipeline"}]
+        assert selector._maybe_rephrase_bullets(bullets, ["kafka"]) == bullets
+        assert inner.calls == 2
+
+    def test_metering_block_scopes_the_meter(self):
+        from src.llm.metering import LLMMeter, current_meter, metering
+
+        outer = current_meter()
+        with metering(LLMMeter()) as meter:
+            assert current_meter() is meter
+        assert current_meter() is outer
+
+
+class TestLLMBatch:
+    def test_local_batch_round_trip(self, tmp_path):
+        from src.llm.batch import BatchError, LLMBatch, LocalBatchBackend, LocalBatchServer
+        from src.llm.metering import LLMMeter, ModelPrice, metering
+
+        class _Picky(_CountingProvider):
+            def generate(self, prompt, max_tokens=500, system_prompt=None):
+                if prompt == "bad":
+                    raise ValueError("model refused")
+                return LLMResponse(
+                    text=f"{system_prompt}:{prompt}:{max_tokens}", model="m", provider="fake",
+                    tokens_used=12, prompt_tokens=10, output_tokens=2,
+                )
+
+        server = LocalBatchServer(tmp_path, _Picky())
+        polls = []
+        batch = LLMBatch(
+            LocalBatchBackend(tmp_path), poll_interval_s=5,
+            sleep=lambda s: polls.append(server.process_pending()),
+        )
+        first = batch.add("JD one", max_tokens=150, system_prompt="sys", site="summary")
+        bad = batch.add("bad", site="bullet")
+        with metering(LLMMeter(prices={"m": ModelPrice(1.0, 0.25, 2.0)})) as meter:
+            results = batch.run()
+
+        assert polls == [1]
+        assert results[first].text == "sys:JD one:150"
+        assert (results[first].prompt_tokens, results[first].output_tokens) == (10, 2)
+        assert isinstance(results[bad], BatchError) and "model refused" in str(results[bad])
+        assert meter.summary()["by_call_site"]["summary"]["input_tokens"] == 10
+        # Charged at the batch discount: half of 10 input + 2 output tokens
+        assert meter.summary()["cost_usd"] == pytest.approx((10 * 1.0 + 2 * 2.0) * 0.5 / 1e6)
+        assert "bullet" not in meter.summary()["by_call_site"]
+
+    def test_openai_batch_file_upload_and_results(self):
+        import json
+        from types import SimpleNamespace
+        from src.llm.batch import BatchRequest, OpenAIBatchBackend
+        from src.llm.provider import GrokProvider
+
+        uploads = []
+        output = json.dumps({"custom_id": "req-00000", "response": {"status_code": 200, "body": {
+            "choices": [{"message": {"content": " tailored "}}],
+            "usage": {"prompt_tokens": 900, "completion_tokens": 40, "total_tokens": 940,
+                      "prompt_tokens_details": {"cached_tokens": 768}},
+        }}, "error": None})
+        errors = json.dumps({"custom_id": "req-00001", "response": {"status_code": 429, "body": {
+            "error": {"message": "rate limited"}}}, "error": None})
+        batch = SimpleNamespace(id="b1", status="completed", output_file_id="out", error_file_id="err")
+        client = SimpleNamespace(
+            files=SimpleNamespace(
+                create=lambda file, purpose: uploads.append((file, purpose)) or SimpleNamespace(id="in"),
+                content=lambda file_id: SimpleNamespace(text={"out": output, "err": errors}[file_id]),
+            ),
+            batches=SimpleNamespace(
+                create=lambda **kwargs: batch if kwargs["input_file_id"] == "in" else None,
+                retrieve=lambda batch_id: batch,
+            ),
+        )
+        provider = GrokProvider(api_key="k")
+        provider._client = client
+        backend = OpenAIBatchBackend(provider)
+
+        assert backend.submit([BatchRequest("req-00000", "JD", 80, "sys"), BatchRequest("req-00001", "JD2")]) == "b1"
+        (name, data), purpose = uploads[0]
+        lines = [json.loads(line) for line in data.decode().splitlines()]
+        assert purpose == "batch" and lines[0]["url"] == "/v1/chat/completions"
+        assert lines[0]["body"] == provider._request("JD", 80, "sys")
+        assert backend.status("b1") == "completed"
+        results = backend.results("b1")
+        assert results["req-00000"].text == "tailored"
+        assert results["req-00000"].cached_prompt_tokens == 768
+        assert "rate limited" in str(results["req-00001"])
+
+    def test_anthropic_message_batches(self):
+        from types import SimpleNamespace
+        from src.llm.batch import AnthropicBatchBackend, BatchRequest, batch_backend_for
+        from src.llm.provider import AnthropicProvider
+
+        created = []
+        usage = SimpleNamespace(
+            input_tokens=20, output_tokens=5, cache_read_input_tokens=0, cache_creation_input_tokens=0,
+        )
+        entries = [
+            SimpleNamespace(custom_id="req-00000", result=SimpleNamespace(
+                type="succeeded",
+                message=SimpleNamespace(content=[SimpleNamespace(text="summary")], usage=usage),
+            )),
+            SimpleNamespace(custom_id="req-00001", result=SimpleNamespace(type="expired")),
+        ]
+        batches = SimpleNamespace(
+            create=lambda requests: created.extend(requests) or SimpleNamespace(id="msgbatch_1"),
+            retrieve=lambda batch_id: SimpleNamespace(processing_status="ended"),
+            results=lambda batch_id: iter(entries),
+        )
+        provider = AnthropicProvider(api_key="k")
+        provider._client = SimpleNamespace(messages=SimpleNamespace(batches=batches))
+        backend = batch_backend_for(provider)
+        assert isinstance(backend, AnthropicBatchBackend)
+
+        assert backend.submit([BatchRequest("req-00000", "JD", 150, "sys")]) == "msgbatch_1"
+        assert created[0]["params"] == provider._request("JD", 150, "sys")
+        assert backend.status("msgbatch_1") == "completed"
+        results = backend.results("msgbatch_1")
+        assert results["req-00000"].text == "summary" and results["req-00000"].output_tokens == 5
+        assert "expired" in str(results["req-00001"])
+
+        with pytest.raises(ValueError, match="no batch API"):
+            batch_backend_for(StubProvider())
+
 
 # ── Integration: API Endpoint Test ───────────────────────────
 
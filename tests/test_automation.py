@@ -1,5 +1,7 @@
 """Tests for Phase 6: Application Automation."""
 
+import json
+
 import pytest
 import asyncio
 from unittest.mock import patch
@@ -7,6 +9,8 @@ from unittest.mock import patch
 from src.automation.question_answerer import QuestionAnswerer
 from src.automation.human_simulator import HumanSimulator
 from src.automation.captcha_handler import CaptchaHandler, CaptchaDetection
+from src.automation.pacing import PacingController
+from src.automation.response_capture import CaptureRule, ResponseCapture
 from src.automation.orchestrator import Orchestrator, PipelineResult
 from src.automation.drivers.base import DiscoveredJob, SearchConfig
 from src.automation.drivers.linkedin import LinkedInDriver
@@ -78,6 +82,13 @@ def profile():
     return CandidateProfile(PROFILE_DATA)
 
 
+def _async(value):
+    """Coroutine function returning ``value`` (for async fakes)."""
+    async def call(*args, **kwargs):
+        return value
+    return call
+
+
 # ── Question Answerer Tests ─────────────────────────────────
 
 class TestQuestionAnswerer:
@@ -122,6 +133,318 @@ class TestQuestionAnswerer:
         assert answers[0]["answer"] == "5"
         assert answers[1]["answer"] == "Yes"
 
+    def test_batch_makes_one_llm_call(self, profile):
+        from src.llm.provider import BaseLLMProvider, LLMResponse
+
+        class _JSONProvider(BaseLLMProvider):
+            def __init__(self):
+                self.calls = 0
+
+            def generate(self, prompt, max_tokens=500, system_prompt=None):
+                self.calls += 1
+                return LLMResponse(text='Sure: {"1": "Functional", "2": "Rust"}', model="fake")
+
+            def is_available(self):
+                return True
+
+        provider = _JSONProvider()
+        qa = QuestionAnswerer(profile, llm_provider=provider)
+        answers = qa.answer_batch([
+            "Favorite programming paradigm?",
+            "How many years of experience?",
+            "Which language would you learn next?",
+        ])
+        assert provider.calls == 1
+        assert [a["answer"] for a in answers] == ["Functional", "5", "Rust"]
+        assert [a["source"] for a in answers] == ["llm", "qa_bank", "llm"]
+
+    def test_batch_falls_back_per_question_on_bad_json(self, profile):
+        from src.llm.provider import BaseLLMProvider, LLMResponse
+
+        class _PlainProvider(BaseLLMProvider):
+            def __init__(self):
+                self.calls = 0
+
+            def generate(self, prompt, max_tokens=500, system_prompt=None):
+                self.calls += 1
+                return LLMResponse(text="Functional", model="fake")
+
+            def is_available(self):
+                return True
+
+        provider = _PlainProvider()
+        qa = QuestionAnswerer(profile, llm_provider=provider)
+        answers = qa.answer_batch(["Favorite paradigm?", "Next language?"])
+        assert provider.calls == 3   # failed batch + one per question
+        assert all(a["answer"] == "Functional" for a in answers)
+
+    def test_invalid_bank_pattern_matched_literally(self, caplog):
+        bad = CandidateProfile({
+            "personal_info": {"full_name": "Test"},
+            "qa_bank": [{"question_pattern": "c++ (years", "answer": "3"}],
+        })
+        with caplog.at_level("WARNING"):
+            qa = QuestionAnswerer(bad)
+            assert qa.answer("How many C++ (years of use?")["answer"] == "3"
+            assert qa.answer("Favourite colour?")["source"] in ("llm", "manual")
+        assert sum("not a valid regex" in r.message for r in caplog.records) == 1
+
+    def test_llm_answers_memoized_per_question(self, profile):
+        from src.llm.provider import BaseLLMProvider, LLMResponse
+
+        class _CountingProvider(BaseLLMProvider):
+            calls = 0
+
+            def generate(self, prompt, max_tokens=500, system_prompt=None):
+                _CountingProvider.calls += 1
+                return LLMResponse(text="Functional", model="fake")
+
+            def is_available(self):
+                return True
+
+        qa = QuestionAnswerer(profile, llm_provider=_CountingProvider())
+        assert qa.answer("Favorite paradigm?")["source"] == "llm"
+        assert qa.answer("  favorite   PARADIGM? ")["answer"] == "Functional"
+        assert qa.answer_batch(["Favorite paradigm?"])[0]["source"] == "llm"
+        assert _CountingProvider.calls == 1
+
+    def test_answer_cache_persists_across_answerers(self, profile, tmp_path):
+        from src.automation.answer_cache import AnswerCache
+        from src.llm.provider import BaseLLMProvider, LLMResponse
+
+        class _CountingProvider(BaseLLMProvider):
+            model = "fake-1"
+            calls = 0
+
+            def generate(self, prompt, max_tokens=500, system_prompt=None):
+                _CountingProvider.calls += 1
+                return LLMResponse(text="Functional", model=self.model)
+
+            def is_available(self):
+                return True
+
+        path = tmp_path / "answers.db"
+        first = QuestionAnswerer(profile, llm_provider=_CountingProvider(),
+                                 answer_cache=AnswerCache(path))
+        assert first.answer("Favorite paradigm?")["source"] == "llm"
+
+        # New answerer (next application / next run): zero LLM calls
+        second = QuestionAnswerer(profile, llm_provider=_CountingProvider(),
+                                  answer_cache=AnswerCache(path))
+        batch = second.answer_batch(["Favorite   paradigm?", "How many years of experience?"])
+        assert _CountingProvider.calls == 1
+        assert batch[0]["source"] == "llm_cache"
+        assert batch[0]["answer"] == "Functional"
+        assert batch[0]["provenance"]["model"] == "fake-1"
+
+        # A different profile context doesn't reuse the answer
+        other = CandidateProfile({**PROFILE_DATA, "personal_info": {"full_name": "Someone Else"}})
+        third = QuestionAnswerer(other, llm_provider=_CountingProvider(),
+                                 answer_cache=AnswerCache(path))
+        assert third.answer("Favorite paradigm?")["source"] == "llm"
+        assert _CountingProvider.calls == 2
+
+    def test_answer_cache_promotion(self, tmp_path):
+        from src.automation.answer_cache import AnswerCache
+
+        cache = AnswerCache(tmp_path / "answers.db")
+        cache.put("preferred shift (day/night)?", "p1", "Day", confidence=0.7, model="m")
+        cache.put("how many years of experience?", "p1", "6", confidence=0.7, model="m")
+        cache.put("rare question", "p1", "Maybe", confidence=0.7, model="m")
+        for _ in range(3):
+            cache.get("preferred shift (day/night)?", "p1")
+            cache.get("how many years of experience?", "p1")
+
+        bank = [{"question_pattern": "years of experience", "answer": "5"}]
+        added = cache.promote(bank, min_hits=3)
+        assert added == [{"question_pattern": r"preferred\ shift\ \(day/night\)\?", "answer": "Day"}]
+        assert len(bank) == 2
+        assert cache.promote(bank, min_hits=3) == []   # offered once
+
+        qa = QuestionAnswerer(CandidateProfile({**PROFILE_DATA, "qa_bank": bank}))
+        assert qa.answer("Preferred shift (day/night)?")["source"] == "qa_bank"
+
+    def test_batch_retries_only_missing_keys_and_sends_options(self, profile):
+        from src.llm.provider import BaseLLMProvider, LLMResponse
+
+        class _PartialProvider(BaseLLMProvider):
+            def __init__(self):
+                self.prompts = []
+
+            def generate(self, prompt, max_tokens=500, system_prompt=None):
+                self.prompts.append(prompt)
+                if len(self.prompts) == 1:
+                    return LLMResponse(text='{"1": "Night", "3": "", "4": {"x": 1}}', model="fake")
+                return LLMResponse(text="Django", model="fake")
+
+            def is_available(self):
+                return True
+
+        provider = _PartialProvider()
+        qa = QuestionAnswerer(profile, llm_provider=provider)
+        answers = qa.answer_batch(
+            ["Preferred shift?", "Favourite framework?", "Favourite ORM?", "Favourite IDE?"],
+            [["Day", "Night"], [], [], []],
+        )
+        # Key 2 missing and key 4 unparseable are re-asked; key 3 was left empty on purpose
+        assert [a["answer"] for a in answers] == ["Night", "Django", "", "Django"]
+        assert answers[2]["source"] == "manual"
+        assert len(provider.prompts) == 3          # one batch + the two missing keys
+        assert "Preferred shift? (options: Day / Night)" in provider.prompts[0]
+
+    def test_large_batch_is_chunked(self, profile):
+        from src.llm.provider import BaseLLMProvider, LLMResponse
+
+        class _JSONProvider(BaseLLMProvider):
+            def __init__(self):
+                self.calls = 0
+
+            def generate(self, prompt, max_tokens=500, system_prompt=None):
+                self.calls += 1
+                return LLMResponse(
+                    text=json.dumps({str(i): f"a{i}" for i in range(1, 11)}), model="fake"
+                )
+
+            def is_available(self):
+                return True
+
+        provider = _JSONProvider()
+        qa = QuestionAnswerer(profile, llm_provider=provider)
+        answers = qa.answer_batch([f"Unusual question number {n}?" for n in range(12)])
+        assert provider.calls == 2
+        assert all(a["source"] == "llm" for a in answers)
+
+    def test_failed_fallback_only_empties_its_own_answer(self, profile):
+        from src.llm.provider import BaseLLMProvider, LLMResponse
+
+        class _FlakyProvider(BaseLLMProvider):
+            def generate(self, prompt, max_tokens=500, system_prompt=None):
+                if "Favourite ORM?" in prompt and "1." not in prompt:
+                    raise RuntimeError("rate limited")
+                if "1." in prompt:
+                    return LLMResponse(text='{"1": "Day"}', model="fake")
+                return LLMResponse(text="Django", model="fake")
+
+            async def agenerate(self, prompt, max_tokens=500, system_prompt=None):
+                return self.generate(prompt, max_tokens, system_prompt)
+
+            def is_available(self):
+                return True
+
+        questions = ["Preferred shift?", "Favourite framework?", "Favourite ORM?"]
+        qa = QuestionAnswerer(profile, llm_provider=_FlakyProvider())
+        for answers in (
+            qa.answer_batch(questions),
+            asyncio.get_event_loop().run_until_complete(
+                QuestionAnswerer(profile, llm_provider=_FlakyProvider()).aanswer_batch(questions)
+            ),
+        ):
+            assert [a["answer"] for a in answers] == ["Day", "Django", ""]
+            assert [a["source"] for a in answers] == ["llm", "llm", "manual"]
+
+    def test_repeated_question_is_asked_once(self, profile):
+        from src.llm.provider import BaseLLMProvider, LLMResponse
+
+        class _JSONProvider(BaseLLMProvider):
+            def __init__(self):
+                self.prompts = []
+
+            def generate(self, prompt, max_tokens=500, system_prompt=None):
+                self.prompts.append(prompt)
+                return LLMResponse(text='{"1": "Night", "2": "Django"}', model="fake")
+
+            def is_available(self):
+                return True
+
+        provider = _JSONProvider()
+        qa = QuestionAnswerer(profile, llm_provider=provider)
+        answers = qa.answer_batch(
+            ["Preferred shift?", "Favourite framework?", "preferred  SHIFT?"],
+            [["Day", "Night"], [], ["Day", "Night"]],
+        )
+        assert len(provider.prompts) == 1
+        assert "3." not in provider.prompts[0]
+        assert [a["answer"] for a in answers] == ["Night", "Django", "Night"]
+
+    def test_async_batch_sends_chunks_concurrently(self, profile):
+        from src.llm.provider import BaseLLMProvider, LLMResponse
+
+        class _AsyncJSONProvider(BaseLLMProvider):
+            def __init__(self):
+                self.in_flight = self.peak = 0
+
+            def generate(self, prompt, max_tokens=500, system_prompt=None):
+                raise AssertionError("async path must not call generate()")
+
+            async def agenerate(self, prompt, max_tokens=500, system_prompt=None):
+                self.in_flight += 1
+                self.peak = max(self.peak, self.in_flight)
+                await asyncio.sleep(0)
+                self.in_flight -= 1
+                return LLMResponse(
+                    text=json.dumps({str(i): f"a{i}" for i in range(1, 11)}), model="fake"
+                )
+
+            def is_available(self):
+                return True
+
+        provider = _AsyncJSONProvider()
+        qa = QuestionAnswerer(profile, llm_provider=provider)
+        answers = asyncio.get_event_loop().run_until_complete(
+            qa.aanswer_batch([f"Unusual question number {n}?" for n in range(12)])
+        )
+        assert provider.peak == 2
+        assert [a["answer"] for a in answers[:2]] == ["a1", "a2"]
+        assert all(a["source"] == "llm" for a in answers)
+
+    def test_semantic_match_catches_paraphrase(self, profile):
+        qa = QuestionAnswerer(profile)
+        result = qa.answer("Years of relevant experience?")
+        assert result["source"] == "semantic"
+        assert result["answer"] == "5"
+        assert 0.7 <= result["confidence"] <= 1.0
+        assert qa.answer("Total experience in years?")["answer"] == "5"
+        assert qa.answer("Describe a challenging project")["source"] in ("llm", "manual")
+        disabled = QuestionAnswerer(profile, semantic_threshold=None)
+        assert disabled.answer("Years of relevant experience?")["source"] != "semantic"
+
+    def test_semantic_match_needs_the_same_subject(self):
+        from src.automation.semantic_matcher import SemanticMatcher
+        matcher = SemanticMatcher()
+        matcher.add("do you have experience with python?", "Yes")
+        matcher.add("what is your expected salary?", "20 LPA")
+        assert matcher.match("Do you have experience with Python 3?").answer == "Yes"
+        assert matcher.match("Expected salary?").answer == "20 LPA"
+        assert matcher.match("Do you have experience with Java?") is None
+        assert matcher.match("Do you have experience with Kubernetes?") is None
+        assert matcher.match("How many years of experience with Rust?") is None
+        assert matcher.match("What is your current salary?") is None
+
+    def test_semantic_match_reuses_answered_questions(self, profile):
+        from src.llm.provider import BaseLLMProvider, LLMResponse
+
+        class _CountingProvider(BaseLLMProvider):
+            calls = 0
+
+            def generate(self, prompt, max_tokens=500, system_prompt=None):
+                _CountingProvider.calls += 1
+                return LLMResponse(text="Night", model="fake")
+
+            def is_available(self):
+                return True
+
+        qa = QuestionAnswerer(profile, llm_provider=_CountingProvider())
+        qa.answer("Which shift do you prefer working?")          # builds the index
+        assert qa.answer("Preferred working shift?")["answer"] == "Night"
+        assert _CountingProvider.calls == 1
+
+    def test_pattern_phrases(self):
+        from src.automation.semantic_matcher import pattern_phrases
+        assert pattern_phrases("require.*sponsorship|need.*visa") == [
+            "require sponsorship", "need visa",
+        ]
+        assert pattern_phrases(r"work (permit|visa)|on.?site") == ["work permit visa", "on site"]
+
     def test_empty_qa_bank(self):
         empty_profile = CandidateProfile({
             "personal_info": {"full_name": "Test"},
@@ -156,6 +479,121 @@ class TestHumanSimulator:
         # Should not all be the same
         assert len(set(delays)) > 1
 
+    def test_virtual_clock_accumulates_without_sleeping(self):
+        import time
+        from src.automation.clock import VIRTUAL, Sleeper
+
+        class _TypingPage:
+            delays = []
+
+            def locator(self, selector):
+                raise RuntimeError("no layout")
+
+            async def click(self, selector):
+                pass
+
+            async def type(self, selector, char, delay=0):
+                self.delays.append(delay)
+
+        sleeper = Sleeper(VIRTUAL, start=1000.0)
+        sim = HumanSimulator(sleeper=sleeper)
+        t0 = time.perf_counter()
+
+        async def run():
+            await sim.random_pause(5.0, 8.0)
+            await sim.think_pause()
+            await sim.type_text(_TypingPage(), "#q", "python")
+
+        asyncio.get_event_loop().run_until_complete(run())
+        assert time.perf_counter() - t0 < 0.5
+        assert sleeper.simulated >= 5.0
+        assert sleeper.slept == 0.0
+        assert sleeper.time() == pytest.approx(1000.0 + sleeper.simulated)
+        assert _TypingPage.delays == [0] * 6
+        report = sleeper.report(wall_seconds=0.2)
+        assert report["compute_s"] == 0.2
+        assert report["simulated_human_s"] >= 5.0
+
+    def test_real_sleeper_tracks_slept_time(self):
+        from src.automation.clock import Sleeper
+
+        sleeper = Sleeper()
+        asyncio.get_event_loop().run_until_complete(sleeper.sleep(0.02))
+        assert sleeper.simulated == pytest.approx(0.02)
+        assert sleeper.slept >= 0.015
+
+    def test_virtual_clock_drives_caches_and_captcha_wait(self, tmp_path):
+        import time
+        from src.automation.clock import VIRTUAL, Sleeper
+        from src.automation.jd_cache import JDCache
+
+        driver = IndeedDriver()
+        driver.sim.sleeper = Sleeper(VIRTUAL, start=1000.0)
+        driver.jd_cache = JDCache(tmp_path / "jd.db", ttl_hours=1, clock=driver.now)
+        driver.jd_cache.put("indeed", "a1", "Full JD")
+        run = asyncio.get_event_loop().run_until_complete
+        run(driver.sim.sleeper.sleep(3601))
+        assert driver.jd_cache.get("indeed", "a1") is None   # expired in virtual time
+
+        class _Page:
+            async def evaluate(self, script):
+                return "recaptcha"
+
+        t0 = time.perf_counter()
+        handler = CaptchaHandler(driver.sim.sleeper)
+        assert run(handler.handle(_Page(), timeout_seconds=120, poll_interval=3)) is False
+        assert time.perf_counter() - t0 < 0.5
+        assert driver.now() == pytest.approx(1000.0 + 3601 + 120)
+        assert driver.sim.sleeper.simulated == pytest.approx(3601)  # waiting isn't human time
+
+    def test_unknown_mode(self):
+        from src.automation.clock import Sleeper
+        with pytest.raises(ValueError):
+            Sleeper("warp")
+
+    def test_same_seed_reproduces_delays(self):
+        from src.automation.clock import VIRTUAL, Sleeper
+
+        def simulated(seed):
+            sim = HumanSimulator(sleeper=Sleeper(VIRTUAL), seed=seed)
+
+            async def run():
+                for _ in range(20):
+                    await sim.random_pause()
+                await sim.think_pause()
+
+            asyncio.get_event_loop().run_until_complete(run())
+            return sim.sleeper.simulated
+
+        assert HumanSimulator(seed=7).seed == 7
+        assert simulated(7) == simulated(7)
+        assert simulated(7) != simulated(8)
+
+    def test_schedule_extends_past_block(self):
+        from src.automation.human_simulator import HumanizationSchedule
+
+        small = HumanizationSchedule(seed=1, block_size=4)
+        draws = [small.randint(1, 3) for _ in range(10)]
+        assert all(1 <= d <= 3 for d in draws)
+        assert small.normal() != 0.0
+
+    def test_time_budget_estimate(self):
+        driver = IndeedDriver()
+        budget = driver.estimate_time_budget(SearchConfig(keywords=["python"], max_results=30))
+        assert budget["pages"] == 2
+        assert 0 < budget["min_s"] < budget["expected_s"]
+        driver.sim.time_scale = 0.5
+        halved = driver.estimate_time_budget(SearchConfig(keywords=["python"], max_results=30))
+        assert halved["min_s"] == pytest.approx(budget["min_s"] / 2, abs=0.1)
+        empty = driver.estimate_time_budget(SearchConfig(keywords=["python"], max_results=0))
+        assert empty["jobs"] == 0 and 0 < empty["min_s"] < empty["expected_s"]
+
+        class _SlowReader(IndeedDriver):
+            JD_SETTLE_S = (12.0, 13.5)     # the pause _fetch_descriptions uses
+
+        slow = _SlowReader().estimate_time_budget(SearchConfig(keywords=["python"], max_results=30))
+        assert slow["min_s"] == pytest.approx(budget["min_s"] + budget["jobs"] * 10.0, abs=0.1)
+
 
 # ── CAPTCHA Handler Tests ───────────────────────────────────
 
@@ -199,9 +637,313 @@ class TestCaptchaHandler:
         result = handler.detect(html)
         assert "manually" in result.message.lower()
 
+    def test_specific_widget_beats_generic_marker(self):
+        html = '<p>Confirm you are not a robot</p><div class="cf-turnstile"></div>'
+        assert CaptchaHandler().detect(html).captcha_type == "cloudflare"
+
+    def test_page_probe_skips_content(self):
+        class _ProbePage:
+            def __init__(self, kinds):
+                self.kinds = list(kinds)
+                self.evaluates = 0
+                self.closed = False
+
+            async def evaluate(self, script):
+                self.evaluates += 1
+                return self.kinds.pop(0) if self.kinds else ""
+
+            async def content(self):
+                raise AssertionError("probe should not fetch the HTML")
+
+            async def close(self):
+                self.closed = True
+
+        handler = CaptchaHandler()
+        run = asyncio.get_event_loop().run_until_complete
+        page = _ProbePage(["hcaptcha"])
+        detection = run(handler.detect_on_page(page))
+        assert detection.detected and detection.captcha_type == "hcaptcha"
+        assert page.evaluates == 1
+
+        # Parked: solved on the third poll, then the tab is closed
+        page = _ProbePage(["hcaptcha", "hcaptcha"])
+        assert run(handler.park(page, timeout_seconds=1, poll_interval=0.001)) is True
+        assert page.evaluates == 3
+        assert page.closed
+
+    def test_probe_failure_falls_back_to_html(self):
+        class _NavigatingPage:
+            async def evaluate(self, script):
+                raise RuntimeError("Execution context was destroyed")
+
+            async def content(self):
+                return '<div class="g-recaptcha"></div>'
+
+        detection = asyncio.get_event_loop().run_until_complete(
+            CaptchaHandler().detect_on_page(_NavigatingPage())
+        )
+        assert detection.captcha_type == "recaptcha"
+
+
+# ── Pacing Controller Tests ─────────────────────────────────
+
+class TestPacingController:
+    def test_additive_increase_multiplicative_decrease(self):
+        pacer = PacingController("naukri", floor=0.1, ceiling=10, increase_step=0.25)
+        pacer.on_success()
+        assert pacer.scale == pytest.approx(1 / 1.25)
+        pacer.on_throttle("HTTP 429")
+        assert pacer.scale == pytest.approx(2 / 1.25)
+        assert pacer.throttle_events == 1
+
+    def test_scale_clamped_to_bounds(self):
+        pacer = PacingController("linkedin", floor=0.75, ceiling=2.0)
+        for _ in range(50):
+            pacer.on_success()
+        assert pacer.scale == 0.75
+        for _ in range(5):
+            pacer.on_throttle("captcha")
+        assert pacer.scale == 2.0
+        assert pacer.delay(8.0) == 16.0
+
+    def test_learned_scale_persists(self, tmp_path):
+        state = tmp_path / "pacing.json"
+        pacer = PacingController("indeed", state_path=state)
+        pacer.on_throttle("empty page")
+        pacer.save()
+        PacingController("naukri", state_path=state).save()
+        assert PacingController("indeed", state_path=state).scale == pytest.approx(2.0)
+
+    def test_disabled_controller_is_inert(self, tmp_path):
+        pacer = PacingController("indeed", state_path=tmp_path / "p.json", enabled=False)
+        pacer.on_throttle("HTTP 429")
+        pacer.save()
+        assert pacer.scale == 1.0
+        assert not (tmp_path / "p.json").exists()
+
+    def test_driver_classifies_empty_page(self):
+        class _Page:
+            url = "https://www.linkedin.com/authwall?trk=x"
+
+        driver = LinkedInDriver()
+        driver.pacer = PacingController("linkedin", floor=0.1, ceiling=10)
+        driver._page = _Page()
+        asyncio.get_event_loop().run_until_complete(driver._observe_pacing(False))
+        assert driver.pacer.scale == pytest.approx(2.0)
+
+    def test_driver_throttle_status_wins(self):
+        class _Resp:
+            status = 999
+            request = type("Req", (), {"resource_type": "document"})()
+
+        driver = LinkedInDriver()
+        driver.pacer = PacingController("linkedin", floor=0.1, ceiling=10)
+        driver._on_response(_Resp())
+        asyncio.get_event_loop().run_until_complete(driver._observe_pacing(True))
+        assert driver.pacer.throttle_events == 1
+
 
 # ── Orchestrator Tests ───────────────────────────────────────
 
+class _FakeFormFrame:
+    """Serves introspected fields and records fills (Page/Frame stand-in)."""
+
+    def __init__(self, fields):
+        self.fields = fields
+        self.evaluate_calls = 0
+        self.filled = {}
+
+    async def evaluate(self, script, arg=None):
+        self.evaluate_calls += 1
+        return self.fields
+
+    async def fill(self, selector, value):
+        self.filled[selector] = value
+
+    async def select_option(self, selector, label=None):
+        self.filled[selector] = label
+
+    async def check(self, selector, timeout=0):
+        self.filled[selector] = "checked"
+
+
+class TestFormFill:
+    FIELDS = [
+        {"key": "0", "label": "First name", "kind": "text", "options": [],
+         "option_keys": [], "required": True, "value": ""},
+        {"key": "1", "label": "Email address", "kind": "email", "options": [],
+         "option_keys": [], "required": True, "value": "prefilled@x.com"},
+        {"key": "2", "label": "Do you require visa sponsorship?", "kind": "radio",
+         "options": ["Yes", "No"], "option_keys": ["2-0", "2-1"], "required": True, "value": ""},
+        {"key": "3", "label": "Years of Python experience", "kind": "select",
+         "options": ["0-2", "3-5", "5+"], "option_keys": [], "required": False, "value": ""},
+        {"key": "4", "label": "Favourite framework", "kind": "text", "options": [],
+         "option_keys": [], "required": True, "value": ""},
+    ]
+
+    def test_choose_option(self):
+        from src.automation.forms import choose_option
+        assert choose_option(["Yes", "No"], "No, I do not") == 1
+        assert choose_option(["0-2", "3-5", "5+"], "5+") == 2
+        assert choose_option(["Red", "Blue"], "Green") is None
+
+    def test_single_introspection_and_one_batch(self, profile):
+        from src.automation.forms import fill_form
+
+        class _Answerer:
+            batches = []
+            options = []
+
+            def answer_batch(self, questions, options=None):
+                self.batches.append(questions)
+                self.options.append(options)
+                return [
+                    {"answer": {"Do you require visa sponsorship?": "No",
+                                "Years of Python experience": "5+"}.get(q, ""),
+                     "source": "qa_bank", "confidence": 0.97}
+                    for q in questions
+                ]
+
+        frame = _FakeFormFrame(self.FIELDS)
+        answerer = _Answerer()
+        stats = asyncio.get_event_loop().run_until_complete(
+            fill_form(frame, {"first name": "Jane", "name": "Jane Doe"}, answerer=answerer)
+        )
+        assert frame.evaluate_calls == 1
+        assert answerer.batches == [[
+            "Do you require visa sponsorship?",
+            "Years of Python experience",
+            "Favourite framework",
+        ]]
+        assert answerer.options[0][0] == ["Yes", "No"]
+        assert frame.filled == {
+            '[data-ja-field="0"]': "Jane",
+            '[data-ja-field="2-1"]': "checked",
+            '[data-ja-field="3"]': "5+",
+        }
+        assert stats == {"fields": 4, "filled": 3, "batched": 3, "unanswered": 1}
+
+    def test_known_answer_needs_whole_label(self, profile):
+        from src.automation.forms import match_known_answer
+
+        answers = QuestionAnswerer(profile).build_answers_dict()
+        assert match_known_answer("Your email address", answers) == answers["email"]
+        assert match_known_answer("LinkedIn profile URL", answers) == answers["linkedin"]
+        assert match_known_answer("First name*", answers) == answers["first name"]
+        for label in (
+            "Company name",
+            "Are you willing to relocate to this location?",
+            "How many years of experience do you have with Python?",
+            "Current salary",
+        ):
+            assert match_known_answer(label, answers) == "", label
+
+    def test_static_answer_outside_options_goes_to_answerer(self):
+        from src.automation.forms import fill_form
+
+        class _Answerer:
+            def __init__(self):
+                self.batches = []
+
+            def answer_batch(self, questions, options=None):
+                self.batches.append(questions)
+                return [{"answer": "Yes", "source": "llm", "confidence": 0.7} for _ in questions]
+
+        frame = _FakeFormFrame([
+            {"key": "0", "label": "Location", "kind": "radio", "options": ["Yes", "No"],
+             "option_keys": ["0-0", "0-1"], "required": True, "value": ""},
+        ])
+        answerer = _Answerer()
+        asyncio.get_event_loop().run_until_complete(
+            fill_form(frame, {"location": "Pune, India"}, answerer=answerer)
+        )
+        assert answerer.batches == [["Location"]]
+        assert frame.filled == {'[data-ja-field="0-0"]': "checked"}
+
+
+class _FakeResponse:
+    """Minimal Playwright response for ResponseCapture."""
+
+    class _Request:
+        def __init__(self, resource_type):
+            self.resource_type = resource_type
+
+    class _Frame:
+        parent_frame = None
+
+    def __init__(self, url, body=b"{}", resource_type="xhr", status=200):
+        self.url = url
+        self.status = status
+        self.ok = status < 400
+        self.request = self._Request(resource_type)
+        self.frame = self._Frame()
+        self._body = body
+
+    async def body(self):
+        await asyncio.sleep(0)
+        return self._body
+
+
+class TestResponseCapture:
+    def _capture(self, **kwargs):
+        return ResponseCapture([CaptureRule("jobs-search", r"/api/search\?", **kwargs)])
+
+    def test_from_selectors(self):
+        capture = ResponseCapture.from_selectors({
+            "capture": {"jobs-search": {"url_pattern": "/api/search", "wait_ms": 100}},
+        })
+        assert capture.rules["jobs-search"].wait_ms == 100
+        assert ResponseCapture.from_selectors({}).rules == {}
+
+    def test_captures_matching_json_only(self):
+        capture = self._capture()
+
+        async def run():
+            capture.observe(_FakeResponse("https://x/api/search?page=1", b'{"jobs": [1, 2]}'))
+            capture.observe(_FakeResponse("https://x/static/app.js", b"{}"))
+            capture.observe(_FakeResponse("https://x/api/search?page=2", b"{}", status=429))
+            return await capture.captured("jobs-search", timeout=1)
+
+        got = asyncio.get_event_loop().run_until_complete(run())
+        assert [c.body for c in got] == [{"jobs": [1, 2]}]
+        assert got[0].url.endswith("page=1")
+
+    def test_times_out_cleanly(self):
+        capture = self._capture()
+        loop = asyncio.get_event_loop()
+        assert loop.run_until_complete(capture.captured("jobs-search", timeout=0.01)) == []
+        # Nothing in flight: no wait at all
+        assert loop.run_until_complete(
+            capture.captured("jobs-search", timeout=30, in_flight_only=True)
+        ) == []
+        assert loop.run_until_complete(capture.captured("unknown")) == []
+
+    def test_bounded_buffer_and_size_cap(self):
+        capture = self._capture(max_buffered=2, max_bytes=20)
+
+        async def run():
+            for i in range(3):
+                capture.observe(_FakeResponse(f"https://x/api/search?p={i}", b'{"p": %d}' % i))
+            capture.observe(_FakeResponse("https://x/api/search?big", b'{"pad": "' + b"x" * 50 + b'"}'))
+            await asyncio.sleep(0.01)
+            return await capture.captured("jobs-search")
+
+        got = asyncio.get_event_loop().run_until_complete(run())
+        assert [c.body["p"] for c in got] == [1, 2]
+        assert capture.dropped == 2
+
+    def test_document_load_resets_buffers(self):
+        capture = self._capture()
+
+        async def run():
+            capture.observe(_FakeResponse("https://x/api/search?p=1", b'{"p": 1}'))
+            await asyncio.sleep(0.01)
+            capture.observe(_FakeResponse("https://x/next", resource_type="document"))
+            return await capture.captured("jobs-search", timeout=0)
+
+        assert asyncio.get_event_loop().run_until_complete(run()) == []
+
+
 class TestOrchestrator:
     def test_pipeline_discovery_only(self, profile, no_browser):
         """Test pipeline with discovery but no auto-apply."""
@@ -220,6 +962,31 @@ class TestOrchestrator:
         assert result.jobs_new > 0
         assert result.resumes_generated > 0
         assert result.applications_submitted == 0  # auto_apply is False
+        # Stub provider: nothing metered, but every run reports its usage
+        assert result.llm_usage["calls"] == 0 and not result.llm_usage["budget_exhausted"]
+
+    def test_run_closes_async_llm_clients(self, profile, no_browser):
+        from src.llm.provider import StubProvider
+
+        class _ClosingStub(StubProvider):
+            def __init__(self):
+                self.closed = 0
+
+            async def aclose(self):
+                self.closed += 1
+
+        orch = Orchestrator(drivers=[IndeedDriver()], profile=profile, min_score=0.0)
+        shared, own = _ClosingStub(), _ClosingStub()
+        orch.content_selector._llm = shared
+        orch.question_answerer.llm = shared
+        asyncio.get_event_loop().run_until_complete(orch.run(SearchConfig(keywords=["python"])))
+        assert shared.closed == 1      # shared provider closed once
+
+        orch.question_answerer.llm = own
+        orch.scorer.score_and_rank = None   # make the run fail
+        with pytest.raises(TypeError):
+            asyncio.get_event_loop().run_until_complete(orch.run(SearchConfig(keywords=["python"])))
+        assert (shared.closed, own.closed) == (2, 1)
 
     def test_pipeline_with_auto_apply(self, profile, no_browser):
         """Test full pipeline with auto-apply enabled."""
@@ -236,6 +1003,114 @@ class TestOrchestrator:
         assert result.jobs_discovered > 0
         assert result.applications_submitted > 0  # Stubs succeed
 
+    def test_parked_captcha_is_retried_after_solve(self, profile, no_browser):
+        """A CAPTCHA'd apply doesn't block others and is retried once solved."""
+        driver = IndeedDriver()
+        calls = []
+
+        async def apply(job, resume_path, answers=None):
+            calls.append(job.url)
+            if len(calls) == 1:
+                solved = asyncio.get_event_loop().create_future()
+                solved.set_result(True)
+                return {"status": "captcha", "message": "CAPTCHA", "job_url": job.url,
+                        "parked": solved}
+            return {"status": "submitted", "message": "ok", "job_url": job.url}
+
+        driver.apply = apply
+        orch = Orchestrator(drivers=[driver], profile=profile, min_score=0.0, auto_apply=True)
+        result = asyncio.get_event_loop().run_until_complete(
+            orch.run(SearchConfig(keywords=["python"]))
+        )
+        assert result.captchas_parked == 1
+        assert result.captchas_solved == 1
+        assert calls[-1] == calls[0]
+        assert result.applications_submitted == result.resumes_generated
+        assert result.applications_failed == 0
+
+    def test_parked_tab_keeps_the_browser_open_until_drained(self, profile, tmp_path, monkeypatch):
+        """Real apply() → _park_captcha() → close: the parked tab outlives apply()."""
+        import sys
+        from types import SimpleNamespace
+        from src.automation.clock import ZERO, Sleeper
+
+        contexts = []
+
+        class _Page:
+            def __init__(self, context, captcha_polls):
+                self.context, self.captcha_polls, self.url = context, captcha_polls, ""
+
+            def on(self, event, handler):
+                pass
+
+            async def goto(self, url, **kwargs):
+                self.url = url
+
+            async def query_selector(self, selector):
+                return None
+
+            async def evaluate(self, script):
+                if self.context.closed:
+                    raise RuntimeError("Target page, context or browser has been closed")
+                if self.captcha_polls:
+                    self.captcha_polls -= 1
+                    return "hcaptcha"
+                return ""
+
+            async def content(self):
+                raise RuntimeError("Target page, context or browser has been closed")
+
+            async def close(self):
+                pass
+
+        class _Context:
+            def __init__(self):
+                self.closed = False
+                self.pages = []
+
+            async def new_page(self):
+                # The first tab shows a CAPTCHA to the detector and to one park poll
+                self.pages.append(_Page(self, 2 if not self.pages else 0))
+                return self.pages[-1]
+
+            async def close(self):
+                self.closed = True
+
+        async def launch_persistent_context(user_data_dir, **kwargs):
+            if any(not c.closed for c in contexts):
+                raise RuntimeError("user data directory is already in use")
+            contexts.append(_Context())
+            return contexts[-1]
+
+        class _Playwright:
+            chromium = SimpleNamespace(launch_persistent_context=launch_persistent_context)
+
+            async def stop(self):
+                pass
+
+        fake_api = SimpleNamespace(async_playwright=lambda: SimpleNamespace(start=_async(_Playwright())))
+        monkeypatch.setitem(sys.modules, "playwright", SimpleNamespace(async_api=fake_api))
+        monkeypatch.setitem(sys.modules, "playwright.async_api", fake_api)
+        monkeypatch.setattr("src.automation.drivers.indeed._playwright_available", lambda: True)
+
+        driver = IndeedDriver(user_data_dir=str(tmp_path / "profile"))
+        driver.sim.sleeper = Sleeper(ZERO)
+        driver.pacer = PacingController("indeed", enabled=False)
+        orch = Orchestrator(drivers=[driver], profile=profile, min_score=0.0, auto_apply=True)
+        job = DiscoveredJob(title="Dev", company="Co", url="https://indeed.com/viewjob?jk=1",
+                            source="indeed")
+        result = PipelineResult()
+        run = asyncio.get_event_loop().run_until_complete
+
+        run(orch._apply_to_job(job, {"tex": "resume.tex"}, result))
+        assert result.captchas_parked == 1
+        assert not contexts[0].closed          # apply() left the parked tab's browser open
+
+        run(orch._drain_parked(result))
+        assert result.captchas_solved == 1     # the park poll reached the live tab
+        assert len(contexts) == 1              # the retry reused the open context
+        assert contexts[0].closed and driver._context is None
+
     def test_pipeline_dedup(self, profile, no_browser):
         """Existing URLs should be filtered out."""
         drivers = [IndeedDriver()]
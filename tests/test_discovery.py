@@ -3,9 +3,14 @@
 import pytest
 import asyncio
 
-from src.automation.drivers.base import DiscoveredJob, SearchConfig
+from src.automation.clock import ZERO, Sleeper
+from src.automation.drivers.base import BaseBrowserDriver, DiscoveredJob, SearchConfig
 from src.automation.drivers.linkedin import LinkedInDriver
 from src.automation.drivers.indeed import IndeedDriver
+from src.automation.jd_cache import JDCache
+from src.automation.pacing import PacingController
+from src.automation.replay import SessionArchive
+from src.automation.response_capture import CapturedResponse
 from src.discovery.deduplicator import Deduplicator, is_duplicate
 from src.discovery.scorer import JobProfileScorer
 from src.profile.manager import CandidateProfile
@@ -130,6 +135,565 @@ class TestIndeedDriver:
         assert any("data" in j.title.lower() for j in jobs)
 
 
+class _FakeCardPage:
+    """Minimal stand-in for a Playwright page that serves pre-extracted card rows."""
+
+    def __init__(self, rows):
+        self.rows = rows
+        self.evaluate_calls = 0
+
+    async def wait_for_selector(self, selector, timeout=0):
+        return None
+
+    async def query_selector(self, selector):
+        return None
+
+    async def evaluate(self, script, arg=None):
+        if "window.mosaic" in script:
+            return []  # no Indeed provider blob: exercise the DOM path
+        self.evaluate_calls += 1
+        return self.rows
+
+
+class TestSingleRoundtripCardExtraction:
+    def test_linkedin_cards_in_one_evaluate(self):
+        driver = LinkedInDriver()
+        driver._page = _FakeCardPage([
+            {"title_aria": "ML Engineer", "title_strong": "", "link_text": "",
+             "href": "/jobs/view/4242/?trk=x", "company": "Acme", "location": "Remote"},
+            {"title_aria": "", "title_strong": "Data Engineer", "link_text": "",
+             "href": "/jobs/view/4343/", "company": "Beta", "location": ""},
+            {"title_aria": "No company", "title_strong": "", "link_text": "",
+             "href": "/jobs/view/1/", "company": "", "location": ""},
+        ])
+        jobs = asyncio.get_event_loop().run_until_complete(driver._extract_job_cards())
+        assert driver._page.evaluate_calls == 1
+        assert [j.external_id for j in jobs] == ["4242", "4343"]
+        assert jobs[0].url == "https://www.linkedin.com/jobs/view/4242/"
+        assert jobs[1].title == "Data Engineer"
+
+    def test_indeed_cards_in_one_evaluate(self):
+        driver = IndeedDriver()
+        driver._page = _FakeCardPage([
+            {"title": "Backend Dev", "href": "/rc/clk?jk=abc123&from=serp",
+             "company": "DevShop", "location": "Pune", "salary": "₹20L"},
+            {"title": "Broken", "href": "javascript:void(0)",
+             "company": "", "location": "", "salary": ""},
+        ])
+        jobs = asyncio.get_event_loop().run_until_complete(driver._extract_job_cards())
+        assert driver._page.evaluate_calls == 1
+        assert len(jobs) == 1
+        assert jobs[0].url == "https://www.indeed.com/viewjob?jk=abc123"
+        assert jobs[0].salary_range == "₹20L"
+
+    def test_naukri_cards_in_one_evaluate(self):
+        from src.automation.drivers.naukri import NaukriDriver
+        driver = NaukriDriver()
+        driver._page = _FakeCardPage([
+            {"title": "Python Developer", "href": "/job-listings-python-dev-123",
+             "company": "InfyTech", "location": "Bengaluru", "salary": ""},
+        ])
+        jobs = asyncio.get_event_loop().run_until_complete(driver._extract_job_cards())
+        assert driver._page.evaluate_calls == 1
+        assert jobs[0].url == "https://www.naukri.com/job-listings-python-dev-123"
+        assert jobs[0].external_id == "job-listings-python-dev-123"
+
+
+_VOYAGER_PAYLOAD = {
+    "data": {"paging": {"start": 0, "count": 25}},
+    "included": [
+        {
+            "$type": "com.linkedin.voyager.dash.jobs.JobPostingCard",
+            "entityUrn": "urn:li:fsd_jobPostingCard:(4242,JOBS_SEARCH)",
+            "jobPostingTitle": "ML Engineer",
+            "primaryDescription": {"text": "Acme"},
+            "secondaryDescription": {"text": "Bengaluru (Remote)"},
+        },
+        {
+            "$type": "com.linkedin.voyager.dash.jobs.JobPosting",
+            "entityUrn": "urn:li:fsd_jobPosting:4242",
+            "title": "ML Engineer",
+            "description": {"text": "Build ranking models. " * 10},
+            "listedAt": 1760745600000,
+        },
+    ],
+}
+
+
+class TestLinkedInJSONExtraction:
+    def test_parse_voyager_payload(self):
+        from datetime import UTC, datetime
+        from src.automation.drivers.linkedin import parse_voyager_payload
+
+        jobs = parse_voyager_payload(_VOYAGER_PAYLOAD)
+        assert list(jobs) == ["4242"]
+        entry = jobs["4242"]
+        assert entry["company"] == "Acme"
+        assert entry["location"] == "Bengaluru (Remote)"
+        assert entry["description"].startswith("Build ranking models.")
+        assert entry["posted_at"] == datetime(2025, 10, 18, tzinfo=UTC)
+
+    def test_dom_cards_enriched_from_json(self):
+        driver = LinkedInDriver()
+        driver.capture.add("voyager", CapturedResponse(
+            "https://www.linkedin.com/voyager/api/voyagerJobsDashJobCards?q=jobSearch",
+            200, _VOYAGER_PAYLOAD,
+        ))
+        driver._page = _FakeCardPage([
+            {"title_aria": "ML Engineer", "title_strong": "", "link_text": "",
+             "href": "/jobs/view/4242/", "company": "Acme", "location": ""},
+        ])
+        jobs = asyncio.get_event_loop().run_until_complete(driver._extract_job_cards())
+        assert jobs[0].description_text.startswith("Build ranking models.")
+        assert jobs[0].location == "Bengaluru (Remote)"
+        assert "posted_at" in jobs[0].metadata
+
+    def test_json_snippet_is_not_stored_as_full_jd(self):
+        import copy
+
+        payload = copy.deepcopy(_VOYAGER_PAYLOAD)
+        payload["included"][1]["description"] = {"text": "Build ranking models."}
+        driver = LinkedInDriver()
+        driver._absorb_json(payload)
+        driver._page = _FakeCardPage([])
+        jobs = asyncio.get_event_loop().run_until_complete(driver._extract_job_cards())
+        assert jobs[0].description_text == ""   # left for _fetch_descriptions
+
+    def test_json_jobs_when_dom_selectors_fail(self):
+        driver = LinkedInDriver()
+        driver._absorb_json(_VOYAGER_PAYLOAD)
+        driver._page = _FakeCardPage([])
+        jobs = asyncio.get_event_loop().run_until_complete(driver._extract_job_cards())
+        assert [j.url for j in jobs] == ["https://www.linkedin.com/jobs/view/4242/"]
+        # Pending JSON jobs are consumed by the page that used them
+        assert driver._json_pending == []
+
+    def test_jd_from_embedded_code_block_without_click(self):
+        import json
+
+        class _JobPage:
+            url = "https://www.linkedin.com/jobs/view/4242/"
+            clicks = 0
+
+            async def evaluate(self, script, arg=None):
+                return [json.dumps(_VOYAGER_PAYLOAD)]
+
+            async def query_selector(self, selector):
+                _JobPage.clicks += 1
+                return None
+
+        driver = LinkedInDriver()
+        driver._page = _JobPage()
+        driver._embedded_stale = True
+        text = asyncio.get_event_loop().run_until_complete(driver._get_full_jd_text())
+        assert text.startswith("Build ranking models.")
+        assert _JobPage.clicks == 0
+
+
+class TestIndeedMosaicExtraction:
+    def test_mosaic_results_skip_dom_walk(self):
+        from datetime import UTC, datetime
+
+        class _MosaicPage:
+            evaluate_calls = 0
+
+            async def evaluate(self, script, arg=None):
+                _MosaicPage.evaluate_calls += 1
+                assert "window.mosaic" in script
+                return [
+                    {"jobkey": "abc123", "title": "Backend Dev", "company": "DevShop",
+                     "location": "Pune", "salary": "₹20L", "snippet": "Go and Python",
+                     "pub_date": 1760745600000},
+                    {"jobkey": "", "title": "Sponsored", "company": "", "location": "",
+                     "salary": "", "snippet": "", "pub_date": 0},
+                ]
+
+        driver = IndeedDriver()
+        driver._page = _MosaicPage()
+        jobs = asyncio.get_event_loop().run_until_complete(driver._extract_job_cards())
+        assert _MosaicPage.evaluate_calls == 1
+        assert len(jobs) == 1
+        job = jobs[0]
+        assert job.url == "https://www.indeed.com/viewjob?jk=abc123"
+        assert job.external_id == "abc123"
+        assert job.salary_range == "₹20L"
+        assert job.description_text == ""  # snippet is not the full JD
+        assert job.metadata["snippet"] == "Go and Python"
+        assert job.metadata["posted_at"] == datetime(2025, 10, 18, tzinfo=UTC)
+
+
+class TestNaukriSearchAPI:
+    _PAYLOAD = {
+        "noOfJobs": 45,
+        "jobDetails": [
+            {
+                "title": "Python Developer",
+                "jobId": "181023500123",
+                "companyName": "InfyTech",
+                "jdURL": "/job-listings-python-developer-infytech-pune-181023500123",
+                "placeholders": [
+                    {"type": "experience", "label": "3-6 Yrs"},
+                    {"type": "salary", "label": "12-18 Lacs PA"},
+                    {"type": "location", "label": "Pune"},
+                ],
+                "createdDate": 1760745600000,
+            },
+            {"title": "", "jdURL": ""},
+        ],
+    }
+
+    def _driver(self):
+        from src.automation.drivers.naukri import NaukriDriver
+
+        class _Page:
+            url = ""
+            gotos = []
+
+            async def goto(self, url, **kwargs):
+                self.gotos.append(url)
+
+        driver = NaukriDriver()
+        driver._page = _Page()
+        driver._get_search_url(SearchConfig(keywords=["python"], location="Pune"))
+        return driver
+
+    def test_jobs_from_captured_api_response(self):
+        driver = self._driver()
+        driver.capture.add("jobs-search", CapturedResponse(
+            "https://www.naukri.com/jobapi/v3/search?keyword=python&pageNo=1", 200, self._PAYLOAD,
+        ))
+        jobs = asyncio.get_event_loop().run_until_complete(driver._extract_job_cards())
+        assert len(jobs) == 1
+        job = jobs[0]
+        assert job.url.endswith("/job-listings-python-developer-infytech-pune-181023500123")
+        assert job.external_id == "job-listings-python-developer-infytech-pune-181023500123"
+        assert (job.location, job.salary_range) == ("Pune", "12-18 Lacs PA")
+        assert "posted_at" in job.metadata
+
+    def test_non_search_bodies_fall_back_to_dom(self):
+        driver = self._driver()
+        driver.capture.add("jobs-search", CapturedResponse(
+            "https://www.naukri.com/jobapi/v3/search?pageNo=1", 200, self._PAYLOAD,
+        ))
+        for body in ([{"jobId": "1"}], {"message": "Something went wrong"}):
+            driver.capture.add("jobs-search", CapturedResponse(
+                "https://www.naukri.com/jobapi/v3/search?pageNo=1", 200, body,
+            ))
+        jobs = asyncio.get_event_loop().run_until_complete(driver._extract_job_cards())
+        assert [j.title for j in jobs] == ["Python Developer"]
+
+    def test_pagination_follows_api_page_number(self):
+        driver = self._driver()
+        loop = asyncio.get_event_loop()
+        driver.capture.add("jobs-search", CapturedResponse(
+            "https://www.naukri.com/jobapi/v3/search?pageNo=2", 200, self._PAYLOAD,
+        ))
+        loop.run_until_complete(driver._extract_job_cards())
+        assert loop.run_until_complete(driver._has_next_page())  # 2 × 2 < 45
+        loop.run_until_complete(driver._goto_next_page())
+        assert driver._page.gotos[-1] == "https://www.naukri.com/python-jobs-in-pune-3?jobAge=7"
+
+        driver._api_page = {"page_no": 23, "page_size": 2, "total": 45}
+        assert not loop.run_until_complete(driver._has_next_page())
+
+
+    def test_page_url_keeps_numbers_in_the_slug(self):
+        driver = self._driver()
+        driver._get_search_url(SearchConfig(keywords=["python 3"], location="Sector 62"))
+        assert driver._page_url(1) == "https://www.naukri.com/python-3-jobs-in-sector-62?jobAge=7"
+        assert driver._page_url(2) == "https://www.naukri.com/python-3-jobs-in-sector-62-2?jobAge=7"
+
+
+class TestJDCache:
+    def test_roundtrip(self, tmp_path):
+        cache = JDCache(tmp_path / "jd.db")
+        cache.put("indeed", "abc", "Full JD text " * 50)
+        assert cache.get("indeed", "abc") == "Full JD text " * 50
+        assert cache.get("linkedin", "abc") is None
+        assert (cache.hits, cache.misses) == (1, 1)
+
+    def test_ttl_expiry(self, tmp_path):
+        now = [1000.0]
+        cache = JDCache(tmp_path / "jd.db", ttl_hours=1, clock=lambda: now[0])
+        cache.put("naukri", "n1", "desc")
+        now[0] += 3601
+        assert cache.get("naukri", "n1") is None
+
+    def test_lru_eviction(self, tmp_path):
+        now = [0.0]
+        cache = JDCache(tmp_path / "jd.db", max_entries=2, clock=lambda: now[0])
+        for job_id in ("a", "b"):
+            now[0] += 1
+            cache.put("indeed", job_id, f"jd {job_id}")
+        now[0] += 1
+        cache.get("indeed", "a")          # "b" is now least recently used
+        now[0] += 1
+        cache.put("indeed", "c", "jd c")
+        assert len(cache) == 2
+        assert cache.get("indeed", "b") is None
+        assert cache.get("indeed", "a") == "jd a"
+
+    def test_disabled_cache_never_stores(self, tmp_path):
+        cache = JDCache(tmp_path / "jd.db", enabled=False)
+        cache.put("indeed", "abc", "text")
+        assert cache.get("indeed", "abc") is None
+        assert not (tmp_path / "jd.db").exists()
+
+    def test_fetch_descriptions_skips_cached(self, tmp_path):
+        cache = JDCache(tmp_path / "jd.db")
+        cache.put("indeed", "abc123", "Cached description")
+        driver = IndeedDriver()
+        driver.jd_cache = cache
+        driver._page = None  # any navigation would raise
+        jobs = [DiscoveredJob(
+            title="Dev", company="X", source="indeed",
+            url="https://www.indeed.com/viewjob?jk=abc123",
+        )]
+        asyncio.get_event_loop().run_until_complete(driver._fetch_descriptions(jobs))
+        assert jobs[0].description_text == "Cached description"
+        assert cache.hits == 1
+
+
+class _FakeSnapshotPage:
+    def __init__(self):
+        self.url = ""
+        self.html = ""
+        self.visited: list[str] = []
+
+    async def content(self):
+        return self.html
+
+    async def goto(self, url, **kwargs):
+        self.visited.append(url)
+        self.url = url
+
+
+class _FakeRoute:
+    def __init__(self, url, resource_type):
+        self.request = type("Req", (), {"url": url, "resource_type": resource_type})()
+        self.fulfilled = None
+        self.aborted = False
+
+    async def fulfill(self, **kwargs):
+        self.fulfilled = kwargs
+
+    async def abort(self):
+        self.aborted = True
+
+
+class TestSessionArchive:
+    def _record(self, root):
+        archive = SessionArchive(root, "indeed", "record")
+        page = _FakeSnapshotPage()
+        run = asyncio.get_event_loop().run_until_complete
+        for url, kind in [
+            ("https://www.indeed.com/jobs?q=python", "search"),
+            ("https://www.indeed.com/jobs?q=python&start=10", "search"),
+            ("https://www.indeed.com/viewjob?jk=abc#apply", "jd"),
+        ]:
+            page.url, page.html = url, f"<html>{kind} {url}</html>"
+            run(archive.snapshot(page, kind))
+        archive.save()
+
+    def test_record_then_replay_lookup(self, tmp_path):
+        self._record(tmp_path)
+        replay = SessionArchive(tmp_path, "indeed", "replay")
+        assert "jd" in replay.lookup("https://www.indeed.com/viewjob?jk=abc")
+        assert replay.lookup("https://www.indeed.com/viewjob?jk=zzz") is None
+        assert replay.launch_kwargs() == {}
+
+    def test_replay_requires_recording(self, tmp_path):
+        with pytest.raises(FileNotFoundError):
+            SessionArchive(tmp_path, "naukri", "replay")
+
+    def test_next_search_url(self, tmp_path):
+        self._record(tmp_path)
+        replay = SessionArchive(tmp_path, "indeed", "replay")
+        first = "https://www.indeed.com/jobs?q=python"
+        second = replay.next_search_url(first)
+        assert second == "https://www.indeed.com/jobs?q=python&start=10"
+        assert replay.next_search_url(second) is None
+
+    def test_serve_documents_and_block_other_requests(self, tmp_path):
+        self._record(tmp_path)
+        replay = SessionArchive(tmp_path, "indeed", "replay")
+        run = asyncio.get_event_loop().run_until_complete
+
+        doc = _FakeRoute("https://www.indeed.com/jobs?q=python", "document")
+        run(replay._serve(doc))
+        assert doc.fulfilled["status"] == 200
+        assert "search" in doc.fulfilled["body"]
+
+        missing = _FakeRoute("https://www.indeed.com/other", "document")
+        run(replay._serve(missing))
+        assert missing.fulfilled["status"] == 404
+
+        script = _FakeRoute("https://cdn.indeed.com/app.js", "script")
+        run(replay._serve(script))
+        assert script.aborted
+
+    def test_driver_replay_disables_delays_and_cache(self, tmp_path):
+        self._record(tmp_path)
+        driver = IndeedDriver()
+        driver.use_archive(SessionArchive(tmp_path, "indeed", "replay"))
+        assert driver.sim.sleeper.mode == "virtual"
+        assert driver.jd_cache.enabled is False
+
+        driver._page = _FakeSnapshotPage()
+        driver._page.url = "https://www.indeed.com/jobs?q=python"
+        run = asyncio.get_event_loop().run_until_complete
+        assert run(driver._goto_next_results_page()) is True
+        assert driver._page.visited == ["https://www.indeed.com/jobs?q=python&start=10"]
+        assert run(driver._goto_next_results_page()) is False
+
+
+    def test_recording_fetches_cached_jds_so_replay_has_them(self, tmp_path, monkeypatch):
+        monkeypatch.setattr("src.automation.drivers.base._playwright_available", lambda: True)
+        url = "https://www.indeed.com/viewjob?jk=abc"
+        warm = JDCache(tmp_path / "jd.db")
+        warm.put("indeed", "abc", "Cached JD")
+        assert warm.get("indeed", "abc") == "Cached JD"
+        driver = IndeedDriver()
+        driver.jd_cache = warm
+        driver.use_archive(SessionArchive(tmp_path / "replay", "indeed", "record"))
+        driver.sim.sleeper = Sleeper(ZERO)
+        driver.pacer = PacingController("indeed", enabled=False)
+        page = _FakeSnapshotPage()
+
+        async def start_browser():
+            driver._page = page
+
+        async def full_jd_text():
+            page.html = "<html>Fresh JD</html>"
+            return "Fresh JD"
+
+        driver._start_browser = start_browser
+        driver._get_full_jd_text = full_jd_text
+        job = asyncio.get_event_loop().run_until_complete(driver.get_job_details(url))
+        assert job.description_text == "Fresh JD" and page.visited == [url]
+
+        replay = SessionArchive(tmp_path / "replay", "indeed", "replay")
+        assert replay.lookup(url) == "<html>Fresh JD</html>"
+
+class _ScriptedDriver(BaseBrowserDriver):
+    """Browser-less driver that serves fixed results pages, newest first."""
+
+    def __init__(self, pages):
+        super().__init__(jd_cache=JDCache(enabled=False))
+        self.pages = pages
+        self.current = 0
+        self.sim.sleeper = Sleeper(ZERO)
+        self.pacer.enabled = False
+
+        class _Page:
+            url = "https://example.test/jobs"
+
+            async def goto(self, url, **kwargs):
+                pass
+
+            async def evaluate(self, script, arg=None):
+                raise RuntimeError("no DOM")
+
+        self._page = _Page()
+
+    def driver_name(self):
+        return "indeed"
+
+    def _get_search_url(self, config):
+        return "https://example.test/jobs"
+
+    async def _extract_job_cards(self):
+        return [
+            DiscoveredJob(title=f"Job {i}", company="Co", url=f"https://x/{i}",
+                          source="indeed", external_id=str(i), description_text="jd")
+            for i in self.pages[self.current]
+        ]
+
+    async def _has_next_page(self):
+        return self.current + 1 < len(self.pages)
+
+    async def _goto_next_page(self):
+        self.current += 1
+
+    async def _get_full_jd_text(self):
+        return ""
+
+    async def _check_session(self):
+        return True
+
+
+class TestIncrementalCrawl:
+    def test_full_crawl_without_incremental(self):
+        driver = _ScriptedDriver([[5, 4], [3, 2], [1, 0]])
+        config = SearchConfig(max_results=10, known_job_keys={"indeed:3", "indeed:2"})
+        jobs = asyncio.get_event_loop().run_until_complete(driver._run_search(config))
+        assert len(jobs) == 6
+        assert driver.last_high_water.pages_crawled == 3
+
+    def test_stops_at_first_fully_known_page(self):
+        driver = _ScriptedDriver([[5, 4], [3, 2], [1, 0]])
+        config = SearchConfig(
+            max_results=10, incremental=True, known_job_keys={"indeed:3", "indeed:2"},
+        )
+        jobs = asyncio.get_event_loop().run_until_complete(driver._run_search(config))
+        assert [j.external_id for j in jobs] == ["5", "4"]
+        mark = driver.last_high_water
+        assert mark.stopped_early is True
+        assert mark.pages_crawled == 2
+        assert mark.external_ids[:2] == ["5", "4"]
+
+    def test_posted_at_high_water(self):
+        from datetime import UTC, datetime
+
+        driver = _ScriptedDriver([[2, 1]])
+        original = driver._extract_job_cards
+
+        async def with_dates():
+            jobs = await original()
+            for job, day in zip(jobs, (10, 9)):
+                job.metadata["posted_at"] = datetime(2026, 10, day, tzinfo=UTC)
+            return jobs
+
+        driver._extract_job_cards = with_dates
+        config = SearchConfig(
+            max_results=10, incremental=True,
+            high_water_at={"indeed": datetime(2026, 10, 9)},  # naive = UTC
+        )
+        jobs = asyncio.get_event_loop().run_until_complete(driver._run_search(config))
+        assert [j.external_id for j in jobs] == ["2"]
+        assert driver.last_high_water.posted_at == datetime(2026, 10, 10, tzinfo=UTC)
+
+    def test_search_run_roundtrip(self):
+        from sqlalchemy import create_engine
+        from sqlalchemy.orm import sessionmaker
+
+        from src.automation.drivers.base import HighWaterMark
+        from src.automation.orchestrator import PipelineResult
+        from src.database import Base
+        from src.discovery.incremental import load_incremental_state, record_search_runs
+
+        engine = create_engine("sqlite:///:memory:")
+        Base.metadata.create_all(engine)
+        session = sessionmaker(bind=engine)()
+
+        config = SearchConfig(keywords=["Python"], location="Pune")
+        result = PipelineResult(high_water={"indeed": HighWaterMark(
+            external_ids=["12", "11"], pages_crawled=2, jobs_found=2, jobs_new=1,
+        )}, humanization_seeds={"indeed": 4242}, llm_usage={"calls": 3, "cost_usd": 0.01})
+        from datetime import UTC, datetime
+        record_search_runs(session, config, result, datetime.now(UTC))
+        from src.models import SearchRun
+        run = session.query(SearchRun).one()
+        assert (run.jobs_found, run.jobs_new) == (2, 1)
+        assert run.humanization_seed == 4242
+        assert run.llm_usage["calls"] == 3
+
+        next_config = SearchConfig(keywords=["python"], location="pune")
+        load_incremental_state(session, next_config, ["indeed"])
+        assert next_config.incremental is True
+        assert next_config.known_job_keys == {"indeed:12", "indeed:11"}
+
+
 # ── Deduplication Tests ──────────────────────────────────────
 
 class TestDeduplicator:
@@ -127,6 +127,14 @@ class TestCLI:
         assert args.command == "analyze"
         assert args.resume == "r.txt"
 
+    def test_parser_generate_batch(self):
+        from src.cli import build_parser
+        parser = build_parser()
+        args = parser.parse_args(["generate", "--jd", "a.txt", "b.txt", "--batch"])
+        assert args.jd == ["a.txt", "b.txt"]
+        assert args.batch is True
+        assert parser.parse_args(["generate", "--jd", "a.txt"]).batch is False
+
     def test_parser_search_options(self):
         from src.cli import build_parser
         parser = build_parser()
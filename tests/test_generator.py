@@ -5,6 +5,7 @@ from pathlib import Path
 
 from src.generator.content_selector import ContentSelector, SelectedContent
 from src.generator.renderer import ResumeRenderer, generate_resume
+from src.llm.provider import BaseLLMProvider, LLMResponse
 from src.profile.manager import CandidateProfile
 
 
@@ -210,13 +211,254 @@ class TestContentSelector:
         result = selector.select(profile, BACKEND_JD)
         assert len(result.certifications) == 1
 
+    def test_aselect_requests_llm_content_concurrently(self, profile):
+        import asyncio
+        from src.llm.provider import BaseLLMProvider, LLMResponse
+
+        class _AsyncProvider(BaseLLMProvider):
+            def __init__(self):
+                self.in_flight = self.peak = self.calls = 0
+
+            def generate(self, prompt, max_tokens=500, system_prompt=None):
+                raise AssertionError("aselect must not call generate()")
+
+            async def agenerate(self, prompt, max_tokens=500, system_prompt=None):
+                self.calls += 1
+                self.in_flight += 1
+                self.peak = max(self.peak, self.in_flight)
+                await asyncio.sleep(0)
+                self.in_flight -= 1
+                return LLMResponse(text=f"Generated text number {self.calls} for the role", model="fake")
+
+            def is_available(self):
+                return True
+
+        provider = _AsyncProvider()
+        result = asyncio.get_event_loop().run_until_complete(
+            ContentSelector(llm_provider=provider).aselect(profile, BACKEND_JD)
+        )
+        assert provider.calls > 1
+        assert provider.peak > 1
+        assert result.summary.startswith("Generated text number")
+
     def test_target_keywords_captured(self, selector, profile):
         result = selector.select(profile, BACKEND_JD)
         assert len(result.target_keywords) > 0
 
+    def test_select_batch_fans_results_back(self, profile, tmp_path):
+        import threading
+        from src.llm.batch import LocalBatchBackend, LocalBatchServer
+
+        class _BatchProvider(BaseLLMProvider):
+            def __init__(self):
+                self.calls = 0
+
+            def generate(self, prompt, max_tokens=500, system_prompt=None):
+                self.calls += 1
+                kind = "summary" if max_tokens == 150 else "bullet"
+                return LLMResponse(text=f"Batched {kind} text long enough to be accepted", model="fake")
+
+            def is_available(self):
+                return True
+
+        worker, stop = _BatchProvider(), threading.Event()
+        threading.Thread(
+            target=LocalBatchServer(tmp_path, worker).serve, args=(0.01, stop), daemon=True,
+        ).start()
+        selector = ContentSelector(llm_provider=_BatchProvider())
+        try:
+            results = selector.select_batch(
+                profile, {"job-1": BACKEND_JD, "job-2": FRONTEND_JD},
+                backend=LocalBatchBackend(tmp_path), poll_interval_s=0.01,
+            )
+        finally:
+            stop.set()
+
+        assert set(results) == {"job-1", "job-2"}
+        assert all(r.summary.startswith("Batched summary") for r in results.values())
+        bullets = [b["text"] for exp in results["job-1"].experience for b in exp["bullets"]]
+        assert any(text.startswith("Batched bullet") for text in bullets)
+        # One batch answered everything; nothing went through generate() directly
+        assert selector._llm.calls == 0 and worker.calls > 2
+        assert len(list(tmp_path.glob("batch_*"))) == 1
+
+    def test_select_batch_falls_back_without_a_batch_api(self, profile):
+        class _NoBatchProvider(BaseLLMProvider):
+            def generate(self, prompt, max_tokens=500, system_prompt=None):
+                raise AssertionError("select_batch must not call generate()")
+
+            def is_available(self):
+                return True
+
+        selector = ContentSelector(llm_provider=_NoBatchProvider())
+        results = selector.select_batch(profile, {"job-1": BACKEND_JD})
+        assert results["job-1"].summary     # rule-based fallback summary
+
 
 # ── Renderer Tests ───────────────────────────────────────────
 
+class _ChunkedLaTeXProvider(BaseLLMProvider):
+    """Fake streaming provider yielding a fixed list of chunks."""
+
+    model = "fake"
+
+    def __init__(self, chunks):
+        self.chunks = chunks
+        self.sent = 0
+
+    def generate(self, prompt, max_tokens=500, system_prompt=None):
+        return LLMResponse(text="".join(self.chunks), model="fake")
+
+    def _stream_chunks(self, stream, prompt, max_tokens, system_prompt):
+        for chunk in self.chunks:
+            self.sent += 1
+            yield chunk
+
+    def is_available(self):
+        return True
+
+
+class TestResumeBuilderStreaming:
+    @pytest.fixture
+    def profile_path(self, tmp_path):
+        path = tmp_path / "profile.yaml"
+        path.write_text("personal_info:\n  full_name: Jane Doe\n", encoding="utf-8")
+        return path
+
+    def test_streams_latex_and_drops_text_after_end_document(self, profile_path, tmp_path):
+        from src.generator.resume_builder import ResumeBuilder
+
+        chunks = ["```la", "tex\n\\docu", "mentclass{article}\n", "\\begin{document}Hi",
+                  "\\end{docu", "ment}\n```\n", "Let me know if", " you want changes."]
+        provider = _ChunkedLaTeXProvider(chunks)
+        builder = ResumeBuilder(profile_path=profile_path, llm_provider=provider)
+        out = builder.build_and_save("Backend engineer", tmp_path / "out" / "resume.tex")
+        tex = out.read_text(encoding="utf-8")
+        assert tex.startswith("\\documentclass{article}")
+        assert tex.endswith("\\end{document}")
+        assert provider.sent == 8
+        assert not (tmp_path / "out" / "resume.tex.part").exists()
+        assert builder.last_metrics.ttft_s is not None
+        assert builder.last_metrics.output_tokens == 8
+
+    def test_streamed_resume_is_cached(self, profile_path, tmp_path):
+        from src.generator.resume_builder import ResumeBuilder
+        from src.llm.cache import CachedProvider, LLMResponseCache
+
+        chunks = ["\\documentclass{article}\n", "\\begin{document}Hi", "\\end{document}",
+                  "\nHope this helps!"]
+        inner = _ChunkedLaTeXProvider(chunks)
+        cache = LLMResponseCache(tmp_path / "llm.db")
+        builder = ResumeBuilder(profile_path=profile_path, llm_provider=CachedProvider(inner, cache))
+        texts = [builder.build("Backend engineer") for _ in range(3)]
+        assert inner.sent == len(chunks)       # one real call, two cache hits
+        assert texts[0] == texts[2] and texts[0].endswith("\\end{document}")
+        assert len(cache) == 1
+
+    def test_metered_under_full_resume_with_provider_usage(self, profile_path):
+        from src.generator.resume_builder import ResumeBuilder
+        from src.llm.metering import LLMMeter, MeteredProvider
+
+        class _UsageLast(_ChunkedLaTeXProvider):
+            def _stream_chunks(self, stream, prompt, max_tokens, system_prompt):
+                yield from super()._stream_chunks(stream, prompt, max_tokens, system_prompt)
+                stream.prompt_tokens, stream.cached_prompt_tokens = 3000, 2500  # usage event
+
+        meter = LLMMeter()
+        provider = MeteredProvider(_UsageLast(["\\documentclass{article}\n", "\\end{document}"]), meter)
+        ResumeBuilder(profile_path=profile_path, llm_provider=provider).build("Backend engineer")
+        usage = meter.summary()["by_call_site"]
+        assert list(usage) == ["full_resume"]
+        assert (usage["full_resume"]["input_tokens"], usage["full_resume"]["cached_tokens"]) == (3000, 2500)
+
+        # An aborted stream is metered when it closes, still under full_resume
+        aborted = MeteredProvider(_ChunkedLaTeXProvider(["Sure!\n"] + ["x"] * 10), meter)
+        with pytest.raises(RuntimeError):
+            ResumeBuilder(profile_path=profile_path, llm_provider=aborted).build("Backend engineer")
+        assert meter.summary()["by_call_site"]["full_resume"]["calls"] == 2
+
+    def test_aborts_early_on_non_latex_opening(self, profile_path, tmp_path):
+        from src.generator.resume_builder import ResumeBuilder
+
+        chunks = ["Sure", "! Here is your resume:\n", "\\documentclass{article}"] + ["x"] * 50
+        provider = _ChunkedLaTeXProvider(chunks)
+        builder = ResumeBuilder(profile_path=profile_path, llm_provider=provider)
+        with pytest.raises(RuntimeError, match="does not start with"):
+            builder.build_and_save("Backend engineer", tmp_path / "resume.tex")
+        assert provider.sent == 1
+        assert list(tmp_path.glob("resume.tex*")) == []
+
+    def test_static_prompt_is_a_stable_prefix(self, profile_path):
+        from src.generator.resume_builder import ResumeBuilder
+
+        calls = []
+
+        class _Recording(_ChunkedLaTeXProvider):
+            def _stream_chunks(self, stream, prompt, max_tokens, system_prompt):
+                calls.append((system_prompt, prompt))
+                yield from super()._stream_chunks(stream, prompt, max_tokens, system_prompt)
+
+        provider = _Recording(["\\documentclass{article}\n\\end{document}"])
+        builder = ResumeBuilder(profile_path=profile_path, llm_provider=provider)
+        builder.build("Backend engineer at Acme")
+        builder.build("Data engineer at Globex")
+        (system_a, user_a), (system_b, user_b) = calls
+        assert system_a == system_b
+        assert "Jane Doe" in system_a and "\\resumeSubheading" in system_a
+        assert "Acme" in user_a and "Jane Doe" not in user_a
+        assert "Globex" in user_b
+
+    def test_aborts_on_fence_inside_document(self, profile_path):
+        from src.generator.resume_builder import ResumeBuilder
+
+        chunks = ["\\documentclass{article}\n", "Use ``", "`python blocks", "\\end{document}"]
+        builder = ResumeBuilder(profile_path=profile_path, llm_provider=_ChunkedLaTeXProvider(chunks))
+        with pytest.raises(RuntimeError, match="markdown fence"):
+            builder.build("Backend engineer")
+
+    def test_build_batch_checks_each_reply(self, profile_path, tmp_path):
+        from src.generator.resume_builder import ResumeBuilder
+        import json
+        from src.llm.batch import LocalBatchBackend, LocalBatchServer
+
+        class _PerJobLaTeX(BaseLLMProvider):
+            def generate(self, prompt, max_tokens=500, system_prompt=None):
+                if "Initech" in prompt:
+                    return LLMResponse(text="Sorry, I cannot help with that.", model="fake")
+                company = "Acme" if "Acme" in prompt else "Globex"
+                return LLMResponse(
+                    text=f"```latex\n\\documentclass{{article}}\n{company}\n\\end{{document}}\n```",
+                    model="fake",
+                )
+
+            def is_available(self):
+                return True
+
+        root = tmp_path / "batches"
+        server = LocalBatchServer(root, _PerJobLaTeX())
+        backend = LocalBatchBackend(root)
+        submit = backend.submit
+
+        def submit_and_serve(requests):
+            batch_id = submit(requests)
+            server.process_pending()
+            return batch_id
+
+        backend.submit = submit_and_serve
+        builder = ResumeBuilder(profile_path=profile_path, llm_provider=_PerJobLaTeX())
+        saved = builder.build_batch_and_save(
+            {"acme": "Backend at Acme", "globex": "SRE at Globex", "initech": "Initech"},
+            tmp_path / "out", backend=backend,
+        )
+        assert saved["acme"].read_text(encoding="utf-8") == "\\documentclass{article}\nAcme\n\\end{document}"
+        assert "Globex" in saved["globex"].read_text(encoding="utf-8")
+        assert isinstance(saved["initech"], RuntimeError)
+        assert not (tmp_path / "out" / "initech.tex").exists()
+        # The static profile prefix is shared by every request in the batch
+        lines = next(root.glob("*/input.jsonl")).read_text(encoding="utf-8").splitlines()
+        assert len({json.loads(line)["body"]["messages"][0]["content"] for line in lines}) == 1
+
+
 class TestResumeRenderer:
     def test_render_html(self, renderer, selector, profile):
         content = selector.select(profile, BACKEND_JD)
@@ -174,3 +174,50 @@ class TestSearchRunModel:
         assert fetched.portal == "linkedin"
         assert fetched.jobs_found == 25
         assert fetched.jobs_new == 18
+
+    def test_search_run_high_water_mark(self, session):
+        """Incremental-crawl fields round-trip."""
+        run = SearchRun(
+            portal="indeed",
+            search_query="python @ pune",
+            high_water_ids=["abc", "def"],
+            pages_crawled=2,
+            stopped_early=True,
+        )
+        session.add(run)
+        session.commit()
+
+        fetched = session.query(SearchRun).first()
+        assert fetched.high_water_ids == ["abc", "def"]
+        assert fetched.stopped_early is True
+
+    def test_init_db_migrates_old_search_runs_table(self, tmp_path):
+        """init_db adds the columns an older search_runs table lacks."""
+        from sqlalchemy import inspect, text
+
+        eng = create_engine(f"sqlite:///{tmp_path / 'old.db'}")
+        with eng.begin() as conn:
+            conn.execute(text(
+                "CREATE TABLE search_runs (id INTEGER PRIMARY KEY, portal VARCHAR NOT NULL, "
+                "search_query VARCHAR, jobs_found INTEGER, jobs_new INTEGER, "
+                "started_at DATETIME, completed_at DATETIME)"
+            ))
+        init_db(eng)
+        init_db(eng)  # idempotent
+
+        columns = {c["name"] for c in inspect(eng).get_columns("search_runs")}
+        assert {
+            "high_water_ids", "high_water_at", "pages_crawled", "stopped_early",
+            "humanization_seed", "llm_usage",
+        } <= columns
+
+        # Every mapped column exists, so the ORM can write and read a full row
+        Session = sessionmaker(bind=eng)
+        with Session() as sess:
+            sess.add(SearchRun(
+                portal="indeed", search_query="python", high_water_ids=["1"],
+                pages_crawled=2, humanization_seed=7, llm_usage={"calls": 1},
+            ))
+            sess.commit()
+            run = sess.query(SearchRun).one()
+            assert (run.high_water_ids, run.llm_usage) == (["1"], {"calls": 1})